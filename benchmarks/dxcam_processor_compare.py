@@ -11,12 +11,13 @@ def run_capture_pass(
     processor_backend: ProcessorBackend,
     target_fps: int,
     target_frames: int,
+    output_color: str,
 ) -> dict[str, float]:
     camera = dxcam.create(
         output_idx=0,
         backend=capture_backend,
         processor_backend=processor_backend,
-        output_color="BGRA",
+        output_color=output_color,
     )
     camera.start(target_fps=target_fps, video_mode=False)
     start = time.perf_counter()
@@ -53,7 +54,7 @@ def run_capture_pass(
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(
-        description="Compare DXcam cv2 vs numpy processor backends."
+        description="Compare DXcam cv2, numpy and pure_numpy processor backends."
     )
     parser.add_argument(
         "--backend",
@@ -73,6 +74,12 @@ def parse_args() -> argparse.Namespace:
         default=1000,
         help="Benchmark loop iterations.",
     )
+    parser.add_argument(
+        "--output-color",
+        choices=("BGRA", "RGBA", "RGB", "BGR", "GRAY"),
+        default="BGRA",
+        help="Output color mode.",
+    )
     return parser.parse_args()
 
 
@@ -80,14 +87,15 @@ def main() -> None:
     args = parse_args()
     print(
         f"Running capture backend={args.backend}, target_fps={args.target_fps}, "
-        f"target_frames={args.target_frames}"
+        f"target_frames={args.target_frames}, output_color={args.output_color}"
     )
-    for processor_backend in ("cv2", "numpy"):
+    for processor_backend in ("cv2", "numpy", "pure_numpy"):
         metrics = run_capture_pass(
             capture_backend=args.backend,
             processor_backend=processor_backend,
             target_fps=args.target_fps,
             target_frames=args.target_frames,
+            output_color=args.output_color,
         )
         print(
             f"[{processor_backend}] elapsed={metrics['elapsed_s']:.3f}s "
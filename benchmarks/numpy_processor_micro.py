@@ -1,13 +1,14 @@
 from __future__ import annotations
 
 import argparse
-import ctypes
 import gc
 import logging
 import statistics
+import sys
 import time
 from dataclasses import dataclass
 from importlib import import_module
+from pathlib import Path
 from typing import Any
 
 import numpy as np
@@ -16,15 +17,10 @@ from numpy.typing import NDArray
 from dxcam.processor import Processor, normalize_processor_backend_name
 from dxcam.types import ColorMode, ProcessorBackend, Region
 
-logger = logging.getLogger(__name__)
-
-
-class FakeMappedRect:
-    """Minimal DXGI_MAPPED_RECT-like object for processor micro-benchmarking."""
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "tests"))
+from mapped_rect import FakeMappedRect, random_mapped_rect  # noqa: E402
 
-    def __init__(self, pitch: int, pbits: Any) -> None:
-        self.Pitch = pitch
-        self.pBits = pbits
+logger = logging.getLogger(__name__)
 
 
 @dataclass
@@ -54,33 +50,6 @@ class BenchResult:
         return statistics.median(self.gpix_per_s)
 
 
-def aligned_pitch(width_pixels: int, align_bytes: int = 256) -> int:
-    row_bytes = width_pixels * 4
-    return ((row_bytes + align_bytes - 1) // align_bytes) * align_bytes
-
-
-def make_fake_rect(
-    width: int,
-    height: int,
-    rotation_angle: int,
-) -> tuple[FakeMappedRect, Any]:
-    rows = height if rotation_angle in (0, 180) else width
-    active_cols = width if rotation_angle in (0, 180) else height
-    pitch = aligned_pitch(active_cols)
-    size = pitch * rows
-    raw = (ctypes.c_ubyte * size)()
-    buffer = np.frombuffer(memoryview(raw), dtype=np.uint8)
-    rng = np.random.default_rng(42)
-    buffer[:] = rng.integers(0, 256, size=size, dtype=np.uint8)
-    return (
-        FakeMappedRect(
-            pitch=pitch,
-            pbits=ctypes.cast(raw, ctypes.POINTER(ctypes.c_ubyte)),
-        ),
-        raw,
-    )
-
-
 def output_shape(mode: ColorMode, width: int, height: int) -> tuple[int, int, int]:
     if mode in ("RGB", "BGR"):
         return (height, width, 3)
@@ -95,6 +64,34 @@ def _frame_checksum(frame: NDArray[np.uint8]) -> int:
     return int(frame[0, 0, 0]) ^ int(frame[-1, -1, 0]) ^ int(frame[frame.shape[0] // 2, 0, 0])
 
 
+def map_fake_rect(
+    rect: FakeMappedRect,
+    width: int,
+    height: int,
+    rotation_angle: int,
+) -> NDArray[np.uint8]:
+    rows = height if rotation_angle in (0, 180) else width
+    byte_view = np.ctypeslib.as_array(rect.pBits, shape=(rect.Pitch * rows,))
+    return byte_view.reshape((rows, rect.Pitch // 4, 4))
+
+
+def _two_pass_into(
+    kernels: Any,
+    image: NDArray[np.uint8],
+    prepared: NDArray[np.uint8],
+    dst: NDArray[np.uint8],
+    width: int,
+    height: int,
+    region: Region,
+    rotation_angle: int,
+    mode: ColorMode,
+) -> None:
+    # Reference pipeline used before the fused kernels: stage a rotated BGRA
+    # copy, then convert it in a second full-frame pass.
+    kernels.prepare_bgra_into(image, prepared, width, height, region, rotation_angle)
+    kernels.convert_bgra_into(prepared, dst, mode)
+
+
 def _run_once(
     processor: Processor,
     variant: str,
@@ -115,6 +112,26 @@ def _run_once(
             frame = processor.process(rect, width, height, region, rotation_angle)
             checksum ^= _frame_checksum(frame)
         elapsed = time.perf_counter() - start
+    elif variant == "two-pass":
+        kernels = import_module("dxcam.processor._numpy_kernels")
+        image = map_fake_rect(rect, width, height, rotation_angle)
+        prepared = np.empty((height, width, 4), dtype=np.uint8)
+        dst = np.empty(output_shape(mode=mode, width=width, height=height), dtype=np.uint8)
+        start = time.perf_counter()
+        for _ in range(iterations):
+            _two_pass_into(
+                kernels,
+                image,
+                prepared,
+                dst,
+                width,
+                height,
+                region,
+                rotation_angle,
+                mode,
+            )
+            checksum ^= _frame_checksum(dst)
+        elapsed = time.perf_counter() - start
     else:
         dst = np.empty(output_shape(mode=mode, width=width, height=height), dtype=np.uint8)
         start = time.perf_counter()
@@ -156,6 +173,18 @@ def run_processor_bench(
             for _ in range(warmup):
                 if variant == "process":
                     warmup_frame = processor.process(rect, width, height, region, rotation_angle)
+                elif variant == "two-pass":
+                    kernels = import_module("dxcam.processor._numpy_kernels")
+                    warmup_frame = kernels.convert_bgra(
+                        kernels.prepare_bgra(
+                            map_fake_rect(rect, width, height, rotation_angle),
+                            width,
+                            height,
+                            region,
+                            rotation_angle,
+                        ),
+                        color_mode,
+                    )
                 else:
                     dst = np.empty(
                         output_shape(mode=color_mode, width=width, height=height),
@@ -257,8 +286,11 @@ def parse_args() -> argparse.Namespace:
         "--variants",
         nargs="+",
         default=["process", "into"],
-        choices=["process", "into"],
-        help="Benchmark allocation path (process), dst-reuse path (into), or both.",
+        choices=["process", "into", "two-pass"],
+        help=(
+            "Benchmark allocation path (process), dst-reuse path (into), or the "
+            "unfused prepare+convert kernel pipeline (two-pass, numpy only)."
+        ),
     )
     parser.add_argument(
         "--skip-verify",
@@ -287,11 +319,7 @@ def main() -> None:
     width = args.width
     height = args.height
     region: Region = (0, 0, width, height)
-    rect, _raw = make_fake_rect(
-        width=width,
-        height=height,
-        rotation_angle=args.rotation,
-    )
+    rect = random_mapped_rect(width, height, args.rotation, seed=42, pitch_align=256)
 
     logger.info(
         "Processor micro-benchmark width=%d height=%d rotation=%d warmup=%d iterations=%d repeats=%d pitch=%d",
@@ -332,6 +360,10 @@ def main() -> None:
     for mode in args.modes:
         for variant in args.variants:
             for processor_backend in deduped_backends:
+                if variant == "two-pass" and (
+                    processor_backend != "numpy" or mode == "BGRA"
+                ):
+                    continue
                 result = run_processor_bench(
                     processor_backend=processor_backend,
                     color_mode=mode,
@@ -376,6 +408,26 @@ def main() -> None:
                 ),
                 None,
             )
+            if variant == "two-pass":
+                two_pass_result = numpy_result
+                numpy_result = next(
+                    (
+                        r
+                        for r in results
+                        if r.backend == "numpy" and r.mode == mode and r.variant == "into"
+                    ),
+                    None,
+                )
+                if two_pass_result is None or numpy_result is None:
+                    continue
+                speedup = numpy_result.median_fps / two_pass_result.median_fps
+                logger.info(
+                    "comparison mode=%s fused_vs_two_pass=%.3fx (%+.2f%%)",
+                    mode,
+                    speedup,
+                    (speedup - 1.0) * 100.0,
+                )
+                continue
             if cv2_result is None or numpy_result is None:
                 continue
             speedup = numpy_result.median_fps / cv2_result.median_fps
@@ -22,12 +22,40 @@ import signal
 import time
 import weakref
 from types import FrameType
-from typing import Any, Callable, cast
+from typing import Any, Callable, Sequence, cast
 
 from dxcam.core.backend import normalize_backend_name
+from dxcam.core.frame_pool import FrameAllocator
 from dxcam.dxcam import DXCamera, Output, Device
-from dxcam.processor import normalize_processor_backend_name
-from dxcam.types import CaptureBackend, ColorMode, ProcessorBackend, Region
+from dxcam.processor import (
+    normalize_band_min_rows,
+    normalize_band_workers,
+    normalize_hdr_white_nits,
+    normalize_interpolation_name,
+    normalize_letterbox_color,
+    normalize_output_size,
+    normalize_processor_backend_name,
+    normalize_source_format,
+    normalize_tensor_format,
+    normalize_tone_map_name,
+    normalize_yuv_matrix_name,
+    normalize_yuv_range_name,
+)
+from dxcam.types import (
+    CaptureBackend,
+    ColorMode,
+    Interpolation,
+    LetterboxTransform,
+    OutputDType,
+    OutputLayout,
+    ProcessorBackend,
+    Region,
+    Size,
+    SourceFormat,
+    ToneMap,
+    YuvMatrix,
+    YuvRange,
+)
 from dxcam.util.io import (
     enum_dxgi_adapters,
     get_output_metadata,
@@ -41,8 +69,15 @@ __all__ = [
     "DXCamera",
     "CaptureBackend",
     "ColorMode",
+    "Interpolation",
+    "LetterboxTransform",
+    "OutputDType",
+    "OutputLayout",
     "ProcessorBackend",
     "Region",
+    "Size",
+    "YuvMatrix",
+    "YuvRange",
     "create",
     "device_info",
     "output_info",
@@ -107,9 +142,60 @@ class DXFactory(metaclass=Singleton):
         max_buffer_len: int = 8,
         backend: CaptureBackend = "dxgi",
         processor_backend: ProcessorBackend = "cv2",
+        output_size: Size | None = None,
+        interpolation: Interpolation = "area",
+        letterbox: bool = False,
+        letterbox_color: int = 114,
+        output_layout: OutputLayout = "HWC",
+        output_dtype: OutputDType = "uint8",
+        normalize_mean: Sequence[float] | None = None,
+        normalize_std: Sequence[float] | None = None,
+        output_scale: float | None = None,
+        yuv_matrix: YuvMatrix = "bt601",
+        yuv_range: YuvRange = "limited",
+        band_workers: int = 0,
+        band_min_rows: int = 64,
+        source_format: SourceFormat = "BGRA8",
+        tone_map: ToneMap = "clip",
+        hdr_white_nits: float = 80.0,
+        draw_cursor: bool = False,
+        allocator: FrameAllocator | None = None,
+        frame_pool_size: int = 4,
+        shared_memory: bool | str = False,
+        disk_buffer: bool | str = False,
+        disk_buffer_preallocate: bool = False,
     ) -> DXCamera:
         backend = normalize_backend_name(str(backend))
         processor_backend = normalize_processor_backend_name(str(processor_backend))
+        output_size = normalize_output_size(output_size)
+        interpolation = normalize_interpolation_name(str(interpolation))
+        letterbox_color = normalize_letterbox_color(letterbox_color)
+        # Validate tensor options before touching DXGI objects.
+        normalize_tensor_format(
+            output_color,
+            output_layout=str(output_layout),
+            output_dtype=str(output_dtype),
+            normalize_mean=normalize_mean,
+            normalize_std=normalize_std,
+            output_scale=output_scale,
+        )
+        yuv_matrix = normalize_yuv_matrix_name(str(yuv_matrix))
+        yuv_range = normalize_yuv_range_name(str(yuv_range))
+        band_workers = normalize_band_workers(band_workers)
+        band_min_rows = normalize_band_min_rows(band_min_rows)
+        source_format = normalize_source_format(str(source_format))
+        tone_map = normalize_tone_map_name(str(tone_map))
+        hdr_white_nits = normalize_hdr_white_nits(hdr_white_nits)
+        if source_format != "BGRA8" and backend != "dxgi":
+            raise ValueError(
+                f"source_format '{source_format}' requires the dxgi backend."
+            )
+        if draw_cursor and backend != "dxgi":
+            raise ValueError("draw_cursor requires the dxgi backend.")
+        if shared_memory and disk_buffer:
+            raise ValueError("shared_memory and disk_buffer are mutually exclusive.")
+        if frame_pool_size < 0:
+            raise ValueError(f"frame_pool_size must be >= 0, got {frame_pool_size}.")
         device = self.devices[device_idx]
         if output_idx is None:
             # Select Primary Output
@@ -158,6 +244,28 @@ class DXFactory(metaclass=Singleton):
             max_buffer_len=max_buffer_len,
             backend=backend,
             processor_backend=processor_backend,
+            output_size=output_size,
+            interpolation=interpolation,
+            letterbox=letterbox,
+            letterbox_color=letterbox_color,
+            output_layout=output_layout,
+            output_dtype=output_dtype,
+            normalize_mean=normalize_mean,
+            normalize_std=normalize_std,
+            output_scale=output_scale,
+            yuv_matrix=yuv_matrix,
+            yuv_range=yuv_range,
+            band_workers=band_workers,
+            band_min_rows=band_min_rows,
+            source_format=source_format,
+            tone_map=tone_map,
+            hdr_white_nits=hdr_white_nits,
+            draw_cursor=draw_cursor,
+            allocator=allocator,
+            frame_pool_size=frame_pool_size,
+            shared_memory=shared_memory,
+            disk_buffer=disk_buffer,
+            disk_buffer_preallocate=disk_buffer_preallocate,
         )
         self._camera_instances[instance_key] = camera
         time.sleep(0.1)  # Fix for https://github.com/ra1nty/DXcam/issues/31
@@ -230,6 +338,28 @@ def create(
     max_buffer_len: int = 8,
     backend: CaptureBackend = "dxgi",
     processor_backend: ProcessorBackend = "cv2",
+    output_size: Size | None = None,
+    interpolation: Interpolation = "area",
+    letterbox: bool = False,
+    letterbox_color: int = 114,
+    output_layout: OutputLayout = "HWC",
+    output_dtype: OutputDType = "uint8",
+    normalize_mean: Sequence[float] | None = None,
+    normalize_std: Sequence[float] | None = None,
+    output_scale: float | None = None,
+    yuv_matrix: YuvMatrix = "bt601",
+    yuv_range: YuvRange = "limited",
+    band_workers: int = 0,
+    band_min_rows: int = 64,
+    source_format: SourceFormat = "BGRA8",
+    tone_map: ToneMap = "clip",
+    hdr_white_nits: float = 80.0,
+    draw_cursor: bool = False,
+    allocator: FrameAllocator | None = None,
+    frame_pool_size: int = 4,
+    shared_memory: bool | str = False,
+    disk_buffer: bool | str = False,
+    disk_buffer_preallocate: bool = False,
 ) -> DXCamera:
     """Create or return a singleton camera for a device/output/backend tuple.
 
@@ -238,12 +368,80 @@ def create(
         output_idx: Output index on the selected adapter. ``None`` chooses
             the primary output.
         region: Optional capture region as ``(left, top, right, bottom)``.
-        output_color: Output pixel format.
+        output_color: Output pixel format. ``"NV12"`` and ``"I420"`` return
+            encoder-ready planar YUV 4:2:0 frames of shape
+            ``(height * 3 // 2, width)``, padded to even dimensions.
         max_buffer_len: Ring-buffer size used in threaded capture mode.
         backend: Capture backend, ``"dxgi"`` or ``"winrt"``.
-        processor_backend: Post-processing backend, ``"cv2"`` (default)
-            or ``"numpy"``. The ``"numpy"`` backend uses compiled Cython
-            kernels when available and falls back to cv2 behavior otherwise.
+        processor_backend: Post-processing backend, ``"cv2"`` (default),
+            ``"numpy"`` or ``"pure_numpy"``. The ``"numpy"`` backend uses
+            compiled Cython kernels when available and falls back to cv2
+            behavior otherwise. ``"pure_numpy"`` only uses NumPy and never
+            imports OpenCV.
+        output_size: Optional ``(width, height)`` every frame is resized to.
+            Resizing runs in the same pass as crop/rotate/convert, so ring
+            buffers and returned frames are allocated at the reduced size.
+        interpolation: Resize filter used with ``output_size``:
+            ``"nearest"``, ``"bilinear"`` or ``"area"`` (default).
+        letterbox: Preserve aspect ratio and pad to ``output_size`` (or to a
+            square canvas when ``output_size`` is ``None``). The per-frame
+            ``(scale, pad_left, pad_top)`` is returned by
+            ``get_latest_frame(with_timestamp=True)``.
+        letterbox_color: Padding value written to every channel of border
+            pixels (default ``114``).
+        output_layout: ``"HWC"`` (default) or planar ``"CHW"`` frames.
+        output_dtype: ``"uint8"`` (default), ``"float32"`` or ``"float16"``.
+            Float frames are ``(value * output_scale - mean) / std`` per
+            channel, computed in the same pass as channel reordering.
+        normalize_mean: Optional per-channel mean (in scaled units) for float
+            outputs, in ``output_color`` channel order.
+        normalize_std: Optional per-channel std for float outputs.
+        output_scale: Float output multiplier applied before normalization,
+            ``1/255`` by default.
+        yuv_matrix: Color matrix for YUV output, ``"bt601"`` (default) or
+            ``"bt709"``.
+        yuv_range: YUV quantization range, ``"limited"`` (default) or
+            ``"full"``.
+        band_workers: Threads that split OpenCV color conversion and BGRA
+            copies into horizontal stripes on a persistent pool. ``0``
+            (default) converts on the capture thread. Useful for 4K capture
+            without the compiled kernels.
+        band_min_rows: Minimum stripe height in rows (default ``64``).
+        source_format: Desktop format requested from Desktop Duplication:
+            ``"BGRA8"`` (default), ``"RGB10A2"`` (HDR10, PQ/BT.2020) or
+            ``"RGBA16F"`` (linear scRGB). HDR formats need the ``"dxgi"``
+            backend and ``IDXGIOutput5.DuplicateOutput1``.
+        tone_map: How HDR sources are mapped to 8-bit sRGB before the usual
+            pipeline: ``"clip"`` (default), ``"reinhard"`` or ``"aces"``.
+            ``"none"`` keeps source precision and returns ``uint16``
+            (``RGB10A2``, 10-bit values) or ``float16`` (``RGBA16F``)
+            ``RGBA``/``RGB`` frames; resize, letterbox, tensor and YUV
+            options are unavailable then.
+        hdr_white_nits: HDR luminance mapped to 8-bit white (default ``80``).
+        draw_cursor: Composite the mouse pointer into frames on the ``"dxgi"``
+            backend. The pointer shape is cached per shape change and drawn
+            into its bounding box after conversion. Needs region-sized
+            ``RGB``/``BGR``/``RGBA``/``BGRA`` output.
+        allocator: Callable ``(shape, dtype) -> ndarray`` that allocates
+            copied frames and the capture ring buffer, e.g. for pinned,
+            shared or aligned memory (see
+            :func:`dxcam.core.frame_pool.aligned_allocator`). ``None`` uses
+            ``np.empty``.
+        frame_pool_size: Recycled frames kept per frame shape (default
+            ``4``). Frames returned with ``copy=True`` can be handed back with
+            ``camera.recycle(frame)`` so later grabs reuse their memory.
+        shared_memory: Allocate the capture ring buffer in
+            ``multiprocessing.shared_memory`` so other processes can read
+            frames zero-copy with
+            :class:`dxcam.core.shared_ring.SharedRingReader` (attach with
+            ``camera.shared_memory_name``). Pass a string to choose the
+            segment name, or ``True`` for a generated one.
+        disk_buffer: Back the capture ring buffer with an ``np.memmap`` file
+            in this directory (``True`` uses the temp directory), so
+            ``max_buffer_len`` can hold minutes of frames; read windows back
+            with ``camera.export_frames()``. Excludes ``shared_memory``.
+        disk_buffer_preallocate: Reserve the whole ring file when the ring is
+            allocated rather than as frames are first written.
 
     Returns:
         A :class:`dxcam.dxcam.DXCamera` instance.
@@ -267,6 +465,28 @@ def create(
         max_buffer_len=max_buffer_len,
         backend=backend,
         processor_backend=processor_backend,
+        output_size=output_size,
+        interpolation=interpolation,
+        letterbox=letterbox,
+        letterbox_color=letterbox_color,
+        output_layout=output_layout,
+        output_dtype=output_dtype,
+        normalize_mean=normalize_mean,
+        normalize_std=normalize_std,
+        output_scale=output_scale,
+        yuv_matrix=yuv_matrix,
+        yuv_range=yuv_range,
+        band_workers=band_workers,
+        band_min_rows=band_min_rows,
+        source_format=source_format,
+        tone_map=tone_map,
+        hdr_white_nits=hdr_white_nits,
+        draw_cursor=draw_cursor,
+        allocator=allocator,
+        frame_pool_size=frame_pool_size,
+        shared_memory=shared_memory,
+        disk_buffer=disk_buffer,
+        disk_buffer_preallocate=disk_buffer_preallocate,
     )
 
 
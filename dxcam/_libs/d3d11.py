@@ -19,8 +19,16 @@ D3D11_USAGE_IMMUTABLE = 1
 D3D11_USAGE_DYNAMIC = 2
 D3D11_USAGE_STAGING = 3
 
+DXGI_FORMAT_R16G16B16A16_FLOAT = 10
+DXGI_FORMAT_R10G10B10A2_UNORM = 24
 DXGI_FORMAT_B8G8R8A8_UNORM = 87
 
+DXGI_FORMAT_NAMES = {
+    DXGI_FORMAT_R16G16B16A16_FLOAT: "DXGI_FORMAT_R16G16B16A16_FLOAT",
+    DXGI_FORMAT_R10G10B10A2_UNORM: "DXGI_FORMAT_R10G10B10A2_UNORM",
+    DXGI_FORMAT_B8G8R8A8_UNORM: "DXGI_FORMAT_B8G8R8A8_UNORM",
+}
+
 
 class DXGI_SAMPLE_DESC(ctypes.Structure):
     _fields_ = [
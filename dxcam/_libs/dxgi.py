@@ -48,6 +48,16 @@ class DXGI_OUTDUPL_POINTER_POSITION(ctypes.Structure):
     _fields_ = [("Position", wintypes.POINT), ("Visible", wintypes.BOOL)]
 
 
+class DXGI_OUTDUPL_POINTER_SHAPE_INFO(ctypes.Structure):
+    _fields_ = [
+        ("Type", wintypes.UINT),
+        ("Width", wintypes.UINT),
+        ("Height", wintypes.UINT),
+        ("Pitch", wintypes.UINT),
+        ("HotSpot", wintypes.POINT),
+    ]
+
+
 class DXGI_OUTDUPL_FRAME_INFO(ctypes.Structure):
     _fields_ = [
         ("LastPresentTime", wintypes.LARGE_INTEGER),
@@ -129,7 +139,16 @@ class IDXGIOutputDuplication(IDXGIObject):
         ),
         comtypes.STDMETHOD(comtypes.HRESULT, "GetFrameDirtyRects"),
         comtypes.STDMETHOD(comtypes.HRESULT, "GetFrameMoveRects"),
-        comtypes.STDMETHOD(comtypes.HRESULT, "GetFramePointerShape"),
+        comtypes.STDMETHOD(
+            comtypes.HRESULT,
+            "GetFramePointerShape",
+            [
+                wintypes.UINT,
+                ctypes.c_void_p,
+                ctypes.POINTER(wintypes.UINT),
+                ctypes.POINTER(DXGI_OUTDUPL_POINTER_SHAPE_INFO),
+            ],
+        ),
         comtypes.STDMETHOD(comtypes.HRESULT, "MapDesktopSurface"),
         comtypes.STDMETHOD(comtypes.HRESULT, "UnMapDesktopSurface"),
         comtypes.STDMETHOD(comtypes.HRESULT, "ReleaseFrame"),
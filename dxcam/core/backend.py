@@ -2,27 +2,54 @@ from __future__ import annotations
 
 from typing import Any, Callable, cast
 
+from dxcam._libs.d3d11 import (
+    DXGI_FORMAT_B8G8R8A8_UNORM,
+    DXGI_FORMAT_R10G10B10A2_UNORM,
+    DXGI_FORMAT_R16G16B16A16_FLOAT,
+)
 from dxcam.core.device import Device
 from dxcam.core.dxgi_duplicator import DXGIDuplicator
 from dxcam.core.output import Output
-from dxcam.types import CaptureBackend
+from dxcam.types import CaptureBackend, SourceFormat
 
 _SUPPORTED_BACKENDS: tuple[CaptureBackend, ...] = ("dxgi", "winrt")
 
+_DXGI_SOURCE_FORMATS: dict[SourceFormat, int] = {
+    "BGRA8": DXGI_FORMAT_B8G8R8A8_UNORM,
+    "RGB10A2": DXGI_FORMAT_R10G10B10A2_UNORM,
+    "RGBA16F": DXGI_FORMAT_R16G16B16A16_FLOAT,
+}
+
+
+def dxgi_source_format(source_format: SourceFormat) -> int:
+    """Return the ``DXGI_FORMAT`` value of a normalized source format."""
+    return _DXGI_SOURCE_FORMATS[source_format]
 
-def _create_dxgi_duplicator(*, output: Output, device: Device) -> Any:
-    return DXGIDuplicator(output=output, device=device)
+
+def _create_dxgi_duplicator(
+    *, output: Output, device: Device, source_format: SourceFormat
+) -> Any:
+    return DXGIDuplicator(
+        output=output,
+        device=device,
+        dxgi_format=dxgi_source_format(source_format),
+    )
 
 
-def _create_winrt_duplicator(*, output: Output, device: Device) -> Any:
+def _create_winrt_duplicator(
+    *, output: Output, device: Device, source_format: SourceFormat
+) -> Any:
+    if source_format != "BGRA8":
+        raise ValueError(
+            f"The winrt backend captures BGRA8 only, got source_format "
+            f"'{source_format}'. Use backend='dxgi' for HDR sources."
+        )
     from dxcam.core.winrt_duplicator import WinRTDuplicator
 
     return WinRTDuplicator(output=output, device=device)
 
 
-_BACKEND_CREATORS: dict[
-    CaptureBackend, Callable[..., Any]
-] = {
+_BACKEND_CREATORS: dict[CaptureBackend, Callable[..., Any]] = {
     "dxgi": _create_dxgi_duplicator,
     "winrt": _create_winrt_duplicator,
 }
@@ -52,6 +79,7 @@ def create_backend_duplicator(
     *,
     output: Output,
     device: Device,
+    source_format: SourceFormat = "BGRA8",
 ) -> Any:
     """Create a backend-specific duplicator instance.
 
@@ -59,15 +87,18 @@ def create_backend_duplicator(
         backend: Selected capture backend.
         output: Output descriptor to capture from.
         device: Device descriptor associated with ``output``.
+        source_format: Desktop format to duplicate (``"BGRA8"``,
+            ``"RGB10A2"`` or ``"RGBA16F"``).
 
     Returns:
         A duplicator instance that implements the capture backend contract.
 
     Raises:
-        ValueError: If ``backend`` has no registered factory.
+        ValueError: If ``backend`` has no registered factory or cannot
+            capture ``source_format``.
     """
     creator = _BACKEND_CREATORS.get(backend)
     if creator is None:
         # Defensive fallback in case literals are expanded without wiring.
         raise ValueError(f"Unsupported backend '{backend}'.")
-    return creator(output=output, device=device)
+    return creator(output=output, device=device, source_format=source_format)
@@ -1,21 +1,32 @@
 from __future__ import annotations
 
 from _thread import LockType
-from threading import Event
+from threading import Condition, Event
 from typing import Callable
 
 import numpy as np
 
+from numpy.typing import NDArray
+
 from dxcam.core.capture_runtime import CaptureRuntime
-from dxcam.types import Frame, Region
+from dxcam.types import Frame, LetterboxTransform, Region
 
-GrabIntoFn = Callable[[Region, Frame], tuple[bool, int, int, int]]
+GrabIntoFn = Callable[
+    [Region, Frame, NDArray[np.uint64] | None], tuple[bool, int, int, int]
+]
 ProcessStagingFrameFn = Callable[[int, int], Frame]
 HandleFrameSizeChangeFn = Callable[[int, int], None]
+LetterboxTransformFn = Callable[[int, int], LetterboxTransform | None]
+HashTilesFn = Callable[[Frame, NDArray[np.uint64]], None]
+FingerprintFn = Callable[[Frame], int]
 
 
 class CaptureLoopRunner:
-    """Runs one capture-loop iteration and updates the ring buffer."""
+    """Runs one capture-loop iteration and updates the ring buffer.
+
+    Every committed frame sets ``frame_available_event`` and, when given,
+    notifies all waiters of ``frame_committed`` (a condition on ``lock``).
+    """
 
     def __init__(
         self,
@@ -26,13 +37,49 @@ class CaptureLoopRunner:
         grab_into: GrabIntoFn,
         process_staging_frame: ProcessStagingFrameFn,
         handle_frame_size_change: HandleFrameSizeChangeFn,
+        letterbox_transform: LetterboxTransformFn | None = None,
+        hash_tiles: HashTilesFn | None = None,
+        fingerprint: FingerprintFn | None = None,
+        frame_committed: Condition | None = None,
     ) -> None:
         self._lock = lock
+        self._frame_committed = frame_committed
         self._frame_available_event = frame_available_event
         self._runtime = runtime
         self._grab_into = grab_into
         self._process_staging_frame = process_staging_frame
         self._handle_frame_size_change = handle_frame_size_change
+        self._letterbox_transform = letterbox_transform
+        self._hash_tiles = hash_tiles
+        self._fingerprint = fingerprint
+
+    def _frame_letterbox(
+        self, frame_width: int, frame_height: int
+    ) -> LetterboxTransform | None:
+        if self._letterbox_transform is None:
+            return None
+        return self._letterbox_transform(frame_width, frame_height)
+
+    def _frame_fingerprint(self, frame: Frame, enabled: bool) -> int | None:
+        if not enabled or self._fingerprint is None:
+            return None
+        return self._fingerprint(frame)
+
+    def _commit(
+        self,
+        write_idx: int,
+        frame_ticks: int,
+        letterbox: LetterboxTransform | None,
+        fingerprint: int | None,
+    ) -> None:
+        with self._lock:
+            if not self._runtime.commit_write(
+                write_idx, frame_ticks, letterbox, fingerprint
+            ):
+                return
+            if self._frame_committed is not None:
+                self._frame_committed.notify_all()
+        self._frame_available_event.set()
 
     def run_once(self, *, region: Region, video_mode: bool) -> None:
         with self._lock:
@@ -40,15 +87,21 @@ class CaptureLoopRunner:
             if write_slot is None:
                 return
             write_idx, write_dst = write_slot
+            write_hashes = self._runtime.tile_hashes_slot(write_idx)
+            fingerprints = self._runtime.frame_fingerprints is not None
+            stages = self._runtime.stages
 
         captured, frame_ticks, frame_width, frame_height = self._grab_into(
             region,
             write_dst,
+            write_hashes,
         )
         if captured:
-            with self._lock:
-                if self._runtime.commit_write(write_idx, frame_ticks):
-                    self._frame_available_event.set()
+            if stages:
+                stages.run(write_idx, write_dst)
+            letterbox = self._frame_letterbox(frame_width, frame_height)
+            fingerprint = self._frame_fingerprint(write_dst, fingerprints)
+            self._commit(write_idx, frame_ticks, letterbox, fingerprint)
             return
 
         if frame_width > 0 and frame_height > 0:
@@ -57,29 +110,35 @@ class CaptureLoopRunner:
                 current_shape = self._runtime.current_frame_shape()
                 if current_shape is None:
                     return
-                current_height, current_width = current_shape
-                if frame.shape[0] != current_height or frame.shape[1] != current_width:
-                    self._handle_frame_size_change(frame.shape[0], frame.shape[1])
+                if self._runtime.frame_size(frame) != current_shape:
+                    self._handle_frame_size_change(*self._runtime.frame_size(frame))
 
                 write_slot = self._runtime.reserve_write_slot()
                 if write_slot is None:
                     return
                 write_idx, write_dst = write_slot
+                write_hashes = self._runtime.tile_hashes_slot(write_idx)
+                fingerprints = self._runtime.frame_fingerprints is not None
+                stages = self._runtime.stages
 
             np.copyto(write_dst, frame)
-            with self._lock:
-                if self._runtime.commit_write(write_idx, frame_ticks):
-                    self._frame_available_event.set()
+            if write_hashes is not None and self._hash_tiles is not None:
+                self._hash_tiles(write_dst, write_hashes)
+            if stages:
+                stages.run(write_idx, write_dst)
+            letterbox = self._frame_letterbox(frame_width, frame_height)
+            fingerprint = self._frame_fingerprint(write_dst, fingerprints)
+            self._commit(write_idx, frame_ticks, letterbox, fingerprint)
             return
 
         if video_mode:
             with self._lock:
                 duplicate_copy = self._runtime.reserve_duplicate_copy()
+                letterbox = self._runtime.latest_letterbox
+                fingerprint = self._runtime.latest_fingerprint
             if duplicate_copy is None:
                 return
             write_idx, write_dst, previous_dst, frame_ticks = duplicate_copy
             np.copyto(write_dst, previous_dst)
-            with self._lock:
-                if self._runtime.commit_write(write_idx, frame_ticks):
-                    self._frame_available_event.set()
+            self._commit(write_idx, frame_ticks, letterbox, fingerprint)
         return
@@ -1,11 +1,44 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from typing import Any, Protocol
 
 import numpy as np
 from numpy.typing import NDArray
 
-from dxcam.types import Frame
+from dxcam.core.capture_stages import StageChain
+from dxcam.core.frame_pool import FrameAllocator, FrameArena, allocate_frame
+from dxcam.types import Frame, LetterboxTransform
+
+
+class RingStorage(Protocol):
+    """Alternative backing store for the ring buffer.
+
+    Implemented by :class:`dxcam.core.shared_ring.SharedRingWriter` and
+    :class:`dxcam.core.disk_ring.DiskRing`.
+    """
+
+    def allocate(
+        self,
+        max_buffer_len: int,
+        frame_shape: tuple[int, ...],
+        dtype: Any,
+        base_sequence: int,
+    ) -> tuple[Frame, NDArray[np.int64]]:
+        """Return new ``frame_buffer`` and ``frame_time_ticks`` arrays."""
+        ...
+
+    def begin_write(self, slot: int) -> None:
+        """Called when ``slot`` is reserved for writing."""
+        ...
+
+    def publish(self, slot: int, sequence: int) -> None:
+        """Called when frame ``sequence`` is committed to ``slot``."""
+        ...
+
+    def release(self) -> None:
+        """Drop the current allocation."""
+        ...
 
 
 @dataclass
@@ -19,54 +52,211 @@ class CaptureRuntime:
 
     Callers must ensure frame-buffer clear/realloc never runs concurrently from
     a non-producer thread while producer is active.
+
+    ``layout`` is ``"HWC"``, ``"CHW"`` or ``"YUV420"``. ``YUV420`` slots hold
+    one ``(even_h * 3 // 2, even_w)`` plane block (NV12/I420) per frame.
+
+    Multi-region capture (:meth:`allocate_for_regions`) packs every region's
+    frame back to back into one flat slot, so all regions of a frame share
+    one write slot and one timestamp. :meth:`split_regions` views a slot as
+    the per-region frames.
+
+    With ``change_tile_size`` set, every slot also keeps one ``uint64`` hash
+    per ``change_tile_size`` tile of its frame in ``frame_tile_hashes``, next
+    to ``frame_time_ticks``; :meth:`peek_latest_changes` compares the latest
+    two frames tile by tile.
+
+    With ``fingerprint_frames`` set, every committed frame also records a
+    64-bit content fingerprint in ``frame_fingerprints``. ``dedupe`` makes
+    :meth:`commit_write` drop frames whose fingerprint equals the latest
+    committed one and stops :meth:`reserve_duplicate_copy` from repeating
+    frames, so consumers only ever see distinct content.
+
+    ``stages`` are user stages run by the producer before commit; each stage
+    owns one output per slot, allocated alongside ``frame_buffer``.
+
+    ``allocator`` provides the memory of ``frame_buffer``. With ``arena``
+    set, ``frame_buffer`` is taken from that :class:`FrameArena` instead, so
+    rebuilding the ring, including after :meth:`clear`, reuses its memory
+    when the new ring fits.
+
+    Every committed frame gets the next value of ``sequence``, stored per slot
+    in ``frame_sequences``. Sequence numbers start at ``1`` and keep counting
+    across reallocation and :meth:`clear`, so consumers can use them as read
+    cursors for the lifetime of the runtime. :meth:`frames_since` returns
+    every still-buffered frame after a sequence number, in commit order.
+
+    With ``storage`` set, ``frame_buffer`` and ``frame_time_ticks`` come from
+    that :class:`RingStorage` instead of ``allocator``, e.g. shared memory
+    readable from other processes or a memory-mapped file on disk.
     """
 
     max_buffer_len: int
     channel_size: int
+    dtype: np.dtype[Any] = np.dtype(np.uint8)
+    layout: str = "HWC"
     frame_buffer: Frame | None = None
     frame_time_ticks: NDArray[np.int64] | None = None
+    frame_sequences: NDArray[np.int64] | None = None
+    frame_letterbox: list[LetterboxTransform | None] | None = None
     head: int = 0
     tail: int = 0
     full: bool = False
     has_frame: bool = False
     frame_count: int = 0
     latest_frame_ticks: int | None = None
+    latest_letterbox: LetterboxTransform | None = None
+    region_shapes: list[tuple[int, ...]] | None = None
+    change_tile_size: int | None = None
+    frame_tile_hashes: NDArray[np.uint64] | None = None
+    fingerprint_frames: bool = False
+    dedupe: bool = False
+    frame_fingerprints: NDArray[np.uint64] | None = None
+    latest_fingerprint: int | None = None
+    deduped_frames: int = 0
+    stages: StageChain | None = None
+    allocator: FrameAllocator = allocate_frame
+    sequence: int = 0
+    storage: RingStorage | None = None
+    arena: FrameArena | None = None
+
+    def frame_shape(self, frame_height: int, frame_width: int) -> tuple[int, ...]:
+        if self.layout == "YUV420":
+            frame_height += frame_height & 1
+            frame_width += frame_width & 1
+            return frame_height * 3 // 2, frame_width
+        if self.layout == "CHW":
+            return self.channel_size, frame_height, frame_width
+        return frame_height, frame_width, self.channel_size
+
+    def frame_size(self, frame: Frame) -> tuple[int, int]:
+        """Return ``(height, width)`` of one frame in this runtime's layout.
+
+        For ``YUV420`` this is the even-padded luma size.
+        """
+        if self.layout == "YUV420":
+            return frame.shape[0] * 2 // 3, frame.shape[1]
+        if self.layout == "CHW":
+            return frame.shape[1], frame.shape[2]
+        return frame.shape[0], frame.shape[1]
 
     def allocate_for_shape(self, frame_height: int, frame_width: int) -> None:
-        frame_shape = (frame_height, frame_width, self.channel_size)
-        self.frame_buffer = np.empty(
-            (self.max_buffer_len, *frame_shape),
-            dtype=np.uint8,
+        frame_shape = self.frame_shape(frame_height, frame_width)
+        self._allocate_frames(frame_shape)
+        self.region_shapes = None
+        self.frame_tile_hashes = None
+        if self.change_tile_size is not None:
+            tile = self.change_tile_size
+            self.frame_tile_hashes = np.zeros(
+                (
+                    self.max_buffer_len,
+                    -(-frame_height // tile),
+                    -(-frame_width // tile),
+                ),
+                dtype=np.uint64,
+            )
+        if self.stages:
+            self.stages.allocate(self.max_buffer_len)
+        self._reset_slots()
+
+    def allocate_for_regions(self, region_shapes: list[tuple[int, ...]]) -> None:
+        """Allocate flat slots holding one frame per region shape."""
+        total = sum(int(np.prod(shape)) for shape in region_shapes)
+        self._allocate_frames((total,))
+        self.region_shapes = list(region_shapes)
+        self.frame_tile_hashes = None
+        if self.stages:
+            self.stages.release()
+        self._reset_slots()
+
+    def _allocate_frames(self, frame_shape: tuple[int, ...]) -> None:
+        if self.storage is None:
+            shape = (self.max_buffer_len, *frame_shape)
+            if self.arena is not None:
+                self.frame_buffer = None
+                self.frame_buffer = self.arena.take(shape, self.dtype)
+            else:
+                self.frame_buffer = self.allocator(shape, self.dtype)
+            self.frame_time_ticks = np.zeros(self.max_buffer_len, dtype=np.int64)
+            return
+        # Drop views of the previous generation so it can be unmapped.
+        self.frame_buffer = self.frame_time_ticks = None
+        self.frame_buffer, self.frame_time_ticks = self.storage.allocate(
+            self.max_buffer_len, frame_shape, self.dtype, self.sequence
+        )
+
+    def split_regions(self, frame: Frame) -> list[Frame]:
+        """Return per-region views of one flat multi-region slot."""
+        assert self.region_shapes is not None
+        frames = []
+        offset = 0
+        for shape in self.region_shapes:
+            size = int(np.prod(shape))
+            frames.append(frame[offset : offset + size].reshape(shape))
+            offset += size
+        return frames
+
+    def _reset_slots(self) -> None:
+        self.frame_sequences = np.zeros(self.max_buffer_len, dtype=np.int64)
+        self.frame_fingerprints = (
+            np.zeros(self.max_buffer_len, dtype=np.uint64)
+            if self.fingerprint_frames
+            else None
         )
-        self.frame_time_ticks = np.zeros(self.max_buffer_len, dtype=np.int64)
+        self.frame_letterbox = [None] * self.max_buffer_len
         self.head = 0
         self.tail = 0
         self.full = False
         self.has_frame = False
         self.frame_count = 0
         self.latest_frame_ticks = None
+        self.latest_letterbox = None
+        self.latest_fingerprint = None
 
     def clear(self) -> None:
         self.frame_buffer = None
         self.frame_time_ticks = None
+        if self.storage is not None:
+            self.storage.release()
+        self.region_shapes = None
+        self.change_tile_size = None
+        self.frame_tile_hashes = None
+        self.fingerprint_frames = False
+        self.dedupe = False
+        self.frame_fingerprints = None
+        self.latest_fingerprint = None
+        self.deduped_frames = 0
+        if self.stages is not None:
+            self.stages.release()
+            self.stages = None
+        self.frame_sequences = None
+        self.frame_letterbox = None
         self.head = 0
         self.tail = 0
         self.full = False
         self.has_frame = False
         self.frame_count = 0
         self.latest_frame_ticks = None
+        self.latest_letterbox = None
 
     def current_frame_shape(self) -> tuple[int, int] | None:
         if self.frame_buffer is None:
             return None
-        return self.frame_buffer.shape[1], self.frame_buffer.shape[2]
+        return self.frame_size(self.frame_buffer[0])
 
     def reserve_write_slot(self) -> tuple[int, Frame] | None:
         if self.frame_buffer is None:
             return None
         write_idx = self.head
+        if self.storage is not None:
+            self.storage.begin_write(write_idx)
         return write_idx, self.frame_buffer[write_idx]
 
+    def tile_hashes_slot(self, write_idx: int) -> NDArray[np.uint64] | None:
+        if self.frame_tile_hashes is None:
+            return None
+        return self.frame_tile_hashes[write_idx]
+
     def reserve_duplicate_copy(
         self,
     ) -> tuple[int, Frame, Frame, int] | None:
@@ -74,25 +264,59 @@ class CaptureRuntime:
             self.frame_buffer is None
             or self.frame_time_ticks is None
             or not self.has_frame
+            or self.dedupe
         ):
             return None
         write_idx = self.head
+        if self.storage is not None:
+            self.storage.begin_write(write_idx)
         previous_idx = (self.head - 1) % self.max_buffer_len
         dst = self.frame_buffer[write_idx]
         src = self.frame_buffer[previous_idx]
         frame_ticks = int(self.frame_time_ticks[previous_idx])
+        if self.frame_tile_hashes is not None:
+            self.frame_tile_hashes[write_idx] = self.frame_tile_hashes[previous_idx]
+        if self.stages:
+            self.stages.copy_slot(write_idx, previous_idx)
         return write_idx, dst, src, frame_ticks
 
-    def commit_write(self, write_idx: int, frame_ticks: int) -> bool:
-        if self.frame_buffer is None or self.frame_time_ticks is None:
+    def commit_write(
+        self,
+        write_idx: int,
+        frame_ticks: int,
+        letterbox: LetterboxTransform | None = None,
+        fingerprint: int | None = None,
+    ) -> bool:
+        if (
+            self.frame_buffer is None
+            or self.frame_time_ticks is None
+            or self.frame_sequences is None
+            or self.frame_letterbox is None
+        ):
             return False
         if write_idx != self.head:
             return False
+        if (
+            self.dedupe
+            and fingerprint is not None
+            and fingerprint == self.latest_fingerprint
+        ):
+            self.deduped_frames += 1
+            return False
         if self.full:
             self.tail = (self.tail + 1) % self.max_buffer_len
+        self.sequence += 1
         self.frame_time_ticks[write_idx] = frame_ticks
+        self.frame_sequences[write_idx] = self.sequence
+        if self.storage is not None:
+            self.storage.publish(write_idx, self.sequence)
+        self.frame_letterbox[write_idx] = letterbox
+        if self.frame_fingerprints is not None and fingerprint is not None:
+            self.frame_fingerprints[write_idx] = fingerprint
+            self.latest_fingerprint = fingerprint
         self.head = (write_idx + 1) % self.max_buffer_len
         self.latest_frame_ticks = frame_ticks
+        self.latest_letterbox = letterbox
         self.frame_count += 1
         self.full = self.head == self.tail
         self.has_frame = True
@@ -121,3 +345,125 @@ class CaptureRuntime:
         if copy:
             return np.array(frame, copy=True), frame_ticks
         return frame, frame_ticks
+
+    def peek_latest_sequence(self) -> int | None:
+        if self.frame_sequences is None or not self.has_frame:
+            return None
+        latest_idx = (self.head - 1) % self.max_buffer_len
+        return int(self.frame_sequences[latest_idx])
+
+    def frames_since(
+        self, sequence: int, copy: bool = True
+    ) -> tuple[tuple[Frame, ...], NDArray[np.int64], NDArray[np.int64], int]:
+        """Return the buffered frames committed after ``sequence``, oldest first.
+
+        When the ring is full, its oldest slot is the producer's next write
+        slot and is not returned.
+
+        Args:
+            sequence: Sequence number of the last frame already read.
+            copy: Copy the frames into one new block. With ``False`` the
+                frames are returned as one or two ``(n, *frame_shape)`` views
+                of ``frame_buffer``, split where the ring wraps around; they
+                are overwritten once the producer laps them.
+
+        Returns:
+            ``(chunks, sequences, frame_ticks, dropped)``: frame blocks,
+            per-frame sequence numbers and ticks, and the number of frames
+            after ``sequence`` that were overwritten before this call.
+        """
+        return self.frames_between(sequence + 1, self.sequence, copy=copy)
+
+    def readable_sequences(self) -> tuple[int, int] | None:
+        """Return ``(oldest, latest)`` readable sequence numbers, if any."""
+        if self.frame_buffer is None or not self.has_frame:
+            return None
+        if self.full:
+            readable = self.max_buffer_len - 1
+        else:
+            readable = (self.head - self.tail) % self.max_buffer_len
+        return self.sequence - readable + 1, self.sequence
+
+    def frames_between(
+        self, first: int, last: int, copy: bool = True
+    ) -> tuple[tuple[Frame, ...], NDArray[np.int64], NDArray[np.int64], int]:
+        """Return buffered frames ``first`` to ``last`` (inclusive), oldest first.
+
+        Same result as :meth:`frames_since`; ``dropped`` counts the requested
+        frames that are no longer buffered.
+        """
+        empty = np.empty(0, dtype=np.int64)
+        readable = self.readable_sequences()
+        last = min(last, self.sequence)
+        if readable is None:
+            return (), empty, empty, max(0, last - first + 1)
+        assert self.frame_buffer is not None
+        assert self.frame_time_ticks is not None and self.frame_sequences is not None
+        oldest = readable[0]
+        dropped = max(0, min(oldest - 1, last) - first + 1)
+        first = max(first, oldest)
+        count = last - first + 1
+        if count <= 0:
+            return (), empty, empty, dropped
+        start = (self.head - (self.sequence - first + 1)) % self.max_buffer_len
+        if start + count <= self.max_buffer_len:
+            spans = [slice(start, start + count)]
+        else:
+            spans = [
+                slice(start, self.max_buffer_len),
+                slice(0, start + count - self.max_buffer_len),
+            ]
+        chunks = tuple(self.frame_buffer[span] for span in spans)
+        if copy:
+            chunks = (np.concatenate(chunks),)
+        sequences = np.concatenate([self.frame_sequences[span] for span in spans])
+        frame_ticks = np.concatenate([self.frame_time_ticks[span] for span in spans])
+        return chunks, sequences, frame_ticks, dropped
+
+    def count_overwritten(
+        self, sequences: NDArray[np.int64], frame_buffer: Frame | None
+    ) -> int:
+        """Return how many of ``sequences`` the producer has overwritten since.
+
+        ``sequences`` come from :meth:`frames_between` views of
+        ``frame_buffer`` read without the lock. They are consecutive, so the
+        overwritten frames are a prefix; a reallocated ring loses them all.
+        """
+        if not len(sequences):
+            return 0
+        readable = self.readable_sequences()
+        if readable is None or self.frame_buffer is not frame_buffer:
+            return len(sequences)
+        return min(max(0, readable[0] - int(sequences[0])), len(sequences))
+
+    def peek_latest_changes(self) -> NDArray[np.bool_] | None:
+        """Return per-tile ``True`` where the latest frame differs from the one before.
+
+        Every tile is marked changed for the first frame after (re)allocation.
+        """
+        if self.frame_tile_hashes is None or not self.has_frame:
+            return None
+        latest_idx = (self.head - 1) % self.max_buffer_len
+        latest = self.frame_tile_hashes[latest_idx]
+        if self.frame_count < 2:
+            return np.ones(latest.shape, dtype=np.bool_)
+        previous = self.frame_tile_hashes[(self.head - 2) % self.max_buffer_len]
+        return latest != previous
+
+    def peek_latest_fingerprint(self) -> int | None:
+        if self.frame_fingerprints is None or not self.has_frame:
+            return None
+        latest_idx = (self.head - 1) % self.max_buffer_len
+        return int(self.frame_fingerprints[latest_idx])
+
+    def peek_latest_stage_outputs(self, copy: bool = True) -> dict[str, Frame]:
+        if not self.stages or not self.has_frame:
+            return {}
+        latest_idx = (self.head - 1) % self.max_buffer_len
+        return self.stages.outputs(latest_idx, copy=copy)
+
+    def peek_latest_letterbox(self) -> LetterboxTransform | None:
+        if self.frame_letterbox is None or not self.has_frame:
+            return None
+        latest_idx = (self.head - 1) % self.max_buffer_len
+        return self.frame_letterbox[latest_idx]
@@ -0,0 +1,197 @@
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Sequence
+
+import numpy as np
+
+from dxcam.types import Frame
+
+#: Stage callable: ``fn(src, out)`` reads ``src`` and writes into ``out``.
+StageFn = Callable[[Frame, Frame], None]
+
+
+@dataclass(frozen=True)
+class StageStats:
+    """Timing of one capture stage.
+
+    Attributes:
+        calls: Number of frames the stage has processed.
+        total_seconds: Summed wall time spent in the stage.
+        last_seconds: Wall time of the most recent call.
+        max_seconds: Slowest call so far.
+    """
+
+    calls: int
+    total_seconds: float
+    last_seconds: float
+    max_seconds: float
+
+    @property
+    def mean_seconds(self) -> float:
+        return self.total_seconds / self.calls if self.calls else 0.0
+
+
+@dataclass
+class CaptureStage:
+    """A user stage run by the capture thread on every new frame.
+
+    ``buffers`` holds one ``out_shape`` output per ring-buffer slot, so each
+    stage output stays paired with the frame it was computed from.
+    """
+
+    name: str
+    fn: StageFn
+    out_shape: tuple[int, ...]
+    out_dtype: np.dtype[Any]
+    source: str | None = None
+    buffers: Frame | None = None
+    calls: int = 0
+    total_ns: int = 0
+    last_ns: int = 0
+    max_ns: int = 0
+
+    def allocate(self, slots: int) -> None:
+        self.buffers = np.zeros((slots, *self.out_shape), dtype=self.out_dtype)
+
+    def record(self, elapsed_ns: int) -> None:
+        self.calls += 1
+        self.total_ns += elapsed_ns
+        self.last_ns = elapsed_ns
+        if elapsed_ns > self.max_ns:
+            self.max_ns = elapsed_ns
+
+    def stats(self) -> StageStats:
+        return StageStats(
+            calls=self.calls,
+            total_seconds=self.total_ns / 1e9,
+            last_seconds=self.last_ns / 1e9,
+            max_seconds=self.max_ns / 1e9,
+        )
+
+    def reset_stats(self) -> None:
+        self.calls = 0
+        self.total_ns = 0
+        self.last_ns = 0
+        self.max_ns = 0
+
+
+@dataclass
+class StageChain:
+    """Ordered capture stages; a stage reads the frame or an earlier stage.
+
+    Stage timings are recorded and read under ``stats_lock``, so a reset
+    from another thread never interleaves with the capture thread's update.
+    """
+
+    stages: list[CaptureStage] = field(default_factory=list)
+    stats_lock: threading.Lock = field(
+        default_factory=threading.Lock, repr=False, compare=False
+    )
+
+    def __bool__(self) -> bool:
+        return bool(self.stages)
+
+    def names(self) -> list[str]:
+        return [stage.name for stage in self.stages]
+
+    def add(
+        self,
+        fn: StageFn,
+        out_shape: Sequence[int],
+        out_dtype: Any = np.uint8,
+        name: str | None = None,
+        source: str | None = None,
+    ) -> CaptureStage:
+        """Validate and append a stage.
+
+        Raises:
+            TypeError: If ``fn`` is not callable.
+            ValueError: If ``out_shape`` is invalid, ``name`` is taken, or
+                ``source`` does not name an earlier stage.
+        """
+        if not callable(fn):
+            raise TypeError("Stage fn must be callable.")
+        shape = tuple(int(dim) for dim in out_shape)
+        if not shape or any(dim <= 0 for dim in shape):
+            raise ValueError(
+                f"out_shape must be a non-empty tuple of positive ints, got {out_shape}."
+            )
+        if name is None:
+            name = getattr(fn, "__name__", "stage")
+            if name in self.names():
+                name = f"{name}_{len(self.stages)}"
+        if name in self.names():
+            raise ValueError(f"A stage named {name!r} is already registered.")
+        if source is not None and source not in self.names():
+            raise ValueError(f"Stage source {source!r} is not a registered stage.")
+        stage = CaptureStage(
+            name=name,
+            fn=fn,
+            out_shape=shape,
+            out_dtype=np.dtype(out_dtype),
+            source=source,
+        )
+        self.stages.append(stage)
+        return stage
+
+    def remove(self, name: str) -> None:
+        """Remove stage ``name``.
+
+        Raises:
+            KeyError: If no such stage exists.
+            ValueError: If another stage reads from it.
+        """
+        if name not in self.names():
+            raise KeyError(name)
+        dependents = [stage.name for stage in self.stages if stage.source == name]
+        if dependents:
+            raise ValueError(f"Stages {dependents} read from stage {name!r}.")
+        self.stages = [stage for stage in self.stages if stage.name != name]
+
+    def allocate(self, slots: int) -> None:
+        for stage in self.stages:
+            stage.allocate(slots)
+
+    def release(self) -> None:
+        for stage in self.stages:
+            stage.buffers = None
+
+    def run(self, slot: int, frame: Frame) -> None:
+        """Run every stage for the frame in ring slot ``slot``."""
+        outputs: dict[str, Frame] = {}
+        for stage in self.stages:
+            assert stage.buffers is not None
+            src = frame if stage.source is None else outputs[stage.source]
+            out = stage.buffers[slot]
+            start = time.perf_counter_ns()
+            stage.fn(src, out)
+            elapsed = time.perf_counter_ns() - start
+            with self.stats_lock:
+                stage.record(elapsed)
+            outputs[stage.name] = out
+
+    def stats(self, reset: bool = False) -> dict[str, StageStats]:
+        """Return per-stage timing, optionally zeroing it in the same step."""
+        with self.stats_lock:
+            stats = {stage.name: stage.stats() for stage in self.stages}
+            if reset:
+                for stage in self.stages:
+                    stage.reset_stats()
+        return stats
+
+    def copy_slot(self, dst_slot: int, src_slot: int) -> None:
+        for stage in self.stages:
+            if stage.buffers is not None:
+                stage.buffers[dst_slot] = stage.buffers[src_slot]
+
+    def outputs(self, slot: int, copy: bool = True) -> dict[str, Frame]:
+        result: dict[str, Frame] = {}
+        for stage in self.stages:
+            if stage.buffers is None:
+                continue
+            out = stage.buffers[slot]
+            result[stage.name] = np.array(out, copy=True) if copy else out
+        return result
@@ -0,0 +1,209 @@
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from threading import Condition
+from typing import Callable, Iterator
+
+import numpy as np
+from numpy.typing import NDArray
+
+from dxcam.core.capture_runtime import CaptureRuntime
+from dxcam.types import Frame
+
+CopyFrameFn = Callable[[Frame, "Frame | None"], Frame]
+TicksToSecondsFn = Callable[[int], float]
+
+
+@dataclass(frozen=True)
+class FrameBatch:
+    """Consecutive buffered frames in commit order.
+
+    Attributes:
+        chunks: One or two ``(n, *frame_shape)`` blocks holding the frames.
+            Zero-copy batches view the ring buffer and split where it wraps
+            around; copied batches are a single caller-owned block.
+        sequences: Sequence number of every frame.
+        timestamps: Timestamp in seconds of every frame.
+        dropped: Frames after the requested sequence that were overwritten
+            before they could be read.
+    """
+
+    chunks: tuple[Frame, ...]
+    sequences: NDArray[np.int64]
+    timestamps: NDArray[np.float64]
+    dropped: int
+
+    def __len__(self) -> int:
+        return len(self.sequences)
+
+    def __iter__(self) -> Iterator[Frame]:
+        for chunk in self.chunks:
+            yield from chunk
+
+    def stacked(self) -> Frame:
+        """Return all frames as one ``(n, *frame_shape)`` array.
+
+        Copies only when the batch is split into two chunks.
+        """
+        if len(self.chunks) == 1:
+            return self.chunks[0]
+        return np.concatenate(self.chunks)
+
+
+class CaptureSubscription:
+    """Independent reader of a capture ring buffer.
+
+    Each subscription keeps its own read cursor (the sequence number of the
+    last frame it returned) and waits on ``frame_committed`` for a frame newer
+    than that cursor, so any number of subscriptions can read one camera
+    without consuming each other's wakeups.
+
+    :meth:`read` jumps to the newest frame; :meth:`read_batch` and
+    :meth:`iter_frames` return every buffered frame after the cursor in
+    order. Frames after the cursor that a read skipped or that were
+    overwritten first are counted in :attr:`overruns`.
+
+    Created by :meth:`dxcam.DXCamera.subscribe`; ``frame_committed`` must be a
+    condition on the lock guarding ``runtime``.
+    """
+
+    def __init__(
+        self,
+        *,
+        frame_committed: Condition,
+        runtime: CaptureRuntime,
+        copy_frame: CopyFrameFn,
+        ticks_to_seconds: TicksToSecondsFn,
+        since: int | None = None,
+    ) -> None:
+        self._frame_committed = frame_committed
+        self._runtime = runtime
+        self._copy_frame = copy_frame
+        self._ticks_to_seconds = ticks_to_seconds
+        with frame_committed:
+            #: Sequence number of the last frame returned by :meth:`read`.
+            self.cursor: int = runtime.sequence if since is None else since
+        #: Frames committed after ``cursor`` that were never returned.
+        self.overruns: int = 0
+
+    @property
+    def pending(self) -> int:
+        """Frames committed since the last :meth:`read`."""
+        with self._frame_committed:
+            return max(0, self._runtime.sequence - self.cursor)
+
+    def _wait_for_frame(self, timeout: float | None) -> bool:
+        # Caller holds ``_frame_committed``.
+        deadline = None if timeout is None else time.monotonic() + timeout
+        runtime = self._runtime
+        while True:
+            if runtime.frame_buffer is None:
+                return False
+            if runtime.has_frame and runtime.sequence > self.cursor:
+                return True
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                return False
+            self._frame_committed.wait(remaining)
+
+    def read(
+        self,
+        copy: bool = True,
+        timeout: float | None = None,
+        with_timestamp: bool = False,
+        out: Frame | None = None,
+    ) -> Frame | list[Frame] | tuple[Frame | list[Frame], float] | None:
+        """Wait for a frame newer than :attr:`cursor` and return the latest.
+
+        Args:
+            copy: Return caller-owned memory when ``True`` (default). Set
+                ``False`` for a view into the ring buffer, valid until the
+                producer wraps around to its slot.
+            timeout: Seconds to wait, or ``None`` to wait until a frame
+                arrives or capture stops.
+            with_timestamp: Return ``(frame, timestamp_seconds)``.
+            out: Optional caller-owned frame to copy into. Implies ``copy``.
+
+        Returns:
+            The newest frame (per-region frames for ``start(regions=...)``
+            capture), optionally with its timestamp, or ``None`` on timeout
+            or when capture is not running.
+
+        Raises:
+            ValueError: If ``out`` does not match the buffered frame.
+        """
+        runtime = self._runtime
+        with self._frame_committed:
+            if not self._wait_for_frame(timeout):
+                return None
+            latest = runtime.peek_latest_with_ticks(copy=False)
+            sequence = runtime.peek_latest_sequence()
+            assert latest is not None and sequence is not None
+            frame, frame_ticks = latest
+            if copy or out is not None:
+                frame = self._copy_frame(frame, out)
+            self.overruns += sequence - self.cursor - 1
+            self.cursor = sequence
+            result: Frame | list[Frame] = (
+                runtime.split_regions(frame)
+                if runtime.region_shapes is not None
+                else frame
+            )
+        if with_timestamp:
+            return result, self._ticks_to_seconds(frame_ticks)
+        return result
+
+    def read_batch(
+        self, copy: bool = True, timeout: float | None = None
+    ) -> FrameBatch | None:
+        """Wait for frames newer than :attr:`cursor` and return all of them.
+
+        Args:
+            copy: Copy the frames into one caller-owned block (default). Set
+                ``False`` for up to two zero-copy views of the ring buffer,
+                valid until the producer laps them.
+            timeout: Seconds to wait for a first frame, or ``None`` to wait
+                until one arrives or capture stops.
+
+        Returns:
+            The frames in commit order (empty on timeout), or ``None`` when
+            capture is not running. Multi-region frames are flat slots; see
+            :meth:`CaptureRuntime.split_regions`.
+        """
+        runtime = self._runtime
+        with self._frame_committed:
+            self._wait_for_frame(timeout)
+            if runtime.frame_buffer is None:
+                return None
+            chunks, sequences, frame_ticks, dropped = runtime.frames_since(
+                self.cursor, copy=copy
+            )
+            # Buffered sequences are consecutive, so skip the dropped frames too.
+            self.overruns += dropped
+            self.cursor += dropped + len(sequences)
+        timestamps = np.array(
+            [self._ticks_to_seconds(int(ticks)) for ticks in frame_ticks],
+            dtype=np.float64,
+        )
+        return FrameBatch(chunks, sequences, timestamps, dropped)
+
+    def iter_frames(
+        self, copy: bool = True, timeout: float | None = None
+    ) -> Iterator[tuple[Frame | list[Frame], float]]:
+        """Yield ``(frame, timestamp_seconds)`` for every frame, in order.
+
+        Stops when capture stops or no frame arrives within ``timeout``.
+        Zero-copy frames must be consumed before the producer laps them;
+        check :attr:`overruns` for frames that were overwritten unread.
+        """
+        while True:
+            batch = self.read_batch(copy=copy, timeout=timeout)
+            if batch is None or not len(batch):
+                return
+            regions = self._runtime.region_shapes is not None
+            for frame, timestamp in zip(batch, batch.timestamps.tolist()):
+                if regions:
+                    yield self._runtime.split_regions(frame), timestamp
+                else:
+                    yield frame, timestamp
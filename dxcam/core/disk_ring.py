@@ -0,0 +1,110 @@
+"""Disk-backed capture ring buffer.
+
+:class:`DiskRing` stores the ring's frames in a ``np.memmap`` file so the
+replay window is bounded by disk space rather than RAM. Writes go to the
+memory mapping, so the OS page cache absorbs them and flushes dirty pages in
+the background; committing a frame stays an in-memory metadata update.
+Frame ticks and sequence numbers are small and stay in RAM.
+"""
+
+from __future__ import annotations
+
+import os
+import tempfile
+import weakref
+from typing import Any
+
+import numpy as np
+from numpy.typing import NDArray
+
+from dxcam.types import Frame
+
+
+class DiskRing:
+    """``np.memmap`` storage for :class:`dxcam.core.capture_runtime.CaptureRuntime`.
+
+    Every (re)allocation creates a new file ``dxcam-ring-*.bin`` in
+    ``directory``; the previous one is deleted as soon as nothing maps it.
+
+    Args:
+        directory: Directory for ring files, ``None`` for the system
+            temporary directory.
+        preallocate: Reserve the file's blocks at allocation instead of on
+            first write. Uses ``posix_fallocate`` where available and sizes
+            the file otherwise; no frame data is written up front.
+
+    Raises:
+        FileNotFoundError: If ``directory`` does not exist.
+    """
+
+    def __init__(self, directory: str | None = None, preallocate: bool = False) -> None:
+        if directory is not None and not os.path.isdir(directory):
+            raise FileNotFoundError(f"Ring directory '{directory}' does not exist.")
+        self.directory = directory
+        self.preallocate = preallocate
+        self.path: str | None = None
+        self._delete_on_unmap: weakref.finalize | None = None
+
+    def allocate(
+        self,
+        max_buffer_len: int,
+        frame_shape: tuple[int, ...],
+        dtype: Any,
+        base_sequence: int,
+    ) -> tuple[Frame, NDArray[np.int64]]:
+        """Create a new ring file and return its frames and (in-memory) ticks."""
+        self.release()
+        dtype = np.dtype(dtype)
+        shape = (max_buffer_len, *frame_shape)
+        fd, path = tempfile.mkstemp(
+            prefix="dxcam-ring-", suffix=".bin", dir=self.directory
+        )
+        try:
+            if self.preallocate:
+                _reserve(fd, int(np.prod(shape)) * dtype.itemsize)
+        finally:
+            os.close(fd)
+        frames = np.memmap(
+            path, dtype=dtype, mode="r+" if self.preallocate else "w+", shape=shape
+        )
+        # Windows refuses to delete a mapped file, so release() may fail while
+        # views of the ring are alive; delete it once the mapping is closed.
+        self._delete_on_unmap = weakref.finalize(frames.base, _remove, path)
+        self.path = path
+        return frames, np.zeros(max_buffer_len, dtype=np.int64)
+
+    def begin_write(self, slot: int) -> None:
+        """No-op; slot validity is tracked by the runtime's sequences."""
+
+    def publish(self, slot: int, sequence: int) -> None:
+        """No-op; the page cache writes slots back on its own schedule."""
+
+    def release(self) -> None:
+        """Delete the current ring file once its mapping is gone."""
+        if self.path is not None:
+            assert self._delete_on_unmap is not None
+            if _remove(self.path):
+                self._delete_on_unmap.detach()
+            self.path = self._delete_on_unmap = None
+
+    def close(self) -> None:
+        self.release()
+
+
+def _reserve(fd: int, size: int) -> None:
+    if hasattr(os, "posix_fallocate"):
+        os.posix_fallocate(fd, 0, size)
+    else:
+        # Extending a file on NTFS allocates its clusters without writing.
+        os.ftruncate(fd, size)
+
+
+def _remove(path: str) -> bool:
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        return True
+    except OSError:
+        # Still mapped on Windows; the finalizer retries.
+        return False
+    return True
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import ctypes
+import ctypes.wintypes as wintypes
 import logging
 import os
 from dataclasses import InitVar, dataclass, field
@@ -8,11 +9,16 @@ from typing import Any, cast
 
 import comtypes
 
-from dxcam._libs.d3d11 import DXGI_FORMAT_B8G8R8A8_UNORM, ID3D11Texture2D
+from dxcam._libs.d3d11 import (
+    DXGI_FORMAT_B8G8R8A8_UNORM,
+    DXGI_FORMAT_NAMES,
+    ID3D11Texture2D,
+)
 from dxcam._libs.dxgi import (
     DXGI_OUTDUPL_FLAG_NONE,
     DXGI_ERROR_WAIT_TIMEOUT,
     DXGI_OUTDUPL_FRAME_INFO,
+    DXGI_OUTDUPL_POINTER_SHAPE_INFO,
     IDXGIOutputDuplication,
     IDXGIOutput5,
     IDXGIResource,
@@ -25,6 +31,7 @@ from dxcam.core.dxgi_errors import (
     is_transient_hresult,
 )
 from dxcam.core.output import Output
+from dxcam.core.pointer import CursorShape, decode_pointer_shape
 
 logger = logging.getLogger(__name__)
 ENABLE_DUPLICATE_OUTPUT1 = os.getenv("DXCAM_USE_DUPLICATE_OUTPUT1", "1").lower() in {
@@ -49,6 +56,16 @@ class DXGIDuplicator:
     accumulated_frames: int = 0
     # ticks per second of the system
     performance_frequency: int = 0
+    # Desktop format requested from DuplicateOutput1; the legacy
+    # DuplicateOutput path only delivers B8G8R8A8.
+    dxgi_format: int = DXGI_FORMAT_B8G8R8A8_UNORM
+    # Pointer state for software cursor compositing, kept only when
+    # track_pointer is set. The shape is fetched on shape-change frames.
+    track_pointer: bool = False
+    pointer_visible: bool = False
+    pointer_position: tuple[int, int] = (0, 0)
+    pointer_shape: CursorShape | None = None
+    _pointer_buffer: Any = None
     _frame_held: bool = False
 
     def __post_init__(self, output: Output | None, device: Device | None) -> None:
@@ -69,6 +86,12 @@ class DXGIDuplicator:
             output_ptr=output_ptr, device=device
         ):
             return
+        if self.dxgi_format != DXGI_FORMAT_B8G8R8A8_UNORM:
+            raise RuntimeError(
+                f"Capturing {DXGI_FORMAT_NAMES[self.dxgi_format]} requires "
+                "IDXGIOutput5.DuplicateOutput1 (Windows 10 1703+ and "
+                "DXCAM_USE_DUPLICATE_OUTPUT1 enabled)."
+            )
         if not ENABLE_DUPLICATE_OUTPUT1:
             logger.debug(
                 "Using legacy IDXGIOutput1.DuplicateOutput. "
@@ -95,7 +118,8 @@ class DXGIDuplicator:
         except comtypes.COMError:
             return False
 
-        supported_formats = (ctypes.c_uint * 1)(DXGI_FORMAT_B8G8R8A8_UNORM)
+        # DuplicateOutput1 converts the desktop to the single listed format.
+        supported_formats = (ctypes.c_uint * 1)(self.dxgi_format)
         try:
             output5.DuplicateOutput1(
                 ctypes.cast(device.device, ctypes.c_void_p),
@@ -162,6 +186,8 @@ class DXGIDuplicator:
                 return False
             raise
         self._frame_held = True
+        if self.track_pointer:
+            self._update_pointer(info)
         try:
             resource = cast(Any, res)
             self.texture = resource.QueryInterface(ID3D11Texture2D)
@@ -181,6 +207,40 @@ class DXGIDuplicator:
         self.updated = True
         return True
 
+    def _update_pointer(self, info: DXGI_OUTDUPL_FRAME_INFO) -> None:
+        # Position and visibility are only valid on frames with mouse updates.
+        if int(info.LastMouseUpdateTime) > 0:
+            position = info.PointerPosition
+            self.pointer_visible = bool(position.Visible)
+            self.pointer_position = (int(position.Position.x), int(position.Position.y))
+        size = int(info.PointerShapeBufferSize)
+        if size == 0:
+            return
+        if self._pointer_buffer is None or len(self._pointer_buffer) < size:
+            self._pointer_buffer = (ctypes.c_ubyte * size)()
+        required = wintypes.UINT()
+        shape_info = DXGI_OUTDUPL_POINTER_SHAPE_INFO()
+        try:
+            self.duplicator.GetFramePointerShape(
+                len(self._pointer_buffer),
+                ctypes.cast(self._pointer_buffer, ctypes.c_void_p),
+                ctypes.byref(required),
+                ctypes.byref(shape_info),
+            )
+            self.pointer_shape = decode_pointer_shape(
+                int(shape_info.Type),
+                int(shape_info.Width),
+                int(shape_info.Height),
+                int(shape_info.Pitch),
+                self._pointer_buffer,
+                (int(shape_info.HotSpot.x), int(shape_info.HotSpot.y)),
+            )
+        except (comtypes.COMError, ValueError):
+            logger.debug(
+                "Failed to read pointer shape; keeping the previous one.",
+                exc_info=True,
+            )
+
     @property
     def latest_frame_time(self) -> float:
         return self.ticks_to_seconds(self.latest_frame_ticks)
@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+import threading
+import weakref
+from typing import Any, Protocol
+
+import numpy as np
+
+from dxcam.types import Frame
+
+
+class FrameAllocator(Protocol):
+    """Allocates uninitialized frame memory.
+
+    Called as ``allocator(shape, dtype)`` and must return a writable,
+    C-contiguous array of exactly that shape and dtype. Plug in pinned,
+    shared or aligned memory by returning arrays that wrap it.
+    """
+
+    def __call__(self, shape: tuple[int, ...], dtype: np.dtype[Any]) -> Frame: ...
+
+
+def allocate_frame(shape: tuple[int, ...], dtype: np.dtype[Any]) -> Frame:
+    """Default :class:`FrameAllocator`: plain ``np.empty``."""
+    return np.empty(shape, dtype=dtype)
+
+
+def aligned_allocator(alignment: int = 64) -> FrameAllocator:
+    """Return a :class:`FrameAllocator` whose arrays start on ``alignment`` bytes.
+
+    Raises:
+        ValueError: If ``alignment`` is not a positive power of two.
+    """
+    if alignment <= 0 or alignment & (alignment - 1):
+        raise ValueError(f"alignment must be a power of two, got {alignment}.")
+
+    def allocate(shape: tuple[int, ...], dtype: np.dtype[Any]) -> Frame:
+        dtype = np.dtype(dtype)
+        nbytes = int(np.prod(shape)) * dtype.itemsize
+        raw = np.empty(nbytes + alignment, dtype=np.uint8)
+        offset = -raw.ctypes.data % alignment
+        return raw[offset : offset + nbytes].view(dtype).reshape(shape)
+
+    return allocate
+
+
+class FramePool:
+    """Recycling pool of caller-owned frames.
+
+    :meth:`acquire` hands out a free frame of the requested shape and dtype,
+    allocating one with ``allocator`` when none is free. Frames passed back
+    to :meth:`recycle` are reused by later calls, up to ``max_free`` idle
+    frames per shape/dtype. Frames that are never recycled are simply
+    garbage collected; the pool keeps no strong reference to them.
+    """
+
+    def __init__(
+        self, allocator: FrameAllocator = allocate_frame, max_free: int = 4
+    ) -> None:
+        if max_free < 0:
+            raise ValueError(f"max_free must be >= 0, got {max_free}.")
+        self.allocator = allocator
+        self.max_free = max_free
+        self._lock = threading.Lock()
+        self._free: dict[tuple[tuple[int, ...], str], list[Frame]] = {}
+        self._issued: weakref.WeakValueDictionary[int, Frame] = (
+            weakref.WeakValueDictionary()
+        )
+        self.allocated = 0
+        self.reused = 0
+
+    def acquire(self, shape: tuple[int, ...], dtype: Any) -> Frame:
+        """Return a frame of ``shape``/``dtype``; its contents are undefined."""
+        dtype = np.dtype(dtype)
+        key = (tuple(shape), dtype.str)
+        with self._lock:
+            free = self._free.get(key)
+            if free:
+                frame = free.pop()
+                self.reused += 1
+            else:
+                frame = None
+        if frame is None:
+            frame = self.allocator(key[0], dtype)
+            if frame.shape != key[0] or frame.dtype != dtype:
+                raise ValueError(
+                    f"Allocator returned shape {frame.shape} and dtype "
+                    f"{frame.dtype}, expected {key[0]} and {dtype}."
+                )
+            with self._lock:
+                self.allocated += 1
+        with self._lock:
+            self._issued[id(frame)] = frame
+        return frame
+
+    def recycle(self, frame: Frame) -> bool:
+        """Take back a frame from :meth:`acquire` for reuse.
+
+        The caller must not touch ``frame`` afterwards. Arrays the pool did
+        not hand out (including views of pool frames) are ignored.
+
+        Returns:
+            ``True`` if the frame was taken back.
+        """
+        with self._lock:
+            if self._issued.get(id(frame)) is not frame:
+                return False
+            del self._issued[id(frame)]
+            free = self._free.setdefault((frame.shape, frame.dtype.str), [])
+            if len(free) < self.max_free:
+                free.append(frame)
+            return True
+
+    def clear(self) -> None:
+        """Drop every idle frame."""
+        with self._lock:
+            self._free.clear()
+
+
+class FrameArena:
+    """Reusable backing memory for the capture ring buffer.
+
+    :meth:`take` returns an array of the requested shape and dtype that views
+    the arena's memory, growing it with ``allocator`` only when the request
+    does not fit the current capacity. Smaller or equal requests reshape the
+    same memory in place, so restarting capture or rebuilding the ring after
+    a size change reuses pages that are already mapped instead of faulting in
+    a fresh allocation. New memory is never initialized here; the OS maps its
+    pages as slots are first written.
+
+    Memory is only reused once every array viewing it is gone. While an array
+    from an earlier :meth:`take` call, or a view of it, is still referenced,
+    :meth:`take` allocates new memory instead, so frames a consumer holds keep
+    their contents.
+    """
+
+    def __init__(self, allocator: FrameAllocator = allocate_frame) -> None:
+        self.allocator = allocator
+        self._memory: Frame | None = None
+        # Base of every view handed out since the last take(); alive while
+        # any of them is.
+        self._views: weakref.ref[Frame] | None = None
+        self.allocated = 0
+        self.reused = 0
+
+    @property
+    def capacity(self) -> int:
+        """Bytes currently held by the arena."""
+        return 0 if self._memory is None else self._memory.nbytes
+
+    def take(self, shape: tuple[int, ...], dtype: Any) -> Frame:
+        """Return a ``shape``/``dtype`` view of the arena; contents undefined."""
+        dtype = np.dtype(dtype)
+        nbytes = int(np.prod(shape)) * dtype.itemsize
+        if (
+            self._memory is None
+            or self._memory.nbytes < nbytes
+            or (self._views is not None and self._views() is not None)
+        ):
+            # Drop the old block first so both are never held at once.
+            self._memory = None
+            self._memory = self.allocator((nbytes,), np.dtype(np.uint8))
+            self.allocated += 1
+        else:
+            self.reused += 1
+        # A fresh base per generation: NumPy points every view of it here
+        # rather than at ``_memory``, since it wraps a buffer, not an array.
+        owner = np.frombuffer(self._memory.data, dtype=np.uint8)
+        self._views = weakref.ref(owner)
+        return owner[:nbytes].view(dtype).reshape(shape)
+
+    def trim(self) -> int:
+        """Release the arena's memory and return the bytes released.
+
+        Arrays still viewing it keep it alive until they are dropped.
+        """
+        capacity = self.capacity
+        self._memory = self._views = None
+        return capacity
@@ -0,0 +1,103 @@
+"""Mouse pointer shapes reported by Desktop Duplication.
+
+``GetFramePointerShape`` returns a shape only when the pointer changes.
+:func:`decode_pointer_shape` turns that buffer into a :class:`CursorShape`
+once; :class:`dxcam.processor.cursor.CursorCompositor` draws it into frames.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+from numpy.typing import NDArray
+
+#: ``DXGI_OUTDUPL_POINTER_SHAPE_TYPE`` values.
+POINTER_SHAPE_MONOCHROME = 1
+POINTER_SHAPE_COLOR = 2
+POINTER_SHAPE_MASKED_COLOR = 4
+
+
+@dataclass(frozen=True)
+class CursorShape:
+    """Decoded pointer shape.
+
+    Attributes:
+        color: ``(height, width, 4)`` BGRA pixels. Alpha-blended over the
+            frame when ``and_mask`` is ``None``, otherwise the XOR values.
+        and_mask: ``None`` for color cursors, else a ``(height, width)``
+            mask of ``0x00``/``0xFF`` applied as ``(dst & mask) ^ color``.
+        hot_spot: Click point ``(x, y)`` within the shape.
+    """
+
+    color: NDArray[np.uint8]
+    and_mask: NDArray[np.uint8] | None = None
+    hot_spot: tuple[int, int] = (0, 0)
+
+    @property
+    def width(self) -> int:
+        return int(self.color.shape[1])
+
+    @property
+    def height(self) -> int:
+        return int(self.color.shape[0])
+
+
+def decode_pointer_shape(
+    shape_type: int,
+    width: int,
+    height: int,
+    pitch: int,
+    buffer: Any,
+    hot_spot: tuple[int, int] = (0, 0),
+) -> CursorShape:
+    """Decode a ``GetFramePointerShape`` buffer.
+
+    Args:
+        shape_type: ``POINTER_SHAPE_MONOCHROME``, ``POINTER_SHAPE_COLOR`` or
+            ``POINTER_SHAPE_MASKED_COLOR``.
+        width: Shape width in pixels.
+        height: Shape height in rows as reported by DXGI; monochrome shapes
+            stack the AND mask over the XOR mask, so the cursor is half as tall.
+        pitch: Bytes per row of ``buffer``.
+        buffer: Shape bytes (any buffer-protocol object).
+        hot_spot: Click point within the shape.
+
+    Returns:
+        The decoded shape, with arrays owned by the result.
+
+    Raises:
+        ValueError: If the type is unknown or ``buffer`` is too small.
+    """
+    if width <= 0 or height <= 0:
+        raise ValueError(f"Invalid pointer shape size {width}x{height}.")
+    row_bytes = (
+        (width + 7) // 8 if shape_type == POINTER_SHAPE_MONOCHROME else width * 4
+    )
+    data = np.frombuffer(buffer, dtype=np.uint8)
+    if pitch < row_bytes or data.size < pitch * height:
+        raise ValueError(
+            f"Pointer shape buffer of {data.size} bytes is too small for "
+            f"{width}x{height} with pitch {pitch}."
+        )
+    rows = data[: pitch * height].reshape(height, pitch)
+
+    if shape_type == POINTER_SHAPE_MONOCHROME:
+        if height % 2 != 0:
+            raise ValueError(f"Monochrome pointer height must be even, got {height}.")
+        bits = np.unpackbits(rows[:, :row_bytes], axis=1)[:, :width]
+        masks = bits * np.uint8(0xFF)
+        half = height // 2
+        color = np.zeros((half, width, 4), dtype=np.uint8)
+        color[..., :3] = masks[half:, :, None]
+        return CursorShape(color, np.ascontiguousarray(masks[:half]), hot_spot)
+
+    if shape_type not in (POINTER_SHAPE_COLOR, POINTER_SHAPE_MASKED_COLOR):
+        raise ValueError(f"Unsupported pointer shape type {shape_type}.")
+    color = rows[:, :row_bytes].reshape(height, width, 4).copy()
+    if shape_type == POINTER_SHAPE_COLOR:
+        return CursorShape(color, None, hot_spot)
+    # Alpha 0xFF XORs the color into the frame; alpha 0 replaces the pixel.
+    and_mask = np.where(color[..., 3] == 0xFF, 0xFF, 0).astype(np.uint8)
+    return CursorShape(color, and_mask, hot_spot)
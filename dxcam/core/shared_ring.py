@@ -0,0 +1,359 @@
+"""Cross-process ring buffer in ``multiprocessing.shared_memory``.
+
+The capture process owns a :class:`SharedRingWriter`; any number of other
+processes attach a :class:`SharedRingReader` by name and read frames as NumPy
+views of the same memory, without pickling.
+
+Two segments are used. The control segment ``name`` only holds a generation
+counter. Every ring (re)allocation creates a data segment
+``f"{name}_{generation}"`` laid out as::
+
+    int64[16] header | int64[n] slot sequences | int64[n] slot ticks | frames
+
+with frames starting on a 64-byte boundary. Readers follow the generation
+counter, so they survive capture restarts and frame-size changes.
+
+Slots are published with a per-slot sequence check (a seqlock): the writer
+zeroes a slot's sequence before overwriting it and stores the new frame's
+sequence number once the frame is complete. A reader accepts a frame only if
+the slot held the expected sequence both before and after reading it. This
+relies on stores becoming visible in program order, which holds on the x86
+and x64 CPUs Desktop Duplication runs on.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+from multiprocessing import resource_tracker, shared_memory
+from typing import Any
+
+import numpy as np
+from numpy.typing import NDArray
+
+from dxcam.types import Frame
+
+_MAGIC = 0x5258434458  # Marks dxcam ring segments.
+_HEADER_WORDS = 16
+_MAX_NDIM = 4
+# Header word indices.
+_H_MAGIC = 0
+_H_SLOTS = 1
+_H_NDIM = 2
+_H_SHAPE = 3
+_H_BASE_SEQUENCE = 7
+_H_LATEST_SEQUENCE = 8
+_H_DTYPE = 9  # Two words holding the dtype string.
+_CONTROL_GENERATION = 1
+_FRAME_ALIGNMENT = 64
+# Segments created by writers in this process. Their resource tracker entry
+# belongs to the writer, so readers in the same process must keep it.
+_created: set[str] = set()
+
+
+def _create(name: str | None, size: int) -> shared_memory.SharedMemory:
+    segment = shared_memory.SharedMemory(name=name, create=True, size=size)
+    _created.add(segment.name)
+    return segment
+
+
+def _unlink(segment: shared_memory.SharedMemory) -> None:
+    segment.unlink()
+    _created.discard(segment.name)
+
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    """Attach to segment ``name`` without taking ownership of it.
+
+    Only the writer may unlink segments. On POSIX before Python 3.13 an
+    attached segment is registered with the resource tracker, which unlinks
+    it when the reader exits, so the registration is dropped again. Windows
+    has no resource tracker.
+    """
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+    segment = shared_memory.SharedMemory(name=name)
+    if os.name == "posix" and name not in _created:
+        # ``_name`` is the key the tracker registered, with its leading slash.
+        resource_tracker.unregister(getattr(segment, "_name"), "shared_memory")
+    return segment
+
+
+def _close(segment: shared_memory.SharedMemory) -> bool:
+    """Close ``segment``; ``False`` while NumPy views of it are still alive."""
+    try:
+        segment.close()
+    except BufferError:
+        return False
+    return True
+
+
+class _RingLayout:
+    """NumPy views of one data segment."""
+
+    def __init__(self, segment: shared_memory.SharedMemory) -> None:
+        buf = segment.buf
+        self.header: NDArray[np.int64] = np.ndarray(
+            (_HEADER_WORDS,), dtype=np.int64, buffer=buf
+        )
+        if int(self.header[_H_MAGIC]) != _MAGIC:
+            raise ValueError(f"'{segment.name}' is not a dxcam frame ring.")
+        slots = int(self.header[_H_SLOTS])
+        ndim = int(self.header[_H_NDIM])
+        shape = tuple(int(v) for v in self.header[_H_SHAPE : _H_SHAPE + ndim])
+        dtype_bytes = self.header[_H_DTYPE : _H_DTYPE + 2].tobytes()
+        dtype = np.dtype(dtype_bytes.rstrip(b"\0").decode("ascii"))
+        offset = _HEADER_WORDS * 8
+        self.sequences: NDArray[np.int64] = np.ndarray(
+            (slots,), dtype=np.int64, buffer=buf, offset=offset
+        )
+        offset += slots * 8
+        self.ticks: NDArray[np.int64] = np.ndarray(
+            (slots,), dtype=np.int64, buffer=buf, offset=offset
+        )
+        offset = _frame_offset(slots)
+        self.frames: Frame = np.ndarray(
+            (slots, *shape), dtype=dtype, buffer=buf, offset=offset
+        )
+
+    @property
+    def slots(self) -> int:
+        return int(self.header[_H_SLOTS])
+
+    def slot(self, sequence: int) -> int:
+        return (sequence - int(self.header[_H_BASE_SEQUENCE]) - 1) % self.slots
+
+
+def _frame_offset(slots: int) -> int:
+    offset = (_HEADER_WORDS + 2 * slots) * 8
+    return -(-offset // _FRAME_ALIGNMENT) * _FRAME_ALIGNMENT
+
+
+class SharedRingWriter:
+    """Producer side of a shared-memory frame ring.
+
+    Used by :class:`dxcam.core.capture_runtime.CaptureRuntime` when created
+    with ``shared``: the runtime allocates its ``frame_buffer`` and
+    ``frame_time_ticks`` through :meth:`allocate` and reports slot writes and
+    commits through :meth:`begin_write` and :meth:`publish`.
+
+    Args:
+        name: Control segment name, or ``None`` for a generated one.
+
+    Raises:
+        FileExistsError: If a segment called ``name`` already exists.
+    """
+
+    def __init__(self, name: str | None = None) -> None:
+        self._control = _create(name, 64)
+        self._control_words: NDArray[np.int64] = np.ndarray(
+            (8,), dtype=np.int64, buffer=self._control.buf
+        )
+        self._control_words[:] = 0
+        self._control_words[0] = _MAGIC
+        self._generation = 0
+        self._segment: shared_memory.SharedMemory | None = None
+        self._layout: _RingLayout | None = None
+        self._retired: list[shared_memory.SharedMemory] = []
+
+    @property
+    def name(self) -> str:
+        """Name readers pass to :class:`SharedRingReader`."""
+        return self._control.name
+
+    def allocate(
+        self,
+        max_buffer_len: int,
+        frame_shape: tuple[int, ...],
+        dtype: Any,
+        base_sequence: int,
+    ) -> tuple[Frame, NDArray[np.int64]]:
+        """Create a new ring generation and return its frames and ticks.
+
+        ``base_sequence`` is the sequence number committed before the first
+        frame of this ring; sequence ``base_sequence + 1`` goes to slot 0.
+        """
+        if len(frame_shape) > _MAX_NDIM:
+            raise ValueError(f"Frames may have at most {_MAX_NDIM} dimensions.")
+        dtype = np.dtype(dtype)
+        frame_bytes = int(np.prod(frame_shape)) * dtype.itemsize
+        size = _frame_offset(max_buffer_len) + max_buffer_len * frame_bytes
+        self.release()
+        self._generation += 1
+        segment = _create(f"{self.name}_{self._generation}", size)
+        header = np.ndarray((_HEADER_WORDS,), dtype=np.int64, buffer=segment.buf)
+        header[:] = 0
+        header[_H_MAGIC] = _MAGIC
+        header[_H_SLOTS] = max_buffer_len
+        header[_H_NDIM] = len(frame_shape)
+        header[_H_SHAPE : _H_SHAPE + len(frame_shape)] = frame_shape
+        header[_H_BASE_SEQUENCE] = base_sequence
+        header[_H_LATEST_SEQUENCE] = base_sequence
+        header[_H_DTYPE : _H_DTYPE + 2] = np.frombuffer(
+            dtype.str.encode("ascii").ljust(16, b"\0"), dtype=np.int64
+        )
+        del header
+        self._segment = segment
+        self._layout = layout = _RingLayout(segment)
+        layout.sequences[:] = 0
+        layout.ticks[:] = 0
+        self._control_words[_CONTROL_GENERATION] = self._generation
+        return layout.frames, layout.ticks
+
+    def begin_write(self, slot: int) -> None:
+        """Invalidate ``slot`` before the producer overwrites it."""
+        if self._layout is not None:
+            self._layout.sequences[slot] = 0
+
+    def publish(self, slot: int, sequence: int) -> None:
+        """Publish the completed frame ``sequence`` in ``slot``."""
+        if self._layout is not None:
+            self._layout.sequences[slot] = sequence
+            self._layout.header[_H_LATEST_SEQUENCE] = sequence
+
+    def release(self) -> None:
+        """Drop the current ring generation; readers see no frames."""
+        self._control_words[_CONTROL_GENERATION] = 0
+        self._layout = None
+        if self._segment is not None:
+            _unlink(self._segment)
+            self._retired.append(self._segment)
+            self._segment = None
+        # Segments stay mapped until the runtime drops its views of them.
+        self._retired = [s for s in self._retired if not _close(s)]
+
+    def close(self) -> None:
+        """Release the ring and remove the control segment."""
+        self.release()
+        self._control_words = np.empty(0, dtype=np.int64)
+        _unlink(self._control)
+        _close(self._control)
+
+
+class SharedRingReader:
+    """Attach to a :class:`SharedRingWriter` ring from any process.
+
+    Example:
+        >>> reader = SharedRingReader("dxcam-ring")
+        >>> latest = reader.read()
+        >>> if latest is not None:
+        ...     frame, frame_ticks, sequence = latest
+
+    Args:
+        name: The writer's :attr:`SharedRingWriter.name`.
+
+    Raises:
+        FileNotFoundError: If no ring called ``name`` exists.
+    """
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self._control = _attach(name)
+        self._control_words: NDArray[np.int64] = np.ndarray(
+            (8,), dtype=np.int64, buffer=self._control.buf
+        )
+        if int(self._control_words[0]) != _MAGIC:
+            _close(self._control)
+            raise ValueError(f"'{name}' is not a dxcam frame ring.")
+        self._generation = 0
+        self._segment: shared_memory.SharedMemory | None = None
+        self._layout: _RingLayout | None = None
+        self._retired: list[shared_memory.SharedMemory] = []
+        #: Reads rejected because the slot was overwritten during the read.
+        self.torn_reads = 0
+
+    def _refresh(self) -> _RingLayout | None:
+        generation = int(self._control_words[_CONTROL_GENERATION])
+        if generation != self._generation:
+            self._detach()
+            if generation:
+                try:
+                    self._segment = _attach(f"{self.name}_{generation}")
+                except FileNotFoundError:
+                    return None
+                self._layout = _RingLayout(self._segment)
+            self._generation = generation
+        return self._layout
+
+    def _detach(self) -> None:
+        self._layout = None
+        if self._segment is not None:
+            self._retired.append(self._segment)
+            self._segment = None
+        self._retired = [s for s in self._retired if not _close(s)]
+
+    @property
+    def latest_sequence(self) -> int:
+        """Sequence number of the newest published frame, ``0`` if none."""
+        layout = self._refresh()
+        if layout is None:
+            return 0
+        return int(layout.header[_H_LATEST_SEQUENCE])
+
+    @property
+    def oldest_sequence(self) -> int:
+        """Oldest sequence number that may still be readable, ``0`` if none."""
+        layout = self._refresh()
+        if layout is None:
+            return 0
+        latest = int(layout.header[_H_LATEST_SEQUENCE])
+        base = int(layout.header[_H_BASE_SEQUENCE])
+        if latest == base:
+            return 0
+        return max(base + 1, latest - layout.slots + 2)
+
+    def read(
+        self, sequence: int | None = None, copy: bool = True
+    ) -> tuple[Frame, int, int] | None:
+        """Read frame ``sequence`` (the newest by default).
+
+        Args:
+            sequence: Sequence number to read, or ``None`` for the latest.
+            copy: Copy the frame and verify it was not overwritten meanwhile
+                (default). With ``False`` the frame is a read-only view of the
+                shared ring; check :meth:`is_valid` after using it.
+
+        Returns:
+            ``(frame, frame_ticks, sequence)``, or ``None`` if the frame is
+            not (or no longer) in the ring or was overwritten while copying.
+        """
+        layout = self._refresh()
+        if layout is None:
+            return None
+        if sequence is None:
+            sequence = int(layout.header[_H_LATEST_SEQUENCE])
+        if sequence <= int(layout.header[_H_BASE_SEQUENCE]):
+            return None
+        slot = layout.slot(sequence)
+        if int(layout.sequences[slot]) != sequence:
+            return None
+        frame_ticks = int(layout.ticks[slot])
+        frame = layout.frames[slot]
+        if not copy:
+            frame = frame.view()
+            frame.flags.writeable = False
+            return frame, frame_ticks, sequence
+        frame = frame.copy()
+        if int(layout.sequences[slot]) != sequence:
+            self.torn_reads += 1
+            return None
+        return frame, frame_ticks, sequence
+
+    def is_valid(self, sequence: int) -> bool:
+        """Whether frame ``sequence`` is still intact in the ring."""
+        layout = self._refresh()
+        if layout is None or sequence <= int(layout.header[_H_BASE_SEQUENCE]):
+            return False
+        return int(layout.sequences[layout.slot(sequence)]) == sequence
+
+    def close(self) -> None:
+        """Detach from the ring. Views returned by :meth:`read` become invalid."""
+        self._detach()
+        self._control_words = np.empty(0, dtype=np.int64)
+        _close(self._control)
+
+    def __enter__(self) -> "SharedRingReader":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
@@ -9,6 +9,7 @@ from dxcam._libs.d3d11 import (
     D3D11_TEXTURE2D_DESC,
     D3D11_USAGE_STAGING,
     DXGI_FORMAT_B8G8R8A8_UNORM,
+    DXGI_FORMAT_NAMES,
     ID3D11Texture2D,
 )
 from dxcam._libs.dxgi import DXGI_MAPPED_RECT, IDXGISurface
@@ -90,5 +91,5 @@ class StageSurface:
             self.__class__.__name__,
             self.texture is not None,
             (self.width, self.height),
-            "DXGI_FORMAT_B8G8R8A8_UNORM",
+            DXGI_FORMAT_NAMES.get(self.dxgi_format, self.dxgi_format),
         )
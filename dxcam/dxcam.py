@@ -25,20 +25,53 @@ import ctypes
 import logging
 import time
 from contextlib import contextmanager
-from threading import Event, Lock, Thread, current_thread
-from typing import Any, Literal, overload
+from threading import Condition, Event, Lock, Thread, current_thread
+from typing import Any, Iterator, Literal, Sequence, overload
 
 import numpy as np
 
 from dxcam._libs.d3d11 import D3D11_BOX
 from dxcam.core import Device, Output, StageSurface
-from dxcam.core.backend import create_backend_duplicator
+from dxcam.core.backend import create_backend_duplicator, dxgi_source_format
+from dxcam.core.disk_ring import DiskRing
 from dxcam.core.display_recovery import DisplayRecoveryHandler
 from dxcam.core.capture_loop import CaptureLoopRunner
 from dxcam.core.capture_runtime import CaptureRuntime
+from dxcam.core.capture_stages import StageChain, StageFn, StageStats
+from dxcam.core.capture_subscription import CaptureSubscription, FrameBatch
+from dxcam.core.frame_pool import (
+    FrameAllocator,
+    FrameArena,
+    FramePool,
+    allocate_frame,
+)
 from dxcam.core.output_recovery import OutputRecoveryHandler
-from dxcam.processor import Processor
-from dxcam.types import CaptureBackend, ColorMode, Frame, ProcessorBackend, Region
+from dxcam.core.shared_ring import SharedRingWriter
+from dxcam.processor import (
+    ProcessingPlan,
+    Processor,
+    ProcessorStats,
+    color_mode_channels,
+    normalize_change_tile_size,
+    normalize_source_format,
+)
+from dxcam.processor.cursor import CursorCompositor
+from dxcam.types import (
+    CaptureBackend,
+    ColorMode,
+    Frame,
+    Interpolation,
+    LetterboxTransform,
+    OutputDType,
+    OutputLayout,
+    ProcessorBackend,
+    Region,
+    Size,
+    SourceFormat,
+    ToneMap,
+    YuvMatrix,
+    YuvRange,
+)
 from dxcam.util.timer import (
     create_high_resolution_timer,
     set_periodic_timer,
@@ -69,6 +102,28 @@ class DXCamera:
         max_buffer_len: int = 8,
         backend: CaptureBackend = "dxgi",
         processor_backend: ProcessorBackend = "cv2",
+        output_size: Size | None = None,
+        interpolation: Interpolation = "area",
+        letterbox: bool = False,
+        letterbox_color: int = 114,
+        output_layout: OutputLayout = "HWC",
+        output_dtype: OutputDType = "uint8",
+        normalize_mean: Sequence[float] | None = None,
+        normalize_std: Sequence[float] | None = None,
+        output_scale: float | None = None,
+        yuv_matrix: YuvMatrix = "bt601",
+        yuv_range: YuvRange = "limited",
+        band_workers: int = 0,
+        band_min_rows: int = 64,
+        source_format: SourceFormat = "BGRA8",
+        tone_map: ToneMap = "clip",
+        hdr_white_nits: float = 80.0,
+        draw_cursor: bool = False,
+        allocator: FrameAllocator | None = None,
+        frame_pool_size: int = 4,
+        shared_memory: bool | str = False,
+        disk_buffer: bool | str = False,
+        disk_buffer_preallocate: bool = False,
     ) -> None:
         """Initialize a camera bound to one output on one device.
 
@@ -82,31 +137,122 @@ class DXCamera:
             output_color: Returned color format.
             max_buffer_len: Ring-buffer size for threaded capture mode.
             backend: Capture backend, ``"dxgi"`` or ``"winrt"``.
-            processor_backend: Post-processing backend, ``"cv2"`` or
-                ``"numpy"``.
+            processor_backend: Post-processing backend, ``"cv2"``,
+                ``"numpy"`` or ``"pure_numpy"``.
+            output_size: Optional ``(width, height)`` every frame is resized to.
+                ``None`` returns region-sized frames.
+            interpolation: Resize filter, ``"nearest"``, ``"bilinear"`` or
+                ``"area"``.
+            letterbox: Preserve aspect ratio and pad frames to ``output_size``
+                (or to a square when ``output_size`` is ``None``).
+            letterbox_color: Padding value for every channel of border pixels.
+            output_layout: ``"HWC"`` (default) or planar ``"CHW"``.
+            output_dtype: ``"uint8"`` (default), ``"float32"`` or ``"float16"``.
+            normalize_mean: Optional per-channel mean for float outputs.
+            normalize_std: Optional per-channel std for float outputs.
+            output_scale: Float output multiplier, ``1/255`` by default.
+            yuv_matrix: Color matrix for ``NV12``/``I420`` output, ``"bt601"``
+                or ``"bt709"``.
+            yuv_range: ``"limited"`` (default) or ``"full"`` YUV range.
+            band_workers: Threads that split OpenCV color conversion and
+                BGRA copies into horizontal stripes; ``0`` disables banding.
+            band_min_rows: Minimum stripe height in rows.
+            source_format: Desktop format to duplicate, ``"BGRA8"``,
+                ``"RGB10A2"`` or ``"RGBA16F"`` (``"dxgi"`` backend only).
+            tone_map: HDR to 8-bit sRGB tone map, or ``"none"`` to keep
+                source precision.
+            hdr_white_nits: HDR luminance mapped to 8-bit white.
+            draw_cursor: Composite the mouse pointer into frames (``"dxgi"``
+                backend, region-sized ``RGB``/``BGR``/``RGBA``/``BGRA``
+                output only).
+            allocator: Allocates returned frames and the ring buffer; see
+                :class:`dxcam.core.frame_pool.FrameAllocator`. ``None`` uses
+                ``np.empty``.
+            frame_pool_size: Frames handed back through :meth:`recycle`
+                kept for reuse, per frame shape.
+            shared_memory: Keep the capture ring buffer in shared memory,
+                readable from other processes by :attr:`shared_memory_name`.
+                A string names the segment; ``True`` generates a name.
+            disk_buffer: Keep the capture ring buffer in a memory-mapped
+                file, in this directory or (``True``) the temp directory.
+            disk_buffer_preallocate: Reserve the ring file's blocks when the
+                ring is allocated instead of on first write.
         """
         self._is_released = False
         self._output: Output = output
         self._device: Device = device
-        self._stagesurf: StageSurface = StageSurface(
-            output=self._output, device=self._device
+        self.source_format: SourceFormat = normalize_source_format(str(source_format))
+        # Validate processing options before creating DXGI resources.
+        self._processor: Processor = Processor(
+            output_color=output_color,
+            backend=processor_backend,
+            output_size=output_size,
+            interpolation=interpolation,
+            letterbox=letterbox,
+            letterbox_color=letterbox_color,
+            output_layout=output_layout,
+            output_dtype=output_dtype,
+            normalize_mean=normalize_mean,
+            normalize_std=normalize_std,
+            output_scale=output_scale,
+            yuv_matrix=yuv_matrix,
+            yuv_range=yuv_range,
+            band_workers=band_workers,
+            band_min_rows=band_min_rows,
+            source_format=self.source_format,
+            tone_map=tone_map,
+            hdr_white_nits=hdr_white_nits,
         )
+        self._cursor: CursorCompositor | None = None
+        if draw_cursor:
+            if backend != "dxgi":
+                raise ValueError(
+                    "draw_cursor requires the dxgi backend; winrt captures the "
+                    "cursor itself (see DXCAM_WINRT_CURSOR_CAPTURE)."
+                )
+            self._cursor = self._processor.cursor_compositor()
+        allocator = allocator if allocator is not None else allocate_frame
+        self._frame_pool = FramePool(allocator, max_free=frame_pool_size)
+        self._frame_arena = FrameArena(allocator)
+        if shared_memory and disk_buffer:
+            raise ValueError("shared_memory and disk_buffer are mutually exclusive.")
+        self._ring_storage: SharedRingWriter | DiskRing | None = None
+        if shared_memory:
+            name = shared_memory if isinstance(shared_memory, str) else None
+            self._ring_storage = SharedRingWriter(name)
+        elif disk_buffer:
+            self._ring_storage = DiskRing(
+                disk_buffer if isinstance(disk_buffer, str) else None,
+                preallocate=disk_buffer_preallocate,
+            )
+        # Top-left of the region last copied to the staging surface.
+        self._stage_origin: tuple[int, int] = (0, 0)
+        try:
+            self._stagesurf: StageSurface = StageSurface(
+                dxgi_format=dxgi_source_format(self.source_format),
+                output=self._output,
+                device=self._device,
+            )
+        except Exception:
+            if self._ring_storage is not None:
+                self._ring_storage.close()
+            raise
         self.backend: CaptureBackend = backend
         try:
             self._duplicator: Any = self._create_duplicator()
         except Exception:
             self._stagesurf.release()
+            if self._ring_storage is not None:
+                self._ring_storage.close()
             raise
-        self._processor: Processor = Processor(
-            output_color=output_color,
-            backend=processor_backend,
-        )
+        # Cached for the staged geometry; see _process_staging_frame_into.
+        self._processing_plan: ProcessingPlan | None = None
         self._source_region: D3D11_BOX = D3D11_BOX()
         self._source_region.front = 0
         self._source_region.back = 1
 
         self.width, self.height = self._output.resolution
-        self.channel_size = len(output_color) if output_color != "GRAY" else 1
+        self.channel_size = color_mode_channels(output_color)
         self.rotation_angle: int = self._output.rotation_angle
 
         self._region_set_by_user = region is not None
@@ -143,15 +289,28 @@ class DXCamera:
         self.__stop_capture = Event()
 
         self.__frame_available = Event()
+        self.__frame_committed = Condition(self.__lock)
         self.__capture_runtime = CaptureRuntime(
             max_buffer_len=self.max_buffer_len,
             channel_size=self.channel_size,
+            dtype=self._processor.output_dtype,
+            layout=self._processor.output_layout,
+            allocator=allocator,
+            storage=self._ring_storage,
+            arena=self._frame_arena,
         )
 
         self.__timer_handle: Any | None = None
 
         self.__capture_start_time = 0
         self.__last_grab_entry: tuple[Region, Frame] | None = None
+        self.__last_regions_entry: tuple[tuple[Region, ...], list[Frame]] | None = None
+        self.__region_frames: tuple[tuple[Region, ...], list[Frame]] | None = None
+        self._capture_regions: tuple[Region, ...] | None = None
+        self._capture_union: Region | None = None
+        self._change_tile_size: int | None = None
+        self._fingerprint_frames = False
+        self._stages = StageChain()
 
     def _assert_runtime_mutation_allowed(self) -> None:
         """Allow runtime buffer mutation only on producer thread or when stopped."""
@@ -163,11 +322,15 @@ class DXCamera:
             )
 
     def _create_duplicator(self) -> Any:
-        return create_backend_duplicator(
+        duplicator = create_backend_duplicator(
             self.backend,
             output=self._output,
             device=self._device,
+            source_format=self.source_format,
         )
+        if self._cursor is not None:
+            duplicator.track_pointer = True
+        return duplicator
 
     def _uses_early_release(self) -> bool:
         return bool(getattr(self._duplicator, "early_release_frame", True))
@@ -210,6 +373,7 @@ class DXCamera:
         region: Region | None = None,
         copy: bool = True,
         new_frame_only: bool = True,
+        out: Frame | None = None,
     ) -> Frame | None:
         """Grab one frame.
 
@@ -220,12 +384,19 @@ class DXCamera:
             new_frame_only: In one-shot mode, return ``None`` when no new frame
                 is available. Set ``False`` to reuse the last cached frame for
                 the same region.
+            out: Optional caller-owned frame to write into, shaped and typed
+                like the frame that would be returned. Implies ``copy``.
 
         Returns:
-            Captured frame data or ``None`` when no new frame is available.
+            Captured frame data (``out`` when given) or ``None`` when no new
+            frame is available.
+
+        Raises:
+            ValueError: If ``out`` does not match the output frame.
 
         Ownership contract:
-        - ``copy=True`` returns caller-owned memory.
+        - ``copy=True`` returns caller-owned memory, taken from the camera's
+          frame pool; hand it back with :meth:`recycle` to reuse it.
         - ``copy=False`` may return internal memory reused by future grabs.
         - ``new_frame_only=True`` returns ``None`` when no new frame is available
           in one-shot mode.
@@ -241,17 +412,26 @@ class DXCamera:
         """
         self._ensure_not_released()
         if self.is_capturing:
+            self._ensure_single_region_capture("grab")
             if region is not None and region != self.region:
                 raise ValueError(
                     "grab(region=...) is not supported while capture is running. "
                     "Use start(region=...) to configure capture region."
                 )
-            return self._peek_latest_buffered_frame(copy=copy)
+            return self._peek_latest_buffered_frame(copy=copy, out=out)
         if region is None:
             region = self.region
         else:
             self._validate_region(region)
-        frame = self._grab(region, copy=copy, new_frame_only=new_frame_only)
+        if out is not None:
+            self._check_out_frame(
+                out,
+                self._processor.output_frame_shape(
+                    region[2] - region[0], region[3] - region[1]
+                ),
+                self._processor.output_dtype,
+            )
+        frame = self._grab(region, copy=copy, new_frame_only=new_frame_only, out=out)
         return frame
 
     def grab_view(self, region: Region | None = None) -> Frame | None:
@@ -272,41 +452,198 @@ class DXCamera:
         """
         return self.grab(region=region, copy=False)
 
-    def _peek_latest_buffered_frame(self, copy: bool = True) -> Frame | None:
+    def recycle(self, frame: Frame) -> bool:
+        """Hand a copied frame back to the camera's frame pool.
+
+        Frames returned with ``copy=True`` by :meth:`grab`,
+        :meth:`grab_regions` and :meth:`get_latest_frame` come from a pool;
+        recycled frames are reused by later calls instead of allocating new
+        memory. Do not use ``frame`` after recycling it.
+
+        Args:
+            frame: A frame previously returned by this camera.
+
+        Returns:
+            ``True`` if the frame was taken back, ``False`` for arrays the
+            pool did not hand out (views, ``out`` buffers, foreign arrays).
+
+        Example:
+            >>> frame = cam.grab()
+            >>> if frame is not None:
+            ...     process(frame)
+            ...     cam.recycle(frame)
+        """
+        entry = self.__last_grab_entry
+        if entry is not None and entry[1] is frame:
+            self.__last_grab_entry = None
+        regions_entry = self.__last_regions_entry
+        if regions_entry is not None and any(f is frame for f in regions_entry[1]):
+            self.__last_regions_entry = None
+        return self._frame_pool.recycle(frame)
+
+    @contextmanager
+    def recycling(self, frame: Frame | None):
+        """Context manager that recycles ``frame`` on exit.
+
+        ``None`` passes through, so grab results can be used directly.
+
+        Example:
+            >>> with cam.recycling(cam.grab()) as frame:
+            ...     if frame is not None:
+            ...         process(frame)
+        """
+        try:
+            yield frame
+        finally:
+            if frame is not None:
+                self.recycle(frame)
+
+    def grab_regions(
+        self,
+        regions: Sequence[Region],
+        copy: bool = True,
+        new_frame_only: bool = True,
+    ) -> list[Frame] | None:
+        """Grab several regions of the same frame.
+
+        The bounding union of ``regions`` is copied to the staging surface and
+        mapped once, then every region is converted into its own output in a
+        single processor call. All regions come from the same desktop frame.
+
+        Args:
+            regions: Capture regions as ``(left, top, right, bottom)``.
+            copy: Return caller-owned memory when ``True``. Set ``False`` to
+                reuse internal per-region buffers across calls.
+            new_frame_only: Return ``None`` when no new frame is available.
+                Set ``False`` to reuse the last result for the same regions.
+
+        Returns:
+            One frame per region, in order, or ``None`` when no new frame is
+            available. Each frame is shaped like ``grab(region=...)`` output.
+
+        Raises:
+            ValueError: If ``regions`` is empty or a region is invalid, or
+                when capture is running with different regions.
+
+        When capture was started with ``start(regions=...)``, this reads the
+        latest buffered frames instead of touching DXGI objects directly.
+
+        Example:
+            >>> minimap, health = cam.grab_regions(
+            ...     [(0, 0, 256, 256), (20, 1000, 420, 1040)]
+            ... )
+        """
+        self._ensure_not_released()
+        regions = self._normalize_regions(regions)
+        if self.is_capturing:
+            if regions != self._capture_regions:
+                raise ValueError(
+                    "grab_regions(...) while capture is running requires the "
+                    "regions passed to start(regions=...)."
+                )
+            with self.__lock:
+                latest = self.__capture_runtime.peek_latest(copy=copy)
+                if latest is None:
+                    return None
+                return self.__capture_runtime.split_regions(latest)
+        return self._grab_regions(regions, copy=copy, new_frame_only=new_frame_only)
+
+    def _normalize_regions(self, regions: Sequence[Region]) -> tuple[Region, ...]:
+        normalized = tuple(
+            (int(r[0]), int(r[1]), int(r[2]), int(r[3])) for r in regions
+        )
+        if not normalized:
+            raise ValueError("regions must contain at least one region.")
+        for region in normalized:
+            self._validate_region(region)
+        return normalized
+
+    @staticmethod
+    def _regions_union(regions: Sequence[Region]) -> Region:
+        return (
+            min(r[0] for r in regions),
+            min(r[1] for r in regions),
+            max(r[2] for r in regions),
+            max(r[3] for r in regions),
+        )
+
+    def _region_frame_shapes(self, regions: Sequence[Region]) -> list[tuple[int, ...]]:
+        return [
+            self._processor.output_frame_shape(r[2] - r[0], r[3] - r[1])
+            for r in regions
+        ]
+
+    def _ensure_single_region_capture(self, method: str) -> None:
+        if self._capture_regions is not None:
+            raise RuntimeError(
+                f"{method}() is unavailable while capture runs with "
+                "start(regions=...). Use get_latest_regions() or grab_regions()."
+            )
+
+    def _peek_latest_buffered_frame(
+        self, copy: bool = True, out: Frame | None = None
+    ) -> Frame | None:
         with self.__lock:
-            return self.__capture_runtime.peek_latest(copy=copy)
+            frame = self.__capture_runtime.peek_latest(copy=False)
+            if frame is None or not (copy or out is not None):
+                return frame
+            return self._copy_frame(frame, out)
+
+    @staticmethod
+    def _check_out_frame(out: Frame, shape: tuple[int, ...], dtype: Any) -> None:
+        if out.shape != tuple(shape) or out.dtype != dtype:
+            raise ValueError(
+                f"out has shape {out.shape} and dtype {out.dtype}, expected "
+                f"{tuple(shape)} and {np.dtype(dtype)}."
+            )
+
+    def _copy_frame(self, frame: Frame, out: Frame | None = None) -> Frame:
+        """Copy ``frame`` into ``out`` or a pooled frame."""
+        if out is None:
+            out = self._frame_pool.acquire(frame.shape, frame.dtype)
+        else:
+            self._check_out_frame(out, frame.shape, frame.dtype)
+        np.copyto(out, frame)
+        return out
 
     def _set_cached_grab_frame(self, region: Region, frame: Frame) -> None:
         self.__last_grab_entry = (region, frame)
 
-    def _get_cached_grab_frame(self, region: Region, copy: bool = True) -> Frame | None:
+    def _get_cached_grab_frame(
+        self, region: Region, copy: bool = True, out: Frame | None = None
+    ) -> Frame | None:
         entry = self.__last_grab_entry
         if entry is None:
             return None
         cached_region, cached = entry
         if cached_region != region:
             return None
-        return np.array(cached, copy=True) if copy else cached
+        if out is cached:
+            return out
+        return self._copy_frame(cached, out) if copy or out is not None else cached
 
     def _grab(
         self,
         region: Region,
         copy: bool = True,
         new_frame_only: bool = True,
+        out: Frame | None = None,
     ) -> Frame | None:
         if not self._acquire_new_frame(wait_for_frame=new_frame_only):
             if new_frame_only:
                 return None
-            return self._get_cached_grab_frame(region=region, copy=copy)
+            return self._get_cached_grab_frame(region=region, copy=copy, out=out)
 
         try:
             with self._multithread_guard():
                 frame_width, frame_height = self._copy_region_to_stage(region)
-                if copy:
-                    frame = self._allocate_output_frame(
-                        frame_width=frame_width,
-                        frame_height=frame_height,
-                    )
+                if out is not None or copy:
+                    frame = out
+                    if frame is None:
+                        frame = self._allocate_output_frame(
+                            frame_width=frame_width,
+                            frame_height=frame_height,
+                        )
                     self._process_staging_frame_into(
                         frame_width=frame_width,
                         frame_height=frame_height,
@@ -323,9 +660,116 @@ class DXCamera:
             self._set_cached_grab_frame(region=region, frame=result)
         return result
 
-    def _grab_into(self, region: Region, dst: Frame) -> tuple[bool, int, int, int]:
+    def _grab_regions(
+        self,
+        regions: tuple[Region, ...],
+        copy: bool = True,
+        new_frame_only: bool = True,
+    ) -> list[Frame] | None:
+        if not self._acquire_new_frame(wait_for_frame=new_frame_only):
+            if new_frame_only:
+                return None
+            entry = self.__last_regions_entry
+            if entry is None or entry[0] != regions:
+                return None
+            if copy:
+                return [self._copy_frame(frame) for frame in entry[1]]
+            return entry[1]
+
+        if copy:
+            frames = [
+                self._frame_pool.acquire(shape, self._processor.output_dtype)
+                for shape in self._region_frame_shapes(regions)
+            ]
+        else:
+            cached = self.__region_frames
+            if cached is None or cached[0] != regions:
+                cached = (
+                    regions,
+                    [
+                        np.empty(shape, dtype=self._processor.output_dtype)
+                        for shape in self._region_frame_shapes(regions)
+                    ],
+                )
+                self.__region_frames = cached
+            frames = cached[1]
+        try:
+            with self._multithread_guard():
+                self._copy_regions_to_stage_into(regions, frames)
+        finally:
+            self._release_frame_if_late_release()
+        if not new_frame_only:
+            self.__last_regions_entry = (regions, frames)
+        return frames
+
+    def _copy_regions_to_stage_into(
+        self,
+        regions: Sequence[Region],
+        dsts: Sequence[Frame],
+    ) -> None:
+        union = self._regions_union(regions)
+        union_width, union_height = self._copy_region_to_stage(union)
+        local_regions = [
+            (r[0] - union[0], r[1] - union[1], r[2] - union[0], r[3] - union[1])
+            for r in regions
+        ]
+        rect = self._stagesurf.map()
+        try:
+            self._processor.process_regions_into(
+                rect,
+                union_width,
+                union_height,
+                local_regions,
+                self.rotation_angle,
+                dsts,
+            )
+        finally:
+            self._stagesurf.unmap()
+        if self._cursor is not None:
+            for region, dst in zip(regions, dsts):
+                self._draw_cursor(dst, region[0], region[1])
+
+    def _grab_regions_into(
+        self,
+        region: Region,
+        dst: Frame,
+        tile_hashes: Frame | None = None,
+    ) -> tuple[bool, int, int, int]:
+        """Capture ``start(regions=...)`` regions into one flat ring slot.
+
+        Same contract as :meth:`_grab_into`; ``region`` is the regions' union.
+        Region shapes never depend on the source size, so a new frame is
+        always written.
+        """
+        assert self._capture_regions is not None
+        if not self._acquire_new_frame(wait_for_frame=True):
+            return False, 0, 0, 0
+
+        try:
+            with self._multithread_guard():
+                self._copy_regions_to_stage_into(
+                    self._capture_regions,
+                    self.__capture_runtime.split_regions(dst),
+                )
+        finally:
+            self._release_frame_if_late_release()
+        return (
+            True,
+            self._duplicator.latest_frame_ticks,
+            region[2] - region[0],
+            region[3] - region[1],
+        )
+
+    def _grab_into(
+        self,
+        region: Region,
+        dst: Frame,
+        tile_hashes: Frame | None = None,
+    ) -> tuple[bool, int, int, int]:
         """Capture into ``dst`` and return ``(captured, frame_ticks, width, height)``.
 
+        ``tile_hashes``, when given, receives the tile hashes of ``dst``.
+
         Contract:
         - ``captured`` is True only when ``dst`` has been fully written with a new frame.
         - ``captured`` is False with ``width == height == 0`` when no new frame is available.
@@ -338,7 +782,10 @@ class DXCamera:
         try:
             with self._multithread_guard():
                 frame_width, frame_height = self._copy_region_to_stage(region)
-                if frame_height != dst.shape[0] or frame_width != dst.shape[1]:
+                frame_shape = self._processor.output_frame_shape(
+                    frame_width, frame_height
+                )
+                if frame_shape != dst.shape:
                     return (
                         False,
                         self._duplicator.latest_frame_ticks,
@@ -349,6 +796,7 @@ class DXCamera:
                     frame_width=frame_width,
                     frame_height=frame_height,
                     dst=dst,
+                    tile_hashes=tile_hashes,
                 )
         finally:
             self._release_frame_if_late_release()
@@ -369,6 +817,7 @@ class DXCamera:
                 dim=(memory_width, memory_height),
             )
         self._update_source_region(memory_region)
+        self._stage_origin = (region[0], region[1])
         self._device.im_context.CopySubresourceRegion(
             self._stagesurf.texture,
             0,
@@ -383,12 +832,15 @@ class DXCamera:
         return region[2] - region[0], region[3] - region[1]
 
     def _allocate_output_frame(self, frame_width: int, frame_height: int) -> Frame:
-        return np.empty((frame_height, frame_width, self.channel_size), dtype=np.uint8)
+        return self._frame_pool.acquire(
+            self._processor.output_frame_shape(frame_width, frame_height),
+            self._processor.output_dtype,
+        )
 
     def _process_staging_frame(self, frame_width: int, frame_height: int) -> Frame:
         rect = self._stagesurf.map()
         try:
-            return self._processor.process(
+            frame = self._processor.process(
                 rect,
                 frame_width,
                 frame_height,
@@ -397,28 +849,60 @@ class DXCamera:
             )
         finally:
             self._stagesurf.unmap()
+        if self._cursor is not None:
+            self._draw_cursor(frame, *self._stage_origin)
+        return frame
 
     def _process_staging_frame_into(
         self,
         frame_width: int,
         frame_height: int,
         dst: Frame,
+        tile_hashes: Frame | None = None,
     ) -> None:
+        # The cursor is drawn after conversion, so tiles are hashed after it.
+        draw_cursor = self._cursor is not None
         rect = self._stagesurf.map()
         try:
-            self._processor.process_into(
+            region = (0, 0, frame_width, frame_height)
+            pitch = int(rect.Pitch)
+            plan = self._processing_plan
+            if plan is None or not plan.matches(
+                pitch, frame_width, frame_height, region, self.rotation_angle, dst
+            ):
+                plan = self._processing_plan = self._processor.processing_plan(
+                    pitch, frame_width, frame_height, region, self.rotation_angle, dst
+                )
+            plan.run(
                 rect,
-                frame_width,
-                frame_height,
-                (0, 0, frame_width, frame_height),
-                self.rotation_angle,
                 dst,
+                None if draw_cursor else tile_hashes,
+                self._change_tile_size or 32,
             )
         finally:
             self._stagesurf.unmap()
+        if draw_cursor:
+            self._draw_cursor(dst, *self._stage_origin)
+            if tile_hashes is not None:
+                self._hash_frame_tiles(dst, tile_hashes)
+
+    def _draw_cursor(self, frame: Frame, left: int, top: int) -> None:
+        """Composite the pointer into ``frame``, a region at ``(left, top)``."""
+        assert self._cursor is not None
+        duplicator = self._duplicator
+        shape = duplicator.pointer_shape
+        if shape is None or not duplicator.pointer_visible:
+            return
+        x, y = duplicator.pointer_position
+        self._cursor.composite(frame, shape, x - left, y - top)
+
+    def _hash_frame_tiles(self, frame: Frame, tile_hashes: Frame) -> None:
+        assert self._change_tile_size is not None
+        self._processor.hash_tiles_into(frame, tile_hashes, self._change_tile_size)
 
     def _recover_output(self) -> None:
         self.__last_grab_entry = None
+        self.__last_regions_entry = None
         old_width, old_height = self.width, self.height
         old_rotation = self.rotation_angle
         duplicator, output_state = self._display_recovery.handle(
@@ -431,6 +915,7 @@ class DXCamera:
         self.rotation_angle = output_state.rotation_angle
         self.region = output_state.region
         self._duplicator = duplicator
+        self._processing_plan = None
         logger.info(
             "Output recovery: %dx%d@%d -> %dx%d@%d, region=%s.",
             old_width,
@@ -449,6 +934,20 @@ class DXCamera:
     def _rebuild_recovery_stage_surface(self) -> None:
         self._stagesurf.rebuild(output=self._output, device=self._device)
 
+    def _allocate_region_frame_buffers(self, *, reason: str) -> None:
+        self._assert_runtime_mutation_allowed()
+        assert self._capture_regions is not None
+        logger.info(
+            "Frame buffer %s: %d regions c=%d n=%d.",
+            reason,
+            len(self._capture_regions),
+            self.channel_size,
+            self.max_buffer_len,
+        )
+        self.__capture_runtime.allocate_for_regions(
+            self._region_frame_shapes(self._capture_regions)
+        )
+
     def _allocate_frame_buffer_for_shape(
         self,
         frame_height: int,
@@ -494,12 +993,114 @@ class DXCamera:
             reason="rebuild(frame-size-change)",
         )
 
+    def add_stage(
+        self,
+        fn: StageFn,
+        out_shape: Sequence[int],
+        out_dtype: Any = np.uint8,
+        name: str | None = None,
+        source: str | None = None,
+    ) -> str:
+        """Register a stage run by the capture thread on every new frame.
+
+        Stages run in registration order right after a frame is captured and
+        before it is published, as ``fn(src, out)``: ``src`` is the captured
+        frame (or the output of stage ``source``) and ``out`` is a
+        preallocated ``out_shape`` buffer the stage must fill in place. Each
+        ring-buffer slot has its own stage outputs, read with
+        ``get_latest_frame(with_stages=True)``. Exceptions raised by a stage
+        stop capture like any other capture-loop error.
+
+        Args:
+            fn: Stage callable ``fn(src, out) -> None``.
+            out_shape: Shape of the stage output.
+            out_dtype: NumPy dtype of the stage output.
+            name: Optional stage name. Defaults to ``fn.__name__``.
+            source: Optional name of an earlier stage whose output is this
+                stage's input. ``None`` reads the captured frame.
+
+        Returns:
+            The registered stage name.
+
+        Raises:
+            RuntimeError: If capture is running.
+            TypeError: If ``fn`` is not callable.
+            ValueError: If ``out_shape``, ``name`` or ``source`` is invalid.
+
+        Example:
+            >>> def mean_rgb(frame, out):
+            ...     out[:] = frame.mean(axis=(0, 1))
+            >>> cam.add_stage(mean_rgb, out_shape=(3,), out_dtype=np.float32)
+            'mean_rgb'
+        """
+        if self.is_capturing:
+            raise RuntimeError("Stop capture before changing stages.")
+        return self._stages.add(fn, out_shape, out_dtype, name, source).name
+
+    def remove_stage(self, name: str) -> None:
+        """Unregister stage ``name``.
+
+        Raises:
+            RuntimeError: If capture is running.
+            KeyError: If no stage is named ``name``.
+            ValueError: If another stage reads from ``name``.
+        """
+        if self.is_capturing:
+            raise RuntimeError("Stop capture before changing stages.")
+        self._stages.remove(name)
+
+    def stage_stats(self, reset: bool = False) -> dict[str, StageStats]:
+        """Return per-stage timing, keyed by stage name.
+
+        Args:
+            reset: Zero the counters after reading them.
+
+        Example:
+            >>> stats = cam.stage_stats()
+            >>> slowest = max(stats, key=lambda n: stats[n].mean_seconds)
+        """
+        return self._stages.stats(reset=reset)
+
+    def enable_processor_stats(self, enabled: bool = True) -> None:
+        """Turn per-stage processor timing on or off.
+
+        Instrumentation is off by default and costs nothing while off.
+
+        Args:
+            enabled: ``True`` to start collecting, ``False`` to stop and drop
+                the counters.
+        """
+        with self.__lock:
+            self._processor.enable_stats(enabled)
+
+    def processor_stats(self, reset: bool = False) -> ProcessorStats | None:
+        """Return processor stage timing, or ``None`` when not enabled.
+
+        Stage times (``map``, ``prepare``, ``resize``, ``convert``, ``copy``)
+        are exclusive; ``stages["total"]`` covers whole frames.
+
+        Args:
+            reset: Zero the counters after reading them.
+
+        Example:
+            >>> cam.enable_processor_stats()
+            >>> cam.grab()
+            >>> stats = cam.processor_stats()
+            >>> stats.stages["convert"].mean_seconds
+        """
+        return self._processor.stats(reset=reset)
+
     def start(
         self,
         region: Region | None = None,
         target_fps: int = 60,
         video_mode: bool = False,
         delay: int = 0,
+        output_size: Size | None = None,
+        regions: Sequence[Region] | None = None,
+        change_tile_size: int | None = None,
+        fingerprint: bool = False,
+        dedupe: bool = False,
     ) -> None:
         """Start threaded capture into the internal ring buffer.
 
@@ -508,6 +1109,27 @@ class DXCamera:
             target_fps: Target capture FPS. ``0`` disables timer pacing.
             video_mode: Reuse previous frame when no new frame arrives.
             delay: Optional startup delay in seconds.
+            output_size: Optional ``(width, height)`` to resize frames to.
+                Overrides the camera's ``output_size``; ``None`` keeps it.
+                The ring buffer is allocated at the resized shape.
+            regions: Optional list of regions captured together from every
+                frame, as with :meth:`grab_regions`. Read them with
+                :meth:`get_latest_regions`. Mutually exclusive with ``region``.
+            change_tile_size: Optional tile edge in pixels (e.g. ``32``) to
+                track which tiles change between frames; read the change map
+                with ``get_latest_frame(with_changes=True)``. Requires ``HWC``
+                output and a single region.
+            fingerprint: Record a 64-bit content fingerprint per buffered
+                frame; read it with ``get_latest_frame(with_fingerprint=True)``
+                or :attr:`latest_fingerprint`.
+            dedupe: Skip buffering frames whose content is identical to the
+                latest buffered frame, including the repeats of
+                ``video_mode``. Implies ``fingerprint=True``.
+
+        Raises:
+            ValueError: If both ``region`` and ``regions`` are given,
+                ``change_tile_size`` is invalid for this camera, or stages are
+                registered together with ``regions``.
 
         Example:
             >>> cam.start(target_fps=120)
@@ -522,23 +1144,53 @@ class DXCamera:
                 "Capture thread is still alive from previous run. "
                 "Call stop() and wait for join before start()."
             )
+        if regions is not None and region is not None:
+            raise ValueError("Pass either region or regions to start(), not both.")
+        capture_regions = (
+            self._normalize_regions(regions) if regions is not None else None
+        )
+        if change_tile_size is not None:
+            change_tile_size = normalize_change_tile_size(change_tile_size)
+            if capture_regions is not None:
+                raise ValueError("change_tile_size is not supported with regions.")
+            if self._processor.output_layout != "HWC":
+                raise ValueError("change_tile_size requires HWC output frames.")
+        if self._stages and capture_regions is not None:
+            raise ValueError("Capture stages are not supported with regions.")
         if delay != 0:
             time.sleep(delay)
             self._recover_output()
-        if region is None:
+        if capture_regions is not None:
+            region = self._regions_union(capture_regions)
+        elif region is None:
             region = self.region
         else:
             self._region_set_by_user = True
             self.region = region
         self._validate_region(region)
+        self._processing_plan = None
+        if output_size is not None:
+            self._processor.set_output_size(output_size)
+        self._capture_regions = capture_regions
+        self._capture_union = region if capture_regions is not None else None
+        self._change_tile_size = change_tile_size
+        self.__capture_runtime.change_tile_size = change_tile_size
+        self._fingerprint_frames = fingerprint or dedupe
+        self.__capture_runtime.fingerprint_frames = self._fingerprint_frames
+        self.__capture_runtime.dedupe = dedupe
+        self.__capture_runtime.stages = self._stages if self._stages else None
         self.is_capturing = True
-        frame_height = region[3] - region[1]
-        frame_width = region[2] - region[0]
-        self._allocate_frame_buffer_for_shape(
-            frame_height=frame_height,
-            frame_width=frame_width,
-            reason="build(start)",
-        )
+        if capture_regions is not None:
+            self._allocate_region_frame_buffers(reason="build(start)")
+        else:
+            frame_width, frame_height = self._processor.output_frame_size(
+                region[2] - region[0], region[3] - region[1]
+            )
+            self._allocate_frame_buffer_for_shape(
+                frame_height=frame_height,
+                frame_width=frame_width,
+                reason="build(start)",
+            )
         self.__frame_available.clear()
         self.__thread = Thread(
             target=self._capture_loop,
@@ -574,11 +1226,52 @@ class DXCamera:
             self._assert_runtime_mutation_allowed()
             self.is_capturing = False
             self.__capture_runtime.clear()
+            self.__frame_committed.notify_all()
             self.__last_grab_entry = None
+            self._capture_regions = None
+            self._capture_union = None
+            self._change_tile_size = None
+            self._fingerprint_frames = False
         self.__frame_available.clear()
         self.__stop_capture.clear()
         self.__thread = None
 
+    def trim(self) -> int:
+        """Return memory the camera keeps for reuse.
+
+        The ring buffer's memory outlives :meth:`stop` so the next
+        :meth:`start`, or a rebuild after a resolution change, reuses it
+        instead of allocating again. Call this to release it once capture is
+        no longer needed; while capturing, the live ring is freed when capture
+        stops. Idle frames of the :meth:`recycle` pool are dropped too.
+
+        Returns:
+            Bytes of ring buffer memory released.
+
+        Example:
+            >>> cam.stop()
+            >>> released = cam.trim()
+        """
+        self._frame_pool.clear()
+        with self.__lock:
+            return self._frame_arena.trim()
+
+    @property
+    def letterbox_transform(self) -> LetterboxTransform | None:
+        """``(scale, pad_left, pad_top)`` applied to frames of the current region.
+
+        ``None`` unless the camera was created with ``letterbox=True``. Use it
+        to map detections in :meth:`grab` output back to region coordinates.
+
+        Example:
+            >>> scale, pad_left, pad_top = cam.letterbox_transform
+            >>> x_region = (x - pad_left) / scale
+        """
+        region = self.region
+        return self._processor.letterbox_transform(
+            region[2] - region[0], region[3] - region[1]
+        )
+
     @property
     def latest_frame_time(self) -> float | None:
         """Timestamp (seconds) of the latest buffered frame, if available.
@@ -608,35 +1301,172 @@ class DXCamera:
         with self.__lock:
             return self.__capture_runtime.latest_frame_ticks
 
+    @property
+    def latest_fingerprint(self) -> int | None:
+        """Content fingerprint of the latest buffered frame.
+
+        ``None`` unless capture was started with ``fingerprint=True`` or
+        ``dedupe=True``. Equal frames have equal fingerprints.
+
+        Example:
+            >>> cam.start(target_fps=60, fingerprint=True)
+            >>> _ = cam.get_latest_frame()
+            >>> fingerprint = cam.latest_fingerprint
+            >>> cam.stop()
+        """
+        with self.__lock:
+            return self.__capture_runtime.peek_latest_fingerprint()
+
     @overload
     def get_latest_frame(
-        self, copy: bool = True, with_timestamp: Literal[False] = False
+        self,
+        copy: bool = True,
+        with_timestamp: Literal[False] = False,
+        with_changes: Literal[False] = False,
+        with_fingerprint: Literal[False] = False,
+        with_stages: Literal[False] = False,
+        out: Frame | None = None,
     ) -> Frame | None: ...
 
     @overload
     def get_latest_frame(
-        self, copy: bool = True, with_timestamp: Literal[True] = True
-    ) -> tuple[Frame, float] | None: ...
+        self,
+        copy: bool = True,
+        with_timestamp: Literal[True] = True,
+        with_changes: Literal[False] = False,
+        with_fingerprint: Literal[False] = False,
+        with_stages: Literal[False] = False,
+        out: Frame | None = None,
+    ) -> tuple[Frame, float] | tuple[Frame, float, LetterboxTransform] | None: ...
 
+    @overload
     def get_latest_frame(
-        self, copy: bool = True, with_timestamp: bool = False
-    ) -> Frame | tuple[Frame, float] | None:
+        self,
+        copy: bool = True,
+        with_timestamp: bool = False,
+        *,
+        with_changes: Literal[True],
+        with_fingerprint: bool = False,
+        with_stages: bool = False,
+        out: Frame | None = None,
+    ) -> tuple[Any, ...] | None: ...
+
+    @overload
+    def get_latest_frame(
+        self,
+        copy: bool = True,
+        with_timestamp: bool = False,
+        with_changes: bool = False,
+        *,
+        with_fingerprint: Literal[True],
+        with_stages: bool = False,
+        out: Frame | None = None,
+    ) -> tuple[Any, ...] | None: ...
+
+    @overload
+    def get_latest_frame(
+        self,
+        copy: bool = True,
+        with_timestamp: bool = False,
+        with_changes: bool = False,
+        with_fingerprint: bool = False,
+        *,
+        with_stages: Literal[True],
+        out: Frame | None = None,
+    ) -> tuple[Any, ...] | None: ...
+
+    def get_latest_frame(
+        self,
+        copy: bool = True,
+        with_timestamp: bool = False,
+        with_changes: bool = False,
+        with_fingerprint: bool = False,
+        with_stages: bool = False,
+        out: Frame | None = None,
+    ) -> Frame | tuple[Any, ...] | None:
         """Block until a buffered frame is available and return the latest one.
 
         Args:
             copy: Return a copied array when ``True`` (default). Set to
                 ``False`` for a zero-copy view.
             with_timestamp: Return ``(frame, timestamp_seconds)`` when ``True``.
+                With ``letterbox=True`` this is
+                ``(frame, timestamp_seconds, (scale, pad_left, pad_top))``.
+            with_changes: Append a boolean ``(tiles_y, tiles_x)`` change map
+                to the result, ``True`` for every tile that differs from the
+                previous captured frame. Requires
+                ``start(change_tile_size=...)``.
+            with_fingerprint: Append the frame's 64-bit content fingerprint
+                (``int``) to the result. Requires ``start(fingerprint=True)``
+                or ``start(dedupe=True)``.
+            with_stages: Append a ``{stage_name: output}`` dict with the
+                outputs of :meth:`add_stage` stages for this frame, copied
+                when ``copy`` is ``True``.
+            out: Optional caller-owned frame the latest frame is copied
+                into. Implies ``copy``.
 
         Returns:
-            Frame data, optionally with timestamp, or ``None`` if capture is
-            stopped and the buffer is unavailable.
+            Frame data, optionally followed by timestamp, change map,
+            fingerprint and stage outputs in that order, or ``None`` if
+            capture is stopped and the buffer is unavailable.
+
+        Raises:
+            RuntimeError: If ``with_changes`` or ``with_fingerprint`` is set
+                but the matching tracking is not enabled.
+            ValueError: If ``out`` does not match the buffered frame.
 
         Example:
             >>> cam.start(target_fps=60)
             >>> frame, ts = cam.get_latest_frame(with_timestamp=True)
             >>> cam.stop()
         """
+        self._ensure_single_region_capture("get_latest_frame")
+        if with_changes and self._change_tile_size is None:
+            raise RuntimeError(
+                "get_latest_frame(with_changes=True) requires "
+                "start(change_tile_size=...)."
+            )
+        if with_fingerprint and not self._fingerprint_frames:
+            raise RuntimeError(
+                "get_latest_frame(with_fingerprint=True) requires "
+                "start(fingerprint=True) or start(dedupe=True)."
+            )
+        latest = self._wait_latest_buffered(
+            copy=copy, with_changes=with_changes, with_stages=with_stages, out=out
+        )
+        if latest is None:
+            return None
+        frame, frame_ticks, letterbox, changes, fingerprint, stages = latest
+        result: tuple[Any, ...] = (frame,)
+        if with_timestamp:
+            result += (self._duplicator.ticks_to_seconds(frame_ticks),)
+            if letterbox is not None:
+                result += (letterbox,)
+        if with_changes:
+            result += (changes,)
+        if with_fingerprint:
+            result += (fingerprint,)
+        if with_stages:
+            result += (stages,)
+        return result if len(result) > 1 else frame
+
+    def _wait_latest_buffered(
+        self,
+        copy: bool,
+        with_changes: bool = False,
+        with_stages: bool = False,
+        out: Frame | None = None,
+    ) -> (
+        tuple[
+            Frame,
+            int,
+            LetterboxTransform | None,
+            Frame | None,
+            int | None,
+            dict[str, Frame],
+        ]
+        | None
+    ):
         while True:
             with self.__lock:
                 if self.__capture_runtime.frame_buffer is None:
@@ -644,15 +1474,289 @@ class DXCamera:
             if not self.__frame_available.wait(timeout=0.1):
                 continue
             with self.__lock:
-                latest = self.__capture_runtime.peek_latest_with_ticks(copy=copy)
+                latest = self.__capture_runtime.peek_latest_with_ticks(copy=False)
                 if latest is None:
                     self.__frame_available.clear()
                     return None
                 frame, frame_ticks = latest
+                if copy or out is not None:
+                    frame = self._copy_frame(frame, out)
+                letterbox = self.__capture_runtime.peek_latest_letterbox()
+                changes = (
+                    self.__capture_runtime.peek_latest_changes()
+                    if with_changes
+                    else None
+                )
+                fingerprint = self.__capture_runtime.peek_latest_fingerprint()
+                stages = (
+                    self.__capture_runtime.peek_latest_stage_outputs(copy=copy)
+                    if with_stages
+                    else {}
+                )
                 self.__frame_available.clear()
-            if with_timestamp:
-                return frame, self._duplicator.ticks_to_seconds(frame_ticks)
-            return frame
+            return frame, frame_ticks, letterbox, changes, fingerprint, stages
+
+    def subscribe(self, since: int | None = None) -> CaptureSubscription:
+        """Return an independent reader of the capture ring buffer.
+
+        :meth:`get_latest_frame` shares one wakeup between all callers, so
+        with several consumer threads whichever wakes first hides the frame
+        from the others. Each subscription instead keeps its own read cursor
+        (a frame sequence number), waits for frames newer than it and counts
+        the frames it missed in ``overruns``. Subscriptions need no cleanup
+        and stay valid across :meth:`stop`/:meth:`start`.
+
+        Args:
+            since: Sequence number to start reading after. ``None`` starts
+                after the latest committed frame.
+
+        Returns:
+            A :class:`dxcam.core.capture_subscription.CaptureSubscription`.
+
+        Example:
+            >>> cam.start(target_fps=60)
+            >>> recorder, detector = cam.subscribe(), cam.subscribe()
+            >>> frame = detector.read(timeout=1.0)
+            >>> detector.overruns
+            0
+        """
+        return CaptureSubscription(
+            frame_committed=self.__frame_committed,
+            runtime=self.__capture_runtime,
+            copy_frame=self._copy_frame,
+            ticks_to_seconds=self._ticks_to_seconds,
+            since=since,
+        )
+
+    def frames_since(self, sequence: int, copy: bool = True) -> FrameBatch | None:
+        """Return every buffered frame committed after ``sequence``, in order.
+
+        Unlike :meth:`get_latest_frame`, frames a slow consumer has not read
+        yet are returned instead of skipped, as long as they are still
+        buffered. Does not wait for new frames.
+
+        Args:
+            sequence: Sequence number of the last frame already read, e.g.
+                ``batch.sequences[-1]`` of the previous batch or
+                :attr:`frame_sequence`.
+            copy: Copy the frames into one caller-owned block (default). Set
+                ``False`` for up to two zero-copy ``(n, *frame_shape)`` views
+                of the ring buffer, split where it wraps around.
+
+        Returns:
+            A :class:`dxcam.core.capture_subscription.FrameBatch` with the
+            frames, their sequence numbers and timestamps, and ``dropped``:
+            how many frames after ``sequence`` were overwritten unread.
+            ``None`` when capture is not running.
+
+        Example:
+            >>> seq = cam.frame_sequence
+            >>> batch = cam.frames_since(seq, copy=False)
+            >>> for frame, ts in zip(batch, batch.timestamps):
+            ...     encode(frame, ts)
+            >>> seq = int(batch.sequences[-1]) if len(batch) else seq
+        """
+        return self.subscribe(since=sequence).read_batch(copy=copy, timeout=0)
+
+    def iter_frames(
+        self,
+        copy: bool = True,
+        timeout: float | None = None,
+        since: int | None = None,
+    ) -> Iterator[tuple[Frame | list[Frame], float]]:
+        """Yield ``(frame, timestamp_seconds)`` for every captured frame, in order.
+
+        Frames buffered while the consumer was busy are yielded rather than
+        skipped; frames overwritten before they were read are counted in the
+        ``overruns`` of the underlying :meth:`subscribe` subscription.
+
+        Args:
+            copy: Yield caller-owned frames (default), or ring-buffer views
+                with ``False`` that must be consumed before the producer laps
+                them.
+            timeout: Stop when no frame arrives for this many seconds.
+                ``None`` iterates until capture stops.
+            since: Sequence number to start after; ``None`` starts with the
+                next frame.
+
+        Example:
+            >>> cam.start(target_fps=60)
+            >>> for frame, ts in cam.iter_frames(timeout=1.0):
+            ...     writer.write(frame)
+        """
+        yield from self.subscribe(since=since).iter_frames(copy=copy, timeout=timeout)
+
+    def _ticks_to_seconds(self, ticks: int) -> float:
+        # Looked up per call: output recovery replaces the duplicator.
+        return self._duplicator.ticks_to_seconds(ticks)
+
+    def export_frames(
+        self,
+        first_sequence: int | None = None,
+        last_sequence: int | None = None,
+        start_time: float | None = None,
+        end_time: float | None = None,
+        copy: bool | None = None,
+    ) -> FrameBatch | None:
+        """Read back a window of buffered frames while capture keeps running.
+
+        Meant for replay buffers (see ``disk_buffer``): select frames by
+        sequence number, by timestamp (seconds, as returned with
+        ``with_timestamp=True``), or both. Bounds are inclusive and default
+        to the oldest/newest buffered frame.
+
+        Args:
+            first_sequence: First sequence number to export.
+            last_sequence: Last sequence number to export.
+            start_time: Export frames at or after this timestamp.
+            end_time: Export frames at or before this timestamp.
+            copy: Copy the window into one caller-owned block. With
+                ``False`` the frames are one or two views of the ring buffer;
+                write them out before the producer laps them. Defaults to
+                ``False`` for ``disk_buffer`` rings, whose window may not fit
+                in RAM, and to ``True`` otherwise.
+
+        Returns:
+            A :class:`dxcam.core.capture_subscription.FrameBatch`, whose
+            ``dropped`` counts frames of the requested sequence range that
+            were overwritten before they were copied, or ``None`` when
+            capture is not running.
+
+        Example:
+            >>> cam = dxcam.create(disk_buffer="D:/replay", max_buffer_len=7200)
+            >>> cam.start(target_fps=60)
+            >>> now = cam.latest_frame_time
+            >>> clip = cam.export_frames(start_time=now - 30.0)
+            >>> for frame, ts in zip(clip, clip.timestamps):
+            ...     writer.write(frame)
+        """
+        if copy is None:
+            copy = not isinstance(self._ring_storage, DiskRing)
+        with self.__lock:
+            runtime = self.__capture_runtime
+            if runtime.frame_buffer is None:
+                return None
+            readable = runtime.readable_sequences()
+            first = runtime.sequence + 1 if readable is None else readable[0]
+            if first_sequence is not None:
+                first = first_sequence
+            last = runtime.sequence if last_sequence is None else last_sequence
+            if readable is not None and (start_time, end_time) != (None, None):
+                # Narrow the window to the buffered frames inside the time range.
+                _, sequences, frame_ticks, _ = runtime.frames_between(
+                    *readable, copy=False
+                )
+                seconds = self._ticks_array_to_seconds(frame_ticks)
+                lo = 0
+                hi = len(seconds)
+                if start_time is not None:
+                    lo = int(np.searchsorted(seconds, start_time))
+                if end_time is not None:
+                    hi = int(np.searchsorted(seconds, end_time, side="right"))
+                if lo >= hi:
+                    first, last = readable[1] + 1, readable[1]
+                else:
+                    first = max(first, int(sequences[lo]))
+                    last = min(last, int(sequences[hi - 1]))
+            frame_buffer = runtime.frame_buffer
+            chunks, sequences, frame_ticks, dropped = runtime.frames_between(
+                first, last, copy=False
+            )
+        if copy and chunks:
+            # Copy without blocking the producer, then drop the frames it
+            # overwrote meanwhile.
+            block = np.concatenate(chunks)
+            with self.__lock:
+                overwritten = runtime.count_overwritten(sequences, frame_buffer)
+            chunks = (block[overwritten:],)
+            sequences = sequences[overwritten:]
+            frame_ticks = frame_ticks[overwritten:]
+            dropped += overwritten
+        timestamps = self._ticks_array_to_seconds(frame_ticks)
+        return FrameBatch(chunks, sequences, timestamps, dropped)
+
+    def _ticks_array_to_seconds(self, frame_ticks: Any) -> Any:
+        return np.array(
+            [self._ticks_to_seconds(int(ticks)) for ticks in frame_ticks],
+            dtype=np.float64,
+        )
+
+    @property
+    def shared_memory_name(self) -> str | None:
+        """Name to open the capture ring with from another process.
+
+        ``None`` unless the camera was created with ``shared_memory``.
+
+        Example:
+            >>> # In a worker process:
+            >>> from dxcam.core.shared_ring import SharedRingReader
+            >>> reader = SharedRingReader(name)
+            >>> frame, frame_ticks, sequence = reader.read()
+        """
+        if isinstance(self._ring_storage, SharedRingWriter):
+            return self._ring_storage.name
+        return None
+
+    @property
+    def frame_sequence(self) -> int:
+        """Sequence number of the latest committed frame, ``0`` before any.
+
+        Sequence numbers increase by one per buffered frame and are never
+        reused by this camera.
+        """
+        with self.__lock:
+            return self.__capture_runtime.sequence
+
+    @overload
+    def get_latest_regions(
+        self, copy: bool = True, with_timestamp: Literal[False] = False
+    ) -> list[Frame] | None: ...
+
+    @overload
+    def get_latest_regions(
+        self, copy: bool = True, with_timestamp: Literal[True] = True
+    ) -> tuple[list[Frame], float] | None: ...
+
+    def get_latest_regions(
+        self, copy: bool = True, with_timestamp: bool = False
+    ) -> list[Frame] | tuple[list[Frame], float] | None:
+        """Block until buffered regions are available and return the latest.
+
+        Requires capture started with ``start(regions=...)``.
+
+        Args:
+            copy: Return caller-owned arrays when ``True`` (default). Set to
+                ``False`` for zero-copy views into the ring buffer.
+            with_timestamp: Return ``(frames, timestamp_seconds)`` when
+                ``True``. All regions share this timestamp.
+
+        Returns:
+            One frame per region, optionally with timestamp, or ``None`` if
+            capture is stopped.
+
+        Raises:
+            RuntimeError: If capture was not started with ``regions``.
+
+        Example:
+            >>> cam.start(regions=[(0, 0, 256, 256), (20, 1000, 420, 1040)])
+            >>> (minimap, health), ts = cam.get_latest_regions(with_timestamp=True)
+            >>> cam.stop()
+        """
+        if self._capture_regions is None:
+            raise RuntimeError(
+                "get_latest_regions() requires capture started with start(regions=...)."
+            )
+        latest = self._wait_latest_buffered(copy=copy)
+        if latest is None:
+            return None
+        frame, frame_ticks, _, _, _, _ = latest
+        with self.__lock:
+            if self.__capture_runtime.region_shapes is None:
+                return None
+            frames = self.__capture_runtime.split_regions(frame)
+        if with_timestamp:
+            return frames, self._duplicator.ticks_to_seconds(frame_ticks)
+        return frames
 
     @overload
     def get_latest_frame_view(
@@ -662,11 +1766,11 @@ class DXCamera:
     @overload
     def get_latest_frame_view(
         self, with_timestamp: Literal[True] = True
-    ) -> tuple[Frame, float] | None: ...
+    ) -> tuple[Frame, float] | tuple[Frame, float, LetterboxTransform] | None: ...
 
     def get_latest_frame_view(
         self, with_timestamp: bool = False
-    ) -> Frame | tuple[Frame, float] | None:
+    ) -> Frame | tuple[Frame, float] | tuple[Frame, float, LetterboxTransform] | None:
         """Zero-copy convenience wrapper for :meth:`get_latest_frame`.
 
         Args:
@@ -694,13 +1798,20 @@ class DXCamera:
         self.__capture_start_time = time.perf_counter()
 
         capture_error = None
+        multi_region = self._capture_regions is not None
         loop_runner = CaptureLoopRunner(
             lock=self.__lock,
             frame_available_event=self.__frame_available,
             runtime=self.__capture_runtime,
-            grab_into=self._grab_into,
+            grab_into=self._grab_regions_into if multi_region else self._grab_into,
             process_staging_frame=self._process_staging_frame,
             handle_frame_size_change=self._handle_frame_size_change,
+            letterbox_transform=(
+                None if multi_region else self._processor.letterbox_transform
+            ),
+            hash_tiles=self._hash_frame_tiles,
+            fingerprint=self._processor.fingerprint,
+            frame_committed=self.__frame_committed,
         )
 
         while not self.__stop_capture.is_set():
@@ -708,7 +1819,7 @@ class DXCamera:
                 wait_for_timer(self.__timer_handle)
             try:
                 loop_runner.run_once(
-                    region=self.region,
+                    region=self._capture_union or self.region,
                     video_mode=video_mode,
                 )
             except Exception as e:
@@ -724,7 +1835,12 @@ class DXCamera:
                 self._assert_runtime_mutation_allowed()
                 self.is_capturing = False
                 self.__capture_runtime.clear()
+                self.__frame_committed.notify_all()
                 self.__last_grab_entry = None
+                self._capture_regions = None
+                self._capture_union = None
+                self._change_tile_size = None
+                self._fingerprint_frames = False
             self.__frame_available.set()
             self.__stop_capture.clear()
             self.__thread = None
@@ -736,10 +1852,15 @@ class DXCamera:
             logger.info("Screen Capture FPS: %.4f", frame_count / elapsed_s)
 
     def _rebuild_frame_buffer(self, region: Region | None) -> None:
+        if self._capture_regions is not None:
+            with self.__lock:
+                self._allocate_region_frame_buffers(reason="rebuild(output-recovery)")
+            return
         if region is None:
             region = self.region
-        frame_height = region[3] - region[1]
-        frame_width = region[2] - region[0]
+        frame_width, frame_height = self._processor.output_frame_size(
+            region[2] - region[0], region[3] - region[1]
+        )
         with self.__lock:
             self._allocate_frame_buffer_for_shape(
                 frame_height=frame_height,
@@ -798,6 +1919,11 @@ class DXCamera:
             return
         self._is_released = True
         self.stop()
+        self._processor.close()
+        self._frame_pool.clear()
+        self._frame_arena.trim()
+        if self._ring_storage is not None:
+            self._ring_storage.close()
         self._duplicator.release()
         self._stagesurf.release()
 
@@ -3,7 +3,57 @@
 from .base import (
     Processor as Processor,
     ProcessorBackends as ProcessorBackends,
+    TensorFormat as TensorFormat,
+    batch_frame_geometry as batch_frame_geometry,
+    color_mode_channels as color_mode_channels,
+    is_yuv420_mode as is_yuv420_mode,
+    letterbox_geometry as letterbox_geometry,
+    normalize_band_min_rows as normalize_band_min_rows,
+    normalize_band_workers as normalize_band_workers,
+    normalize_change_tile_size as normalize_change_tile_size,
+    normalize_interpolation_name as normalize_interpolation_name,
+    normalize_hdr_white_nits as normalize_hdr_white_nits,
+    normalize_letterbox_color as normalize_letterbox_color,
+    normalize_output_size as normalize_output_size,
     normalize_processor_backend_name as normalize_processor_backend_name,
+    normalize_source_format as normalize_source_format,
+    normalize_tensor_format as normalize_tensor_format,
+    normalize_tone_map_name as normalize_tone_map_name,
+    normalize_yuv_matrix_name as normalize_yuv_matrix_name,
+    normalize_yuv_range_name as normalize_yuv_range_name,
+    tile_grid_shape as tile_grid_shape,
+    yuv420_frame_shape as yuv420_frame_shape,
+)
+from .plan import ProcessingPlan as ProcessingPlan
+from .stats import (
+    ProcessorStageStats as ProcessorStageStats,
+    ProcessorStats as ProcessorStats,
 )
 
-__all__ = ["Processor", "ProcessorBackends", "normalize_processor_backend_name"]
+__all__ = [
+    "ProcessingPlan",
+    "Processor",
+    "ProcessorBackends",
+    "ProcessorStageStats",
+    "ProcessorStats",
+    "TensorFormat",
+    "batch_frame_geometry",
+    "color_mode_channels",
+    "is_yuv420_mode",
+    "letterbox_geometry",
+    "normalize_band_min_rows",
+    "normalize_band_workers",
+    "normalize_change_tile_size",
+    "normalize_interpolation_name",
+    "normalize_hdr_white_nits",
+    "normalize_letterbox_color",
+    "normalize_output_size",
+    "normalize_processor_backend_name",
+    "normalize_source_format",
+    "normalize_tensor_format",
+    "normalize_tone_map_name",
+    "normalize_yuv_matrix_name",
+    "normalize_yuv_range_name",
+    "tile_grid_shape",
+    "yuv420_frame_shape",
+]
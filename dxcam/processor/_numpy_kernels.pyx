@@ -5,14 +5,55 @@
 # cython: nonecheck=False
 # cython: cdivision=True
 
-from libc.stdint cimport uint8_t, uint32_t
-from cython.parallel cimport prange
+from libc.math cimport ceil, floor
+from libc.stdint cimport int32_t, int64_t, uint8_t, uint16_t, uint32_t, uint64_t
+from libc.stdlib cimport abort, free, malloc
+from libc.string cimport memcpy
+from cython.parallel cimport parallel, prange
 cimport numpy as cnp
+cimport openmp
 import numpy as np
 import os
+import sys
 
 cnp.import_array()
 
+
+cdef extern from "_simd_kernels.h" nogil:
+    int DXCAM_SIMD_SCALAR
+    int DXCAM_SIMD_SSE41
+    int DXCAM_SIMD_AVX2
+    int dxcam_simd_detect()
+    Py_ssize_t dxcam_bgra_to_rgb_sse41(const uint8_t* src, uint8_t* dst, Py_ssize_t n)
+    Py_ssize_t dxcam_bgra_to_bgr_sse41(const uint8_t* src, uint8_t* dst, Py_ssize_t n)
+    Py_ssize_t dxcam_bgra_to_rgba_sse41(const uint8_t* src, uint8_t* dst, Py_ssize_t n)
+    Py_ssize_t dxcam_bgra_to_gray_sse41(const uint8_t* src, uint8_t* dst, Py_ssize_t n)
+    Py_ssize_t dxcam_bgra_to_rgb_avx2(const uint8_t* src, uint8_t* dst, Py_ssize_t n)
+    Py_ssize_t dxcam_bgra_to_bgr_avx2(const uint8_t* src, uint8_t* dst, Py_ssize_t n)
+    Py_ssize_t dxcam_bgra_to_rgba_avx2(const uint8_t* src, uint8_t* dst, Py_ssize_t n)
+    Py_ssize_t dxcam_bgra_to_gray_avx2(const uint8_t* src, uint8_t* dst, Py_ssize_t n)
+    void dxcam_tile_hash_row_scalar(
+        const uint8_t* row,
+        Py_ssize_t row_bytes,
+        Py_ssize_t tile_bytes,
+        const uint64_t* keys,
+        uint64_t* acc,
+    )
+    void dxcam_tile_hash_row_sse41(
+        const uint8_t* row,
+        Py_ssize_t row_bytes,
+        Py_ssize_t tile_bytes,
+        const uint64_t* keys,
+        uint64_t* acc,
+    )
+    void dxcam_tile_hash_row_avx2(
+        const uint8_t* row,
+        Py_ssize_t row_bytes,
+        Py_ssize_t tile_bytes,
+        const uint64_t* keys,
+        uint64_t* acc,
+    )
+
 # Default to enabling OpenMP for frames at or above 128x128.
 # The crossover point is typically far below HD on modern CPUs.
 cdef Py_ssize_t _DEFAULT_PARALLEL_PIXELS_THRESHOLD = 128 * 128
@@ -66,6 +107,89 @@ def reset_rotate_tile() -> None:
     _ROTATE_TILE = _DEFAULT_ROTATE_TILE
 
 
+# OpenMP team size for every parallel loop. Passed explicitly to each
+# ``prange`` so it also applies to the capture thread, which does not see
+# ``omp_set_num_threads`` calls made from other threads.
+cdef int _DEFAULT_NUM_THREADS = max(1, openmp.omp_get_max_threads())
+cdef int _NUM_THREADS = _DEFAULT_NUM_THREADS
+
+
+def get_num_threads() -> int:
+    """Return the number of OpenMP threads used by parallel paths."""
+    return int(_NUM_THREADS)
+
+
+def get_max_threads() -> int:
+    """Return the OpenMP default thread count detected at import."""
+    return int(_DEFAULT_NUM_THREADS)
+
+
+def set_num_threads(value: int) -> None:
+    """Set the number of OpenMP threads used by parallel paths (>= 1)."""
+    global _NUM_THREADS
+    if value < 1:
+        raise ValueError("thread count must be >= 1")
+    _NUM_THREADS = <int>value
+
+
+def reset_num_threads() -> None:
+    """Reset the thread count to the OpenMP default."""
+    global _NUM_THREADS
+    _NUM_THREADS = _DEFAULT_NUM_THREADS
+
+
+# Vector tier used by the contiguous BGRA -> RGB/BGR/RGBA/GRAY loops, picked
+# from CPUID at import time. Index into _SIMD_TIER_NAMES.
+_SIMD_TIER_NAMES: tuple[str, ...] = ("scalar", "sse4.1", "avx2")
+cdef int _DETECTED_SIMD_TIER = dxcam_simd_detect()
+cdef int _SIMD_TIER = _DETECTED_SIMD_TIER
+
+
+def get_simd_tier() -> str:
+    """Return the active SIMD tier: ``"scalar"``, ``"sse4.1"`` or ``"avx2"``."""
+    return _SIMD_TIER_NAMES[_SIMD_TIER]
+
+
+def get_supported_simd_tiers() -> tuple[str, ...]:
+    """Return the SIMD tiers this CPU can run, from ``"scalar"`` upwards."""
+    return _SIMD_TIER_NAMES[: _DETECTED_SIMD_TIER + 1]
+
+
+def set_simd_tier(tier: str) -> None:
+    """Force a SIMD tier, e.g. ``"scalar"`` to disable explicit vectorization.
+
+    Tiers above the one detected for this CPU are rejected.
+    """
+    global _SIMD_TIER
+    if tier not in _SIMD_TIER_NAMES:
+        supported = ", ".join(_SIMD_TIER_NAMES)
+        raise ValueError(f"Unknown SIMD tier '{tier}'. Supported: {supported}.")
+    index = _SIMD_TIER_NAMES.index(tier)
+    if index > _DETECTED_SIMD_TIER:
+        raise ValueError(
+            f"SIMD tier '{tier}' is not supported by this CPU "
+            f"(detected: {_SIMD_TIER_NAMES[_DETECTED_SIMD_TIER]})."
+        )
+    _SIMD_TIER = index
+
+
+def reset_simd_tier() -> None:
+    """Reset the SIMD tier to the one detected for this CPU."""
+    global _SIMD_TIER
+    _SIMD_TIER = _DETECTED_SIMD_TIER
+
+
+def _initialize_tuning_from_cache() -> None:
+    # Autotuned settings persisted for this CPU and extension build, if any.
+    # Environment variables below still take precedence.
+    try:
+        from dxcam.processor.autotune import apply_cached_tuning
+
+        apply_cached_tuning(sys.modules[__name__])
+    except Exception:
+        pass
+
+
 def _initialize_tuning_from_env() -> None:
     raw = os.environ.get("DXCAM_NUMPY_PARALLEL_THRESHOLD")
     if raw is not None:
@@ -88,7 +212,24 @@ def _initialize_tuning_from_env() -> None:
             except ValueError:
                 pass
 
+    raw = os.environ.get("DXCAM_NUMPY_THREADS")
+    if raw is not None:
+        try:
+            value = int(raw)
+        except ValueError:
+            value = 0
+        if value >= 1:
+            set_num_threads(value)
+
+    raw = os.environ.get("DXCAM_NUMPY_SIMD")
+    if raw is not None:
+        try:
+            set_simd_tier(raw.strip().lower())
+        except ValueError:
+            pass
 
+
+_initialize_tuning_from_cache()
 _initialize_tuning_from_env()
 
 
@@ -97,6 +238,13 @@ cdef enum _ModeCode:
     MODE_BGR = 2
     MODE_RGBA = 3
     MODE_GRAY = 4
+    MODE_BGRA = 5
+
+
+cdef enum _InterpolationCode:
+    INTERP_NEAREST = 0
+    INTERP_BILINEAR = 1
+    INTERP_AREA = 2
 
 
 cdef inline int _mode_to_code(str mode) except -1:
@@ -113,6 +261,27 @@ cdef inline int _mode_to_code(str mode) except -1:
     )
 
 
+cdef inline int _output_mode_to_code(str mode) except -1:
+    # Like _mode_to_code, but also accepts BGRA passthrough for kernels that
+    # reshape the frame (resize) and therefore always write a new buffer.
+    if mode == "BGRA":
+        return MODE_BGRA
+    return _mode_to_code(mode)
+
+
+cdef inline int _interpolation_to_code(str interpolation) except -1:
+    if interpolation == "nearest":
+        return INTERP_NEAREST
+    if interpolation == "bilinear":
+        return INTERP_BILINEAR
+    if interpolation == "area":
+        return INTERP_AREA
+    raise ValueError(
+        f"Unsupported interpolation '{interpolation}'. "
+        "Supported: nearest, bilinear, area."
+    )
+
+
 cdef inline cnp.ndarray[uint8_t, ndim=3, mode="c"] _ensure_src_bgra_contiguous(
     cnp.ndarray[uint8_t, ndim=3] src
 ):
@@ -145,6 +314,47 @@ cdef inline int _validate_rotation_angle(int rotation_angle) except -1:
     )
 
 
+cdef inline int _validate_prepare_geometry(
+    cnp.ndarray src,
+    int width,
+    int height,
+    Py_ssize_t left,
+    Py_ssize_t top,
+    Py_ssize_t right,
+    Py_ssize_t bottom,
+    int rotation_angle,
+) except -1:
+    cdef Py_ssize_t expected_src_rows
+    cdef Py_ssize_t expected_active_cols
+
+    if width <= 0 or height <= 0:
+        raise ValueError("width and height must be > 0")
+    if not (0 <= left < right <= width and 0 <= top < bottom <= height):
+        raise ValueError(
+            f"Invalid region {(left, top, right, bottom)} for frame size "
+            f"{width}x{height}."
+        )
+
+    if rotation_angle == 0 or rotation_angle == 180:
+        expected_src_rows = height
+        expected_active_cols = width
+    else:
+        expected_src_rows = width
+        expected_active_cols = height
+
+    if src.shape[0] != expected_src_rows:
+        raise ValueError(
+            f"Unexpected source rows for rotation={rotation_angle}: "
+            f"expected {expected_src_rows}, got {src.shape[0]}."
+        )
+    if src.shape[1] < expected_active_cols:
+        raise ValueError(
+            f"Source pitch columns {src.shape[1]} smaller than required "
+            f"{expected_active_cols}."
+        )
+    return 0
+
+
 cdef inline void _copy_bgra_prepare_serial(
     const uint32_t[:, :] src32,
     uint32_t[:, :] dst32,
@@ -248,7 +458,7 @@ cdef inline void _copy_bgra_prepare_parallel(
     cdef Py_ssize_t src_x
 
     if rotation_angle == 0:
-        for y in prange(out_h, schedule="static"):
+        for y in prange(out_h, schedule="static", num_threads=_NUM_THREADS):
             src_y = top + y
             for x in range(out_w):
                 src_x = left + x
@@ -257,7 +467,7 @@ cdef inline void _copy_bgra_prepare_parallel(
     if rotation_angle == 90:
         n_blocks_y = (out_h + tile - 1) // tile
         n_blocks_x = (out_w + tile - 1) // tile
-        for block_y in prange(n_blocks_y, schedule="static"):
+        for block_y in prange(n_blocks_y, schedule="static", num_threads=_NUM_THREADS):
             by = block_y * tile
             y_end = by + tile
             if y_end > out_h:
@@ -274,7 +484,7 @@ cdef inline void _copy_bgra_prepare_parallel(
                         dst32[y, x] = src32[src_y, src_x]
         return
     if rotation_angle == 180:
-        for y in prange(out_h, schedule="static"):
+        for y in prange(out_h, schedule="static", num_threads=_NUM_THREADS):
             src_y = height - 1 - (top + y)
             for x in range(out_w):
                 src_x = width - 1 - (left + x)
@@ -282,7 +492,7 @@ cdef inline void _copy_bgra_prepare_parallel(
         return
     n_blocks_y = (out_h + tile - 1) // tile
     n_blocks_x = (out_w + tile - 1) // tile
-    for block_y in prange(n_blocks_y, schedule="static"):
+    for block_y in prange(n_blocks_y, schedule="static", num_threads=_NUM_THREADS):
         by = block_y * tile
         y_end = by + tile
         if y_end > out_h:
@@ -351,8 +561,6 @@ def prepare_bgra_into(
     cdef Py_ssize_t bottom
     cdef Py_ssize_t out_h
     cdef Py_ssize_t out_w
-    cdef Py_ssize_t expected_src_rows
-    cdef Py_ssize_t expected_active_cols
     cdef Py_ssize_t n_pixels
     cdef bint use_parallel
 
@@ -368,31 +576,7 @@ def prepare_bgra_into(
     top = <Py_ssize_t>region[1]
     right = <Py_ssize_t>region[2]
     bottom = <Py_ssize_t>region[3]
-
-    if width <= 0 or height <= 0:
-        raise ValueError("width and height must be > 0")
-    if not (0 <= left < right <= width and 0 <= top < bottom <= height):
-        raise ValueError(
-            f"Invalid region {tuple(region)} for frame size {width}x{height}."
-        )
-
-    if rotation_angle == 0 or rotation_angle == 180:
-        expected_src_rows = height
-        expected_active_cols = width
-    else:
-        expected_src_rows = width
-        expected_active_cols = height
-
-    if src_c.shape[0] != expected_src_rows:
-        raise ValueError(
-            f"Unexpected source rows for rotation={rotation_angle}: "
-            f"expected {expected_src_rows}, got {src_c.shape[0]}."
-        )
-    if src_c.shape[1] < expected_active_cols:
-        raise ValueError(
-            f"Source pitch columns {src_c.shape[1]} smaller than required "
-            f"{expected_active_cols}."
-        )
+    _validate_prepare_geometry(src_c, width, height, left, top, right, bottom, rotation_angle)
 
     out_w = right - left
     out_h = bottom - top
@@ -433,82 +617,88 @@ def prepare_bgra_into(
             )
 
 
-cdef inline void _bgra_to_rgb_ptr(
+cdef inline Py_ssize_t _simd_bgra_to_rgb(
     const uint8_t* src,
     uint8_t* dst,
     Py_ssize_t n_pixels,
 ) noexcept nogil:
-    cdef Py_ssize_t i
-    for i in range(n_pixels):
-        dst[0] = src[2]
-        dst[1] = src[1]
-        dst[2] = src[0]
-        src += 4
-        dst += 3
+    if _SIMD_TIER == DXCAM_SIMD_AVX2:
+        return dxcam_bgra_to_rgb_avx2(src, dst, n_pixels)
+    if _SIMD_TIER == DXCAM_SIMD_SSE41:
+        return dxcam_bgra_to_rgb_sse41(src, dst, n_pixels)
+    return 0
 
 
-cdef inline void _bgra_to_rgb_ptr_parallel(
+cdef inline Py_ssize_t _simd_bgra_to_bgr(
     const uint8_t* src,
     uint8_t* dst,
-    Py_ssize_t h,
-    Py_ssize_t w,
+    Py_ssize_t n_pixels,
 ) noexcept nogil:
-    cdef Py_ssize_t y
-    cdef Py_ssize_t x
-    cdef Py_ssize_t src_row_stride = w * 4
-    cdef Py_ssize_t dst_row_stride = w * 3
-    cdef Py_ssize_t src_base
-    cdef Py_ssize_t dst_base
-    cdef Py_ssize_t si
-    cdef Py_ssize_t di
-    for y in prange(h, schedule="static"):
-        src_base = y * src_row_stride
-        dst_base = y * dst_row_stride
-        for x in range(w):
-            si = src_base + (x * 4)
-            di = dst_base + (x * 3)
-            dst[di] = src[si + 2]
-            dst[di + 1] = src[si + 1]
-            dst[di + 2] = src[si]
+    if _SIMD_TIER == DXCAM_SIMD_AVX2:
+        return dxcam_bgra_to_bgr_avx2(src, dst, n_pixels)
+    if _SIMD_TIER == DXCAM_SIMD_SSE41:
+        return dxcam_bgra_to_bgr_sse41(src, dst, n_pixels)
+    return 0
 
 
-cdef inline void _bgra_to_bgr_ptr(
+cdef inline Py_ssize_t _simd_bgra_to_rgba(
+    const uint8_t* src,
+    uint8_t* dst,
+    Py_ssize_t n_pixels,
+) noexcept nogil:
+    if _SIMD_TIER == DXCAM_SIMD_AVX2:
+        return dxcam_bgra_to_rgba_avx2(src, dst, n_pixels)
+    if _SIMD_TIER == DXCAM_SIMD_SSE41:
+        return dxcam_bgra_to_rgba_sse41(src, dst, n_pixels)
+    return 0
+
+
+cdef inline Py_ssize_t _simd_bgra_to_gray(
     const uint8_t* src,
     uint8_t* dst,
     Py_ssize_t n_pixels,
 ) noexcept nogil:
+    if _SIMD_TIER == DXCAM_SIMD_AVX2:
+        return dxcam_bgra_to_gray_avx2(src, dst, n_pixels)
+    if _SIMD_TIER == DXCAM_SIMD_SSE41:
+        return dxcam_bgra_to_gray_sse41(src, dst, n_pixels)
+    return 0
+
+
+cdef inline void _bgra_to_rgb_ptr(
+    const uint8_t* src,
+    uint8_t* dst,
+    Py_ssize_t n_pixels,
+) noexcept nogil:
+    # Vector prefix first; the scalar loop finishes the tail (or everything
+    # on the scalar tier).
+    cdef Py_ssize_t done = _simd_bgra_to_rgb(src, dst, n_pixels)
     cdef Py_ssize_t i
-    for i in range(n_pixels):
-        dst[0] = src[0]
+    src += done * 4
+    dst += done * 3
+    for i in range(done, n_pixels):
+        dst[0] = src[2]
         dst[1] = src[1]
-        dst[2] = src[2]
+        dst[2] = src[0]
         src += 4
         dst += 3
 
 
-cdef inline void _bgra_to_bgr_ptr_parallel(
+cdef inline void _bgra_to_bgr_ptr(
     const uint8_t* src,
     uint8_t* dst,
-    Py_ssize_t h,
-    Py_ssize_t w,
+    Py_ssize_t n_pixels,
 ) noexcept nogil:
-    cdef Py_ssize_t y
-    cdef Py_ssize_t x
-    cdef Py_ssize_t src_row_stride = w * 4
-    cdef Py_ssize_t dst_row_stride = w * 3
-    cdef Py_ssize_t src_base
-    cdef Py_ssize_t dst_base
-    cdef Py_ssize_t si
-    cdef Py_ssize_t di
-    for y in prange(h, schedule="static"):
-        src_base = y * src_row_stride
-        dst_base = y * dst_row_stride
-        for x in range(w):
-            si = src_base + (x * 4)
-            di = dst_base + (x * 3)
-            dst[di] = src[si]
-            dst[di + 1] = src[si + 1]
-            dst[di + 2] = src[si + 2]
+    cdef Py_ssize_t done = _simd_bgra_to_bgr(src, dst, n_pixels)
+    cdef Py_ssize_t i
+    src += done * 4
+    dst += done * 3
+    for i in range(done, n_pixels):
+        dst[0] = src[0]
+        dst[1] = src[1]
+        dst[2] = src[2]
+        src += 4
+        dst += 3
 
 
 cdef inline void _bgra_to_rgba_ptr(
@@ -516,8 +706,11 @@ cdef inline void _bgra_to_rgba_ptr(
     uint8_t* dst,
     Py_ssize_t n_pixels,
 ) noexcept nogil:
+    cdef Py_ssize_t done = _simd_bgra_to_rgba(src, dst, n_pixels)
     cdef Py_ssize_t i
-    for i in range(n_pixels):
+    src += done * 4
+    dst += done * 4
+    for i in range(done, n_pixels):
         dst[0] = src[2]
         dst[1] = src[1]
         dst[2] = src[0]
@@ -526,40 +719,17 @@ cdef inline void _bgra_to_rgba_ptr(
         dst += 4
 
 
-cdef inline void _bgra_to_rgba_ptr_parallel(
-    const uint8_t* src,
-    uint8_t* dst,
-    Py_ssize_t h,
-    Py_ssize_t w,
-) noexcept nogil:
-    cdef Py_ssize_t y
-    cdef Py_ssize_t x
-    cdef Py_ssize_t src_row_stride = w * 4
-    cdef Py_ssize_t dst_row_stride = w * 4
-    cdef Py_ssize_t src_base
-    cdef Py_ssize_t dst_base
-    cdef Py_ssize_t si
-    cdef Py_ssize_t di
-    for y in prange(h, schedule="static"):
-        src_base = y * src_row_stride
-        dst_base = y * dst_row_stride
-        for x in range(w):
-            si = src_base + (x * 4)
-            di = dst_base + (x * 4)
-            dst[di] = src[si + 2]
-            dst[di + 1] = src[si + 1]
-            dst[di + 2] = src[si]
-            dst[di + 3] = src[si + 3]
-
-
 cdef inline void _bgra_to_gray_ptr(
     const uint8_t* src,
     uint8_t* dst,
     Py_ssize_t n_pixels,
 ) noexcept nogil:
+    cdef Py_ssize_t done = _simd_bgra_to_gray(src, dst, n_pixels)
     cdef Py_ssize_t i
     cdef uint32_t gray
-    for i in range(n_pixels):
+    src += done * 4
+    dst += done
+    for i in range(done, n_pixels):
         gray = (
             9798 * <uint32_t>src[2]
             + 19235 * <uint32_t>src[1]
@@ -571,86 +741,408 @@ cdef inline void _bgra_to_gray_ptr(
         dst += 1
 
 
-cdef inline void _bgra_to_gray_ptr_parallel(
+cdef inline Py_ssize_t _mode_channels(int mode_code) noexcept nogil:
+    if mode_code == MODE_RGB or mode_code == MODE_BGR:
+        return 3
+    if mode_code == MODE_RGBA or mode_code == MODE_BGRA:
+        return 4
+    return 1
+
+
+cdef inline void _convert_bgra_span(
+    const uint8_t* src,
+    uint8_t* dst,
+    Py_ssize_t n_pixels,
+    int mode_code,
+) noexcept nogil:
+    if mode_code == MODE_RGB:
+        _bgra_to_rgb_ptr(src, dst, n_pixels)
+    elif mode_code == MODE_BGR:
+        _bgra_to_bgr_ptr(src, dst, n_pixels)
+    elif mode_code == MODE_RGBA:
+        _bgra_to_rgba_ptr(src, dst, n_pixels)
+    else:
+        _bgra_to_gray_ptr(src, dst, n_pixels)
+
+
+cdef inline void _convert_bgra_rows(
     const uint8_t* src,
+    Py_ssize_t src_row_stride,
     uint8_t* dst,
+    Py_ssize_t dst_row_stride,
     Py_ssize_t h,
     Py_ssize_t w,
+    int mode_code,
+    bint use_parallel,
 ) noexcept nogil:
+    # Rows are addressed by byte stride, so crop views of the mapped frame and
+    # row-padded destinations are converted in place without staging copies.
     cdef Py_ssize_t y
-    cdef Py_ssize_t x
-    cdef Py_ssize_t src_row_stride = w * 4
-    cdef Py_ssize_t dst_row_stride = w
-    cdef Py_ssize_t src_base
-    cdef Py_ssize_t dst_base
-    cdef Py_ssize_t si
-    cdef Py_ssize_t di
-    cdef uint32_t gray
-    for y in prange(h, schedule="static"):
-        src_base = y * src_row_stride
-        dst_base = y * dst_row_stride
-        for x in range(w):
-            si = src_base + (x * 4)
-            di = dst_base + x
-            gray = (
-                9798 * <uint32_t>src[si + 2]
-                + 19235 * <uint32_t>src[si + 1]
-                + 3735 * <uint32_t>src[si]
-                + 16384
-            ) >> 15
-            dst[di] = <uint8_t>gray
+    if use_parallel:
+        for y in prange(h, schedule="static", num_threads=_NUM_THREADS):
+            _convert_bgra_span(
+                src + y * src_row_stride, dst + y * dst_row_stride, w, mode_code
+            )
+        return
+    if src_row_stride == w * 4 and dst_row_stride == w * _mode_channels(mode_code):
+        _convert_bgra_span(src, dst, h * w, mode_code)
+        return
+    for y in range(h):
+        _convert_bgra_span(
+            src + y * src_row_stride, dst + y * dst_row_stride, w, mode_code
+        )
 
 
-def convert_bgra(
-    cnp.ndarray[uint8_t, ndim=3] src,
-    mode: str,
-) -> cnp.ndarray:
-    """Convert BGRA ``src`` to a target color mode."""
-    cdef cnp.ndarray[uint8_t, ndim=3, mode="c"] src_c = _ensure_src_bgra_contiguous(src)
-    cdef Py_ssize_t h = src_c.shape[0]
-    cdef Py_ssize_t w = src_c.shape[1]
-    cdef Py_ssize_t n_pixels = h * w
-    cdef int mode_code = _mode_to_code(mode)
-    cdef cnp.ndarray[uint8_t, ndim=3, mode="c"] out
-    cdef const uint8_t* src_ptr = <const uint8_t*>src_c.data
-    cdef uint8_t* dst_ptr
-    cdef bint use_parallel = n_pixels >= _PARALLEL_PIXELS_THRESHOLD
+cdef inline Py_ssize_t _bgra_row_stride(cnp.ndarray src) except? -2:
+    # Byte stride between rows of a BGRA image whose pixels are packed within
+    # each row (C-contiguous frames, crop views, pitch-padded mappings), or
+    # -1 when the layout needs a contiguous copy.
+    if src.ndim != 3 or src.shape[2] != 4:
+        raise ValueError(
+            f"Expected BGRA input with 4 channels, got shape {(<object>src).shape}."
+        )
+    if src.strides[2] != 1 or (src.shape[1] > 1 and src.strides[1] != 4):
+        return -1
+    if src.shape[0] > 1 and src.strides[0] < src.shape[1] * 4:
+        return -1
+    return src.strides[0] if src.shape[0] > 1 else src.shape[1] * 4
+
+
+cdef inline Py_ssize_t _packed_row_stride(cnp.ndarray dst) noexcept:
+    # Same for an (h, w, c) destination: packed pixels, any forward row pitch.
+    cdef Py_ssize_t channels = dst.shape[2]
+    if channels > 1 and dst.strides[2] != 1:
+        return -1
+    if dst.shape[1] > 1 and dst.strides[1] != channels:
+        return -1
+    if dst.shape[0] > 1 and dst.strides[0] < dst.shape[1] * channels:
+        return -1
+    return dst.strides[0] if dst.shape[0] > 1 else dst.shape[1] * channels
+
+
+# Tile hashes: every output tile gets a 64-bit hash of its bytes so callers
+# can tell which tiles changed between frames. Each 8-byte word is mixed with
+# a key for its position inside the tile (NH/XXH3-style multiply-accumulate),
+# so the per-tile sum is position sensitive and vectorizes well. Key runs for
+# one tile row start anywhere in the first _TILE_HASH_KEYS entries; the table
+# repeats itself once more so a run never wraps.
+cdef enum:
+    _TILE_HASH_KEYS = 1024
+    _TILE_HASH_MAX_ROW_WORDS = 1024
+
+cdef uint64_t _TILE_HASH_KEY[_TILE_HASH_KEYS + _TILE_HASH_MAX_ROW_WORDS]
+
+
+cdef void _init_tile_hash_keys() noexcept:
+    cdef uint64_t state = 0x9E3779B97F4A7C15ULL
+    cdef uint64_t z
+    cdef Py_ssize_t i
+    for i in range(_TILE_HASH_KEYS):
+        # splitmix64
+        state += 0x9E3779B97F4A7C15ULL
+        z = state
+        z = (z ^ (z >> 30)) * 0xBF58476D1CE4E5B9ULL
+        z = (z ^ (z >> 27)) * 0x94D049BB133111EBULL
+        _TILE_HASH_KEY[i] = z ^ (z >> 31)
+    for i in range(_TILE_HASH_MAX_ROW_WORDS):
+        _TILE_HASH_KEY[_TILE_HASH_KEYS + i] = _TILE_HASH_KEY[i]
+
+
+_init_tile_hash_keys()
+
+
+cdef inline uint64_t _avalanche64(uint64_t h) noexcept nogil:
+    # XXH3 avalanche
+    h = h ^ (h >> 37)
+    h = h * 0x165667919E3779F9ULL
+    return h ^ (h >> 32)
+
+
+cdef inline void _hash_tile_band(
+    const uint8_t* rows,
+    Py_ssize_t row_stride,
+    Py_ssize_t n_rows,
+    Py_ssize_t row_bytes,
+    Py_ssize_t tile_bytes,
+    uint64_t* out,
+    Py_ssize_t tiles_x,
+) noexcept nogil:
+    # Hash one band of at most ``tile`` rows into ``tiles_x`` tile hashes.
+    cdef Py_ssize_t words_per_row = (tile_bytes + 7) >> 3
+    cdef Py_ssize_t y
+    cdef Py_ssize_t tx
+    cdef const uint64_t* keys
+    for tx in range(tiles_x):
+        out[tx] = 0
+    for y in range(n_rows):
+        keys = &_TILE_HASH_KEY[(y * words_per_row) & (_TILE_HASH_KEYS - 1)]
+        if _SIMD_TIER >= DXCAM_SIMD_AVX2:
+            dxcam_tile_hash_row_avx2(rows + y * row_stride, row_bytes, tile_bytes, keys, out)
+        elif _SIMD_TIER >= DXCAM_SIMD_SSE41:
+            dxcam_tile_hash_row_sse41(rows + y * row_stride, row_bytes, tile_bytes, keys, out)
+        else:
+            dxcam_tile_hash_row_scalar(rows + y * row_stride, row_bytes, tile_bytes, keys, out)
+    for tx in range(tiles_x):
+        out[tx] = _avalanche64(out[tx])
 
-    if mode_code == MODE_RGB:
-        out = np.empty((h, w, 3), dtype=np.uint8)
-        dst_ptr = <uint8_t*>out.data
-        with nogil:
-            if use_parallel:
-                _bgra_to_rgb_ptr_parallel(src_ptr, dst_ptr, h, w)
-            else:
-                _bgra_to_rgb_ptr(src_ptr, dst_ptr, n_pixels)
-        return out
-    if mode_code == MODE_BGR:
-        out = np.empty((h, w, 3), dtype=np.uint8)
-        dst_ptr = <uint8_t*>out.data
-        with nogil:
-            if use_parallel:
-                _bgra_to_bgr_ptr_parallel(src_ptr, dst_ptr, h, w)
-            else:
-                _bgra_to_bgr_ptr(src_ptr, dst_ptr, n_pixels)
-        return out
-    if mode_code == MODE_RGBA:
-        out = np.empty((h, w, 4), dtype=np.uint8)
-        dst_ptr = <uint8_t*>out.data
-        with nogil:
-            if use_parallel:
-                _bgra_to_rgba_ptr_parallel(src_ptr, dst_ptr, h, w)
-            else:
-                _bgra_to_rgba_ptr(src_ptr, dst_ptr, n_pixels)
-        return out
 
-    out = np.empty((h, w, 1), dtype=np.uint8)
-    dst_ptr = <uint8_t*>out.data
+def tile_grid_shape(int height, int width, int tile_size) -> tuple:
+    """Return ``(tiles_y, tiles_x)`` covering a ``height`` x ``width`` frame."""
+    if tile_size <= 0:
+        raise ValueError("tile_size must be > 0")
+    return (height + tile_size - 1) // tile_size, (width + tile_size - 1) // tile_size
+
+
+cdef inline uint64_t* _tile_hashes_ptr(
+    object tile_hashes,
+    Py_ssize_t height,
+    Py_ssize_t width,
+    int tile_size,
+    Py_ssize_t pixel_bytes,
+) except NULL:
+    cdef cnp.ndarray hashes
+    expected = tile_grid_shape(height, width, tile_size)
+    if (tile_size * pixel_bytes + 7) // 8 >= _TILE_HASH_MAX_ROW_WORDS:
+        raise ValueError(f"tile_size {tile_size} is too large for {pixel_bytes}-byte pixels.")
+    if not isinstance(tile_hashes, np.ndarray):
+        raise TypeError("tile_hashes must be a numpy.ndarray")
+    hashes = tile_hashes
+    if (
+        hashes.dtype != np.uint64
+        or (<object>hashes).shape != expected
+        or not hashes.flags.c_contiguous
+    ):
+        raise ValueError(
+            f"tile_hashes must be a C-contiguous uint64 array of shape {expected}, "
+            f"got {(<object>hashes).shape} {hashes.dtype}."
+        )
+    return <uint64_t*>cnp.PyArray_DATA(hashes)
+
+
+def hash_tiles_into(cnp.ndarray frame, tile_hashes, int tile_size=32) -> None:
+    """Hash ``tile_size`` x ``tile_size`` tiles of an HWC ``frame``.
+
+    ``frame`` may be 2-D or 3-D and of any dtype; tiles are hashed over their
+    raw bytes, exactly as the ``tile_hashes`` option of the conversion
+    kernels does.
+    """
+    cdef Py_ssize_t height
+    cdef Py_ssize_t width
+    cdef Py_ssize_t pixel_bytes
+    cdef Py_ssize_t row_bytes
+    cdef Py_ssize_t tile_bytes
+    cdef Py_ssize_t row_stride
+    cdef Py_ssize_t tiles_y
+    cdef Py_ssize_t tiles_x
+    cdef Py_ssize_t band
+    cdef Py_ssize_t y0
+    cdef Py_ssize_t n_rows
+    cdef const uint8_t* data
+    cdef uint64_t* out
+    cdef bint use_parallel
+
+    if frame.ndim not in (2, 3):
+        raise ValueError(f"Expected an HWC frame, got shape {(<object>frame).shape}.")
+    if not frame.flags.c_contiguous:
+        frame = np.ascontiguousarray(frame)
+    height = frame.shape[0]
+    width = frame.shape[1]
+    pixel_bytes = frame.itemsize * (frame.shape[2] if frame.ndim == 3 else 1)
+    out = _tile_hashes_ptr(tile_hashes, height, width, tile_size, pixel_bytes)
+    tiles_y, tiles_x = tile_grid_shape(height, width, tile_size)
+    row_bytes = width * pixel_bytes
+    tile_bytes = tile_size * pixel_bytes
+    row_stride = row_bytes
+    data = <const uint8_t*>cnp.PyArray_DATA(frame)
+    use_parallel = height * width >= _PARALLEL_PIXELS_THRESHOLD
     with nogil:
         if use_parallel:
-            _bgra_to_gray_ptr_parallel(src_ptr, dst_ptr, h, w)
+            for band in prange(tiles_y, schedule="static", num_threads=_NUM_THREADS):
+                y0 = band * tile_size
+                n_rows = height - y0
+                if n_rows > tile_size:
+                    n_rows = tile_size
+                _hash_tile_band(
+                    data + y0 * row_stride,
+                    row_stride,
+                    n_rows,
+                    row_bytes,
+                    tile_bytes,
+                    out + band * tiles_x,
+                    tiles_x,
+                )
+        else:
+            for band in range(tiles_y):
+                y0 = band * tile_size
+                n_rows = height - y0
+                if n_rows > tile_size:
+                    n_rows = tile_size
+                _hash_tile_band(
+                    data + y0 * row_stride,
+                    row_stride,
+                    n_rows,
+                    row_bytes,
+                    tile_bytes,
+                    out + band * tiles_x,
+                    tiles_x,
+                )
+
+
+# Frame fingerprints: the frame's bytes are split into fixed blocks, each
+# block is hashed with the tile hash row kernels and avalanched together with
+# its index, and the block hashes are summed. The sum makes the reduction
+# order-free (parallel-safe) while the index keeps it position sensitive.
+cdef enum:
+    _FINGERPRINT_BLOCK_BYTES = 4096
+
+
+cdef inline uint64_t _fingerprint_block(
+    const uint8_t* data,
+    Py_ssize_t n_bytes,
+    Py_ssize_t block,
+) noexcept nogil:
+    cdef uint64_t acc = 0
+    if _SIMD_TIER >= DXCAM_SIMD_AVX2:
+        dxcam_tile_hash_row_avx2(data, n_bytes, n_bytes, _TILE_HASH_KEY, &acc)
+    elif _SIMD_TIER >= DXCAM_SIMD_SSE41:
+        dxcam_tile_hash_row_sse41(data, n_bytes, n_bytes, _TILE_HASH_KEY, &acc)
+    else:
+        dxcam_tile_hash_row_scalar(data, n_bytes, n_bytes, _TILE_HASH_KEY, &acc)
+    return _avalanche64(acc + <uint64_t>block * 0x9E3779B185EBCA87ULL)
+
+
+def frame_fingerprint(cnp.ndarray frame, int sample_step=1) -> int:
+    """Return a 64-bit fingerprint of the raw bytes of ``frame``.
+
+    ``sample_step > 1`` only hashes every ``sample_step``-th 4 KiB block,
+    trading exactness for speed; such fingerprints can miss changes.
+    """
+    cdef Py_ssize_t n_bytes
+    cdef Py_ssize_t n_blocks
+    cdef Py_ssize_t n_samples
+    cdef Py_ssize_t i
+    cdef Py_ssize_t block
+    cdef Py_ssize_t start
+    cdef Py_ssize_t size
+    cdef const uint8_t* data
+    cdef uint64_t total = 0
+
+    if sample_step < 1:
+        raise ValueError(f"sample_step must be >= 1, got {sample_step}.")
+    if not frame.flags.c_contiguous:
+        frame = np.ascontiguousarray(frame)
+    n_bytes = frame.nbytes
+    n_blocks = (n_bytes + _FINGERPRINT_BLOCK_BYTES - 1) // _FINGERPRINT_BLOCK_BYTES
+    n_samples = (n_blocks + sample_step - 1) // sample_step
+    data = <const uint8_t*>cnp.PyArray_DATA(frame)
+    with nogil:
+        if n_bytes >= _PARALLEL_PIXELS_THRESHOLD * 4:
+            for i in prange(n_samples, schedule="static", num_threads=_NUM_THREADS):
+                block = i * sample_step
+                start = block * _FINGERPRINT_BLOCK_BYTES
+                size = n_bytes - start
+                if size > _FINGERPRINT_BLOCK_BYTES:
+                    size = _FINGERPRINT_BLOCK_BYTES
+                total += _fingerprint_block(data + start, size, block)
         else:
-            _bgra_to_gray_ptr(src_ptr, dst_ptr, n_pixels)
+            for i in range(n_samples):
+                block = i * sample_step
+                start = block * _FINGERPRINT_BLOCK_BYTES
+                size = n_bytes - start
+                if size > _FINGERPRINT_BLOCK_BYTES:
+                    size = _FINGERPRINT_BLOCK_BYTES
+                total += _fingerprint_block(data + start, size, block)
+    return _avalanche64(total ^ <uint64_t>n_bytes)
+
+
+cdef inline void _convert_bgra_rows_hashed(
+    const uint8_t* src,
+    Py_ssize_t src_row_stride,
+    uint8_t* dst,
+    Py_ssize_t dst_row_stride,
+    Py_ssize_t h,
+    Py_ssize_t w,
+    int mode_code,
+    bint use_parallel,
+    Py_ssize_t tile_size,
+    uint64_t* tile_hashes,
+) noexcept nogil:
+    # Convert one band of ``tile_size`` rows, then hash it while the freshly
+    # written rows are still in cache. Bands are independent, so each thread
+    # owns whole tile rows of the hash grid.
+    cdef Py_ssize_t channels = _mode_channels(mode_code)
+    cdef Py_ssize_t tiles_y = (h + tile_size - 1) // tile_size
+    cdef Py_ssize_t tiles_x = (w + tile_size - 1) // tile_size
+    cdef Py_ssize_t band
+    cdef Py_ssize_t y0
+    cdef Py_ssize_t n_rows
+    if use_parallel:
+        for band in prange(tiles_y, schedule="static", num_threads=_NUM_THREADS):
+            y0 = band * tile_size
+            n_rows = h - y0
+            if n_rows > tile_size:
+                n_rows = tile_size
+            _convert_bgra_rows(
+                src + y0 * src_row_stride,
+                src_row_stride,
+                dst + y0 * dst_row_stride,
+                dst_row_stride,
+                n_rows,
+                w,
+                mode_code,
+                False,
+            )
+            _hash_tile_band(
+                dst + y0 * dst_row_stride,
+                dst_row_stride,
+                n_rows,
+                w * channels,
+                tile_size * channels,
+                tile_hashes + band * tiles_x,
+                tiles_x,
+            )
+        return
+    for band in range(tiles_y):
+        y0 = band * tile_size
+        n_rows = h - y0
+        if n_rows > tile_size:
+            n_rows = tile_size
+        _convert_bgra_rows(
+            src + y0 * src_row_stride,
+            src_row_stride,
+            dst + y0 * dst_row_stride,
+            dst_row_stride,
+            n_rows,
+            w,
+            mode_code,
+            False,
+        )
+        _hash_tile_band(
+            dst + y0 * dst_row_stride,
+            dst_row_stride,
+            n_rows,
+            w * channels,
+            tile_size * channels,
+            tile_hashes + band * tiles_x,
+            tiles_x,
+        )
+
+
+def convert_bgra(
+    cnp.ndarray[uint8_t, ndim=3] src,
+    mode: str,
+) -> cnp.ndarray:
+    """Convert BGRA ``src`` to a target color mode.
+
+    ``src`` may be a row-strided view (e.g. a crop of a mapped frame).
+    """
+    cdef int mode_code = _mode_to_code(mode)
+    cdef Py_ssize_t h = src.shape[0]
+    cdef Py_ssize_t w = src.shape[1]
+    cdef cnp.ndarray[uint8_t, ndim=3, mode="c"] out = np.empty(
+        (h, w, _mode_channels(mode_code)), dtype=np.uint8
+    )
+    convert_bgra_into(src, out, mode)
     return out
 
 
@@ -658,68 +1150,2150 @@ def convert_bgra_into(
     cnp.ndarray[uint8_t, ndim=3] src,
     cnp.ndarray[uint8_t, ndim=3] dst,
     mode: str,
+    tile_hashes=None,
+    int tile_size=32,
 ) -> None:
-    """Convert BGRA ``src`` into caller-provided ``dst`` array."""
-    cdef cnp.ndarray[uint8_t, ndim=3, mode="c"] src_c = _ensure_src_bgra_contiguous(src)
-    cdef cnp.ndarray[uint8_t, ndim=3, mode="c"] dst_c = _ensure_dst_contiguous(dst)
-    cdef Py_ssize_t src_h = src_c.shape[0]
-    cdef Py_ssize_t src_w = src_c.shape[1]
-    cdef Py_ssize_t dst_h = dst_c.shape[0]
-    cdef Py_ssize_t dst_w = dst_c.shape[1]
+    """Convert BGRA ``src`` into caller-provided ``dst`` array.
+
+    Both arrays may be row-strided views: pixels must be packed within each
+    row, but rows can sit at any pitch (crop views, pitch-padded mappings,
+    row slices of a larger buffer). Other layouts are copied first.
+
+    When ``tile_hashes`` is given, the hashes of ``dst`` tiles (see
+    :func:`hash_tiles_into`) are computed in the same pass.
+    """
     cdef int mode_code = _mode_to_code(mode)
-    cdef Py_ssize_t n_pixels = src_h * src_w
+    cdef Py_ssize_t channels = _mode_channels(mode_code)
+    cdef Py_ssize_t src_row_stride = _bgra_row_stride(src)
+    cdef Py_ssize_t dst_row_stride
+    cdef Py_ssize_t h = src.shape[0]
+    cdef Py_ssize_t w = src.shape[1]
+    cdef cnp.ndarray target = dst
     cdef const uint8_t* src_ptr
     cdef uint8_t* dst_ptr
-    cdef bint use_parallel = n_pixels >= _PARALLEL_PIXELS_THRESHOLD
+    cdef uint64_t* hashes_ptr = NULL
+    cdef bint use_parallel = h * w >= _PARALLEL_PIXELS_THRESHOLD
 
-    if dst_h != src_h or dst_w != src_w:
+    if dst.shape[0] != h or dst.shape[1] != w:
         raise ValueError(
             "Destination shape does not match source dimensions: "
-            f"src=({src_h}, {src_w}, {src_c.shape[2]}) "
-            f"dst=({dst_h}, {dst_w}, {dst_c.shape[2]})."
+            f"src=({h}, {w}, {src.shape[2]}) "
+            f"dst=({dst.shape[0]}, {dst.shape[1]}, {dst.shape[2]})."
+        )
+    if dst.shape[2] != channels:
+        raise ValueError(
+            f"{mode} destination must have {channels} "
+            f"channel{'s' if channels > 1 else ''}, got {dst.shape[2]}."
         )
+    if src_row_stride < 0:
+        src = np.ascontiguousarray(src)
+        src_row_stride = w * 4
+    dst_row_stride = _packed_row_stride(dst)
+    if dst_row_stride < 0:
+        target = np.empty((h, w, channels), dtype=np.uint8)
+        dst_row_stride = w * channels
+
+    if tile_hashes is not None:
+        hashes_ptr = _tile_hashes_ptr(tile_hashes, h, w, tile_size, channels)
+
+    src_ptr = <const uint8_t*>cnp.PyArray_DATA(src)
+    dst_ptr = <uint8_t*>cnp.PyArray_DATA(target)
+    with nogil:
+        if hashes_ptr != NULL:
+            _convert_bgra_rows_hashed(
+                src_ptr,
+                src_row_stride,
+                dst_ptr,
+                dst_row_stride,
+                h,
+                w,
+                mode_code,
+                use_parallel,
+                tile_size,
+                hashes_ptr,
+            )
+        else:
+            _convert_bgra_rows(
+                src_ptr,
+                src_row_stride,
+                dst_ptr,
+                dst_row_stride,
+                h,
+                w,
+                mode_code,
+                use_parallel,
+            )
+    if target is not dst:
+        np.copyto(dst, target)
 
-    src_ptr = <const uint8_t*>src_c.data
-    dst_ptr = <uint8_t*>dst_c.data
 
-    if mode_code == MODE_RGB:
-        if dst_c.shape[2] != 3:
-            raise ValueError(
-                f"RGB destination must have 3 channels, got {dst_c.shape[2]}."
-            )
-        with nogil:
+cdef inline void _convert_bgra_segment(
+    const uint8_t* src,
+    Py_ssize_t src_step,
+    uint8_t* dst,
+    Py_ssize_t n_pixels,
+    int mode_code,
+) noexcept nogil:
+    # ``src_step`` is the signed byte distance between consecutive output
+    # pixels in the mapped source. Rotated outputs walk source columns.
+    cdef Py_ssize_t i
+    cdef uint32_t gray
+    if mode_code == MODE_RGB:
+        for i in range(n_pixels):
+            dst[0] = src[2]
+            dst[1] = src[1]
+            dst[2] = src[0]
+            src += src_step
+            dst += 3
+        return
+    if mode_code == MODE_BGR:
+        for i in range(n_pixels):
+            dst[0] = src[0]
+            dst[1] = src[1]
+            dst[2] = src[2]
+            src += src_step
+            dst += 3
+        return
+    if mode_code == MODE_RGBA:
+        for i in range(n_pixels):
+            dst[0] = src[2]
+            dst[1] = src[1]
+            dst[2] = src[0]
+            dst[3] = src[3]
+            src += src_step
+            dst += 4
+        return
+    if mode_code == MODE_BGRA:
+        for i in range(n_pixels):
+            memcpy(dst, src, 4)
+            src += src_step
+            dst += 4
+        return
+    for i in range(n_pixels):
+        gray = (
+            9798 * <uint32_t>src[2]
+            + 19235 * <uint32_t>src[1]
+            + 3735 * <uint32_t>src[0]
+            + 16384
+        ) >> 15
+        dst[0] = <uint8_t>gray
+        src += src_step
+        dst += 1
+
+
+cdef enum _TensorDTypeCode:
+    TENSOR_UINT8 = 0
+    TENSOR_FLOAT32 = 1
+    TENSOR_FLOAT16 = 2
+
+
+cdef inline uint16_t _float_to_half(float value) noexcept nogil:
+    # IEEE 754 binary32 -> binary16 with round-to-nearest-even.
+    cdef uint32_t bits
+    cdef uint32_t sign
+    cdef uint32_t magnitude
+    cdef uint32_t mantissa
+    cdef uint32_t half
+    cdef uint32_t rest
+    cdef uint32_t halfway
+    cdef int shift
+    memcpy(&bits, &value, 4)
+    sign = (bits >> 16) & 0x8000
+    magnitude = bits & 0x7FFFFFFF
+    if magnitude >= 0x7F800000:
+        # inf stays inf, NaN stays (quiet) NaN.
+        return <uint16_t>(sign | 0x7C00 | (0x0200 if magnitude > 0x7F800000 else 0))
+    if magnitude >= 0x477FF000:
+        # >= 65520 rounds past the largest finite half.
+        return <uint16_t>(sign | 0x7C00)
+    if magnitude < 0x38800000:
+        # Result is subnormal (or zero) in binary16.
+        if magnitude < 0x33000000:
+            return <uint16_t>sign
+        mantissa = (magnitude & 0x007FFFFF) | 0x00800000
+        shift = 126 - <int>(magnitude >> 23)
+        half = mantissa >> shift
+        rest = mantissa & ((<uint32_t>1 << shift) - 1)
+        halfway = <uint32_t>1 << (shift - 1)
+        if rest > halfway or (rest == halfway and (half & 1)):
+            half += 1
+        return <uint16_t>(sign | half)
+    half = (magnitude - 0x38000000) >> 13
+    rest = magnitude & 0x1FFF
+    if rest > 0x1000 or (rest == 0x1000 and (half & 1)):
+        half += 1
+    return <uint16_t>(sign | half)
+
+
+cdef struct _TensorParams:
+    const uint8_t* src
+    Py_ssize_t src_row_stride
+    char* dst
+    Py_ssize_t h
+    Py_ssize_t w
+    Py_ssize_t channels
+    int mode_code
+    int dtype_code
+    bint planar
+    # Byte offset of each output channel inside a BGRA pixel (-1 for gray).
+    int src_offset[4]
+    float scale[4]
+    float bias[4]
+
+
+cdef inline void _tensor_row(const _TensorParams* p, Py_ssize_t y) noexcept nogil:
+    cdef const uint8_t* src_row = p.src + y * p.src_row_stride
+    cdef const uint8_t* px
+    cdef Py_ssize_t c
+    cdef Py_ssize_t x
+    cdef Py_ssize_t index
+    cdef Py_ssize_t x_step
+    cdef int offset
+    cdef uint32_t value
+    cdef float scaled
+    for c in range(p.channels):
+        offset = p.src_offset[c]
+        # Planar rows are contiguous per channel; interleaved rows stride by C.
+        if p.planar:
+            index = (c * p.h + y) * p.w
+            x_step = 1
+        else:
+            index = y * p.w * p.channels + c
+            x_step = p.channels
+        px = src_row
+        for x in range(p.w):
+            if offset < 0:
+                value = (
+                    9798 * <uint32_t>px[2]
+                    + 19235 * <uint32_t>px[1]
+                    + 3735 * <uint32_t>px[0]
+                    + 16384
+                ) >> 15
+            else:
+                value = px[offset]
+            if p.dtype_code == TENSOR_UINT8:
+                (<uint8_t*>p.dst)[index] = <uint8_t>value
+            else:
+                scaled = <float>value * p.scale[c] + p.bias[c]
+                if p.dtype_code == TENSOR_FLOAT32:
+                    (<float*>p.dst)[index] = scaled
+                else:
+                    (<uint16_t*>p.dst)[index] = _float_to_half(scaled)
+            px += 4
+            index += x_step
+
+
+def convert_bgra_tensor_into(
+    cnp.ndarray src,
+    cnp.ndarray dst,
+    mode: str,
+    layout: str = "CHW",
+    scale=None,
+    bias=None,
+) -> None:
+    """Convert BGRA ``src`` into a ``CHW``/``HWC`` tensor ``dst`` in one pass.
+
+    ``dst`` dtype selects the output type (``uint8``, ``float32`` or
+    ``float16``). Float outputs are ``value * scale[c] + bias[c]`` per output
+    channel ``c``, so ``scale = 1 / (255 * std)`` and ``bias = -mean / std``
+    fuse the usual ``/255`` and mean/std normalization. ``src`` rows may be
+    pitch-strided (e.g. a crop view of the mapped frame) as long as pixels
+    within a row are packed.
+    """
+    cdef int mode_code = _output_mode_to_code(mode)
+    cdef Py_ssize_t channels = _mode_channels(mode_code)
+    cdef Py_ssize_t h
+    cdef Py_ssize_t w
+    cdef Py_ssize_t c
+    cdef Py_ssize_t y
+    cdef _TensorParams params
+    cdef bint use_parallel
+    cdef object scale_values
+    cdef object bias_values
+
+    if src.ndim != 3 or src.dtype != np.uint8 or src.shape[2] != 4:
+        raise ValueError("Source must be a uint8 BGRA image with shape (h, w, 4).")
+    if src.strides[2] != 1 or src.strides[1] != 4 or src.strides[0] <= 0:
+        src = np.ascontiguousarray(src)
+    if layout == "CHW":
+        params.planar = True
+    elif layout == "HWC":
+        params.planar = False
+    else:
+        raise ValueError(f"Unsupported tensor layout '{layout}'. Supported: CHW, HWC.")
+    if dst.dtype == np.uint8:
+        params.dtype_code = TENSOR_UINT8
+    elif dst.dtype == np.float32:
+        params.dtype_code = TENSOR_FLOAT32
+    elif dst.dtype == np.float16:
+        params.dtype_code = TENSOR_FLOAT16
+    else:
+        raise ValueError(
+            f"Unsupported tensor dtype {dst.dtype}. Supported: uint8, float32, float16."
+        )
+    if not dst.flags.c_contiguous:
+        raise ValueError("Destination tensor must be C-contiguous.")
+
+    h = src.shape[0]
+    w = src.shape[1]
+    if params.planar:
+        expected = (channels, h, w)
+    else:
+        expected = (h, w, channels)
+    dst_shape = (<object>dst).shape
+    if dst_shape != expected:
+        raise ValueError(
+            f"{mode} {layout} destination must have shape {expected}, got {dst_shape}."
+        )
+
+    scale_values = [1.0] * channels if scale is None else list(scale)
+    bias_values = [0.0] * channels if bias is None else list(bias)
+    if len(scale_values) != channels or len(bias_values) != channels:
+        raise ValueError(f"scale and bias must have {channels} value(s) for {mode}.")
+
+    if mode_code == MODE_RGB:
+        params.src_offset[0], params.src_offset[1], params.src_offset[2] = 2, 1, 0
+    elif mode_code == MODE_BGR:
+        params.src_offset[0], params.src_offset[1], params.src_offset[2] = 0, 1, 2
+    elif mode_code == MODE_RGBA:
+        params.src_offset[0], params.src_offset[1] = 2, 1
+        params.src_offset[2], params.src_offset[3] = 0, 3
+    elif mode_code == MODE_BGRA:
+        params.src_offset[0], params.src_offset[1] = 0, 1
+        params.src_offset[2], params.src_offset[3] = 2, 3
+    else:
+        params.src_offset[0] = -1
+    for c in range(channels):
+        params.scale[c] = <float>scale_values[c]
+        params.bias[c] = <float>bias_values[c]
+
+    params.src = <const uint8_t*>cnp.PyArray_DATA(src)
+    params.src_row_stride = src.strides[0]
+    params.dst = <char*>cnp.PyArray_DATA(dst)
+    params.h = h
+    params.w = w
+    params.channels = channels
+    params.mode_code = mode_code
+
+    use_parallel = h * w >= _PARALLEL_PIXELS_THRESHOLD
+    with nogil:
+        if use_parallel:
+            for y in prange(h, schedule="static", num_threads=_NUM_THREADS):
+                _tensor_row(&params, y)
+        else:
+            for y in range(h):
+                _tensor_row(&params, y)
+
+
+cdef struct _YuvParams:
+    const uint8_t* src
+    Py_ssize_t src_row_stride
+    Py_ssize_t w
+    Py_ssize_t h
+    uint8_t* y_plane
+    uint8_t* u_plane
+    uint8_t* v_plane
+    Py_ssize_t out_w
+    # NV12 interleaves U/V (step 2); I420 stores them in separate planes.
+    Py_ssize_t chroma_step
+    Py_ssize_t chroma_row_stride
+    int32_t y_coef[3]
+    int32_t u_coef[3]
+    int32_t v_coef[3]
+    int32_t y_offset
+
+
+cdef inline uint8_t _clamp_u8(int32_t value) noexcept nogil:
+    if value < 0:
+        return 0
+    if value > 255:
+        return 255
+    return <uint8_t>value
+
+
+cdef inline void _yuv420_block_row(const _YuvParams* p, Py_ssize_t by) noexcept nogil:
+    # One iteration writes two luma rows and one chroma row. Odd widths and
+    # heights replicate the last source column/row into the padding.
+    cdef Py_ssize_t sy0 = 2 * by
+    cdef Py_ssize_t sy1 = sy0 + 1 if sy0 + 1 < p.h else sy0
+    cdef const uint8_t* row0 = p.src + sy0 * p.src_row_stride
+    cdef const uint8_t* row1 = p.src + sy1 * p.src_row_stride
+    cdef uint8_t* y_row0 = p.y_plane + sy0 * p.out_w
+    cdef uint8_t* y_row1 = y_row0 + p.out_w
+    cdef uint8_t* u_row = p.u_plane + by * p.chroma_row_stride
+    cdef uint8_t* v_row = p.v_plane + by * p.chroma_row_stride
+    cdef Py_ssize_t bx
+    cdef Py_ssize_t x0
+    cdef Py_ssize_t x1
+    cdef const uint8_t* px[4]
+    cdef uint8_t* y_out[4]
+    cdef int32_t sum_b
+    cdef int32_t sum_g
+    cdef int32_t sum_r
+    cdef int k
+    for bx in range(p.out_w // 2):
+        x0 = 2 * bx
+        x1 = x0 + 1 if x0 + 1 < p.w else x0
+        px[0] = row0 + x0 * 4
+        px[1] = row0 + x1 * 4
+        px[2] = row1 + x0 * 4
+        px[3] = row1 + x1 * 4
+        y_out[0] = y_row0 + x0
+        y_out[1] = y_row0 + x0 + 1
+        y_out[2] = y_row1 + x0
+        y_out[3] = y_row1 + x0 + 1
+        sum_b = 0
+        sum_g = 0
+        sum_r = 0
+        for k in range(4):
+            y_out[k][0] = _clamp_u8(
+                (
+                    p.y_coef[0] * <int32_t>px[k][2]
+                    + p.y_coef[1] * <int32_t>px[k][1]
+                    + p.y_coef[2] * <int32_t>px[k][0]
+                    + p.y_offset
+                )
+                >> 16
+            )
+            sum_b += px[k][0]
+            sum_g += px[k][1]
+            sum_r += px[k][2]
+        # Chroma of the 2x2 block average; the /4 folds into the shift.
+        u_row[bx * p.chroma_step] = _clamp_u8(
+            (
+                p.u_coef[0] * sum_r
+                + p.u_coef[1] * sum_g
+                + p.u_coef[2] * sum_b
+                + (128 << 18)
+                + (1 << 17)
+            )
+            >> 18
+        )
+        v_row[bx * p.chroma_step] = _clamp_u8(
+            (
+                p.v_coef[0] * sum_r
+                + p.v_coef[1] * sum_g
+                + p.v_coef[2] * sum_b
+                + (128 << 18)
+                + (1 << 17)
+            )
+            >> 18
+        )
+
+
+cdef tuple _yuv_coefficients(str matrix, bint full_range):
+    if matrix == "bt601":
+        kr, kb = 0.299, 0.114
+    elif matrix == "bt709":
+        kr, kb = 0.2126, 0.0722
+    else:
+        raise ValueError(f"Unsupported YUV matrix '{matrix}'. Supported: bt601, bt709.")
+    kg = 1.0 - kr - kb
+    y_scale = 1.0 if full_range else 219.0 / 255.0
+    c_scale = 1.0 if full_range else 224.0 / 255.0
+    one = 1 << 16
+    y_coef = [round(c * y_scale * one) for c in (kr, kg, kb)]
+    u_coef = [
+        round(c * c_scale * one)
+        for c in (-kr / (2.0 * (1.0 - kb)), -kg / (2.0 * (1.0 - kb)), 0.5)
+    ]
+    v_coef = [
+        round(c * c_scale * one)
+        for c in (0.5, -kg / (2.0 * (1.0 - kr)), -kb / (2.0 * (1.0 - kr)))
+    ]
+    y_offset = (0 if full_range else 16 << 16) + (1 << 15)
+    return y_coef, u_coef, v_coef, y_offset
+
+
+def yuv420_frame_shape(int width, int height) -> tuple:
+    """Return the ``(rows, cols)`` shape of a 4:2:0 frame for ``width`` x ``height``.
+
+    Dimensions are padded up to even values; the luma plane is followed by the
+    chroma data in ``rows // 3`` extra rows (NV12 and I420 share the shape).
+    """
+    cdef Py_ssize_t out_w = width + (width & 1)
+    cdef Py_ssize_t out_h = height + (height & 1)
+    return (out_h * 3 // 2, out_w)
+
+
+def convert_bgra_yuv420_into(
+    cnp.ndarray src,
+    cnp.ndarray[uint8_t, ndim=2] dst,
+    fourcc: str,
+    matrix: str = "bt601",
+    bint full_range = False,
+) -> None:
+    """Convert BGRA ``src`` into a planar 4:2:0 frame (``NV12`` or ``I420``).
+
+    ``dst`` has shape ``yuv420_frame_shape(w, h)``: the luma plane followed by
+    interleaved UV (``NV12``) or the U then V planes (``I420``). Odd widths
+    and heights are padded to even by replicating the last column/row.
+    ``matrix`` is ``"bt601"`` or ``"bt709"``; ``full_range`` selects
+    0-255 instead of 16-235/16-240 levels. ``src`` rows may be pitch-strided.
+    """
+    cdef cnp.ndarray[uint8_t, ndim=2, mode="c"] dst_c
+    cdef Py_ssize_t h
+    cdef Py_ssize_t w
+    cdef Py_ssize_t out_h
+    cdef Py_ssize_t out_w
+    cdef Py_ssize_t by
+    cdef Py_ssize_t luma_size
+    cdef int k
+    cdef _YuvParams params
+    cdef bint use_parallel
+
+    if not dst.flags.c_contiguous:
+        raise ValueError("Destination array must be C-contiguous.")
+    dst_c = dst
+    if src.ndim != 3 or src.dtype != np.uint8 or src.shape[2] != 4:
+        raise ValueError("Source must be a uint8 BGRA image with shape (h, w, 4).")
+    if src.strides[2] != 1 or src.strides[1] != 4 or src.strides[0] <= 0:
+        src = np.ascontiguousarray(src)
+    h = src.shape[0]
+    w = src.shape[1]
+    if h <= 0 or w <= 0:
+        raise ValueError("Source image must be non-empty.")
+    out_w = w + (w & 1)
+    out_h = h + (h & 1)
+    if dst_c.shape[0] != out_h * 3 // 2 or dst_c.shape[1] != out_w:
+        raise ValueError(
+            f"{fourcc} destination must have shape {(out_h * 3 // 2, out_w)}, "
+            f"got {(dst_c.shape[0], dst_c.shape[1])}."
+        )
+
+    y_coef, u_coef, v_coef, y_offset = _yuv_coefficients(matrix, full_range)
+    for k in range(3):
+        params.y_coef[k] = y_coef[k]
+        params.u_coef[k] = u_coef[k]
+        params.v_coef[k] = v_coef[k]
+    params.y_offset = y_offset
+
+    luma_size = out_h * out_w
+    params.src = <const uint8_t*>cnp.PyArray_DATA(src)
+    params.src_row_stride = src.strides[0]
+    params.w = w
+    params.h = h
+    params.out_w = out_w
+    params.y_plane = <uint8_t*>dst_c.data
+    if fourcc == "NV12":
+        params.u_plane = params.y_plane + luma_size
+        params.v_plane = params.u_plane + 1
+        params.chroma_step = 2
+        params.chroma_row_stride = out_w
+    elif fourcc == "I420":
+        params.u_plane = params.y_plane + luma_size
+        params.v_plane = params.u_plane + luma_size // 4
+        params.chroma_step = 1
+        params.chroma_row_stride = out_w // 2
+    else:
+        raise ValueError(f"Unsupported YUV format '{fourcc}'. Supported: NV12, I420.")
+
+    use_parallel = h * w >= _PARALLEL_PIXELS_THRESHOLD
+    with nogil:
+        if use_parallel:
+            for by in prange(out_h // 2, schedule="static", num_threads=_NUM_THREADS):
+                _yuv420_block_row(&params, by)
+        else:
+            for by in range(out_h // 2):
+                _yuv420_block_row(&params, by)
+
+
+cdef struct _SourceWalk:
+    const uint8_t* origin
+    Py_ssize_t row_step
+    Py_ssize_t col_step
+
+
+cdef inline _SourceWalk _source_walk(
+    cnp.ndarray src,
+    int width,
+    int height,
+    Py_ssize_t left,
+    Py_ssize_t top,
+    int rotation_angle,
+) noexcept:
+    return _source_walk_at(
+        <const uint8_t*>src.data,
+        src.shape[1] * 4,
+        width,
+        height,
+        left,
+        top,
+        rotation_angle,
+    )
+
+
+cdef inline _SourceWalk _source_walk_at(
+    const uint8_t* base,
+    Py_ssize_t pitch,
+    int width,
+    int height,
+    Py_ssize_t left,
+    Py_ssize_t top,
+    int rotation_angle,
+) noexcept nogil:
+    # Express the rotation as the mapped-source address of output pixel (0, 0)
+    # plus signed byte steps per output row and column, so every output row is
+    # a strided walk over the pitch-padded source.
+    cdef _SourceWalk walk
+    cdef Py_ssize_t origin_y
+    cdef Py_ssize_t origin_x
+    if rotation_angle == 0:
+        origin_y = top
+        origin_x = left
+        walk.row_step = pitch
+        walk.col_step = 4
+    elif rotation_angle == 90:
+        origin_y = width - 1 - left
+        origin_x = top
+        walk.row_step = 4
+        walk.col_step = -pitch
+    elif rotation_angle == 180:
+        origin_y = height - 1 - top
+        origin_x = width - 1 - left
+        walk.row_step = -pitch
+        walk.col_step = -4
+    else:
+        origin_y = left
+        origin_x = height - 1 - top
+        walk.row_step = -4
+        walk.col_step = pitch
+    walk.origin = base + origin_y * pitch + origin_x * 4
+    return walk
+
+
+cdef inline void _convert_bgra_prepare_blocks(
+    const uint8_t* origin,
+    Py_ssize_t row_step,
+    Py_ssize_t col_step,
+    uint8_t* dst,
+    Py_ssize_t dst_row_stride,
+    Py_ssize_t channels,
+    Py_ssize_t out_h,
+    Py_ssize_t out_w,
+    Py_ssize_t tile_h,
+    Py_ssize_t tile_w,
+    int mode_code,
+    bint use_parallel,
+) noexcept nogil:
+    cdef Py_ssize_t n_blocks_y = (out_h + tile_h - 1) // tile_h
+    cdef Py_ssize_t n_blocks_x = (out_w + tile_w - 1) // tile_w
+    cdef Py_ssize_t block_y
+    cdef Py_ssize_t block_x
+    cdef Py_ssize_t by
+    cdef Py_ssize_t bx
+    cdef Py_ssize_t y_end
+    cdef Py_ssize_t x_end
+    cdef Py_ssize_t y
+
+    if use_parallel:
+        for block_y in prange(n_blocks_y, schedule="static", num_threads=_NUM_THREADS):
+            by = block_y * tile_h
+            y_end = by + tile_h
+            if y_end > out_h:
+                y_end = out_h
+            for block_x in range(n_blocks_x):
+                bx = block_x * tile_w
+                x_end = bx + tile_w
+                if x_end > out_w:
+                    x_end = out_w
+                for y in range(by, y_end):
+                    _convert_bgra_segment(
+                        origin + y * row_step + bx * col_step,
+                        col_step,
+                        dst + y * dst_row_stride + bx * channels,
+                        x_end - bx,
+                        mode_code,
+                    )
+        return
+    for block_y in range(n_blocks_y):
+        by = block_y * tile_h
+        y_end = by + tile_h
+        if y_end > out_h:
+            y_end = out_h
+        for block_x in range(n_blocks_x):
+            bx = block_x * tile_w
+            x_end = bx + tile_w
+            if x_end > out_w:
+                x_end = out_w
+            for y in range(by, y_end):
+                _convert_bgra_segment(
+                    origin + y * row_step + bx * col_step,
+                    col_step,
+                    dst + y * dst_row_stride + bx * channels,
+                    x_end - bx,
+                    mode_code,
+                )
+
+
+cdef inline void _convert_bgra_prepare_hashed_band(
+    const _SourceWalk* walk,
+    uint8_t* dst,
+    Py_ssize_t channels,
+    Py_ssize_t out_h,
+    Py_ssize_t out_w,
+    Py_ssize_t band,
+    Py_ssize_t tile_size,
+    Py_ssize_t tile_h,
+    Py_ssize_t tile_w,
+    int mode_code,
+    uint64_t* band_hashes,
+    Py_ssize_t tiles_x,
+) noexcept nogil:
+    cdef Py_ssize_t y0 = band * tile_size
+    cdef Py_ssize_t n_rows = out_h - y0
+    cdef Py_ssize_t row_bytes = out_w * channels
+    if n_rows > tile_size:
+        n_rows = tile_size
+    _convert_bgra_prepare_blocks(
+        walk.origin + y0 * walk.row_step,
+        walk.row_step,
+        walk.col_step,
+        dst + y0 * row_bytes,
+        row_bytes,
+        channels,
+        n_rows,
+        out_w,
+        tile_h,
+        tile_w,
+        mode_code,
+        False,
+    )
+    _hash_tile_band(
+        dst + y0 * row_bytes,
+        row_bytes,
+        n_rows,
+        row_bytes,
+        tile_size * channels,
+        band_hashes,
+        tiles_x,
+    )
+
+
+def convert_bgra_prepare(
+    cnp.ndarray[uint8_t, ndim=3] src,
+    int width,
+    int height,
+    region,
+    int rotation_angle,
+    mode: str,
+) -> cnp.ndarray:
+    """Map/rotate/crop mapped BGRA ``src`` and convert it in one pass."""
+    cdef int mode_code = _mode_to_code(mode)
+    cdef cnp.ndarray[uint8_t, ndim=3, mode="c"] out
+
+    out = np.empty(
+        (
+            <Py_ssize_t>region[3] - <Py_ssize_t>region[1],
+            <Py_ssize_t>region[2] - <Py_ssize_t>region[0],
+            _mode_channels(mode_code),
+        ),
+        dtype=np.uint8,
+    )
+    convert_bgra_prepare_into(src, out, width, height, region, rotation_angle, mode)
+    return out
+
+
+def convert_bgra_prepare_into(
+    cnp.ndarray[uint8_t, ndim=3] src,
+    cnp.ndarray[uint8_t, ndim=3] dst,
+    int width,
+    int height,
+    region,
+    int rotation_angle,
+    mode: str,
+    tile_hashes=None,
+    int tile_size=32,
+) -> None:
+    """Map/rotate/crop mapped BGRA ``src`` and convert it into ``dst`` in one pass.
+
+    Equivalent to :func:`prepare_bgra_into` followed by
+    :func:`convert_bgra_into`, without the intermediate BGRA frame.
+    ``tile_hashes`` is filled in the same pass, as in :func:`convert_bgra_into`.
+    """
+    cdef cnp.ndarray[uint8_t, ndim=3, mode="c"] src_c = _ensure_src_bgra_contiguous(src)
+    cdef cnp.ndarray[uint8_t, ndim=3, mode="c"] dst_c = _ensure_dst_contiguous(dst)
+    cdef int mode_code = _mode_to_code(mode)
+    cdef Py_ssize_t channels = _mode_channels(mode_code)
+    cdef Py_ssize_t left
+    cdef Py_ssize_t top
+    cdef Py_ssize_t right
+    cdef Py_ssize_t bottom
+    cdef Py_ssize_t out_h
+    cdef Py_ssize_t out_w
+    cdef _SourceWalk walk
+    cdef Py_ssize_t tile_h
+    cdef Py_ssize_t tile_w
+    cdef uint8_t* dst_ptr
+    cdef uint64_t* hashes_ptr = NULL
+    cdef Py_ssize_t tiles_y
+    cdef Py_ssize_t tiles_x
+    cdef Py_ssize_t band
+    cdef bint use_parallel
+
+    _validate_rotation_angle(rotation_angle)
+    left = <Py_ssize_t>region[0]
+    top = <Py_ssize_t>region[1]
+    right = <Py_ssize_t>region[2]
+    bottom = <Py_ssize_t>region[3]
+    _validate_prepare_geometry(src_c, width, height, left, top, right, bottom, rotation_angle)
+
+    out_w = right - left
+    out_h = bottom - top
+    if dst_c.shape[0] != out_h or dst_c.shape[1] != out_w:
+        raise ValueError(
+            "Destination shape does not match requested region: "
+            f"region=({left}, {top}, {right}, {bottom}) "
+            f"dst=({dst_c.shape[0]}, {dst_c.shape[1]}, {dst_c.shape[2]})."
+        )
+    if dst_c.shape[2] != channels:
+        raise ValueError(
+            f"{mode} destination must have {channels} channel(s), "
+            f"got {dst_c.shape[2]}."
+        )
+
+    walk = _source_walk(src_c, width, height, left, top, rotation_angle)
+    if rotation_angle == 90 or rotation_angle == 270:
+        tile_h = _ROTATE_TILE
+        tile_w = _ROTATE_TILE
+    else:
+        tile_h = 1
+        tile_w = out_w
+
+    dst_ptr = <uint8_t*>dst_c.data
+    use_parallel = out_w * out_h >= _PARALLEL_PIXELS_THRESHOLD
+    if tile_hashes is not None:
+        hashes_ptr = _tile_hashes_ptr(tile_hashes, out_h, out_w, tile_size, channels)
+        tiles_y, tiles_x = tile_grid_shape(out_h, out_w, tile_size)
+        if tile_h > tile_size:
+            tile_h = tile_size
+        with nogil:
+            # One band of hash-tile rows per task: convert, then hash while hot.
             if use_parallel:
-                _bgra_to_rgb_ptr_parallel(src_ptr, dst_ptr, src_h, src_w)
+                for band in prange(tiles_y, schedule="static", num_threads=_NUM_THREADS):
+                    _convert_bgra_prepare_hashed_band(
+                        &walk,
+                        dst_ptr,
+                        channels,
+                        out_h,
+                        out_w,
+                        band,
+                        tile_size,
+                        tile_h,
+                        tile_w,
+                        mode_code,
+                        hashes_ptr + band * tiles_x,
+                        tiles_x,
+                    )
             else:
-                _bgra_to_rgb_ptr(src_ptr, dst_ptr, n_pixels)
+                for band in range(tiles_y):
+                    _convert_bgra_prepare_hashed_band(
+                        &walk,
+                        dst_ptr,
+                        channels,
+                        out_h,
+                        out_w,
+                        band,
+                        tile_size,
+                        tile_h,
+                        tile_w,
+                        mode_code,
+                        hashes_ptr + band * tiles_x,
+                        tiles_x,
+                    )
         return
-    if mode_code == MODE_BGR:
-        if dst_c.shape[2] != 3:
+
+    with nogil:
+        _convert_bgra_prepare_blocks(
+            walk.origin,
+            walk.row_step,
+            walk.col_step,
+            dst_ptr,
+            out_w * channels,
+            channels,
+            out_h,
+            out_w,
+            tile_h,
+            tile_w,
+            mode_code,
+            use_parallel,
+        )
+
+
+cdef struct _RegionTask:
+    # One band of output rows of one region: source address of its first
+    # output pixel, signed byte steps, and the packed destination rows.
+    const uint8_t* src
+    Py_ssize_t row_step
+    Py_ssize_t col_step
+    uint8_t* dst
+    Py_ssize_t dst_row_stride
+    Py_ssize_t rows
+    Py_ssize_t cols
+    Py_ssize_t channels
+
+
+cdef inline void _run_region_task(
+    const _RegionTask* task,
+    Py_ssize_t tile_w,
+    int mode_code,
+) noexcept nogil:
+    cdef Py_ssize_t y
+    if task.col_step != 4:
+        _convert_bgra_prepare_blocks(
+            task.src,
+            task.row_step,
+            task.col_step,
+            task.dst,
+            task.dst_row_stride,
+            task.channels,
+            task.rows,
+            task.cols,
+            task.rows,
+            tile_w if tile_w > 0 else task.cols,
+            mode_code,
+            False,
+        )
+        return
+    for y in range(task.rows):
+        if mode_code == MODE_BGRA:
+            memcpy(
+                task.dst + y * task.dst_row_stride,
+                task.src + y * task.row_step,
+                task.cols * 4,
+            )
+        else:
+            _convert_bgra_span(
+                task.src + y * task.row_step,
+                task.dst + y * task.dst_row_stride,
+                task.cols,
+                mode_code,
+            )
+
+
+def convert_bgra_regions_into(
+    cnp.ndarray[uint8_t, ndim=3] src,
+    dsts,
+    int width,
+    int height,
+    regions,
+    int rotation_angle,
+    mode: str,
+) -> None:
+    """Map/rotate/crop several regions of mapped BGRA ``src`` in one pass.
+
+    Every ``regions[i]`` is converted into ``dsts[i]`` exactly as
+    :func:`convert_bgra_prepare_into` would, but all regions are split into
+    row bands and scheduled in a single parallel loop over the mapped frame.
+    ``mode`` may be ``"BGRA"`` for a plain copy. Destinations may be
+    row-strided but must have packed pixels.
+    """
+    cdef cnp.ndarray[uint8_t, ndim=3, mode="c"] src_c = _ensure_src_bgra_contiguous(src)
+    cdef int mode_code = _output_mode_to_code(mode)
+    cdef Py_ssize_t channels = _mode_channels(mode_code)
+    cdef Py_ssize_t n_regions = len(regions)
+    cdef Py_ssize_t band_rows
+    cdef Py_ssize_t n_tasks = 0
+    cdef Py_ssize_t total_pixels = 0
+    cdef Py_ssize_t i
+    cdef Py_ssize_t t
+    cdef Py_ssize_t y0
+    cdef Py_ssize_t left
+    cdef Py_ssize_t top
+    cdef Py_ssize_t right
+    cdef Py_ssize_t bottom
+    cdef Py_ssize_t out_h
+    cdef Py_ssize_t out_w
+    cdef Py_ssize_t dst_row_stride
+    cdef Py_ssize_t tile_w
+    cdef cnp.ndarray dst
+    cdef _SourceWalk walk
+    cdef _RegionTask* tasks
+    cdef bint use_parallel
+
+    if len(dsts) != n_regions:
+        raise ValueError(
+            f"Expected {n_regions} destination arrays, got {len(dsts)}."
+        )
+    _validate_rotation_angle(rotation_angle)
+    if rotation_angle == 90 or rotation_angle == 270:
+        band_rows = _ROTATE_TILE
+        tile_w = _ROTATE_TILE
+    else:
+        band_rows = 1
+        tile_w = 0  # whole rows
+
+    for i in range(n_regions):
+        region = regions[i]
+        left = <Py_ssize_t>region[0]
+        top = <Py_ssize_t>region[1]
+        right = <Py_ssize_t>region[2]
+        bottom = <Py_ssize_t>region[3]
+        _validate_prepare_geometry(
+            src_c, width, height, left, top, right, bottom, rotation_angle
+        )
+        dst = dsts[i]
+        out_w = right - left
+        out_h = bottom - top
+        if (
+            dst.dtype != np.uint8
+            or dst.ndim != 3
+            or dst.shape[0] != out_h
+            or dst.shape[1] != out_w
+        ):
             raise ValueError(
-                f"BGR destination must have 3 channels, got {dst_c.shape[2]}."
+                f"Destination {i} does not match region "
+                f"({left}, {top}, {right}, {bottom}): "
+                f"dst shape={(<object>dst).shape}, dtype={dst.dtype}."
             )
+        if dst.shape[2] != channels:
+            raise ValueError(
+                f"{mode} destination must have {channels} channel(s), "
+                f"got {dst.shape[2]}."
+            )
+        if _packed_row_stride(dst) < 0:
+            raise ValueError(f"Destination {i} must have packed pixel rows.")
+        n_tasks += (out_h + band_rows - 1) // band_rows
+        total_pixels += out_h * out_w
+
+    if n_tasks == 0:
+        return
+    tasks = <_RegionTask*>malloc(n_tasks * sizeof(_RegionTask))
+    if tasks == NULL:
+        raise MemoryError()
+    try:
+        t = 0
+        for i in range(n_regions):
+            region = regions[i]
+            dst = dsts[i]
+            left = <Py_ssize_t>region[0]
+            top = <Py_ssize_t>region[1]
+            out_w = <Py_ssize_t>region[2] - left
+            out_h = <Py_ssize_t>region[3] - top
+            walk = _source_walk(src_c, width, height, left, top, rotation_angle)
+            dst_row_stride = _packed_row_stride(dst)
+            for y0 in range(0, out_h, band_rows):
+                tasks[t].src = walk.origin + y0 * walk.row_step
+                tasks[t].row_step = walk.row_step
+                tasks[t].col_step = walk.col_step
+                tasks[t].dst = <uint8_t*>cnp.PyArray_DATA(dst) + y0 * dst_row_stride
+                tasks[t].dst_row_stride = dst_row_stride
+                tasks[t].rows = min(band_rows, out_h - y0)
+                tasks[t].cols = out_w
+                tasks[t].channels = channels
+                t += 1
+
+        use_parallel = total_pixels >= _PARALLEL_PIXELS_THRESHOLD
         with nogil:
             if use_parallel:
-                _bgra_to_bgr_ptr_parallel(src_ptr, dst_ptr, src_h, src_w)
+                for t in prange(n_tasks, schedule="static", num_threads=_NUM_THREADS):
+                    _run_region_task(&tasks[t], tile_w, mode_code)
             else:
-                _bgra_to_bgr_ptr(src_ptr, dst_ptr, n_pixels)
+                for t in range(n_tasks):
+                    _run_region_task(&tasks[t], tile_w, mode_code)
+    finally:
+        free(tasks)
+
+
+cdef struct _BatchParams:
+    # Frame ``n`` of the stack is the walk below shifted by n * src_frame_step;
+    # its output rows start at dst + n * dst_frame_step.
+    _SourceWalk walk
+    Py_ssize_t src_frame_step
+    uint8_t* dst
+    Py_ssize_t dst_frame_step
+    Py_ssize_t dst_row_stride
+    Py_ssize_t out_h
+    Py_ssize_t out_w
+    Py_ssize_t channels
+    Py_ssize_t band_rows
+    Py_ssize_t bands_per_frame
+    Py_ssize_t tile_w
+    int mode_code
+
+
+cdef inline void _run_batch_task(const _BatchParams* p, Py_ssize_t t) noexcept nogil:
+    cdef Py_ssize_t frame = t // p.bands_per_frame
+    cdef Py_ssize_t y0 = (t % p.bands_per_frame) * p.band_rows
+    cdef _RegionTask task
+    task.src = p.walk.origin + frame * p.src_frame_step + y0 * p.walk.row_step
+    task.row_step = p.walk.row_step
+    task.col_step = p.walk.col_step
+    task.dst = p.dst + frame * p.dst_frame_step + y0 * p.dst_row_stride
+    task.dst_row_stride = p.dst_row_stride
+    task.rows = min(p.band_rows, p.out_h - y0)
+    task.cols = p.out_w
+    task.channels = p.channels
+    _run_region_task(&task, p.tile_w, p.mode_code)
+
+
+def convert_bgra_batch_into(
+    cnp.ndarray src,
+    cnp.ndarray dst,
+    mode: str,
+    int rotation_angle=0,
+    region=None,
+) -> None:
+    """Rotate/crop/convert a stack of BGRA frames in one parallel pass.
+
+    ``src`` is ``(N, rows, cols, 4)`` unrotated frames; each output frame is
+    what :func:`convert_bgra_prepare_into` produces for a ``cols x rows``
+    frame (``rows x cols`` when rotated by 90/270) and ``region`` in output
+    coordinates (default: the whole frame). Bands of rows of every frame are
+    scheduled in a single parallel loop. ``mode`` may be ``"BGRA"`` for a
+    plain rotate/crop copy. Frames and destination rows may be strided, but
+    pixels must be packed within each row.
+    """
+    cdef int mode_code = _output_mode_to_code(mode)
+    cdef Py_ssize_t channels = _mode_channels(mode_code)
+    cdef Py_ssize_t n_frames
+    cdef Py_ssize_t rows
+    cdef Py_ssize_t cols
+    cdef int width
+    cdef int height
+    cdef Py_ssize_t left
+    cdef Py_ssize_t top
+    cdef Py_ssize_t right
+    cdef Py_ssize_t bottom
+    cdef Py_ssize_t n_tasks
+    cdef Py_ssize_t t
+    cdef _BatchParams params
+
+    if src.dtype != np.uint8 or src.ndim != 4 or src.shape[3] != 4:
+        raise ValueError(
+            f"Expected (N, H, W, 4) uint8 BGRA frames, got shape "
+            f"{(<object>src).shape} and dtype {src.dtype}."
+        )
+    if (
+        src.strides[3] != 1
+        or src.strides[2] != 4
+        or src.strides[1] < src.shape[2] * 4
+        or src.strides[0] < 0
+    ):
+        src = np.ascontiguousarray(src)
+    _validate_rotation_angle(rotation_angle)
+    n_frames = src.shape[0]
+    rows = src.shape[1]
+    cols = src.shape[2]
+    if rotation_angle == 0 or rotation_angle == 180:
+        width = <int>cols
+        height = <int>rows
+    else:
+        width = <int>rows
+        height = <int>cols
+    if region is None:
+        region = (0, 0, width, height)
+    left = <Py_ssize_t>region[0]
+    top = <Py_ssize_t>region[1]
+    right = <Py_ssize_t>region[2]
+    bottom = <Py_ssize_t>region[3]
+    if not (0 <= left < right <= width and 0 <= top < bottom <= height):
+        raise ValueError(
+            f"Invalid region {(left, top, right, bottom)} for frame size "
+            f"{width}x{height}."
+        )
+    params.out_w = right - left
+    params.out_h = bottom - top
+    if (
+        dst.dtype != np.uint8
+        or dst.ndim != 4
+        or dst.shape[0] != n_frames
+        or dst.shape[1] != params.out_h
+        or dst.shape[2] != params.out_w
+        or dst.shape[3] != channels
+    ):
+        raise ValueError(
+            f"Destination must be ({n_frames}, {params.out_h}, {params.out_w}, "
+            f"{channels}) uint8 for {mode}, got shape {(<object>dst).shape} "
+            f"and dtype {dst.dtype}."
+        )
+    if (
+        (channels > 1 and dst.strides[3] != 1)
+        or (params.out_w > 1 and dst.strides[2] != channels)
+        or (params.out_h > 1 and dst.strides[1] < params.out_w * channels)
+        or dst.strides[0] < 0
+    ):
+        raise ValueError("Destination frames must have packed pixel rows.")
+    if n_frames == 0:
         return
-    if mode_code == MODE_RGBA:
-        if dst_c.shape[2] != 4:
+
+    params.walk = _source_walk_at(
+        <const uint8_t*>src.data,
+        src.strides[1],
+        width,
+        height,
+        left,
+        top,
+        rotation_angle,
+    )
+    params.src_frame_step = src.strides[0]
+    params.dst = <uint8_t*>dst.data
+    params.dst_frame_step = dst.strides[0]
+    params.dst_row_stride = (
+        dst.strides[1] if params.out_h > 1 else params.out_w * channels
+    )
+    params.channels = channels
+    params.mode_code = mode_code
+    # Rotated frames are walked in square tiles; unrotated ones in row bands
+    # of the same height to keep the task count low for long stacks.
+    params.band_rows = _ROTATE_TILE
+    params.tile_w = _ROTATE_TILE if rotation_angle == 90 or rotation_angle == 270 else 0
+    params.bands_per_frame = (params.out_h + params.band_rows - 1) // params.band_rows
+    n_tasks = n_frames * params.bands_per_frame
+
+    with nogil:
+        if n_frames * params.out_h * params.out_w >= _PARALLEL_PIXELS_THRESHOLD:
+            for t in prange(n_tasks, schedule="static", num_threads=_NUM_THREADS):
+                _run_batch_task(&params, t)
+        else:
+            for t in range(n_tasks):
+                _run_batch_task(&params, t)
+
+
+cdef class ConversionPlan:
+    """Pre-validated rotate/crop/convert of one mapped-frame geometry.
+
+    Everything :func:`convert_bgra_prepare_into` checks per call (pitch,
+    rotation, region, destination layout) is checked once here; :meth:`run`
+    then only takes the mapped base address and a destination with the same
+    shape and strides as the one the plan was built for. ``mode`` may be
+    ``"BGRA"`` for a plain rotate/crop copy.
+    """
+
+    cdef _BatchParams params
+    cdef Py_ssize_t origin_offset
+    cdef Py_ssize_t n_tasks
+    cdef readonly Py_ssize_t pitch
+    cdef readonly tuple dst_shape
+    cdef readonly tuple dst_strides
+
+    def __cinit__(
+        self,
+        Py_ssize_t pitch,
+        int width,
+        int height,
+        region,
+        int rotation_angle,
+        str mode,
+        cnp.ndarray dst not None,
+    ):
+        cdef int mode_code = _output_mode_to_code(mode)
+        cdef Py_ssize_t channels = _mode_channels(mode_code)
+        cdef Py_ssize_t left
+        cdef Py_ssize_t top
+        cdef Py_ssize_t right
+        cdef Py_ssize_t bottom
+        cdef Py_ssize_t active_cols
+        cdef _SourceWalk walk
+
+        _validate_rotation_angle(rotation_angle)
+        active_cols = width if rotation_angle == 0 or rotation_angle == 180 else height
+        if pitch <= 0 or pitch % 4 != 0 or pitch < active_cols * 4:
+            raise ValueError(f"Invalid mapped pitch {pitch} for {active_cols} columns.")
+        left = <Py_ssize_t>region[0]
+        top = <Py_ssize_t>region[1]
+        right = <Py_ssize_t>region[2]
+        bottom = <Py_ssize_t>region[3]
+        if not (0 <= left < right <= width and 0 <= top < bottom <= height):
+            raise ValueError(
+                f"Invalid region {(left, top, right, bottom)} for frame size "
+                f"{width}x{height}."
+            )
+        self.params.out_w = right - left
+        self.params.out_h = bottom - top
+        if (
+            dst.dtype != np.uint8
+            or dst.ndim != 3
+            or dst.shape[0] != self.params.out_h
+            or dst.shape[1] != self.params.out_w
+            or dst.shape[2] != channels
+        ):
             raise ValueError(
-                f"RGBA destination must have 4 channels, got {dst_c.shape[2]}."
+                f"Destination must be ({self.params.out_h}, {self.params.out_w}, "
+                f"{channels}) uint8 for {mode}, got shape {(<object>dst).shape} "
+                f"and dtype {dst.dtype}."
             )
+        if (
+            (channels > 1 and dst.strides[2] != 1)
+            or (self.params.out_w > 1 and dst.strides[1] != channels)
+            or (self.params.out_h > 1 and dst.strides[0] < self.params.out_w * channels)
+        ):
+            raise ValueError("Destination must have packed pixel rows.")
+
+        # Walk relative to a null base; run() adds the mapped address.
+        walk = _source_walk_at(NULL, pitch, width, height, left, top, rotation_angle)
+        self.origin_offset = <Py_ssize_t>walk.origin
+        self.params.walk = walk
+        self.params.src_frame_step = 0
+        self.params.dst = NULL
+        self.params.dst_frame_step = 0
+        self.params.dst_row_stride = (
+            dst.strides[0] if self.params.out_h > 1 else self.params.out_w * channels
+        )
+        self.params.channels = channels
+        self.params.mode_code = mode_code
+        self.params.band_rows = _ROTATE_TILE
+        self.params.tile_w = (
+            _ROTATE_TILE if rotation_angle == 90 or rotation_angle == 270 else 0
+        )
+        self.params.bands_per_frame = (
+            (self.params.out_h + self.params.band_rows - 1) // self.params.band_rows
+        )
+        self.n_tasks = self.params.bands_per_frame
+        self.pitch = pitch
+        self.dst_shape = (<object>dst).shape
+        self.dst_strides = (<object>dst).strides
+
+    def run(self, size_t address, cnp.ndarray dst not None) -> None:
+        """Convert the frame mapped at ``address`` into ``dst``."""
+        cdef _BatchParams params = self.params
+        cdef Py_ssize_t t
+        params.walk.origin = <const uint8_t*>(address + <size_t>self.origin_offset)
+        params.dst = <uint8_t*>dst.data
         with nogil:
-            if use_parallel:
-                _bgra_to_rgba_ptr_parallel(src_ptr, dst_ptr, src_h, src_w)
+            if params.out_h * params.out_w >= _PARALLEL_PIXELS_THRESHOLD:
+                for t in prange(self.n_tasks, schedule="static", num_threads=_NUM_THREADS):
+                    _run_batch_task(&params, t)
             else:
-                _bgra_to_rgba_ptr(src_ptr, dst_ptr, n_pixels)
+                for t in range(self.n_tasks):
+                    _run_batch_task(&params, t)
+
+
+# Fixed-point precision of bilinear weights (matches OpenCV's 11-bit
+# INTER_LINEAR coefficients).
+cdef enum:
+    _RESIZE_BITS = 11
+    _RESIZE_ONE = 1 << 11
+    _RESIZE_SHIFT = 22
+    _RESIZE_ROUND = 1 << 21
+
+_AXIS_TABLE_CACHE_SIZE = 32
+_axis_table_cache = {}
+
+
+cdef struct _ResizeParams:
+    const uint8_t* origin
+    Py_ssize_t row_step
+    Py_ssize_t col_step
+    uint8_t* dst
+    Py_ssize_t dst_row_stride
+    Py_ssize_t out_h
+    Py_ssize_t out_w
+    int mode_code
+    int interpolation
+    # nearest / bilinear: per-axis byte offsets (+ fixed-point weights).
+    const Py_ssize_t* x0_off
+    const Py_ssize_t* x1_off
+    const int32_t* x_weight
+    const Py_ssize_t* y0_off
+    const Py_ssize_t* y1_off
+    const int32_t* y_weight
+    # area, exact integer factors.
+    Py_ssize_t kx
+    Py_ssize_t ky
+    int area_shift
+    uint32_t area_count
+    # area, fractional coverage.
+    const Py_ssize_t* x_start
+    const Py_ssize_t* x_count
+    const Py_ssize_t* x_woff
+    const float* x_area_weight
+    const Py_ssize_t* y_start
+    const Py_ssize_t* y_count
+    const Py_ssize_t* y_woff
+    const float* y_area_weight
+
+
+cdef inline uint8_t _saturate_u8(float value) noexcept nogil:
+    if value <= 0.0:
+        return 0
+    if value >= 255.0:
+        return 255
+    return <uint8_t>(value + 0.5)
+
+
+cdef inline void _resample_row_nearest(
+    const uint8_t* row,
+    const Py_ssize_t* x_off,
+    uint8_t* out,
+    Py_ssize_t out_w,
+) noexcept nogil:
+    cdef Py_ssize_t x
+    for x in range(out_w):
+        memcpy(out + x * 4, row + x_off[x], 4)
+
+
+cdef inline void _resample_row_bilinear(
+    const uint8_t* row0,
+    const uint8_t* row1,
+    uint32_t wy,
+    const Py_ssize_t* x0_off,
+    const Py_ssize_t* x1_off,
+    const int32_t* wx,
+    uint8_t* out,
+    Py_ssize_t out_w,
+) noexcept nogil:
+    cdef Py_ssize_t x
+    cdef Py_ssize_t c
+    cdef const uint8_t* p00
+    cdef const uint8_t* p01
+    cdef const uint8_t* p10
+    cdef const uint8_t* p11
+    cdef uint32_t w0
+    cdef uint32_t w1
+    cdef uint32_t wy0 = _RESIZE_ONE - wy
+    cdef uint32_t top
+    cdef uint32_t bottom
+    for x in range(out_w):
+        p00 = row0 + x0_off[x]
+        p01 = row0 + x1_off[x]
+        p10 = row1 + x0_off[x]
+        p11 = row1 + x1_off[x]
+        w1 = <uint32_t>wx[x]
+        w0 = _RESIZE_ONE - w1
+        for c in range(4):
+            top = p00[c] * w0 + p01[c] * w1
+            bottom = p10[c] * w0 + p11[c] * w1
+            out[x * 4 + c] = <uint8_t>(
+                (top * wy0 + bottom * wy + _RESIZE_ROUND) >> _RESIZE_SHIFT
+            )
+
+
+cdef inline void _resample_row_area_integer(
+    const uint8_t* row,
+    Py_ssize_t row_step,
+    Py_ssize_t col_step,
+    Py_ssize_t kx,
+    Py_ssize_t ky,
+    int shift,
+    uint32_t count,
+    uint8_t* out,
+    Py_ssize_t out_w,
+) noexcept nogil:
+    # Exact box binning. Power-of-two boxes (2x2, 4x4, ...) round with a
+    # shift instead of a division.
+    cdef Py_ssize_t x
+    cdef Py_ssize_t i
+    cdef Py_ssize_t j
+    cdef const uint8_t* base
+    cdef const uint8_t* px
+    cdef uint32_t half = count >> 1
+    cdef uint32_t s0
+    cdef uint32_t s1
+    cdef uint32_t s2
+    cdef uint32_t s3
+    for x in range(out_w):
+        base = row + x * kx * col_step
+        s0 = 0
+        s1 = 0
+        s2 = 0
+        s3 = 0
+        for j in range(ky):
+            px = base + j * row_step
+            for i in range(kx):
+                s0 += px[0]
+                s1 += px[1]
+                s2 += px[2]
+                s3 += px[3]
+                px += col_step
+        if shift >= 0:
+            out[x * 4] = <uint8_t>((s0 + half) >> shift)
+            out[x * 4 + 1] = <uint8_t>((s1 + half) >> shift)
+            out[x * 4 + 2] = <uint8_t>((s2 + half) >> shift)
+            out[x * 4 + 3] = <uint8_t>((s3 + half) >> shift)
+        else:
+            out[x * 4] = <uint8_t>((s0 + half) // count)
+            out[x * 4 + 1] = <uint8_t>((s1 + half) // count)
+            out[x * 4 + 2] = <uint8_t>((s2 + half) // count)
+            out[x * 4 + 3] = <uint8_t>((s3 + half) // count)
+
+
+cdef inline void _resample_row_area(
+    const _ResizeParams* p,
+    Py_ssize_t y,
+    uint8_t* out,
+) noexcept nogil:
+    cdef Py_ssize_t x
+    cdef Py_ssize_t i
+    cdef Py_ssize_t j
+    cdef Py_ssize_t y_start = p.y_start[y]
+    cdef Py_ssize_t y_count = p.y_count[y]
+    cdef const float* y_w = p.y_area_weight + p.y_woff[y]
+    cdef const float* x_w
+    cdef const uint8_t* px
+    cdef float wj
+    cdef float w
+    cdef float a0
+    cdef float a1
+    cdef float a2
+    cdef float a3
+    for x in range(p.out_w):
+        x_w = p.x_area_weight + p.x_woff[x]
+        a0 = 0.0
+        a1 = 0.0
+        a2 = 0.0
+        a3 = 0.0
+        for j in range(y_count):
+            wj = y_w[j]
+            px = p.origin + (y_start + j) * p.row_step + p.x_start[x] * p.col_step
+            for i in range(p.x_count[x]):
+                w = wj * x_w[i]
+                a0 += w * px[0]
+                a1 += w * px[1]
+                a2 += w * px[2]
+                a3 += w * px[3]
+                px += p.col_step
+        out[x * 4] = _saturate_u8(a0)
+        out[x * 4 + 1] = _saturate_u8(a1)
+        out[x * 4 + 2] = _saturate_u8(a2)
+        out[x * 4 + 3] = _saturate_u8(a3)
+
+
+cdef inline void _resize_row(
+    const _ResizeParams* p,
+    Py_ssize_t y,
+    uint8_t* bgra_row,
+) noexcept nogil:
+    cdef uint8_t* dst_row = p.dst + y * p.dst_row_stride
+    cdef uint8_t* out = dst_row if p.mode_code == MODE_BGRA else bgra_row
+
+    if p.interpolation == INTERP_NEAREST:
+        _resample_row_nearest(p.origin + p.y0_off[y], p.x0_off, out, p.out_w)
+    elif p.interpolation == INTERP_BILINEAR:
+        _resample_row_bilinear(
+            p.origin + p.y0_off[y],
+            p.origin + p.y1_off[y],
+            <uint32_t>p.y_weight[y],
+            p.x0_off,
+            p.x1_off,
+            p.x_weight,
+            out,
+            p.out_w,
+        )
+    elif p.kx > 0:
+        _resample_row_area_integer(
+            p.origin + y * p.ky * p.row_step,
+            p.row_step,
+            p.col_step,
+            p.kx,
+            p.ky,
+            p.area_shift,
+            p.area_count,
+            out,
+            p.out_w,
+        )
+    else:
+        _resample_row_area(p, y, out)
+
+    if out != dst_row:
+        _convert_bgra_segment(out, 4, dst_row, p.out_w, p.mode_code)
+
+
+cdef void _resize_frame(const _ResizeParams* p, bint use_parallel) noexcept nogil:
+    # Each row is resampled into a BGRA scratch row (per thread), then color
+    # converted while it is still in L1. BGRA output resamples in place.
+    cdef Py_ssize_t y
+    cdef uint8_t* scratch
+
+    if not use_parallel:
+        scratch = <uint8_t*>malloc(p.out_w * 4)
+        if scratch is NULL:
+            abort()
+        for y in range(p.out_h):
+            _resize_row(p, y, scratch)
+        free(scratch)
         return
 
-    if dst_c.shape[2] != 1:
-        raise ValueError(f"GRAY destination must have 1 channel, got {dst_c.shape[2]}.")
+    with parallel(num_threads=_NUM_THREADS):
+        scratch = <uint8_t*>malloc(p.out_w * 4)
+        if scratch is NULL:
+            abort()
+        for y in prange(p.out_h, schedule="static"):
+            _resize_row(p, y, scratch)
+        free(scratch)
+
+
+cdef tuple _area_axis_weights(Py_ssize_t src_len, Py_ssize_t dst_len):
+    cdef double scale = <double>src_len / <double>dst_len
+    cdef cnp.ndarray[Py_ssize_t, ndim=1] start = np.empty(dst_len, dtype=np.intp)
+    cdef cnp.ndarray[Py_ssize_t, ndim=1] count = np.empty(dst_len, dtype=np.intp)
+    cdef cnp.ndarray[Py_ssize_t, ndim=1] woff = np.empty(dst_len, dtype=np.intp)
+    cdef list weights = []
+    cdef Py_ssize_t d
+    cdef Py_ssize_t s
+    cdef Py_ssize_t s0
+    cdef Py_ssize_t s1
+    cdef double f0
+    cdef double f1
+    cdef double lo
+    cdef double hi
+    for d in range(dst_len):
+        f0 = d * scale
+        f1 = (d + 1) * scale
+        s0 = <Py_ssize_t>floor(f0)
+        s1 = <Py_ssize_t>ceil(f1)
+        if s1 > src_len:
+            s1 = src_len
+        start[d] = s0
+        count[d] = s1 - s0
+        woff[d] = len(weights)
+        for s in range(s0, s1):
+            lo = f0 if f0 > s else <double>s
+            hi = f1 if f1 < s + 1 else <double>(s + 1)
+            weights.append((hi - lo) / scale)
+    return start, count, woff, np.asarray(weights, dtype=np.float32)
+
+
+cdef tuple _resize_axis_table(
+    Py_ssize_t src_len,
+    Py_ssize_t dst_len,
+    Py_ssize_t step,
+    int interpolation,
+):
+    # Per-axis lookup tables depend only on geometry, so they are cached and
+    # reused across frames.
+    key = (src_len, dst_len, step, interpolation)
+    table = _axis_table_cache.get(key)
+    if table is not None:
+        return table
+
+    centers = (np.arange(dst_len, dtype=np.float64) + 0.5) * (<double>src_len / dst_len)
+    if interpolation == INTERP_NEAREST:
+        # OpenCV INTER_NEAREST_EXACT's 16-bit fixed-point pixel centers; plain
+        # floating point breaks ties differently on fractional scales.
+        scale = ((src_len << 16) + dst_len // 2) // dst_len
+        offset = scale // 2 - src_len % 2
+        idx = (np.arange(dst_len, dtype=np.int64) * scale + offset) >> 16
+        table = (np.minimum(idx, src_len - 1).astype(np.intp) * step,)
+    elif interpolation == INTERP_BILINEAR:
+        pos = np.clip(centers - 0.5, 0.0, src_len - 1)
+        idx0 = np.minimum(np.floor(pos).astype(np.intp), src_len - 1)
+        idx1 = np.minimum(idx0 + 1, src_len - 1)
+        weight = np.rint((pos - idx0) * _RESIZE_ONE).astype(np.int32)
+        table = (idx0 * step, idx1 * step, weight)
+    else:
+        table = _area_axis_weights(src_len, dst_len)
+
+    if len(_axis_table_cache) >= _AXIS_TABLE_CACHE_SIZE:
+        _axis_table_cache.clear()
+    _axis_table_cache[key] = table
+    return table
+
+
+def resize_bgra_prepare(
+    cnp.ndarray[uint8_t, ndim=3] src,
+    int width,
+    int height,
+    region,
+    int rotation_angle,
+    output_size,
+    mode: str,
+    interpolation: str = "area",
+) -> cnp.ndarray:
+    """Map/rotate/crop mapped BGRA ``src``, resize to ``output_size`` and convert.
+
+    ``output_size`` is ``(width, height)``. ``mode`` may also be ``"BGRA"``.
+    """
+    cdef int mode_code = _output_mode_to_code(mode)
+    cdef cnp.ndarray[uint8_t, ndim=3, mode="c"] out
+
+    out = np.empty(
+        (<Py_ssize_t>output_size[1], <Py_ssize_t>output_size[0], _mode_channels(mode_code)),
+        dtype=np.uint8,
+    )
+    resize_bgra_prepare_into(
+        src, out, width, height, region, rotation_angle, mode, interpolation
+    )
+    return out
+
+
+def resize_bgra_prepare_into(
+    cnp.ndarray[uint8_t, ndim=3] src,
+    cnp.ndarray[uint8_t, ndim=3] dst,
+    int width,
+    int height,
+    region,
+    int rotation_angle,
+    mode: str,
+    interpolation: str = "area",
+    dst_rect=None,
+) -> None:
+    """Map/rotate/crop mapped BGRA ``src`` and resize + convert it into ``dst``.
+
+    The output size is taken from ``dst``, or from ``dst_rect`` given as
+    ``(x, y, width, height)`` to write only that sub-rectangle of ``dst``
+    (pixels outside it are left untouched). Reads the pitch-padded mapped
+    frame once and writes the final frame, without full-size intermediates.
+
+    Interpolation:
+    - ``nearest``: pixel-center aligned nearest neighbor, index-exact with
+      OpenCV's ``INTER_NEAREST_EXACT``.
+    - ``bilinear``: half-pixel aligned, 11-bit fixed-point weights.
+    - ``area``: box averaging. Exact integer factors (2x, 4x, ...) use an
+      integer box-binning path; other downscales weight partial coverage.
+      Upscaling falls back to ``bilinear``.
+    """
+    cdef cnp.ndarray[uint8_t, ndim=3, mode="c"] src_c = _ensure_src_bgra_contiguous(src)
+    cdef cnp.ndarray[uint8_t, ndim=3, mode="c"] dst_c = _ensure_dst_contiguous(dst)
+    cdef int mode_code = _output_mode_to_code(mode)
+    cdef int interp_code = _interpolation_to_code(interpolation)
+    cdef Py_ssize_t channels = _mode_channels(mode_code)
+    cdef Py_ssize_t left
+    cdef Py_ssize_t top
+    cdef Py_ssize_t right
+    cdef Py_ssize_t bottom
+    cdef Py_ssize_t region_w
+    cdef Py_ssize_t region_h
+    cdef Py_ssize_t out_h = dst_c.shape[0]
+    cdef Py_ssize_t out_w = dst_c.shape[1]
+    cdef Py_ssize_t out_x = 0
+    cdef Py_ssize_t out_y = 0
+    cdef Py_ssize_t count
+    cdef _SourceWalk walk
+    cdef _ResizeParams params
+    cdef Py_ssize_t[::1] x0_off
+    cdef Py_ssize_t[::1] x1_off
+    cdef int32_t[::1] x_weight
+    cdef Py_ssize_t[::1] y0_off
+    cdef Py_ssize_t[::1] y1_off
+    cdef int32_t[::1] y_weight
+    cdef Py_ssize_t[::1] x_start
+    cdef Py_ssize_t[::1] x_count
+    cdef Py_ssize_t[::1] x_woff
+    cdef float[::1] x_area_weight
+    cdef Py_ssize_t[::1] y_start
+    cdef Py_ssize_t[::1] y_count
+    cdef Py_ssize_t[::1] y_woff
+    cdef float[::1] y_area_weight
+    cdef bint use_parallel
+
+    _validate_rotation_angle(rotation_angle)
+    left = <Py_ssize_t>region[0]
+    top = <Py_ssize_t>region[1]
+    right = <Py_ssize_t>region[2]
+    bottom = <Py_ssize_t>region[3]
+    _validate_prepare_geometry(src_c, width, height, left, top, right, bottom, rotation_angle)
+    if dst_c.shape[2] != channels:
+        raise ValueError(
+            f"{mode} destination must have {channels} channel(s), "
+            f"got {dst_c.shape[2]}."
+        )
+    if dst_rect is not None:
+        out_x = <Py_ssize_t>dst_rect[0]
+        out_y = <Py_ssize_t>dst_rect[1]
+        out_w = <Py_ssize_t>dst_rect[2]
+        out_h = <Py_ssize_t>dst_rect[3]
+        if (
+            out_x < 0
+            or out_y < 0
+            or out_x + out_w > dst_c.shape[1]
+            or out_y + out_h > dst_c.shape[0]
+        ):
+            raise ValueError(
+                f"dst_rect {tuple(dst_rect)} exceeds destination shape "
+                f"{dst_c.shape[1]}x{dst_c.shape[0]}."
+            )
+    if out_h <= 0 or out_w <= 0:
+        raise ValueError("Resize destination must have a non-empty shape.")
+
+    region_w = right - left
+    region_h = bottom - top
+    if interp_code == INTERP_AREA and (out_w > region_w or out_h > region_h):
+        interp_code = INTERP_BILINEAR
+
+    walk = _source_walk(src_c, width, height, left, top, rotation_angle)
+    params.origin = walk.origin
+    params.row_step = walk.row_step
+    params.col_step = walk.col_step
+    params.dst_row_stride = dst_c.shape[1] * channels
+    params.dst = <uint8_t*>dst_c.data + out_y * params.dst_row_stride + out_x * channels
+    params.out_h = out_h
+    params.out_w = out_w
+    params.mode_code = mode_code
+    params.interpolation = interp_code
+    params.kx = 0
+    params.ky = 0
+
+    if interp_code == INTERP_NEAREST:
+        (x0_off,) = _resize_axis_table(region_w, out_w, walk.col_step, interp_code)
+        (y0_off,) = _resize_axis_table(region_h, out_h, walk.row_step, interp_code)
+        params.x0_off = &x0_off[0]
+        params.y0_off = &y0_off[0]
+    elif interp_code == INTERP_BILINEAR:
+        x0_off, x1_off, x_weight = _resize_axis_table(
+            region_w, out_w, walk.col_step, interp_code
+        )
+        y0_off, y1_off, y_weight = _resize_axis_table(
+            region_h, out_h, walk.row_step, interp_code
+        )
+        params.x0_off = &x0_off[0]
+        params.x1_off = &x1_off[0]
+        params.x_weight = &x_weight[0]
+        params.y0_off = &y0_off[0]
+        params.y1_off = &y1_off[0]
+        params.y_weight = &y_weight[0]
+    elif region_w % out_w == 0 and region_h % out_h == 0:
+        params.kx = region_w // out_w
+        params.ky = region_h // out_h
+        count = params.kx * params.ky
+        params.area_count = <uint32_t>count
+        params.area_shift = -1
+        if count & (count - 1) == 0:
+            params.area_shift = 0
+            while (<Py_ssize_t>1 << params.area_shift) < count:
+                params.area_shift += 1
+    else:
+        x_start, x_count, x_woff, x_area_weight = _resize_axis_table(
+            region_w, out_w, 1, interp_code
+        )
+        y_start, y_count, y_woff, y_area_weight = _resize_axis_table(
+            region_h, out_h, 1, interp_code
+        )
+        params.x_start = &x_start[0]
+        params.x_count = &x_count[0]
+        params.x_woff = &x_woff[0]
+        params.x_area_weight = &x_area_weight[0]
+        params.y_start = &y_start[0]
+        params.y_count = &y_count[0]
+        params.y_woff = &y_woff[0]
+        params.y_area_weight = &y_area_weight[0]
+
+    use_parallel = out_w * out_h >= _PARALLEL_PIXELS_THRESHOLD
     with nogil:
-        if use_parallel:
-            _bgra_to_gray_ptr_parallel(src_ptr, dst_ptr, src_h, src_w)
+        _resize_frame(&params, use_parallel)
+
+
+cdef enum _ToneMapCode:
+    TONE_CLIP = 0
+    TONE_REINHARD = 1
+    TONE_ACES = 2
+
+
+cdef inline int _tone_map_to_code(str tone_map) except -1:
+    if tone_map == "clip":
+        return TONE_CLIP
+    if tone_map == "reinhard":
+        return TONE_REINHARD
+    if tone_map == "aces":
+        return TONE_ACES
+    raise ValueError(
+        f"Unsupported tone map '{tone_map}'. Supported: clip, reinhard, aces."
+    )
+
+
+cdef inline double _tone_map_value(double x, int code) noexcept nogil:
+    # ``x`` is linear light relative to SDR white; returns display-linear 0..1.
+    if x <= 0.0:
+        return 0.0
+    if code == TONE_REINHARD:
+        x = x / (1.0 + x)
+    elif code == TONE_ACES:
+        x = (x * (2.51 * x + 0.03)) / (x * (2.43 * x + 0.59) + 0.14)
+    return x if x < 1.0 else 1.0
+
+
+cdef void _validate_hdr_dst(cnp.ndarray src, cnp.ndarray dst) except *:
+    if (
+        dst.dtype != np.uint8
+        or dst.ndim != 3
+        or dst.shape[0] != src.shape[0]
+        or dst.shape[1] != src.shape[1]
+        or dst.shape[2] != 4
+    ):
+        raise ValueError(
+            f"Destination must be ({src.shape[0]}, {src.shape[1]}, 4) uint8, got "
+            f"shape {(<object>dst).shape} and dtype {dst.dtype}."
+        )
+    if dst.strides[2] != 1 or dst.strides[1] != 4:
+        raise ValueError("Destination must have packed BGRA pixels.")
+
+
+def rgba16f_to_bgra_into(
+    cnp.ndarray src,
+    cnp.ndarray dst,
+    cnp.ndarray[uint8_t, ndim=1, mode="c"] lut,
+) -> None:
+    """Tone-map ``(rows, cols, 4)`` half-float RGBA pixels into BGRA8.
+
+    ``src`` holds raw IEEE half bits (``uint16`` or ``float16``); each
+    channel is mapped through ``lut``, a 65536-entry table of 8-bit sRGB
+    codes indexed by those bits. Rows of ``src`` and ``dst`` may be strided.
+    """
+    cdef Py_ssize_t rows
+    cdef Py_ssize_t cols
+    cdef Py_ssize_t y
+    cdef Py_ssize_t x
+    cdef Py_ssize_t src_stride
+    cdef Py_ssize_t dst_stride
+    cdef const uint8_t* src_base
+    cdef uint8_t* dst_base
+    cdef const uint16_t* s
+    cdef uint8_t* d
+    cdef const uint8_t* table
+
+    if src.ndim != 3 or src.shape[2] != 4 or src.itemsize != 2:
+        raise ValueError(
+            f"Expected (H, W, 4) half-float pixels, got shape {(<object>src).shape} "
+            f"and dtype {src.dtype}."
+        )
+    if src.strides[2] != 2 or src.strides[1] != 8:
+        raise ValueError("Source must have packed RGBA16F pixels.")
+    if lut.shape[0] != 65536:
+        raise ValueError(f"Expected a 65536-entry LUT, got {lut.shape[0]}.")
+    _validate_hdr_dst(src, dst)
+    rows = src.shape[0]
+    cols = src.shape[1]
+    src_stride = src.strides[0]
+    dst_stride = dst.strides[0]
+    src_base = <const uint8_t*>src.data
+    dst_base = <uint8_t*>dst.data
+    table = &lut[0]
+
+    with nogil:
+        if rows * cols >= _PARALLEL_PIXELS_THRESHOLD:
+            for y in prange(rows, schedule="static", num_threads=_NUM_THREADS):
+                s = <const uint16_t*>(src_base + y * src_stride)
+                d = dst_base + y * dst_stride
+                for x in range(cols):
+                    d[4 * x] = table[s[4 * x + 2]]
+                    d[4 * x + 1] = table[s[4 * x + 1]]
+                    d[4 * x + 2] = table[s[4 * x]]
+                    d[4 * x + 3] = 255
+        else:
+            for y in range(rows):
+                s = <const uint16_t*>(src_base + y * src_stride)
+                d = dst_base + y * dst_stride
+                for x in range(cols):
+                    d[4 * x] = table[s[4 * x + 2]]
+                    d[4 * x + 1] = table[s[4 * x + 1]]
+                    d[4 * x + 2] = table[s[4 * x]]
+                    d[4 * x + 3] = 255
+
+
+cdef inline void _rgb10a2_row_to_bgra(
+    const uint32_t* s,
+    uint8_t* d,
+    Py_ssize_t cols,
+    const double* decode,
+    const double* m,
+    const uint8_t* encode,
+    double encode_last,
+    int tone_code,
+) noexcept nogil:
+    cdef Py_ssize_t x
+    cdef uint32_t v
+    cdef double r
+    cdef double g
+    cdef double b
+    cdef double t
+    for x in range(cols):
+        v = s[x]
+        r = decode[v & 0x3FF]
+        g = decode[(v >> 10) & 0x3FF]
+        b = decode[(v >> 20) & 0x3FF]
+        t = _tone_map_value(m[6] * r + m[7] * g + m[8] * b, tone_code)
+        d[4 * x] = encode[<Py_ssize_t>(t * encode_last + 0.5)]
+        t = _tone_map_value(m[3] * r + m[4] * g + m[5] * b, tone_code)
+        d[4 * x + 1] = encode[<Py_ssize_t>(t * encode_last + 0.5)]
+        t = _tone_map_value(m[0] * r + m[1] * g + m[2] * b, tone_code)
+        d[4 * x + 2] = encode[<Py_ssize_t>(t * encode_last + 0.5)]
+        d[4 * x + 3] = 255
+
+
+def rgb10a2_to_bgra_into(
+    cnp.ndarray src,
+    cnp.ndarray dst,
+    cnp.ndarray[double, ndim=1, mode="c"] decode_lut,
+    cnp.ndarray[double, ndim=2, mode="c"] matrix,
+    cnp.ndarray[uint8_t, ndim=1, mode="c"] encode_lut,
+    str tone_map="clip",
+) -> None:
+    """Tone-map ``(rows, cols)`` packed R10G10B10A2 pixels into BGRA8.
+
+    Each 10-bit code is linearized through ``decode_lut`` (1024 entries,
+    relative to SDR white), the RGB triple is transformed by the 3x3
+    ``matrix`` (e.g. BT.2020 to BT.709), tone-mapped per channel and encoded
+    through ``encode_lut``, a table of 8-bit codes over ``[0, 1]``.
+    """
+    cdef int tone_code = _tone_map_to_code(tone_map)
+    cdef Py_ssize_t rows
+    cdef Py_ssize_t cols
+    cdef Py_ssize_t y
+    cdef Py_ssize_t src_stride
+    cdef Py_ssize_t dst_stride
+    cdef const uint8_t* src_base
+    cdef uint8_t* dst_base
+    cdef const double* decode
+    cdef const double* m
+    cdef const uint8_t* encode
+    cdef double encode_last
+
+    if src.ndim != 2 or src.itemsize != 4 or src.dtype.kind != "u":
+        raise ValueError(
+            f"Expected (H, W) uint32 R10G10B10A2 pixels, got shape "
+            f"{(<object>src).shape} and dtype {src.dtype}."
+        )
+    if src.strides[1] != 4:
+        raise ValueError("Source must have packed R10G10B10A2 pixels.")
+    if decode_lut.shape[0] != 1024:
+        raise ValueError(f"Expected a 1024-entry decode LUT, got {decode_lut.shape[0]}.")
+    if matrix.shape[0] != 3 or matrix.shape[1] != 3:
+        raise ValueError("matrix must be 3x3.")
+    if encode_lut.shape[0] < 2:
+        raise ValueError("encode_lut must have at least 2 entries.")
+    _validate_hdr_dst(src, dst)
+    rows = src.shape[0]
+    cols = src.shape[1]
+    src_stride = src.strides[0]
+    dst_stride = dst.strides[0]
+    src_base = <const uint8_t*>src.data
+    dst_base = <uint8_t*>dst.data
+    decode = &decode_lut[0]
+    m = &matrix[0, 0]
+    encode = &encode_lut[0]
+    encode_last = <double>(encode_lut.shape[0] - 1)
+
+    with nogil:
+        if rows * cols >= _PARALLEL_PIXELS_THRESHOLD:
+            for y in prange(rows, schedule="static", num_threads=_NUM_THREADS):
+                _rgb10a2_row_to_bgra(
+                    <const uint32_t*>(src_base + y * src_stride),
+                    dst_base + y * dst_stride,
+                    cols,
+                    decode,
+                    m,
+                    encode,
+                    encode_last,
+                    tone_code,
+                )
         else:
-            _bgra_to_gray_ptr(src_ptr, dst_ptr, n_pixels)
+            for y in range(rows):
+                _rgb10a2_row_to_bgra(
+                    <const uint32_t*>(src_base + y * src_stride),
+                    dst_base + y * dst_stride,
+                    cols,
+                    decode,
+                    m,
+                    encode,
+                    encode_last,
+                    tone_code,
+                )
+
+
+cdef inline uint8_t _blend_channel(uint32_t src, uint32_t dst, uint32_t alpha) noexcept nogil:
+    # Exact round(x / 255) for x in [0, 255 * 255].
+    cdef uint32_t v = src * alpha + dst * (255 - alpha) + 128
+    return <uint8_t>((v + (v >> 8)) >> 8)
+
+
+def composite_cursor_into(
+    cnp.ndarray dst,
+    cnp.ndarray color,
+    object and_mask,
+    int left,
+    int top,
+    tuple channel_offsets,
+) -> None:
+    """Composite a pointer shape into the cursor's box of an output frame.
+
+    ``color`` holds ``(h, w, 4)`` BGRA shape pixels. Without ``and_mask``
+    they are alpha-blended over ``dst``; with an ``(h, w)`` ``and_mask``
+    each channel becomes ``(dst & mask) ^ color``, which covers monochrome
+    and masked-color cursors. ``left``/``top`` place the shape in ``dst``
+    and may be negative or past the edge; only the overlap is written.
+    ``channel_offsets`` gives the ``dst`` channel of blue, green and red.
+    """
+    cdef Py_ssize_t rows
+    cdef Py_ssize_t cols
+    cdef Py_ssize_t channels
+    cdef Py_ssize_t x0
+    cdef Py_ssize_t y0
+    cdef Py_ssize_t x1
+    cdef Py_ssize_t y1
+    cdef Py_ssize_t x
+    cdef Py_ssize_t y
+    cdef Py_ssize_t dst_stride
+    cdef Py_ssize_t color_stride
+    cdef Py_ssize_t mask_stride = 0
+    cdef Py_ssize_t ob
+    cdef Py_ssize_t og
+    cdef Py_ssize_t orr
+    cdef uint8_t* dst_base
+    cdef const uint8_t* color_base
+    cdef const uint8_t* mask_base = NULL
+    cdef uint8_t* d
+    cdef const uint8_t* c
+    cdef const uint8_t* m
+    cdef uint32_t a
+    cdef cnp.ndarray mask_arr
+
+    if dst.dtype != np.uint8 or dst.ndim != 3 or dst.shape[2] < 3:
+        raise ValueError(
+            f"Expected (H, W, C>=3) uint8 destination, got shape "
+            f"{(<object>dst).shape} and dtype {dst.dtype}."
+        )
+    if dst.strides[2] != 1:
+        raise ValueError("Destination channels must be packed.")
+    if (
+        color.dtype != np.uint8
+        or color.ndim != 3
+        or color.shape[2] != 4
+        or color.strides[2] != 1
+        or color.strides[1] != 4
+    ):
+        raise ValueError("color must be packed (h, w, 4) uint8 BGRA pixels.")
+    if and_mask is not None:
+        mask_arr = and_mask
+        if (
+            mask_arr.dtype != np.uint8
+            or mask_arr.ndim != 2
+            or mask_arr.shape[0] != color.shape[0]
+            or mask_arr.shape[1] != color.shape[1]
+            or mask_arr.strides[1] != 1
+        ):
+            raise ValueError("and_mask must be (h, w) uint8 matching color.")
+        mask_base = <const uint8_t*>mask_arr.data
+        mask_stride = mask_arr.strides[0]
+    ob, og, orr = channel_offsets
+    channels = dst.shape[2]
+    if not (0 <= ob < channels and 0 <= og < channels and 0 <= orr < channels):
+        raise ValueError(f"Invalid channel offsets {channel_offsets}.")
+
+    rows = dst.shape[0]
+    cols = dst.shape[1]
+    x0 = left if left > 0 else 0
+    y0 = top if top > 0 else 0
+    x1 = min(<Py_ssize_t>left + color.shape[1], cols)
+    y1 = min(<Py_ssize_t>top + color.shape[0], rows)
+    if x0 >= x1 or y0 >= y1:
+        return
+    dst_base = <uint8_t*>dst.data
+    dst_stride = dst.strides[0]
+    color_base = <const uint8_t*>color.data
+    color_stride = color.strides[0]
+
+    with nogil:
+        for y in range(y0, y1):
+            d = dst_base + y * dst_stride + x0 * channels
+            c = color_base + (y - top) * color_stride + (x0 - left) * 4
+            if mask_base == NULL:
+                for x in range(x1 - x0):
+                    a = c[3]
+                    if a == 255:
+                        d[ob] = c[0]
+                        d[og] = c[1]
+                        d[orr] = c[2]
+                    elif a != 0:
+                        d[ob] = _blend_channel(c[0], d[ob], a)
+                        d[og] = _blend_channel(c[1], d[og], a)
+                        d[orr] = _blend_channel(c[2], d[orr], a)
+                    d += channels
+                    c += 4
+            else:
+                m = mask_base + (y - top) * mask_stride + (x0 - left)
+                for x in range(x1 - x0):
+                    d[ob] = (d[ob] & m[x]) ^ c[0]
+                    d[og] = (d[og] & m[x]) ^ c[1]
+                    d[orr] = (d[orr] & m[x]) ^ c[2]
+                    d += channels
+                    c += 4
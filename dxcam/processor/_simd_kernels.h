@@ -0,0 +1,388 @@
+/*
+ * Explicitly vectorized BGRA conversion kernels for ``_numpy_kernels.pyx``.
+ *
+ * Each kernel converts the longest prefix of ``n`` contiguous BGRA pixels it
+ * can handle with full vectors and returns the number of pixels written; the
+ * caller finishes the tail with its scalar loop. Kernels are compiled with
+ * per-function target attributes so the extension itself keeps baseline
+ * compiler flags, and the active tier is picked at import time from CPUID.
+ *
+ * Tile hashing kernels (``dxcam_tile_hash_row_*``) instead process a whole
+ * row including tails, so every tier produces identical hashes.
+ */
+#ifndef DXCAM_SIMD_KERNELS_H
+#define DXCAM_SIMD_KERNELS_H
+
+#include <stddef.h>
+#include <stdint.h>
+#include <string.h>
+
+#define DXCAM_SIMD_SCALAR 0
+#define DXCAM_SIMD_SSE41 1
+#define DXCAM_SIMD_AVX2 2
+
+#if defined(__x86_64__) || defined(_M_X64) || defined(__i386__) || defined(_M_IX86)
+#define DXCAM_SIMD_X86 1
+#else
+#define DXCAM_SIMD_X86 0
+#endif
+
+/*
+ * Tile hash of one row: for each tile, adds
+ *   sum_i lo32(w_i ^ k_i) * hi32(w_i ^ k_i) + w_i
+ * over its 8-byte words w_i (the last one zero-padded) to ``acc[tile]``.
+ * ``keys`` holds one key per word position of the tile row.
+ */
+static uint64_t dxcam_tile_hash_span(
+    const uint8_t* data, ptrdiff_t n_bytes, const uint64_t* keys
+) {
+    uint64_t acc = 0;
+    uint64_t word;
+    uint64_t mixed;
+    ptrdiff_t i = 0;
+    for (; (i + 1) * 8 <= n_bytes; ++i) {
+        memcpy(&word, data + i * 8, 8);
+        mixed = word ^ keys[i];
+        acc += (mixed & 0xFFFFFFFFu) * (mixed >> 32) + word;
+    }
+    if (i * 8 < n_bytes) {
+        word = 0;
+        memcpy(&word, data + i * 8, (size_t)(n_bytes - i * 8));
+        mixed = word ^ keys[i];
+        acc += (mixed & 0xFFFFFFFFu) * (mixed >> 32) + word;
+    }
+    return acc;
+}
+
+static void dxcam_tile_hash_row_scalar(
+    const uint8_t* row,
+    ptrdiff_t row_bytes,
+    ptrdiff_t tile_bytes,
+    const uint64_t* keys,
+    uint64_t* acc
+) {
+    ptrdiff_t offset;
+    ptrdiff_t n;
+    for (offset = 0; offset < row_bytes; offset += tile_bytes, ++acc) {
+        n = row_bytes - offset < tile_bytes ? row_bytes - offset : tile_bytes;
+        *acc += dxcam_tile_hash_span(row + offset, n, keys);
+    }
+}
+
+#if DXCAM_SIMD_X86
+
+#include <immintrin.h>
+
+#if defined(_MSC_VER) && !defined(__clang__)
+#include <intrin.h>
+#define DXCAM_TARGET_SSE41
+#define DXCAM_TARGET_AVX2
+#else
+#include <cpuid.h>
+#define DXCAM_TARGET_SSE41 __attribute__((target("sse4.1")))
+#define DXCAM_TARGET_AVX2 __attribute__((target("avx2")))
+#endif
+
+static void dxcam_cpuid(int leaf, int subleaf, unsigned int regs[4]) {
+#if defined(_MSC_VER) && !defined(__clang__)
+    int info[4];
+    __cpuidex(info, leaf, subleaf);
+    regs[0] = (unsigned int)info[0];
+    regs[1] = (unsigned int)info[1];
+    regs[2] = (unsigned int)info[2];
+    regs[3] = (unsigned int)info[3];
+#else
+    __cpuid_count(leaf, subleaf, regs[0], regs[1], regs[2], regs[3]);
+#endif
+}
+
+static uint64_t dxcam_xgetbv0(void) {
+#if defined(_MSC_VER) && !defined(__clang__)
+    return (uint64_t)_xgetbv(0);
+#else
+    unsigned int eax, edx;
+    __asm__ volatile("xgetbv" : "=a"(eax), "=d"(edx) : "c"(0));
+    return ((uint64_t)edx << 32) | eax;
+#endif
+}
+
+static int dxcam_simd_detect(void) {
+    unsigned int regs[4];
+    unsigned int max_leaf;
+    int tier = DXCAM_SIMD_SCALAR;
+
+    dxcam_cpuid(0, 0, regs);
+    max_leaf = regs[0];
+    if (max_leaf < 1) {
+        return tier;
+    }
+    dxcam_cpuid(1, 0, regs);
+    if (!(regs[2] & (1u << 19))) {
+        return tier;
+    }
+    tier = DXCAM_SIMD_SSE41;
+    /* AVX2 needs the CPU bit and OS support for saving YMM state. */
+    if (max_leaf < 7 || !(regs[2] & (1u << 27)) || !(regs[2] & (1u << 28))) {
+        return tier;
+    }
+    if ((dxcam_xgetbv0() & 0x6) != 0x6) {
+        return tier;
+    }
+    dxcam_cpuid(7, 0, regs);
+    if (regs[1] & (1u << 5)) {
+        tier = DXCAM_SIMD_AVX2;
+    }
+    return tier;
+}
+
+/* Byte shuffles, duplicated for both AVX2 lanes. Passed by pointer because
+ * 32-bit MSVC cannot pass vector types by value. */
+static const int8_t dxcam_shuffle_rgb[32] = {
+    2, 1, 0, 6, 5, 4, 10, 9, 8, 14, 13, 12, -1, -1, -1, -1,
+    2, 1, 0, 6, 5, 4, 10, 9, 8, 14, 13, 12, -1, -1, -1, -1,
+};
+static const int8_t dxcam_shuffle_bgr[32] = {
+    0, 1, 2, 4, 5, 6, 8, 9, 10, 12, 13, 14, -1, -1, -1, -1,
+    0, 1, 2, 4, 5, 6, 8, 9, 10, 12, 13, 14, -1, -1, -1, -1,
+};
+static const int8_t dxcam_shuffle_rgba[32] = {
+    2, 1, 0, 3, 6, 5, 4, 7, 10, 9, 8, 11, 14, 13, 12, 15,
+    2, 1, 0, 3, 6, 5, 4, 7, 10, 9, 8, 11, 14, 13, 12, 15,
+};
+/* BT.601 gray weights in Q15 as (B, G, R, A) 16-bit pairs for madd. */
+static const int16_t dxcam_gray_coef[16] = {
+    3735, 19235, 9798, 0, 3735, 19235, 9798, 0,
+    3735, 19235, 9798, 0, 3735, 19235, 9798, 0,
+};
+
+/* ---- SSE4.1: 16 pixels per iteration ---------------------------------- */
+
+DXCAM_TARGET_SSE41
+static ptrdiff_t dxcam_bgra_to_3ch_sse41(
+    const uint8_t* src, uint8_t* dst, ptrdiff_t n, const int8_t* table
+) {
+    const __m128i shuffle = _mm_loadu_si128((const __m128i*)table);
+    ptrdiff_t i = 0;
+    for (; i + 16 <= n; i += 16) {
+        /* Each shuffle packs 4 pixels into the low 12 bytes, zeroing the
+         * rest, so neighbouring results can be OR-ed into 3 full stores. */
+        __m128i a = _mm_shuffle_epi8(_mm_loadu_si128((const __m128i*)(src + 0)), shuffle);
+        __m128i b = _mm_shuffle_epi8(_mm_loadu_si128((const __m128i*)(src + 16)), shuffle);
+        __m128i c = _mm_shuffle_epi8(_mm_loadu_si128((const __m128i*)(src + 32)), shuffle);
+        __m128i d = _mm_shuffle_epi8(_mm_loadu_si128((const __m128i*)(src + 48)), shuffle);
+        _mm_storeu_si128((__m128i*)(dst + 0), _mm_or_si128(a, _mm_slli_si128(b, 12)));
+        _mm_storeu_si128(
+            (__m128i*)(dst + 16), _mm_or_si128(_mm_srli_si128(b, 4), _mm_slli_si128(c, 8))
+        );
+        _mm_storeu_si128(
+            (__m128i*)(dst + 32), _mm_or_si128(_mm_srli_si128(c, 8), _mm_slli_si128(d, 4))
+        );
+        src += 64;
+        dst += 48;
+    }
+    return i;
+}
+
+DXCAM_TARGET_SSE41
+static ptrdiff_t dxcam_bgra_to_rgb_sse41(const uint8_t* src, uint8_t* dst, ptrdiff_t n) {
+    return dxcam_bgra_to_3ch_sse41(src, dst, n, dxcam_shuffle_rgb);
+}
+
+DXCAM_TARGET_SSE41
+static ptrdiff_t dxcam_bgra_to_bgr_sse41(const uint8_t* src, uint8_t* dst, ptrdiff_t n) {
+    return dxcam_bgra_to_3ch_sse41(src, dst, n, dxcam_shuffle_bgr);
+}
+
+DXCAM_TARGET_SSE41
+static ptrdiff_t dxcam_bgra_to_rgba_sse41(const uint8_t* src, uint8_t* dst, ptrdiff_t n) {
+    const __m128i shuffle = _mm_loadu_si128((const __m128i*)dxcam_shuffle_rgba);
+    ptrdiff_t i = 0;
+    for (; i + 4 <= n; i += 4) {
+        __m128i v = _mm_loadu_si128((const __m128i*)src);
+        _mm_storeu_si128((__m128i*)dst, _mm_shuffle_epi8(v, shuffle));
+        src += 16;
+        dst += 16;
+    }
+    return i;
+}
+
+DXCAM_TARGET_SSE41
+static __m128i dxcam_gray4_sse41(const uint8_t* src) {
+    /* (3735*B + 19235*G) and (9798*R + 0*A) per pixel via madd, then a
+     * horizontal add gives the same fixed-point sum as the scalar loop. */
+    const __m128i coef = _mm_loadu_si128((const __m128i*)dxcam_gray_coef);
+    const __m128i round = _mm_set1_epi32(16384);
+    const __m128i zero = _mm_setzero_si128();
+    __m128i v = _mm_loadu_si128((const __m128i*)src);
+    __m128i lo = _mm_madd_epi16(_mm_unpacklo_epi8(v, zero), coef);
+    __m128i hi = _mm_madd_epi16(_mm_unpackhi_epi8(v, zero), coef);
+    return _mm_srli_epi32(_mm_add_epi32(_mm_hadd_epi32(lo, hi), round), 15);
+}
+
+DXCAM_TARGET_SSE41
+static ptrdiff_t dxcam_bgra_to_gray_sse41(const uint8_t* src, uint8_t* dst, ptrdiff_t n) {
+    ptrdiff_t i = 0;
+    for (; i + 16 <= n; i += 16) {
+        __m128i g0 = dxcam_gray4_sse41(src + 0);
+        __m128i g1 = dxcam_gray4_sse41(src + 16);
+        __m128i g2 = dxcam_gray4_sse41(src + 32);
+        __m128i g3 = dxcam_gray4_sse41(src + 48);
+        __m128i w0 = _mm_packs_epi32(g0, g1);
+        __m128i w1 = _mm_packs_epi32(g2, g3);
+        _mm_storeu_si128((__m128i*)dst, _mm_packus_epi16(w0, w1));
+        src += 64;
+        dst += 16;
+    }
+    return i;
+}
+
+/* ---- AVX2: 8 (3/4 channel) or 32 (gray) pixels per iteration ----------- */
+
+DXCAM_TARGET_AVX2
+static ptrdiff_t dxcam_bgra_to_3ch_avx2(
+    const uint8_t* src, uint8_t* dst, ptrdiff_t n, const int8_t* table
+) {
+    /* Shuffles work per 128-bit lane; the permute joins the two 12-byte
+     * halves and the masked store writes exactly 24 bytes. */
+    const __m256i shuffle = _mm256_loadu_si256((const __m256i*)table);
+    const __m256i join = _mm256_setr_epi32(0, 1, 2, 4, 5, 6, 3, 7);
+    const __m256i mask = _mm256_setr_epi32(-1, -1, -1, -1, -1, -1, 0, 0);
+    ptrdiff_t i = 0;
+    for (; i + 8 <= n; i += 8) {
+        __m256i v = _mm256_loadu_si256((const __m256i*)src);
+        v = _mm256_permutevar8x32_epi32(_mm256_shuffle_epi8(v, shuffle), join);
+        _mm256_maskstore_epi32((int*)dst, mask, v);
+        src += 32;
+        dst += 24;
+    }
+    return i;
+}
+
+DXCAM_TARGET_AVX2
+static ptrdiff_t dxcam_bgra_to_rgb_avx2(const uint8_t* src, uint8_t* dst, ptrdiff_t n) {
+    return dxcam_bgra_to_3ch_avx2(src, dst, n, dxcam_shuffle_rgb);
+}
+
+DXCAM_TARGET_AVX2
+static ptrdiff_t dxcam_bgra_to_bgr_avx2(const uint8_t* src, uint8_t* dst, ptrdiff_t n) {
+    return dxcam_bgra_to_3ch_avx2(src, dst, n, dxcam_shuffle_bgr);
+}
+
+DXCAM_TARGET_AVX2
+static ptrdiff_t dxcam_bgra_to_rgba_avx2(const uint8_t* src, uint8_t* dst, ptrdiff_t n) {
+    const __m256i shuffle = _mm256_loadu_si256((const __m256i*)dxcam_shuffle_rgba);
+    ptrdiff_t i = 0;
+    for (; i + 8 <= n; i += 8) {
+        __m256i v = _mm256_loadu_si256((const __m256i*)src);
+        _mm256_storeu_si256((__m256i*)dst, _mm256_shuffle_epi8(v, shuffle));
+        src += 32;
+        dst += 32;
+    }
+    return i;
+}
+
+DXCAM_TARGET_AVX2
+static __m256i dxcam_gray8_avx2(const uint8_t* src) {
+    /* Lane 0 holds pixels 0-3 and lane 1 pixels 4-7 after the hadd. */
+    const __m256i coef = _mm256_loadu_si256((const __m256i*)dxcam_gray_coef);
+    const __m256i round = _mm256_set1_epi32(16384);
+    const __m256i zero = _mm256_setzero_si256();
+    __m256i v = _mm256_loadu_si256((const __m256i*)src);
+    __m256i lo = _mm256_madd_epi16(_mm256_unpacklo_epi8(v, zero), coef);
+    __m256i hi = _mm256_madd_epi16(_mm256_unpackhi_epi8(v, zero), coef);
+    return _mm256_srli_epi32(_mm256_add_epi32(_mm256_hadd_epi32(lo, hi), round), 15);
+}
+
+DXCAM_TARGET_AVX2
+static ptrdiff_t dxcam_bgra_to_gray_avx2(const uint8_t* src, uint8_t* dst, ptrdiff_t n) {
+    /* Packs interleave lanes; this permute restores pixel order. */
+    const __m256i order = _mm256_setr_epi32(0, 4, 1, 5, 2, 6, 3, 7);
+    ptrdiff_t i = 0;
+    for (; i + 32 <= n; i += 32) {
+        __m256i g0 = dxcam_gray8_avx2(src + 0);
+        __m256i g1 = dxcam_gray8_avx2(src + 32);
+        __m256i g2 = dxcam_gray8_avx2(src + 64);
+        __m256i g3 = dxcam_gray8_avx2(src + 96);
+        __m256i w0 = _mm256_packs_epi32(g0, g1);
+        __m256i w1 = _mm256_packs_epi32(g2, g3);
+        __m256i b = _mm256_packus_epi16(w0, w1);
+        _mm256_storeu_si256((__m256i*)dst, _mm256_permutevar8x32_epi32(b, order));
+        src += 128;
+        dst += 32;
+    }
+    return i;
+}
+
+DXCAM_TARGET_SSE41
+static void dxcam_tile_hash_row_sse41(
+    const uint8_t* row,
+    ptrdiff_t row_bytes,
+    ptrdiff_t tile_bytes,
+    const uint64_t* keys,
+    uint64_t* acc
+) {
+    ptrdiff_t offset;
+    ptrdiff_t n;
+    ptrdiff_t i;
+    uint64_t lanes[2];
+    for (offset = 0; offset < row_bytes; offset += tile_bytes, ++acc) {
+        const uint8_t* data = row + offset;
+        __m128i sum = _mm_setzero_si128();
+        n = row_bytes - offset < tile_bytes ? row_bytes - offset : tile_bytes;
+        for (i = 0; (i + 2) * 8 <= n; i += 2) {
+            __m128i w = _mm_loadu_si128((const __m128i*)(data + i * 8));
+            __m128i m = _mm_xor_si128(w, _mm_loadu_si128((const __m128i*)(keys + i)));
+            sum = _mm_add_epi64(sum, _mm_add_epi64(_mm_mul_epu32(m, _mm_srli_epi64(m, 32)), w));
+        }
+        _mm_storeu_si128((__m128i*)lanes, sum);
+        *acc += lanes[0] + lanes[1] + dxcam_tile_hash_span(data + i * 8, n - i * 8, keys + i);
+    }
+}
+
+DXCAM_TARGET_AVX2
+static void dxcam_tile_hash_row_avx2(
+    const uint8_t* row,
+    ptrdiff_t row_bytes,
+    ptrdiff_t tile_bytes,
+    const uint64_t* keys,
+    uint64_t* acc
+) {
+    ptrdiff_t offset;
+    ptrdiff_t n;
+    ptrdiff_t i;
+    uint64_t lanes[4];
+    for (offset = 0; offset < row_bytes; offset += tile_bytes, ++acc) {
+        const uint8_t* data = row + offset;
+        __m256i sum = _mm256_setzero_si256();
+        n = row_bytes - offset < tile_bytes ? row_bytes - offset : tile_bytes;
+        for (i = 0; (i + 4) * 8 <= n; i += 4) {
+            __m256i w = _mm256_loadu_si256((const __m256i*)(data + i * 8));
+            __m256i m = _mm256_xor_si256(w, _mm256_loadu_si256((const __m256i*)(keys + i)));
+            sum = _mm256_add_epi64(
+                sum, _mm256_add_epi64(_mm256_mul_epu32(m, _mm256_srli_epi64(m, 32)), w)
+            );
+        }
+        _mm256_storeu_si256((__m256i*)lanes, sum);
+        *acc += lanes[0] + lanes[1] + lanes[2] + lanes[3]
+            + dxcam_tile_hash_span(data + i * 8, n - i * 8, keys + i);
+    }
+}
+
+#else /* !DXCAM_SIMD_X86 */
+
+static int dxcam_simd_detect(void) { return DXCAM_SIMD_SCALAR; }
+
+static ptrdiff_t dxcam_bgra_to_rgb_sse41(const uint8_t* s, uint8_t* d, ptrdiff_t n) { (void)s; (void)d; (void)n; return 0; }
+static ptrdiff_t dxcam_bgra_to_bgr_sse41(const uint8_t* s, uint8_t* d, ptrdiff_t n) { (void)s; (void)d; (void)n; return 0; }
+static ptrdiff_t dxcam_bgra_to_rgba_sse41(const uint8_t* s, uint8_t* d, ptrdiff_t n) { (void)s; (void)d; (void)n; return 0; }
+static ptrdiff_t dxcam_bgra_to_gray_sse41(const uint8_t* s, uint8_t* d, ptrdiff_t n) { (void)s; (void)d; (void)n; return 0; }
+static ptrdiff_t dxcam_bgra_to_rgb_avx2(const uint8_t* s, uint8_t* d, ptrdiff_t n) { (void)s; (void)d; (void)n; return 0; }
+static ptrdiff_t dxcam_bgra_to_bgr_avx2(const uint8_t* s, uint8_t* d, ptrdiff_t n) { (void)s; (void)d; (void)n; return 0; }
+static ptrdiff_t dxcam_bgra_to_rgba_avx2(const uint8_t* s, uint8_t* d, ptrdiff_t n) { (void)s; (void)d; (void)n; return 0; }
+static ptrdiff_t dxcam_bgra_to_gray_avx2(const uint8_t* s, uint8_t* d, ptrdiff_t n) { (void)s; (void)d; (void)n; return 0; }
+#define dxcam_tile_hash_row_sse41 dxcam_tile_hash_row_scalar
+#define dxcam_tile_hash_row_avx2 dxcam_tile_hash_row_scalar
+
+#endif /* DXCAM_SIMD_X86 */
+
+#endif /* DXCAM_SIMD_KERNELS_H */
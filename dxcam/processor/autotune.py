@@ -0,0 +1,358 @@
+"""Autotuning for the compiled NumPy kernels.
+
+:func:`autotune` times the ``_numpy_kernels`` conversion on synthetic frames
+for the resolutions and rotations actually captured, picks the fastest OpenMP
+thread count, rotate tile and parallel-pixels threshold, and persists them to
+a per-user cache keyed by CPU model and extension build. The cached winners
+are applied whenever ``dxcam.processor._numpy_kernels`` is imported;
+``DXCAM_NUMPY_*`` environment variables still override them.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import platform
+import sys
+import time
+from dataclasses import asdict, dataclass
+from importlib import import_module
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Sequence
+
+import numpy as np
+
+from dxcam.types import ColorMode, Size
+from .base import color_mode_channels
+
+_CACHE_FORMAT = 1
+_CACHE_FILENAME = "kernel_tuning.json"
+# Pixel counts at or above which the parallel path runs; the last candidate
+# keeps every frame on the serial path.
+_DEFAULT_THRESHOLDS: tuple[int, ...] = (
+    0,
+    64 * 64,
+    128 * 128,
+    256 * 256,
+    512 * 512,
+    1024 * 1024,
+    2048 * 2048,
+    1 << 40,
+)
+_DEFAULT_TILES: tuple[int, ...] = (8, 16, 32, 64, 128)
+
+
+@dataclass(frozen=True)
+class KernelTuning:
+    """Kernel tunables picked by :func:`autotune`.
+
+    Attributes:
+        parallel_pixels_threshold: Frame pixel count that enables OpenMP.
+        rotate_tile: Tile edge of the rotate(90/270) loops.
+        num_threads: OpenMP threads used by parallel loops.
+    """
+
+    parallel_pixels_threshold: int
+    rotate_tile: int
+    num_threads: int
+
+
+def _load_kernels(kernels: ModuleType | None = None) -> ModuleType:
+    if kernels is not None:
+        return kernels
+    try:
+        return import_module("dxcam.processor._numpy_kernels")
+    except Exception as exc:
+        raise RuntimeError(
+            "Autotuning requires the compiled dxcam.processor._numpy_kernels extension."
+        ) from exc
+
+
+def tuning_cache_path() -> Path | None:
+    """Return the per-user tuning cache file, or ``None`` when disabled.
+
+    ``DXCAM_TUNING_CACHE`` overrides the location; an empty value disables
+    the cache. The default is ``%LOCALAPPDATA%\\dxcam`` on Windows and
+    ``$XDG_CACHE_HOME/dxcam`` (``~/.cache/dxcam``) elsewhere.
+    """
+    raw = os.environ.get("DXCAM_TUNING_CACHE")
+    if raw is not None:
+        return Path(raw) if raw else None
+    if sys.platform.startswith("win"):
+        base = os.environ.get("LOCALAPPDATA") or str(Path.home() / "AppData" / "Local")
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+    return Path(base) / "dxcam" / _CACHE_FILENAME
+
+
+def cpu_model() -> str:
+    """Return a human-readable CPU model string for cache keys."""
+    if sys.platform.startswith("linux"):
+        try:
+            with open("/proc/cpuinfo", encoding="utf-8") as cpuinfo:
+                for line in cpuinfo:
+                    if line.startswith("model name"):
+                        return line.split(":", 1)[1].strip()
+        except OSError:
+            pass
+    return platform.processor() or platform.machine() or "unknown"
+
+
+def machine_key(kernels: ModuleType | None = None) -> str:
+    """Return the cache key: CPU model, logical CPUs and extension build.
+
+    The extension build is identified by the size and modification time of
+    the compiled module, so rebuilding or upgrading it invalidates old
+    entries.
+    """
+    kernels = _load_kernels(kernels)
+    try:
+        stat = os.stat(kernels.__file__ or "")
+        build = f"{stat.st_size:x}-{stat.st_mtime_ns:x}"
+    except OSError:
+        build = "unknown"
+    return f"{cpu_model()}|{os.cpu_count()}|{build}"
+
+
+def _read_cache(path: Path) -> dict[str, Any]:
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("format") != _CACHE_FORMAT:
+        return {}
+    machines = data.get("machines")
+    return machines if isinstance(machines, dict) else {}
+
+
+def load_cached_tuning(
+    kernels: ModuleType | None = None,
+    path: Path | None = None,
+) -> KernelTuning | None:
+    """Return the cached tuning for this machine, or ``None`` if absent."""
+    path = path if path is not None else tuning_cache_path()
+    if path is None:
+        return None
+    entry = _read_cache(path).get(machine_key(kernels))
+    if not isinstance(entry, dict):
+        return None
+    try:
+        return KernelTuning(
+            parallel_pixels_threshold=int(entry["parallel_pixels_threshold"]),
+            rotate_tile=int(entry["rotate_tile"]),
+            num_threads=int(entry["num_threads"]),
+        )
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def save_tuning(
+    tuning: KernelTuning,
+    kernels: ModuleType | None = None,
+    path: Path | None = None,
+) -> Path | None:
+    """Persist ``tuning`` for this machine, keeping other machines' entries.
+
+    Returns:
+        The cache file written, or ``None`` when the cache is disabled.
+    """
+    path = path if path is not None else tuning_cache_path()
+    if path is None:
+        return None
+    machines = _read_cache(path)
+    machines[machine_key(kernels)] = asdict(tuning)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp_path.write_text(
+        json.dumps({"format": _CACHE_FORMAT, "machines": machines}, indent=2),
+        encoding="utf-8",
+    )
+    os.replace(tmp_path, path)
+    return path
+
+
+def current_tuning(kernels: ModuleType | None = None) -> KernelTuning:
+    """Return the tunables currently active in the kernels module."""
+    kernels = _load_kernels(kernels)
+    return KernelTuning(
+        parallel_pixels_threshold=kernels.get_parallel_pixels_threshold(),
+        rotate_tile=kernels.get_rotate_tile(),
+        num_threads=kernels.get_num_threads(),
+    )
+
+
+def apply_tuning(tuning: KernelTuning, kernels: ModuleType | None = None) -> None:
+    """Set ``tuning`` on the kernels module.
+
+    Raises:
+        ValueError: If a value is outside the range the kernels accept.
+    """
+    kernels = _load_kernels(kernels)
+    kernels.set_parallel_pixels_threshold(tuning.parallel_pixels_threshold)
+    kernels.set_rotate_tile(tuning.rotate_tile)
+    kernels.set_num_threads(tuning.num_threads)
+
+
+def apply_cached_tuning(kernels: ModuleType | None = None) -> KernelTuning | None:
+    """Apply this machine's cached tuning, if any, and return it."""
+    tuning = load_cached_tuning(kernels)
+    if tuning is not None:
+        apply_tuning(tuning, kernels)
+    return tuning
+
+
+def _default_thread_counts(max_threads: int) -> tuple[int, ...]:
+    counts = {max_threads}
+    count = 1
+    while count < max_threads:
+        counts.add(count)
+        count *= 2
+    return tuple(sorted(counts))
+
+
+class _Case:
+    """One synthetic mapped frame and destination for a resolution/rotation."""
+
+    def __init__(
+        self, size: Size, rotation_angle: int, mode: str, channels: int
+    ) -> None:
+        width, height = size
+        rows, cols = (height, width) if rotation_angle in (0, 180) else (width, height)
+        rng = np.random.default_rng(rows * 31 + cols)
+        self.src = rng.integers(0, 256, size=(rows, cols, 4), dtype=np.uint8)
+        self.dst = np.empty((height, width, channels), dtype=np.uint8)
+        self.width = width
+        self.height = height
+        self.region = (0, 0, width, height)
+        self.rotation_angle = rotation_angle
+        self.mode = mode
+
+    @property
+    def pixels(self) -> int:
+        return self.width * self.height
+
+    def time(self, kernels: ModuleType, repeat: int) -> float:
+        run = kernels.convert_bgra_prepare_into
+        args = (
+            self.src,
+            self.dst,
+            self.width,
+            self.height,
+            self.region,
+            self.rotation_angle,
+            self.mode,
+        )
+        run(*args)  # warm-up: page in buffers, spin up the OpenMP team
+        best = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter_ns()
+            run(*args)
+            best = min(best, float(time.perf_counter_ns() - start))
+        return best
+
+
+def _time_cases(kernels: ModuleType, cases: Sequence[_Case], repeat: int) -> float:
+    return sum(case.time(kernels, repeat) for case in cases)
+
+
+def autotune(
+    resolutions: Sequence[Size] = ((1920, 1080),),
+    rotations: Sequence[int] = (0,),
+    output_color: ColorMode = "RGB",
+    thresholds: Sequence[int] | None = None,
+    tiles: Sequence[int] | None = None,
+    thread_counts: Sequence[int] | None = None,
+    repeat: int = 5,
+    persist: bool = True,
+    path: Path | None = None,
+) -> KernelTuning:
+    """Sweep kernel tunables on synthetic frames and apply the fastest.
+
+    Thread counts are timed first on the parallel path, then rotate tiles
+    (only when a 90/270 rotation is in use), then the parallel threshold is
+    chosen from the serial and parallel time of every resolution.
+
+    Args:
+        resolutions: Captured ``(width, height)`` sizes to tune for.
+        rotations: Output rotations in use (``0``, ``90``, ``180``, ``270``).
+        output_color: Color mode converted during timing.
+        thresholds: Candidate parallel-pixels thresholds.
+        tiles: Candidate rotate tile edges.
+        thread_counts: Candidate OpenMP thread counts; defaults to powers of
+            two up to the OpenMP maximum.
+        repeat: Timed runs per case; the fastest run is used.
+        persist: Save the result to the per-user cache.
+        path: Cache file override (defaults to :func:`tuning_cache_path`).
+
+    Returns:
+        The applied :class:`KernelTuning`.
+
+    Raises:
+        RuntimeError: If the compiled kernels are unavailable.
+        ValueError: If an argument is empty or out of range.
+    """
+    kernels = _load_kernels()
+    if not resolutions or not rotations:
+        raise ValueError("resolutions and rotations must not be empty.")
+    if any(rotation not in (0, 90, 180, 270) for rotation in rotations):
+        raise ValueError(f"Unsupported rotations: {tuple(rotations)}.")
+    if repeat < 1:
+        raise ValueError(f"repeat must be >= 1, got {repeat}.")
+    thresholds = tuple(thresholds or _DEFAULT_THRESHOLDS)
+    tiles = tuple(tiles or _DEFAULT_TILES)
+    thread_counts = tuple(
+        thread_counts or _default_thread_counts(kernels.get_max_threads())
+    )
+    channels = color_mode_channels(output_color)
+    cases = [
+        _Case((int(width), int(height)), int(rotation), output_color, channels)
+        for width, height in resolutions
+        for rotation in rotations
+    ]
+    rotated = [case for case in cases if case.rotation_angle in (90, 270)]
+
+    previous = current_tuning(kernels)
+    try:
+        kernels.set_parallel_pixels_threshold(0)
+
+        timings: dict[int, float] = {}
+        for count in thread_counts:
+            kernels.set_num_threads(count)
+            timings[count] = _time_cases(kernels, cases, repeat)
+        num_threads = min(timings, key=timings.__getitem__)
+        kernels.set_num_threads(num_threads)
+
+        rotate_tile = previous.rotate_tile
+        if rotated:
+            timings = {}
+            for tile in tiles:
+                kernels.set_rotate_tile(tile)
+                timings[tile] = _time_cases(kernels, rotated, repeat)
+            rotate_tile = min(timings, key=timings.__getitem__)
+        kernels.set_rotate_tile(rotate_tile)
+
+        parallel = [case.time(kernels, repeat) for case in cases]
+        kernels.set_parallel_pixels_threshold(max(thresholds) + 1)
+        serial = [case.time(kernels, repeat) for case in cases]
+        costs = {
+            threshold: sum(
+                par if case.pixels >= threshold else ser
+                for case, par, ser in zip(cases, parallel, serial)
+            )
+            for threshold in thresholds
+        }
+        threshold = min(costs, key=costs.__getitem__)
+    except BaseException:
+        apply_tuning(previous, kernels)
+        raise
+
+    tuning = KernelTuning(
+        parallel_pixels_threshold=threshold,
+        rotate_tile=rotate_tile,
+        num_threads=num_threads,
+    )
+    apply_tuning(tuning, kernels)
+    if persist:
+        save_tuning(tuning, kernels, path)
+    return tuning
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable
+
+#: Band job: ``fn(start_row, stop_row)`` processes destination rows
+#: ``[start_row, stop_row)``.
+BandFn = Callable[[int, int], None]
+
+
+class BandExecutor:
+    """Split row ranges into horizontal stripes run on a persistent pool.
+
+    Jobs must release the GIL (``cv2`` calls and large NumPy copies do) for
+    stripes to overlap. The calling thread runs the last stripe itself, so a
+    pool of ``workers - 1`` threads keeps ``workers`` cores busy. The pool is
+    created on first use and lives until :meth:`close`.
+    """
+
+    def __init__(self, workers: int, min_rows: int) -> None:
+        self.workers = workers
+        self.min_rows = min_rows
+        self._pool: ThreadPoolExecutor | None = None
+
+    def bands(self, rows: int) -> list[tuple[int, int]]:
+        """Return the ``(start, stop)`` stripes used for ``rows`` rows."""
+        count = max(1, min(self.workers, rows // self.min_rows))
+        step, extra = divmod(rows, count)
+        bands = []
+        start = 0
+        for index in range(count):
+            stop = start + step + (1 if index < extra else 0)
+            bands.append((start, stop))
+            start = stop
+        return bands
+
+    def run(self, fn: BandFn, rows: int) -> None:
+        """Run ``fn`` over ``[0, rows)`` and wait for every stripe.
+
+        Raises:
+            Exception: The first exception raised by any stripe.
+        """
+        bands = self.bands(rows)
+        if len(bands) == 1:
+            fn(0, rows)
+            return
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(
+                max_workers=self.workers - 1,
+                thread_name_prefix="dxcam-band",
+            )
+        futures: list[Future[None]] = [
+            self._pool.submit(fn, start, stop) for start, stop in bands[:-1]
+        ]
+        try:
+            fn(*bands[-1])
+        finally:
+            for future in futures:
+                future.result()
+
+    def close(self) -> None:
+        """Shut down the worker threads; a later :meth:`run` recreates them."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
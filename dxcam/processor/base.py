@@ -1,11 +1,30 @@
 from __future__ import annotations
 
 import enum
-from typing import Any, cast
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Sequence, cast
 
 import numpy as np
 from numpy.typing import NDArray
-from dxcam.types import ColorMode, ProcessorBackend, Region
+from dxcam.types import (
+    ColorMode,
+    Interpolation,
+    LetterboxTransform,
+    OutputDType,
+    OutputLayout,
+    ProcessorBackend,
+    Region,
+    Size,
+    SourceFormat,
+    ToneMap,
+    YuvMatrix,
+    YuvRange,
+)
+from .stats import ProcessorStats
+
+if TYPE_CHECKING:
+    from .cursor import CursorCompositor
+    from .plan import ProcessingPlan
 
 
 class ProcessorBackends(enum.Enum):
@@ -14,9 +33,14 @@ class ProcessorBackends(enum.Enum):
     PIL = 0
     CV2 = 1
     NUMPY = 2
+    PURE_NUMPY = 3
 
 
-_SUPPORTED_PROCESSOR_BACKENDS: tuple[ProcessorBackend, ...] = ("cv2", "numpy")
+_SUPPORTED_PROCESSOR_BACKENDS: tuple[ProcessorBackend, ...] = (
+    "cv2",
+    "numpy",
+    "pure_numpy",
+)
 
 
 def normalize_processor_backend_name(backend: str) -> ProcessorBackend:
@@ -26,7 +50,8 @@ def normalize_processor_backend_name(backend: str) -> ProcessorBackend:
         backend: Backend name provided by user input.
 
     Returns:
-        Lower-cased validated backend literal (``"cv2"`` or ``"numpy"``).
+        Lower-cased validated backend literal (``"cv2"``, ``"numpy"`` or
+        ``"pure_numpy"``).
 
     Raises:
         ValueError: If ``backend`` is not a supported processor backend.
@@ -40,24 +65,523 @@ def normalize_processor_backend_name(backend: str) -> ProcessorBackend:
     return cast(ProcessorBackend, normalized)
 
 
+_SUPPORTED_INTERPOLATIONS: tuple[Interpolation, ...] = ("nearest", "bilinear", "area")
+
+
+def normalize_interpolation_name(interpolation: str) -> Interpolation:
+    """Normalize and validate a resize interpolation name.
+
+    Args:
+        interpolation: Interpolation name provided by user input.
+
+    Returns:
+        Lower-cased validated interpolation literal.
+
+    Raises:
+        ValueError: If ``interpolation`` is not supported.
+    """
+    normalized = interpolation.lower()
+    if normalized not in _SUPPORTED_INTERPOLATIONS:
+        supported = ", ".join(_SUPPORTED_INTERPOLATIONS)
+        raise ValueError(
+            f"Unsupported interpolation '{interpolation}'. Supported: {supported}."
+        )
+    return cast(Interpolation, normalized)
+
+
+def normalize_output_size(output_size: Size | None) -> Size | None:
+    """Validate an optional ``(width, height)`` output size.
+
+    Args:
+        output_size: Requested output size, or ``None`` to keep region size.
+
+    Returns:
+        ``None`` or a tuple of two positive ints.
+
+    Raises:
+        ValueError: If either dimension is not a positive integer.
+    """
+    if output_size is None:
+        return None
+    out_width, out_height = (int(v) for v in output_size)
+    if out_width <= 0 or out_height <= 0:
+        raise ValueError(
+            f"Invalid output_size {tuple(output_size)}: width and height must be > 0."
+        )
+    return out_width, out_height
+
+
+def normalize_letterbox_color(letterbox_color: int) -> int:
+    """Validate the constant letterbox padding value.
+
+    Args:
+        letterbox_color: Padding value written to every channel of border pixels.
+
+    Returns:
+        The padding value as an ``int``.
+
+    Raises:
+        ValueError: If ``letterbox_color`` is outside ``0..255``.
+    """
+    value = int(letterbox_color)
+    if not 0 <= value <= 255:
+        raise ValueError(
+            f"Invalid letterbox_color {letterbox_color}: must be in range 0..255."
+        )
+    return value
+
+
+def letterbox_geometry(
+    width: int,
+    height: int,
+    canvas_size: Size,
+) -> tuple[float, Region]:
+    """Fit a ``width`` x ``height`` image into ``canvas_size`` preserving aspect.
+
+    Args:
+        width: Source width in pixels.
+        height: Source height in pixels.
+        canvas_size: Padded canvas ``(width, height)``.
+
+    Returns:
+        ``(scale, inner)`` where ``inner`` is the ``(left, top, right, bottom)``
+        rectangle of the canvas covered by the scaled image. The remaining
+        border bands are padding.
+    """
+    canvas_width, canvas_height = canvas_size
+    scale = min(canvas_width / width, canvas_height / height)
+    inner_width = min(canvas_width, max(1, round(width * scale)))
+    inner_height = min(canvas_height, max(1, round(height * scale)))
+    pad_left = (canvas_width - inner_width) // 2
+    pad_top = (canvas_height - inner_height) // 2
+    return scale, (
+        pad_left,
+        pad_top,
+        pad_left + inner_width,
+        pad_top + inner_height,
+    )
+
+
+_SUPPORTED_OUTPUT_LAYOUTS: tuple[OutputLayout, ...] = ("HWC", "CHW")
+_SUPPORTED_OUTPUT_DTYPES: tuple[OutputDType, ...] = ("uint8", "float32", "float16")
+_MODE_CHANNELS: dict[str, int] = {
+    "RGB": 3,
+    "BGR": 3,
+    "RGBA": 4,
+    "BGRA": 4,
+    "GRAY": 1,
+    "NV12": 1,
+    "I420": 1,
+}
+_YUV420_MODES: tuple[ColorMode, ...] = ("NV12", "I420")
+_SUPPORTED_YUV_MATRICES: tuple[YuvMatrix, ...] = ("bt601", "bt709")
+_SUPPORTED_YUV_RANGES: tuple[YuvRange, ...] = ("limited", "full")
+_SUPPORTED_SOURCE_FORMATS: tuple[SourceFormat, ...] = ("BGRA8", "RGB10A2", "RGBA16F")
+_SUPPORTED_TONE_MAPS: tuple[ToneMap, ...] = ("none", "clip", "reinhard", "aces")
+
+
+def color_mode_channels(color_mode: ColorMode | None) -> int:
+    """Return the channel count of ``color_mode`` (``None`` means BGRA).
+
+    Planar YUV modes report ``1``: their frames are single-channel 2D planes.
+    """
+    return _MODE_CHANNELS[color_mode or "BGRA"]
+
+
+def batch_frame_geometry(
+    frames_shape: tuple[int, ...],
+    rotation_angle: int,
+    region: Region | None = None,
+) -> tuple[int, int, Region]:
+    """Return ``(width, height, region)`` for a stack of unrotated BGRA frames.
+
+    Args:
+        frames_shape: Shape of the ``(N, rows, cols, 4)`` source stack.
+        rotation_angle: Output rotation in degrees.
+        region: Region as ``(left, top, right, bottom)`` in rotated frame
+            coordinates, or ``None`` for the whole frame.
+
+    Returns:
+        The rotated frame size and the validated region.
+
+    Raises:
+        ValueError: If the shape, rotation or region is invalid.
+    """
+    if len(frames_shape) != 4 or frames_shape[3] != 4:
+        raise ValueError(
+            f"Expected (N, H, W, 4) BGRA frames, got shape {tuple(frames_shape)}."
+        )
+    if rotation_angle not in (0, 90, 180, 270):
+        raise ValueError(f"Unsupported rotation angle: {rotation_angle}.")
+    rows, cols = int(frames_shape[1]), int(frames_shape[2])
+    width, height = (cols, rows) if rotation_angle in (0, 180) else (rows, cols)
+    if region is None:
+        region = (0, 0, width, height)
+    left, top, right, bottom = (int(value) for value in region)
+    if not (0 <= left < right <= width and 0 <= top < bottom <= height):
+        raise ValueError(
+            f"Invalid region {tuple(region)} for frame size {width}x{height}."
+        )
+    return width, height, (left, top, right, bottom)
+
+
+def tile_grid_shape(height: int, width: int, tile_size: int) -> tuple[int, int]:
+    """Return ``(tiles_y, tiles_x)`` of ``tile_size`` tiles covering a frame.
+
+    Edge tiles are partial when the frame size is not a multiple of
+    ``tile_size``.
+    """
+    return -(-height // tile_size), -(-width // tile_size)
+
+
+def normalize_change_tile_size(tile_size: int) -> int:
+    """Validate the tile edge used for frame change maps.
+
+    Args:
+        tile_size: Tile edge in pixels.
+
+    Returns:
+        ``tile_size`` as ``int``.
+
+    Raises:
+        ValueError: If ``tile_size`` is outside ``[8, 256]``.
+    """
+    tile_size = int(tile_size)
+    if not 8 <= tile_size <= 256:
+        raise ValueError(f"change_tile_size must be in [8, 256], got {tile_size}.")
+    return tile_size
+
+
+def normalize_band_workers(workers: int) -> int:
+    """Validate the band-parallel worker count.
+
+    Args:
+        workers: Number of threads converting horizontal stripes; ``0`` or
+            ``1`` keeps conversion on the calling thread.
+
+    Returns:
+        ``workers`` as ``int``.
+
+    Raises:
+        ValueError: If ``workers`` is negative.
+    """
+    workers = int(workers)
+    if workers < 0:
+        raise ValueError(f"band_workers must be >= 0, got {workers}.")
+    return workers
+
+
+def normalize_band_min_rows(min_rows: int) -> int:
+    """Validate the minimum stripe height for band-parallel conversion.
+
+    Args:
+        min_rows: Smallest number of rows handed to one worker.
+
+    Returns:
+        ``min_rows`` as ``int``.
+
+    Raises:
+        ValueError: If ``min_rows`` is smaller than 1.
+    """
+    min_rows = int(min_rows)
+    if min_rows < 1:
+        raise ValueError(f"band_min_rows must be >= 1, got {min_rows}.")
+    return min_rows
+
+
+def is_yuv420_mode(color_mode: ColorMode | None) -> bool:
+    """Return whether ``color_mode`` is a planar YUV 4:2:0 mode."""
+    return color_mode in _YUV420_MODES
+
+
+def yuv420_frame_shape(width: int, height: int) -> tuple[int, int]:
+    """Return the ``(rows, cols)`` of a 4:2:0 frame, padded to even dimensions.
+
+    Args:
+        width: Image width in pixels.
+        height: Image height in pixels.
+    """
+    out_width = width + (width & 1)
+    out_height = height + (height & 1)
+    return out_height * 3 // 2, out_width
+
+
+def normalize_yuv_matrix_name(yuv_matrix: str) -> YuvMatrix:
+    """Normalize and validate a YUV color matrix name.
+
+    Args:
+        yuv_matrix: Matrix name provided by user input.
+
+    Returns:
+        Lower-cased validated matrix literal (``"bt601"`` or ``"bt709"``).
+
+    Raises:
+        ValueError: If ``yuv_matrix`` is not supported.
+    """
+    normalized = yuv_matrix.lower().replace(".", "")
+    if normalized not in _SUPPORTED_YUV_MATRICES:
+        supported = ", ".join(_SUPPORTED_YUV_MATRICES)
+        raise ValueError(
+            f"Unsupported YUV matrix '{yuv_matrix}'. Supported: {supported}."
+        )
+    return cast(YuvMatrix, normalized)
+
+
+def normalize_yuv_range_name(yuv_range: str) -> YuvRange:
+    """Normalize and validate a YUV quantization range name.
+
+    Args:
+        yuv_range: Range name provided by user input.
+
+    Returns:
+        Lower-cased validated range literal (``"limited"`` or ``"full"``).
+
+    Raises:
+        ValueError: If ``yuv_range`` is not supported.
+    """
+    normalized = yuv_range.lower()
+    if normalized not in _SUPPORTED_YUV_RANGES:
+        supported = ", ".join(_SUPPORTED_YUV_RANGES)
+        raise ValueError(
+            f"Unsupported YUV range '{yuv_range}'. Supported: {supported}."
+        )
+    return cast(YuvRange, normalized)
+
+
+def normalize_source_format(source_format: str) -> SourceFormat:
+    """Normalize and validate a capture source format name.
+
+    Args:
+        source_format: Format name provided by user input.
+
+    Returns:
+        Upper-cased validated format literal.
+
+    Raises:
+        ValueError: If ``source_format`` is not supported.
+    """
+    normalized = source_format.upper()
+    if normalized not in _SUPPORTED_SOURCE_FORMATS:
+        supported = ", ".join(_SUPPORTED_SOURCE_FORMATS)
+        raise ValueError(
+            f"Unsupported source_format '{source_format}'. Supported: {supported}."
+        )
+    return cast(SourceFormat, normalized)
+
+
+def normalize_tone_map_name(tone_map: str) -> ToneMap:
+    """Normalize and validate an HDR tone map name.
+
+    Args:
+        tone_map: Tone map name provided by user input.
+
+    Returns:
+        Lower-cased validated tone map literal.
+
+    Raises:
+        ValueError: If ``tone_map`` is not supported.
+    """
+    normalized = tone_map.lower()
+    if normalized not in _SUPPORTED_TONE_MAPS:
+        supported = ", ".join(_SUPPORTED_TONE_MAPS)
+        raise ValueError(f"Unsupported tone_map '{tone_map}'. Supported: {supported}.")
+    return cast(ToneMap, normalized)
+
+
+def normalize_hdr_white_nits(white_nits: float) -> float:
+    """Validate the luminance mapped to 8-bit white by HDR tone mapping.
+
+    Args:
+        white_nits: SDR reference white in nits (cd/m^2).
+
+    Returns:
+        ``white_nits`` as ``float``.
+
+    Raises:
+        ValueError: If ``white_nits`` is not a positive finite number.
+    """
+    value = float(white_nits)
+    if not (0.0 < value < float("inf")):
+        raise ValueError(f"hdr_white_nits must be positive, got {white_nits}.")
+    return value
+
+
+@dataclass(frozen=True)
+class TensorFormat:
+    """Tensor output format: layout, dtype and fused per-channel affine.
+
+    Float outputs are ``value * scale[c] + bias[c]`` for each output channel.
+    """
+
+    layout: OutputLayout
+    dtype: OutputDType
+    scale: tuple[float, ...]
+    bias: tuple[float, ...]
+
+    @property
+    def numpy_dtype(self) -> np.dtype[Any]:
+        return np.dtype(self.dtype)
+
+    def frame_shape(self, width: int, height: int, channels: int) -> tuple[int, ...]:
+        if self.layout == "CHW":
+            return channels, height, width
+        return height, width, channels
+
+
+def normalize_tensor_format(
+    output_color: ColorMode,
+    output_layout: str = "HWC",
+    output_dtype: str = "uint8",
+    normalize_mean: Sequence[float] | None = None,
+    normalize_std: Sequence[float] | None = None,
+    output_scale: float | None = None,
+) -> TensorFormat | None:
+    """Validate tensor output options.
+
+    Args:
+        output_color: Output color mode; fixes channel order and count.
+        output_layout: ``"HWC"`` (interleaved) or ``"CHW"`` (planar).
+        output_dtype: ``"uint8"``, ``"float32"`` or ``"float16"``.
+        normalize_mean: Optional per-channel mean, subtracted after scaling.
+        normalize_std: Optional per-channel std, divided after mean subtraction.
+        output_scale: Multiplier applied before normalization. Defaults to
+            ``1/255`` for float dtypes.
+
+    Returns:
+        ``None`` for plain ``HWC`` ``uint8`` frames, otherwise a
+        :class:`TensorFormat`.
+
+    Raises:
+        ValueError: If an option is unsupported or inconsistent with the
+            output color mode.
+    """
+    layout = output_layout.upper()
+    if layout not in _SUPPORTED_OUTPUT_LAYOUTS:
+        supported = ", ".join(_SUPPORTED_OUTPUT_LAYOUTS)
+        raise ValueError(
+            f"Unsupported output layout '{output_layout}'. Supported: {supported}."
+        )
+    dtype = output_dtype.lower()
+    if dtype not in _SUPPORTED_OUTPUT_DTYPES:
+        supported = ", ".join(_SUPPORTED_OUTPUT_DTYPES)
+        raise ValueError(
+            f"Unsupported output dtype '{output_dtype}'. Supported: {supported}."
+        )
+
+    if is_yuv420_mode(output_color) and (layout != "HWC" or dtype != "uint8"):
+        raise ValueError(
+            f"{output_color} output is planar uint8; output_layout and "
+            "output_dtype cannot be changed."
+        )
+
+    normalizes = (
+        normalize_mean is not None
+        or normalize_std is not None
+        or output_scale is not None
+    )
+    if dtype == "uint8":
+        if normalizes:
+            raise ValueError(
+                "normalize_mean, normalize_std and output_scale require a float "
+                "output_dtype."
+            )
+        if layout == "HWC":
+            return None
+        return TensorFormat(layout="CHW", dtype="uint8", scale=(), bias=())
+
+    channels = color_mode_channels(output_color)
+
+    def _per_channel(
+        values: Sequence[float] | None, default: float, name: str
+    ) -> tuple[float, ...]:
+        if values is None:
+            return (default,) * channels
+        items = tuple(float(v) for v in values)
+        if len(items) == 1:
+            items = items * channels
+        if len(items) != channels:
+            raise ValueError(
+                f"{name} must have 1 or {channels} value(s) for {output_color}, "
+                f"got {len(items)}."
+            )
+        return items
+
+    mean = _per_channel(normalize_mean, 0.0, "normalize_mean")
+    std = _per_channel(normalize_std, 1.0, "normalize_std")
+    if any(v == 0.0 for v in std):
+        raise ValueError("normalize_std values must be non-zero.")
+    multiplier = 1.0 / 255.0 if output_scale is None else float(output_scale)
+    return TensorFormat(
+        layout=cast(OutputLayout, layout),
+        dtype=cast(OutputDType, dtype),
+        scale=tuple(multiplier / s for s in std),
+        bias=tuple(-m / s for m, s in zip(mean, std)),
+    )
+
+
 class Processor:
     """Color conversion and post-processing backend selector.
 
     This wrapper dispatches to one concrete backend:
     - ``cv2``: OpenCV-based conversion path (default).
     - ``numpy``: Cython-accelerated conversion path with cv2 fallback.
+    - ``pure_numpy``: Vectorized NumPy only; needs neither OpenCV nor the
+      compiled extension.
     """
 
+    # Backends share the output properties below but decode no HDR sources.
+    source_format: SourceFormat = "BGRA8"
+    native_hdr = False
+
     def __init__(
         self,
         backend: ProcessorBackends | ProcessorBackend = ProcessorBackends.CV2,
         output_color: ColorMode = "RGB",
+        output_size: Size | None = None,
+        interpolation: Interpolation = "area",
+        letterbox: bool = False,
+        letterbox_color: int = 114,
+        output_layout: OutputLayout = "HWC",
+        output_dtype: OutputDType = "uint8",
+        normalize_mean: Sequence[float] | None = None,
+        normalize_std: Sequence[float] | None = None,
+        output_scale: float | None = None,
+        yuv_matrix: YuvMatrix = "bt601",
+        yuv_range: YuvRange = "limited",
+        band_workers: int = 0,
+        band_min_rows: int = 64,
+        source_format: SourceFormat = "BGRA8",
+        tone_map: ToneMap = "clip",
+        hdr_white_nits: float = 80.0,
     ) -> None:
         """Create a processor dispatcher.
 
         Args:
             backend: Processor backend enum or backend name.
             output_color: Desired output color mode.
+            output_size: Optional ``(width, height)`` to resize every frame to.
+                ``None`` keeps the capture region size.
+            interpolation: Resize interpolation used when ``output_size`` is set.
+            letterbox: Preserve aspect ratio and pad to ``output_size`` (or to
+                a square canvas when ``output_size`` is ``None``).
+            letterbox_color: Padding value for every channel of border pixels.
+            output_layout: ``"HWC"`` (default) or planar ``"CHW"``.
+            output_dtype: ``"uint8"`` (default), ``"float32"`` or ``"float16"``.
+            normalize_mean: Optional per-channel mean for float outputs.
+            normalize_std: Optional per-channel std for float outputs.
+            output_scale: Float output multiplier, ``1/255`` by default.
+            yuv_matrix: Color matrix for ``NV12``/``I420`` output.
+            yuv_range: ``"limited"`` or ``"full"`` range for YUV output.
+            band_workers: Threads that split OpenCV conversion and copies
+                into horizontal stripes. ``0`` (default) disables banding.
+            band_min_rows: Minimum stripe height in rows.
+            source_format: Format of mapped frames: ``"BGRA8"`` (default),
+                ``"RGB10A2"`` (HDR10) or ``"RGBA16F"`` (scRGB).
+            tone_map: How HDR sources reach 8-bit sRGB: ``"clip"``
+                (default), ``"reinhard"`` or ``"aces"``. ``"none"`` keeps
+                source precision and needs ``RGBA``/``RGB`` output without
+                resize, letterbox, tensor or YUV options.
+            hdr_white_nits: HDR luminance mapped to 8-bit white.
         """
         if isinstance(backend, str):
             backend_name = normalize_processor_backend_name(backend)
@@ -65,10 +589,133 @@ class Processor:
                 backend = ProcessorBackends.CV2
             elif backend_name == "numpy":
                 backend = ProcessorBackends.NUMPY
+            elif backend_name == "pure_numpy":
+                backend = ProcessorBackends.PURE_NUMPY
             else:
                 raise ValueError(f"Unsupported processor backend: {backend_name}")
         self.color_mode = output_color
+        self.interpolation = normalize_interpolation_name(str(interpolation))
+        self.output_size = normalize_output_size(output_size)
+        self.letterbox = bool(letterbox)
+        self.letterbox_color = normalize_letterbox_color(letterbox_color)
+        self.tensor_format = normalize_tensor_format(
+            output_color,
+            output_layout=str(output_layout),
+            output_dtype=str(output_dtype),
+            normalize_mean=normalize_mean,
+            normalize_std=normalize_std,
+            output_scale=output_scale,
+        )
+        self.yuv_matrix = normalize_yuv_matrix_name(str(yuv_matrix))
+        self.yuv_range = normalize_yuv_range_name(str(yuv_range))
+        self.band_workers = normalize_band_workers(band_workers)
+        self.band_min_rows = normalize_band_min_rows(band_min_rows)
+        self.source_format: SourceFormat = normalize_source_format(str(source_format))
+        self.tone_map = normalize_tone_map_name(str(tone_map))
+        self.hdr_white_nits = normalize_hdr_white_nits(hdr_white_nits)
+        self.native_hdr = self.source_format != "BGRA8" and self.tone_map == "none"
+        if self.native_hdr and (
+            output_color not in ("RGBA", "RGB")
+            or self.output_size is not None
+            or self.letterbox
+            or self.tensor_format is not None
+        ):
+            raise ValueError(
+                "tone_map='none' supports only RGBA/RGB output without "
+                "output_size, letterbox or tensor options."
+            )
         self.backend = self._initialize_backend(backend)
+        if self.source_format != "BGRA8":
+            from dxcam.processor.hdr import HdrProcessor
+
+            self.backend = HdrProcessor(
+                self.backend,
+                self.source_format,
+                tone_map=self.tone_map,
+                white_nits=self.hdr_white_nits,
+                color_mode=output_color,
+            )
+
+    def set_output_size(self, output_size: Size | None) -> None:
+        """Change the resize target ``(width, height)``; ``None`` disables resize.
+
+        Args:
+            output_size: New output size, or ``None`` for region-sized frames.
+
+        Raises:
+            ValueError: If resizing is requested with ``tone_map="none"``.
+        """
+        output_size = normalize_output_size(output_size)
+        if output_size is not None and self.native_hdr:
+            raise ValueError("output_size is not supported with tone_map='none'.")
+        self.output_size = output_size
+        self.backend.set_output_size(self.output_size)
+
+    def output_frame_size(self, width: int, height: int) -> Size:
+        """Return the ``(width, height)`` of frames produced for a region size.
+
+        Args:
+            width: Capture region width in pixels.
+            height: Capture region height in pixels.
+        """
+        if self.output_size is not None:
+            return self.output_size
+        if self.letterbox:
+            side = max(width, height)
+            return side, side
+        return width, height
+
+    def output_frame_shape(self, width: int, height: int) -> tuple[int, ...]:
+        """Return the array shape of frames produced for a region size.
+
+        Args:
+            width: Capture region width in pixels.
+            height: Capture region height in pixels.
+        """
+        out_width, out_height = self.output_frame_size(width, height)
+        if is_yuv420_mode(self.color_mode):
+            return yuv420_frame_shape(out_width, out_height)
+        channels = color_mode_channels(self.color_mode)
+        if self.tensor_format is None:
+            return out_height, out_width, channels
+        return self.tensor_format.frame_shape(out_width, out_height, channels)
+
+    @property
+    def output_layout(self) -> str:
+        """Memory layout of produced frames: ``HWC``, ``CHW`` or ``YUV420``."""
+        if is_yuv420_mode(self.color_mode):
+            return "YUV420"
+        if self.tensor_format is None:
+            return "HWC"
+        return self.tensor_format.layout
+
+    @property
+    def output_dtype(self) -> np.dtype[Any]:
+        """NumPy dtype of produced frames."""
+        if self.native_hdr:
+            return np.dtype(
+                np.float16 if self.source_format == "RGBA16F" else np.uint16
+            )
+        if self.tensor_format is None:
+            return np.dtype(np.uint8)
+        return self.tensor_format.numpy_dtype
+
+    def letterbox_transform(self, width: int, height: int) -> LetterboxTransform | None:
+        """Return ``(scale, pad_left, pad_top)`` for a region size.
+
+        Args:
+            width: Capture region width in pixels.
+            height: Capture region height in pixels.
+
+        Returns:
+            The letterbox mapping, or ``None`` when letterboxing is disabled.
+        """
+        if not self.letterbox:
+            return None
+        scale, inner = letterbox_geometry(
+            width, height, self.output_frame_size(width, height)
+        )
+        return scale, inner[0], inner[1]
 
     def process(
         self,
@@ -100,6 +747,8 @@ class Processor:
         region: Region,
         rotation_angle: int,
         dst: NDArray[np.uint8],
+        tile_hashes: NDArray[np.uint64] | None = None,
+        tile_size: int = 32,
     ) -> None:
         """Process into caller-provided destination array ``dst``.
 
@@ -110,16 +759,262 @@ class Processor:
             region: Capture region as ``(left, top, right, bottom)``.
             rotation_angle: Output rotation in degrees.
             dst: Destination array to write into.
+            tile_hashes: Optional ``uint64`` array of shape
+                :func:`tile_grid_shape` that receives a hash per
+                ``tile_size`` x ``tile_size`` tile of ``dst``. The ``numpy``
+                backend computes it during color conversion.
+            tile_size: Tile edge in pixels for ``tile_hashes``.
+        """
+        self.backend.process_into(
+            rect, width, height, region, rotation_angle, dst, tile_hashes, tile_size
+        )
+
+    def hash_tiles_into(
+        self,
+        frame: NDArray[Any],
+        tile_hashes: NDArray[np.uint64],
+        tile_size: int,
+    ) -> None:
+        """Hash the ``tile_size`` tiles of an HWC ``frame`` into ``tile_hashes``.
+
+        Produces the same hashes as :meth:`process_into` for the same bytes.
+
+        Args:
+            frame: HWC frame to hash.
+            tile_hashes: ``uint64`` array of shape :func:`tile_grid_shape`.
+            tile_size: Tile edge in pixels.
         """
-        self.backend.process_into(rect, width, height, region, rotation_angle, dst)
+        self.backend.hash_tiles_into(frame, tile_hashes, tile_size)
+
+    def fingerprint(self, frame: NDArray[Any], sample_step: int = 1) -> int:
+        """Return a 64-bit fingerprint of the raw bytes of ``frame``.
+
+        Args:
+            frame: Any array; it is hashed as its C-order bytes.
+            sample_step: Hash only every ``sample_step``-th 4 KiB block.
+                ``1`` (default) hashes every byte; larger steps are faster
+                but can miss changes.
+
+        Returns:
+            Fingerprint as an unsigned 64-bit ``int``.
+
+        Raises:
+            ValueError: If ``sample_step`` is less than 1.
+        """
+        return self.backend.fingerprint(frame, sample_step)
+
+    def cursor_compositor(self) -> CursorCompositor:
+        """Return a compositor that draws pointer shapes into output frames.
+
+        Returns:
+            A :class:`~dxcam.processor.cursor.CursorCompositor` for this
+            processor's color mode. It uses the compiled kernels unless the
+            backend is ``"pure_numpy"``.
+
+        Raises:
+            ValueError: If frames are not region-sized ``RGB``/``BGR``/
+                ``RGBA``/``BGRA`` uint8 images (resize, letterbox, tensor,
+                YUV, ``GRAY`` and native HDR outputs are unsupported).
+        """
+        from dxcam.processor.cursor import CursorCompositor
+        from dxcam.processor.pure_numpy_processor import PureNumpyProcessor
+
+        if (
+            self.native_hdr
+            or self.output_size is not None
+            or self.letterbox
+            or self.tensor_format is not None
+        ):
+            raise ValueError(
+                "Cursor compositing needs region-sized uint8 HWC frames; "
+                "disable output_size, letterbox, tensor and tone_map='none' "
+                "options."
+            )
+        backend = getattr(self.backend, "inner", self.backend)
+        return CursorCompositor(
+            self.color_mode,
+            use_kernels=not isinstance(backend, PureNumpyProcessor),
+        )
+
+    def process_regions_into(
+        self,
+        rect: Any,
+        width: int,
+        height: int,
+        regions: Sequence[Region],
+        rotation_angle: int,
+        dsts: Sequence[NDArray[Any]],
+    ) -> None:
+        """Process several regions of one mapped frame into ``dsts``.
+
+        Each ``dsts[i]`` receives exactly what :meth:`process_into` would
+        write for ``regions[i]``. The ``numpy`` backend converts all regions
+        in one kernel call.
+
+        Args:
+            rect: Backend-specific mapped frame object.
+            width: Active frame width in pixels.
+            height: Active frame height in pixels.
+            regions: Regions as ``(left, top, right, bottom)`` in the frame.
+            rotation_angle: Output rotation in degrees.
+            dsts: One destination array per region.
+
+        Raises:
+            ValueError: If ``regions`` and ``dsts`` differ in length.
+        """
+        self.backend.process_regions_into(
+            rect, width, height, regions, rotation_angle, dsts
+        )
+
+    def processing_plan(
+        self,
+        pitch: int,
+        width: int,
+        height: int,
+        region: Region,
+        rotation_angle: int,
+        dst: NDArray[Any],
+    ) -> ProcessingPlan:
+        """Build a reusable plan for repeated :meth:`process_into` calls.
+
+        The plan resolves validation, views and the conversion routine once
+        for this geometry and destination layout; per frame it only checks
+        the mapped pointer. Check :meth:`ProcessingPlan.matches` before
+        reusing it: plans go stale when the output size or stats change.
+
+        Args:
+            pitch: Mapped row pitch in bytes.
+            width: Active frame width in pixels.
+            height: Active frame height in pixels.
+            region: Capture region as ``(left, top, right, bottom)``.
+            rotation_angle: Output rotation in degrees.
+            dst: Destination array whose shape, strides and dtype later
+                ``run`` calls reuse.
+
+        Raises:
+            ValueError: If the geometry or destination is invalid.
+        """
+        return self.backend.processing_plan(
+            pitch, width, height, region, rotation_angle, dst
+        )
+
+    def process_batch(
+        self,
+        frames: NDArray[np.uint8],
+        rotation_angle: int = 0,
+        region: Region | None = None,
+    ) -> NDArray[Any]:
+        """Return a new ``(N, *frame_shape)`` array of processed frames.
+
+        See :meth:`process_batch_into`.
+        """
+        _, _, region = batch_frame_geometry(frames.shape, rotation_angle, region)
+        dst = np.empty(
+            (
+                frames.shape[0],
+                *self.output_frame_shape(region[2] - region[0], region[3] - region[1]),
+            ),
+            dtype=self.output_dtype,
+        )
+        self.backend.process_batch_into(frames, dst, rotation_angle, region)
+        return dst
+
+    def process_batch_into(
+        self,
+        frames: NDArray[np.uint8],
+        dst: NDArray[Any],
+        rotation_angle: int = 0,
+        region: Region | None = None,
+    ) -> None:
+        """Process a stack of recorded BGRA frames into ``dst``.
+
+        ``dst[i]`` receives what :meth:`process_into` writes for ``frames[i]``
+        mapped as an unrotated ``cols x rows`` frame (``rows x cols`` for 90
+        and 270 degrees). For plain color conversion the ``numpy`` backend
+        runs the whole stack as one parallel kernel pass over frames and
+        rows; other configurations process frame by frame.
+
+        Args:
+            frames: ``(N, rows, cols, 4)`` uint8 BGRA frames.
+            dst: ``(N, *output_frame_shape(region size))`` destination.
+            rotation_angle: Output rotation in degrees.
+            region: Crop in rotated frame coordinates, or ``None`` for the
+                whole frame.
+
+        Raises:
+            ValueError: If the frames, region or destination are invalid.
+        """
+        self.backend.process_batch_into(frames, dst, rotation_angle, region)
+
+    def close(self) -> None:
+        """Stop band-parallel worker threads, if any were started."""
+        self.backend.close()
+
+    def enable_stats(self, enabled: bool = True) -> None:
+        """Turn per-stage timing on or off.
+
+        While enabled, the ``map``, ``prepare``, ``resize``, ``convert`` and
+        ``copy`` stages record exclusive nanosecond timings and histograms,
+        and every frame records bytes moved and whether a parallel path ran.
+        Disabling removes the instrumentation entirely and drops the counters.
+
+        Args:
+            enabled: ``True`` to start collecting, ``False`` to stop.
+        """
+        self.backend.enable_stats(enabled)
+
+    def stats(self, reset: bool = False) -> ProcessorStats | None:
+        """Return a snapshot of the per-stage timing, or ``None`` if disabled.
+
+        Args:
+            reset: Zero the counters after reading them.
+        """
+        return self.backend.stats(reset=reset)
 
     def _initialize_backend(self, backend: ProcessorBackends) -> Any:
         if backend == ProcessorBackends.CV2:
             from dxcam.processor.cv2_processor import Cv2Processor
 
-            return Cv2Processor(self.color_mode)
+            return Cv2Processor(
+                self.color_mode,
+                output_size=self.output_size,
+                interpolation=self.interpolation,
+                letterbox=self.letterbox,
+                letterbox_color=self.letterbox_color,
+                tensor_format=self.tensor_format,
+                yuv_matrix=self.yuv_matrix,
+                yuv_range=self.yuv_range,
+                band_workers=self.band_workers,
+                band_min_rows=self.band_min_rows,
+            )
         if backend == ProcessorBackends.NUMPY:
             from dxcam.processor.numpy_processor import NumpyProcessor
 
-            return NumpyProcessor(self.color_mode)
+            return NumpyProcessor(
+                self.color_mode,
+                output_size=self.output_size,
+                interpolation=self.interpolation,
+                letterbox=self.letterbox,
+                letterbox_color=self.letterbox_color,
+                tensor_format=self.tensor_format,
+                yuv_matrix=self.yuv_matrix,
+                yuv_range=self.yuv_range,
+                band_workers=self.band_workers,
+                band_min_rows=self.band_min_rows,
+            )
+        if backend == ProcessorBackends.PURE_NUMPY:
+            from dxcam.processor.pure_numpy_processor import PureNumpyProcessor
+
+            return PureNumpyProcessor(
+                self.color_mode,
+                output_size=self.output_size,
+                interpolation=self.interpolation,
+                letterbox=self.letterbox,
+                letterbox_color=self.letterbox_color,
+                tensor_format=self.tensor_format,
+                yuv_matrix=self.yuv_matrix,
+                yuv_range=self.yuv_range,
+                band_workers=self.band_workers,
+                band_min_rows=self.band_min_rows,
+            )
         raise ValueError(f"Unsupported processor backend: {backend}")
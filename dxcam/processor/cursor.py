@@ -0,0 +1,89 @@
+"""Software pointer compositing for Desktop Duplication frames.
+
+DXGI reports the pointer separately from the desktop image: a position per
+frame and, only when it changes, a shape (``GetFramePointerShape``). The
+duplicator decodes the shape once with
+:func:`dxcam.core.pointer.decode_pointer_shape`, and :class:`CursorCompositor`
+draws it into the cursor's bounding box of each converted output frame.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+from numpy.typing import NDArray
+
+from dxcam.core.pointer import CursorShape
+from dxcam.types import ColorMode
+from .cv2_processor import _NUMPY_KERNELS_AVAILABLE, _numpy_kernels
+
+# Output channel of blue, green and red for each supported color mode.
+_CHANNEL_OFFSETS: dict[str, tuple[int, int, int]] = {
+    "RGB": (2, 1, 0),
+    "BGR": (0, 1, 2),
+    "RGBA": (2, 1, 0),
+    "BGRA": (0, 1, 2),
+}
+
+
+def cursor_channel_offsets(color_mode: ColorMode) -> tuple[int, int, int]:
+    """Return the output channels of blue, green and red for ``color_mode``.
+
+    Raises:
+        ValueError: If cursors cannot be composited into ``color_mode`` frames.
+    """
+    offsets = _CHANNEL_OFFSETS.get(color_mode)
+    if offsets is None:
+        supported = ", ".join(_CHANNEL_OFFSETS)
+        raise ValueError(
+            f"Cursor compositing supports {supported} output, got '{color_mode}'."
+        )
+    return offsets
+
+
+def composite_cursor_numpy(
+    dst: NDArray[np.uint8],
+    shape: CursorShape,
+    left: int,
+    top: int,
+    channel_offsets: tuple[int, int, int],
+) -> None:
+    """NumPy equivalent of the ``composite_cursor_into`` kernel."""
+    x0, y0 = max(left, 0), max(top, 0)
+    x1 = min(left + shape.width, dst.shape[1])
+    y1 = min(top + shape.height, dst.shape[0])
+    if x0 >= x1 or y0 >= y1:
+        return
+    box = dst[y0:y1, x0:x1]
+    color = shape.color[y0 - top : y1 - top, x0 - left : x1 - left]
+    if shape.and_mask is None:
+        alpha = color[..., 3].astype(np.uint32)
+        for src, out in zip(range(3), channel_offsets):
+            v = color[..., src] * alpha + box[..., out] * (255 - alpha) + 128
+            box[..., out] = (v + (v >> 8)) >> 8
+        return
+    mask = shape.and_mask[y0 - top : y1 - top, x0 - left : x1 - left]
+    for src, out in zip(range(3), channel_offsets):
+        box[..., out] = (box[..., out] & mask) ^ color[..., src]
+
+
+class CursorCompositor:
+    """Draws pointer shapes into ``HWC`` uint8 frames of one color mode."""
+
+    def __init__(self, color_mode: ColorMode, use_kernels: bool = True) -> None:
+        self.channel_offsets = cursor_channel_offsets(color_mode)
+        self._use_kernels = use_kernels and _NUMPY_KERNELS_AVAILABLE
+
+    def composite(
+        self, frame: NDArray[np.uint8], shape: CursorShape, left: int, top: int
+    ) -> None:
+        """Draw ``shape`` with its top-left corner at ``(left, top)`` of ``frame``.
+
+        Only the overlap of the shape's box with ``frame`` is touched.
+        """
+        if self._use_kernels:
+            assert _numpy_kernels is not None
+            _numpy_kernels.composite_cursor_into(
+                frame, shape.color, shape.and_mask, left, top, self.channel_offsets
+            )
+        else:
+            composite_cursor_numpy(frame, shape, left, top, self.channel_offsets)
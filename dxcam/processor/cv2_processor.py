@@ -1,14 +1,28 @@
 from __future__ import annotations
 
 import ctypes
+import hashlib
+import weakref
 from importlib import import_module
-from typing import Any, Callable
+from typing import Any, Callable, Sequence
 
 import numpy as np
 from numpy.typing import NDArray
 
-from dxcam.types import ColorMode, Region
-from .base import Processor
+from dxcam.types import ColorMode, Interpolation, Region, Size, YuvMatrix, YuvRange
+from .base import (
+    Processor,
+    TensorFormat,
+    batch_frame_geometry,
+    is_yuv420_mode,
+    letterbox_geometry,
+    normalize_interpolation_name,
+    normalize_letterbox_color,
+    normalize_output_size,
+)
+from .bands import BandExecutor
+from .plan import ProcessingPlan
+from .stats import ProcessorInstrumentation, ProcessorStats
 
 try:
     _numpy_kernels = import_module("dxcam.processor._numpy_kernels")
@@ -19,15 +33,102 @@ except Exception as exc:  # pragma: no cover - depends on local build env
     _NUMPY_KERNELS_AVAILABLE = False
     _NUMPY_IMPORT_ERROR = exc
 
+_YUV_KR_KB: dict[str, tuple[float, float]] = {
+    "bt601": (0.299, 0.114),
+    "bt709": (0.2126, 0.0722),
+}
+
+
+def _yuv_matrix(
+    yuv_matrix: YuvMatrix, full_range: bool
+) -> tuple[NDArray[np.float32], NDArray[np.float32]]:
+    """Return the ``(3, 3)`` RGB->YUV matrix and ``(3,)`` offsets for 0-255 input."""
+    kr, kb = _YUV_KR_KB[yuv_matrix]
+    kg = 1.0 - kr - kb
+    y_scale = 1.0 if full_range else 219.0 / 255.0
+    c_scale = 1.0 if full_range else 224.0 / 255.0
+    matrix = np.array(
+        [
+            [kr * y_scale, kg * y_scale, kb * y_scale],
+            [
+                -kr / (2.0 * (1.0 - kb)) * c_scale,
+                -kg / (2.0 * (1.0 - kb)) * c_scale,
+                0.5 * c_scale,
+            ],
+            [
+                0.5 * c_scale,
+                -kg / (2.0 * (1.0 - kr)) * c_scale,
+                -kb / (2.0 * (1.0 - kr)) * c_scale,
+            ],
+        ],
+        dtype=np.float32,
+    )
+    offsets = np.array([0.0 if full_range else 16.0, 128.0, 128.0], dtype=np.float32)
+    return matrix, offsets
+
+
+class _ArrayRect:
+    """DXGI_MAPPED_RECT-like view of one BGRA frame array with packed pixels."""
+
+    def __init__(self, image: NDArray[np.uint8]) -> None:
+        if (
+            image.strides[2] != 1
+            or image.strides[1] != 4
+            or image.strides[0] % 4
+            or image.strides[0] < image.shape[1] * 4
+        ):
+            image = np.ascontiguousarray(image)
+        self.keepalive = image
+        self.Pitch = image.strides[0]
+        self.pBits = image.ctypes.data
+
 
 class Cv2Processor(Processor):
     """cv2-first frame processor with shared BGRA preparation helpers.
 
     ``process()`` may return an internal reusable buffer for some modes.
     Use ``process_into()`` when caller-owned output memory is required.
+
+    With ``band_workers > 1``, ``cvtColor`` and the BGRA copies of the
+    pitch-trim/crop and (kernel-less) rotation paths run as horizontal
+    stripes on a persistent thread pool.
+
+    :meth:`enable_stats` times the stages listed in ``_STAGE_METHODS`` by
+    shadowing them with timed wrappers on the instance.
     """
 
-    def __init__(self, color_mode: ColorMode) -> None:
+    # Stage name -> methods whose exclusive time is charged to it.
+    _STAGE_METHODS: dict[str, tuple[str, ...]] = {
+        "map": ("_map_rect_as_image",),
+        "prepare": ("_prepare_image", "_prepare_bgra_into", "_letterbox_into"),
+        "resize": ("_resize_prepared_bgra",),
+        "convert": ("process_cvtcolor", "_cvtcolor_into", "_tensor_into", "_yuv_into"),
+        "copy": ("_copy_into",),
+    }
+
+    def __init__(
+        self,
+        color_mode: ColorMode,
+        output_size: Size | None = None,
+        interpolation: Interpolation = "area",
+        letterbox: bool = False,
+        letterbox_color: int = 114,
+        tensor_format: TensorFormat | None = None,
+        yuv_matrix: YuvMatrix = "bt601",
+        yuv_range: YuvRange = "limited",
+        band_workers: int = 0,
+        band_min_rows: int = 64,
+    ) -> None:
+        self.output_size = normalize_output_size(output_size)
+        self.interpolation = normalize_interpolation_name(str(interpolation))
+        self.letterbox = bool(letterbox)
+        self.letterbox_color = normalize_letterbox_color(letterbox_color)
+        # dst data address -> (weakref to owning array, filled geometry).
+        self._letterbox_borders: dict[
+            int, tuple[weakref.ref[Any], tuple[Any, ...]]
+        ] = {}
+        self._letterbox_dst: NDArray[np.uint8] | None = None
+        self._letterbox_dst_shape: tuple[int, int, int] | None = None
         self._cv2: Any | None = None
         self._cv2_code: int | None = None
         self._cv2_rotate_mod: Any | None = None
@@ -35,8 +136,17 @@ class Cv2Processor(Processor):
         self._cv2_dst_shape: tuple[int, ...] | None = None
         self._prepared_bgra: NDArray[np.uint8] | None = None
         self._prepared_bgra_shape: tuple[int, int, int] | None = None
+        self._resized_bgra: NDArray[np.uint8] | None = None
+        self._resized_bgra_shape: tuple[int, int, int] | None = None
         self.color_mode: ColorMode | None = None if color_mode == "BGRA" else color_mode
         self._pbyte = ctypes.POINTER(ctypes.c_ubyte)
+        self._instrumentation: ProcessorInstrumentation | None = None
+        # Bumped whenever output settings or instrumentation change, so
+        # ProcessingPlan instances built earlier stop matching.
+        self._plan_epoch = 0
+        self._bands: BandExecutor | None = (
+            BandExecutor(band_workers, band_min_rows) if band_workers > 1 else None
+        )
         self._cvtcolor_impl: Callable[[NDArray[np.uint8]], NDArray[np.uint8]] = (
             self._init_cvtcolor_impl
         )
@@ -47,6 +157,221 @@ class Cv2Processor(Processor):
             self._dst_channels = 4
         else:
             self._dst_channels = 1
+        self.tensor_format = tensor_format
+        self.yuv_matrix: YuvMatrix = yuv_matrix
+        self.yuv_range: YuvRange = yuv_range
+        self._is_yuv420 = is_yuv420_mode(self.color_mode)
+        self._staged_dst: NDArray[Any] | None = None
+        self._tensor_work: NDArray[np.float32] | None = None
+        self._tensor_scale: NDArray[np.float32] | None = None
+        self._tensor_bias: NDArray[np.float32] | None = None
+        # Tensor and YUV outputs convert from a BGRA frame staged by a sibling
+        # processor that applies the same crop/rotate/resize/letterbox steps.
+        self._bgra_stage: Cv2Processor | None = None
+        if tensor_format is not None or self._is_yuv420:
+            self._bgra_stage = type(self)(
+                "BGRA",
+                output_size=output_size,
+                interpolation=interpolation,
+                letterbox=letterbox,
+                letterbox_color=letterbox_color,
+                band_workers=band_workers,
+                band_min_rows=band_min_rows,
+            )
+            if tensor_format is not None and tensor_format.scale:
+                self._tensor_scale = np.asarray(tensor_format.scale, dtype=np.float32)
+                self._tensor_bias = np.asarray(tensor_format.bias, dtype=np.float32)
+
+    def set_output_size(self, output_size: Size | None) -> None:
+        self.output_size = normalize_output_size(output_size)
+        self._plan_epoch += 1
+        if self._bgra_stage is not None:
+            self._bgra_stage.set_output_size(output_size)
+
+    def close(self) -> None:
+        if self._bands is not None:
+            self._bands.close()
+        if self._bgra_stage is not None:
+            self._bgra_stage.close()
+
+    def enable_stats(
+        self,
+        enabled: bool = True,
+        instrumentation: ProcessorInstrumentation | None = None,
+    ) -> None:
+        self._plan_epoch += 1
+        if not enabled:
+            if self._instrumentation is not None:
+                for names in self._STAGE_METHODS.values():
+                    for name in names:
+                        self.__dict__.pop(name, None)
+                for name in (
+                    "process",
+                    "process_into",
+                    "process_regions_into",
+                    "process_batch_into",
+                ):
+                    self.__dict__.pop(name, None)
+                self._instrumentation = None
+            if self._bgra_stage is not None:
+                self._bgra_stage.enable_stats(False)
+            return
+        if self._instrumentation is not None:
+            return
+        stats = instrumentation or ProcessorInstrumentation()
+        for stage, names in self._STAGE_METHODS.items():
+            for name in names:
+                setattr(self, name, stats.wrap_stage(stage, getattr(self, name)))
+        for name in ("process", "process_into"):
+            setattr(
+                self, name, stats.wrap_frame(getattr(self, name), self._account_frame)
+            )
+        setattr(
+            self,
+            "process_regions_into",
+            stats.wrap_frame(self.process_regions_into, self._account_regions),
+        )
+        setattr(
+            self,
+            "process_batch_into",
+            stats.wrap_frame(self.process_batch_into, self._account_batch),
+        )
+        self._instrumentation = stats
+        if self._bgra_stage is not None:
+            # The staging sibling's stages nest inside this processor's frames.
+            self._bgra_stage.enable_stats(True, stats)
+
+    def stats(self, reset: bool = False) -> ProcessorStats | None:
+        stats = self._instrumentation
+        if stats is None:
+            return None
+        snapshot = stats.snapshot()
+        if reset:
+            stats.reset()
+        return snapshot
+
+    def _runs_parallel(self, height: int, width: int) -> bool:
+        return self._bands is not None and len(self._bands.bands(height)) > 1
+
+    def processing_plan(
+        self,
+        pitch: int,
+        width: int,
+        height: int,
+        region: Region,
+        rotation_angle: int,
+        dst: NDArray[Any],
+    ) -> ProcessingPlan:
+        return ProcessingPlan(self, pitch, width, height, region, rotation_angle, dst)
+
+    def _plans_direct(self) -> bool:
+        # Plans may bypass process_into only for the plain color/BGRA path
+        # without instrumentation wrappers.
+        return (
+            self._bgra_stage is None
+            and self.output_size is None
+            and not self.letterbox
+            and self._instrumentation is None
+        )
+
+    def _plan_kernel_mode(self) -> str | None:
+        if (
+            self.color_mode is None
+            and _NUMPY_KERNELS_AVAILABLE
+            and self._plans_direct()
+        ):
+            return "BGRA"
+        return None
+
+    def _plan_stages_bgra(self, rotation_angle: int) -> bool:
+        return (
+            rotation_angle != 0
+            and self.color_mode is not None
+            and _NUMPY_KERNELS_AVAILABLE
+            and self._plans_direct()
+        )
+
+    def _plan_uses_view(self, rotation_angle: int) -> bool:
+        return (
+            rotation_angle == 0 and self.color_mode is not None and self._plans_direct()
+        )
+
+    def _account_frame(
+        self,
+        result: NDArray[Any] | None,
+        rect: Any,
+        width: int,
+        height: int,
+        region: Region,
+        rotation_angle: int,
+        dst: NDArray[Any] | None = None,
+        *args: Any,
+        **kwargs: Any,
+    ) -> tuple[int, int, int, bool]:
+        out = result if dst is None else dst
+        region_w = region[2] - region[0]
+        region_h = region[3] - region[1]
+        written = 0 if out is None else int(out.nbytes)
+        parallel = self._runs_parallel(region_h, region_w)
+        return 1, region_w * region_h * 4, written, parallel
+
+    def _account_regions(
+        self,
+        result: None,
+        rect: Any,
+        width: int,
+        height: int,
+        regions: Sequence[Region],
+        rotation_angle: int,
+        dsts: Sequence[NDArray[Any]],
+    ) -> tuple[int, int, int, bool]:
+        areas = [(r[3] - r[1], r[2] - r[0]) for r in regions]
+        parallel = any(self._runs_parallel(h, w) for h, w in areas)
+        read = sum(h * w * 4 for h, w in areas)
+        return 1, read, sum(int(dst.nbytes) for dst in dsts), parallel
+
+    def _runs_batch_parallel(self, frames: int, height: int, width: int) -> bool:
+        return self._runs_parallel(height, width)
+
+    def _account_batch(
+        self,
+        result: None,
+        frames: NDArray[np.uint8],
+        dst: NDArray[Any],
+        rotation_angle: int = 0,
+        region: Region | None = None,
+    ) -> tuple[int, int, int, bool]:
+        _, _, region = batch_frame_geometry(frames.shape, rotation_angle, region)
+        region_w = region[2] - region[0]
+        region_h = region[3] - region[1]
+        count = int(frames.shape[0])
+        parallel = self._runs_batch_parallel(count, region_h, region_w)
+        return count, count * region_w * region_h * 4, int(dst.nbytes), parallel
+
+    def _copy_into(self, dst: NDArray[Any], src: NDArray[Any]) -> None:
+        if self._bands is None:
+            np.copyto(dst, src, casting="no")
+            return
+
+        def _copy_band(start: int, stop: int) -> None:
+            np.copyto(dst[start:stop], src[start:stop], casting="no")
+
+        self._bands.run(_copy_band, dst.shape[0])
+
+    def _cvtcolor_bands(self, image: NDArray[np.uint8], dst: NDArray[np.uint8]) -> None:
+        # ``dst`` is the 2-D plane for GRAY; cvtColor writes each stripe in place.
+        assert self._cv2 is not None
+        assert self._cv2_code is not None
+        cv2_mod = self._cv2
+        code = self._cv2_code
+        if self._bands is None:
+            cv2_mod.cvtColor(image, code, dst=dst)
+            return
+
+        def _convert_band(start: int, stop: int) -> None:
+            cv2_mod.cvtColor(image[start:stop], code, dst=dst[start:stop])
+
+        self._bands.run(_convert_band, dst.shape[0])
 
     @staticmethod
     def _region_is_full_frame(region: Region, width: int, height: int) -> bool:
@@ -128,17 +453,13 @@ class Cv2Processor(Processor):
     def _process_cvtcolor_color(self, image: NDArray[np.uint8]) -> NDArray[np.uint8]:
         height, width = image.shape[:2]
         dst = self._ensure_cvtcolor_dst(height=height, width=width)
-        assert self._cv2 is not None
-        assert self._cv2_code is not None
-        self._cv2.cvtColor(image, self._cv2_code, dst=dst)
+        self._cvtcolor_bands(image, dst)
         return dst
 
     def _process_cvtcolor_gray(self, image: NDArray[np.uint8]) -> NDArray[np.uint8]:
         height, width = image.shape[:2]
         dst = self._ensure_cvtcolor_dst(height=height, width=width)
-        assert self._cv2 is not None
-        assert self._cv2_code is not None
-        self._cv2.cvtColor(image, self._cv2_code, dst=dst)
+        self._cvtcolor_bands(image, dst)
         return dst[..., np.newaxis]
 
     def process_cvtcolor(self, image: NDArray[np.uint8]) -> NDArray[np.uint8]:
@@ -151,6 +472,154 @@ class Cv2Processor(Processor):
             self._prepared_bgra_shape = dst_shape
         return self._prepared_bgra
 
+    def _ensure_resized_bgra_dst(self, height: int, width: int) -> NDArray[np.uint8]:
+        dst_shape = (height, width, 4)
+        if self._resized_bgra is None or self._resized_bgra_shape != dst_shape:
+            self._resized_bgra = np.empty(dst_shape, dtype=np.uint8)
+            self._resized_bgra_shape = dst_shape
+        return self._resized_bgra
+
+    def _resize_prepared_bgra(
+        self,
+        image: NDArray[np.uint8],
+        size: Size,
+    ) -> NDArray[np.uint8]:
+        # Resize before color conversion so the conversion pass only touches
+        # output-sized pixels.
+        if self._cv2 is None:
+            self._cv2 = import_module("cv2")
+        cv2_mod = self._cv2
+        if self.interpolation == "nearest":
+            flag = getattr(cv2_mod, "INTER_NEAREST_EXACT", cv2_mod.INTER_NEAREST)
+        elif self.interpolation == "bilinear":
+            flag = cv2_mod.INTER_LINEAR
+        else:
+            flag = cv2_mod.INTER_AREA
+        out_w, out_h = size
+        dst = self._ensure_resized_bgra_dst(height=out_h, width=out_w)
+        cv2_mod.resize(image, (out_w, out_h), dst=dst, interpolation=flag)
+        return dst
+
+    def _letterbox_inner(self, region: Region) -> tuple[Size, Region]:
+        region_w = region[2] - region[0]
+        region_h = region[3] - region[1]
+        canvas = self.output_frame_size(region_w, region_h)
+        _, inner = letterbox_geometry(region_w, region_h, canvas)
+        return canvas, inner
+
+    def _ensure_letterbox_dst(self, height: int, width: int) -> NDArray[np.uint8]:
+        channels = 4 if self.color_mode is None else self._dst_channels
+        dst_shape = (height, width, channels)
+        if self._letterbox_dst is None or self._letterbox_dst_shape != dst_shape:
+            self._letterbox_dst = np.empty(dst_shape, dtype=np.uint8)
+            self._letterbox_dst_shape = dst_shape
+        return self._letterbox_dst
+
+    def _fill_letterbox_border(self, dst: NDArray[np.uint8], inner: Region) -> None:
+        # Border bands only change with geometry, so each destination buffer
+        # (e.g. every ring-buffer slot) is padded once and then reused.
+        owner = dst
+        while isinstance(owner.base, np.ndarray):
+            owner = owner.base
+        key = dst.__array_interface__["data"][0]
+        geometry = (dst.shape, dst.strides, inner, self.letterbox_color)
+        entry = self._letterbox_borders.get(key)
+        if entry is not None and entry[0]() is owner and entry[1] == geometry:
+            return
+
+        left, top, right, bottom = inner
+        value = self.letterbox_color
+        dst[:top] = value
+        dst[bottom:] = value
+        dst[top:bottom, :left] = value
+        dst[top:bottom, right:] = value
+
+        if len(self._letterbox_borders) >= 64:
+            self._letterbox_borders = {
+                k: v for k, v in self._letterbox_borders.items() if v[0]() is not None
+            }
+        self._letterbox_borders[key] = (weakref.ref(owner), geometry)
+
+    def _letterbox_into(
+        self,
+        rect: Any,
+        width: int,
+        height: int,
+        region: Region,
+        rotation_angle: int,
+        dst: NDArray[np.uint8],
+    ) -> None:
+        _, inner = self._letterbox_inner(region)
+        inner_size = (inner[2] - inner[0], inner[3] - inner[1])
+        image = self._prepare_image(rect, width, height, region, rotation_angle)
+        if inner_size != (image.shape[1], image.shape[0]):
+            image = self._resize_prepared_bgra(image, inner_size)
+        if self.color_mode is not None:
+            image = self.process_cvtcolor(image)
+        view = dst[inner[1] : inner[3], inner[0] : inner[2]]
+        self._copy_into(view, image)
+        self._fill_letterbox_border(dst, inner)
+
+    def _ensure_staged_dst(self, shape: tuple[int, ...]) -> NDArray[Any]:
+        dtype = self.output_dtype
+        if (
+            self._staged_dst is None
+            or self._staged_dst.shape != shape
+            or self._staged_dst.dtype != dtype
+        ):
+            self._staged_dst = np.empty(shape, dtype=dtype)
+        return self._staged_dst
+
+    def _tensor_into(self, image: NDArray[np.uint8], dst: NDArray[Any]) -> None:
+        # NumPy reference path: channel select via cvtColor, then one fused
+        # multiply-add per channel in float32.
+        assert self.tensor_format is not None
+        channels_last = (
+            image if self.color_mode is None else self.process_cvtcolor(image)
+        )
+        planar = self.tensor_format.layout == "CHW"
+        src = channels_last.transpose(2, 0, 1) if planar else channels_last
+        if self._tensor_scale is None or self._tensor_bias is None:
+            np.copyto(dst, src, casting="unsafe")
+            return
+        scale = self._tensor_scale
+        bias = self._tensor_bias
+        if planar:
+            scale = scale[:, np.newaxis, np.newaxis]
+            bias = bias[:, np.newaxis, np.newaxis]
+        work: NDArray[np.float32] = dst
+        if dst.dtype != np.float32:
+            if self._tensor_work is None or self._tensor_work.shape != dst.shape:
+                self._tensor_work = np.empty(dst.shape, dtype=np.float32)
+            work = self._tensor_work
+        np.multiply(src, scale, out=work, casting="unsafe")
+        np.add(work, bias, out=work)
+        if work is not dst:
+            np.copyto(dst, work, casting="same_kind")
+
+    def _yuv_into(self, image: NDArray[np.uint8], dst: NDArray[np.uint8]) -> None:
+        # NumPy reference path: edge-pad to even dimensions, convert in
+        # float32 and average chroma over each 2x2 block.
+        height, width = image.shape[:2]
+        rgb = image[..., 2::-1]
+        if (height | width) & 1:
+            rgb = np.pad(rgb, ((0, height & 1), (0, width & 1), (0, 0)), mode="edge")
+        out_h, out_w = rgb.shape[:2]
+        matrix, offsets = _yuv_matrix(self.yuv_matrix, self.yuv_range == "full")
+        rgb_f = rgb.astype(np.float32)
+        luma = rgb_f @ matrix[0] + offsets[0]
+        np.copyto(dst[:out_h], np.clip(np.rint(luma), 0, 255), casting="unsafe")
+        blocks = rgb_f.reshape(out_h // 2, 2, out_w // 2, 2, 3).mean(axis=(1, 3))
+        chroma = np.clip(np.rint(blocks @ matrix[1:].T + offsets[1:]), 0, 255)
+        chroma = chroma.astype(np.uint8)
+        if self.color_mode == "NV12":
+            dst[out_h:] = chroma.reshape(out_h // 2, out_w)
+            return
+        plane = chroma.shape[0] * chroma.shape[1]
+        flat = dst[out_h:].reshape(-1)
+        flat[:plane] = chroma[..., 0].reshape(-1)
+        flat[plane:] = chroma[..., 1].reshape(-1)
+
     def _get_cv2_rotate_module(self) -> Any | None:
         if self._cv2_rotate_mod is not None:
             return self._cv2_rotate_mod
@@ -202,6 +671,58 @@ class Cv2Processor(Processor):
 
         return image
 
+    def _rotate_bands_into(
+        self,
+        image: NDArray[np.uint8],
+        width: int,
+        height: int,
+        region: Region,
+        rotation_angle: int,
+        dst: NDArray[np.uint8],
+    ) -> None:
+        # Stripe ``dst`` rows and rotate, per stripe, only the source block
+        # that lands in it, so each worker runs a small cache-friendly
+        # cv2.rotate instead of one full-frame rotate on a single thread.
+        assert self._bands is not None
+        image = self._trim_pitch_for_rotation(
+            image=image,
+            width=width,
+            height=height,
+            rotation_angle=rotation_angle,
+        )
+        cv2_mod = self._get_cv2_rotate_module()
+        if cv2_mod is None or not dst.flags.c_contiguous:
+            view = self._prepare_image_python(
+                image=image,
+                width=width,
+                height=height,
+                region=region,
+                rotation_angle=rotation_angle,
+            )
+            self._copy_into(dst, view)
+            return
+        src_h, src_w = image.shape[:2]
+        left, top, right, _ = region
+        if rotation_angle == 90:
+            code = cv2_mod.ROTATE_90_CLOCKWISE
+        elif rotation_angle == 180:
+            code = cv2_mod.ROTATE_180
+        else:
+            code = cv2_mod.ROTATE_90_COUNTERCLOCKWISE
+
+        def _rotate_band(start: int, stop: int) -> None:
+            # Rows [r0, r1) and columns [left, right) of the rotated frame.
+            r0, r1 = top + start, top + stop
+            if rotation_angle == 90:
+                block = image[src_h - right : src_h - left, r0:r1]
+            elif rotation_angle == 180:
+                block = image[src_h - r1 : src_h - r0, src_w - right : src_w - left]
+            else:
+                block = image[left:right, src_w - r1 : src_w - r0]
+            cv2_mod.rotate(block, code, dst=dst[start:stop])
+
+        self._bands.run(_rotate_band, dst.shape[0])
+
     def _prepare_bgra_into(
         self,
         rect: Any,
@@ -224,7 +745,7 @@ class Cv2Processor(Processor):
                 rotation_angle=rotation_angle,
             )
             view = image if full_region else self._crop_view(image=image, region=region)
-            np.copyto(dst, view, casting="no")
+            self._copy_into(dst, view)
             return
 
         if (
@@ -243,6 +764,10 @@ class Cv2Processor(Processor):
             )
             return
 
+        if self._bands is not None:
+            self._rotate_bands_into(image, width, height, region, rotation_angle, dst)
+            return
+
         image = self._prepare_image_python(
             image=image,
             width=width,
@@ -290,6 +815,13 @@ class Cv2Processor(Processor):
             )
             return dst
 
+        if self._bands is not None:
+            out_h = region[3] - region[1]
+            out_w = region[2] - region[0]
+            dst = self._ensure_prepared_bgra_dst(height=out_h, width=out_w)
+            self._rotate_bands_into(image, width, height, region, rotation_angle, dst)
+            return dst
+
         return self._prepare_image_python(
             image=image,
             width=width,
@@ -306,6 +838,26 @@ class Cv2Processor(Processor):
         region: Region,
         rotation_angle: int,
     ) -> NDArray[np.uint8]:
+        if self._bgra_stage is not None:
+            dst = self._ensure_staged_dst(
+                self.output_frame_shape(region[2] - region[0], region[3] - region[1])
+            )
+            self.process_into(rect, width, height, region, rotation_angle, dst)
+            return dst
+
+        if self.letterbox:
+            canvas, _ = self._letterbox_inner(region)
+            dst = self._ensure_letterbox_dst(height=canvas[1], width=canvas[0])
+            self._letterbox_into(rect, width, height, region, rotation_angle, dst)
+            return dst
+
+        if self.output_size is not None:
+            image = self._prepare_image(rect, width, height, region, rotation_angle)
+            resized = self._resize_prepared_bgra(image, self.output_size)
+            if self.color_mode is None:
+                return resized
+            return self.process_cvtcolor(resized)
+
         if self.color_mode is None:
             out_h = region[3] - region[1]
             out_w = region[2] - region[0]
@@ -326,6 +878,38 @@ class Cv2Processor(Processor):
         image = self._prepare_image(rect, width, height, region, rotation_angle)
         return self.process_cvtcolor(image)
 
+    def hash_tiles_into(
+        self,
+        frame: NDArray[Any],
+        tile_hashes: NDArray[np.uint64],
+        tile_size: int,
+    ) -> None:
+        if _NUMPY_KERNELS_AVAILABLE:
+            assert _numpy_kernels is not None
+            _numpy_kernels.hash_tiles_into(frame, tile_hashes, tile_size)
+            return
+        tiles_y, tiles_x = tile_hashes.shape
+        for ty in range(tiles_y):
+            rows = frame[ty * tile_size : (ty + 1) * tile_size]
+            for tx in range(tiles_x):
+                tile = rows[:, tx * tile_size : (tx + 1) * tile_size]
+                tile_hashes[ty, tx] = hash(tile.tobytes()) & 0xFFFFFFFFFFFFFFFF
+
+    def fingerprint(self, frame: NDArray[Any], sample_step: int = 1) -> int:
+        if _NUMPY_KERNELS_AVAILABLE:
+            assert _numpy_kernels is not None
+            return int(_numpy_kernels.frame_fingerprint(frame, sample_step))
+        if sample_step < 1:
+            raise ValueError(f"sample_step must be >= 1, got {sample_step}.")
+        data = np.ascontiguousarray(frame).reshape(-1).view(np.uint8).data
+        digest = hashlib.blake2b(digest_size=8)
+        if sample_step == 1:
+            digest.update(data)
+        else:
+            for start in range(0, data.nbytes, 4096 * sample_step):
+                digest.update(data[start : start + 4096])
+        return int.from_bytes(digest.digest(), "little")
+
     def process_into(
         self,
         rect: Any,
@@ -334,7 +918,45 @@ class Cv2Processor(Processor):
         region: Region,
         rotation_angle: int,
         dst: NDArray[np.uint8],
+        tile_hashes: NDArray[np.uint64] | None = None,
+        tile_size: int = 32,
     ) -> None:
+        self._process_into(rect, width, height, region, rotation_angle, dst)
+        if tile_hashes is not None:
+            self.hash_tiles_into(dst, tile_hashes, tile_size)
+
+    def _process_into(
+        self,
+        rect: Any,
+        width: int,
+        height: int,
+        region: Region,
+        rotation_angle: int,
+        dst: NDArray[np.uint8],
+    ) -> None:
+        if self._bgra_stage is not None:
+            image = self._bgra_stage.process(
+                rect, width, height, region, rotation_angle
+            )
+            if self._is_yuv420:
+                self._yuv_into(image, dst)
+            else:
+                self._tensor_into(image, dst)
+            return
+
+        if self.letterbox:
+            self._letterbox_into(rect, width, height, region, rotation_angle, dst)
+            return
+
+        if self.output_size is not None:
+            image = self._prepare_image(rect, width, height, region, rotation_angle)
+            resized = self._resize_prepared_bgra(image, self.output_size)
+            if self.color_mode is None:
+                self._copy_into(dst, resized)
+                return
+            self._cvtcolor_into(resized, dst)
+            return
+
         if self.color_mode is None:
             self._prepare_bgra_into(
                 rect=rect,
@@ -347,10 +969,58 @@ class Cv2Processor(Processor):
             return
 
         image = self._prepare_image(rect, width, height, region, rotation_angle)
+        self._cvtcolor_into(image, dst)
+
+    def process_regions_into(
+        self,
+        rect: Any,
+        width: int,
+        height: int,
+        regions: Sequence[Region],
+        rotation_angle: int,
+        dsts: Sequence[NDArray[Any]],
+    ) -> None:
+        if len(regions) != len(dsts):
+            raise ValueError(
+                f"Expected {len(regions)} destination arrays, got {len(dsts)}."
+            )
+        for region, dst in zip(regions, dsts):
+            self.process_into(rect, width, height, region, rotation_angle, dst)
+
+    def _check_batch_dst(
+        self, frames: NDArray[np.uint8], dst: NDArray[Any], region: Region
+    ) -> None:
+        if frames.dtype != np.uint8:
+            raise ValueError(f"Expected uint8 BGRA frames, got {frames.dtype}.")
+        expected = (
+            frames.shape[0],
+            *self.output_frame_shape(region[2] - region[0], region[3] - region[1]),
+        )
+        dtype = (
+            np.uint8 if self.tensor_format is None else self.tensor_format.numpy_dtype
+        )
+        if dst.shape != expected or dst.dtype != dtype:
+            raise ValueError(
+                f"Destination must be {expected} {np.dtype(dtype)}, got "
+                f"{dst.shape} {dst.dtype}."
+            )
+
+    def process_batch_into(
+        self,
+        frames: NDArray[np.uint8],
+        dst: NDArray[Any],
+        rotation_angle: int = 0,
+        region: Region | None = None,
+    ) -> None:
+        width, height, region = batch_frame_geometry(
+            frames.shape, rotation_angle, region
+        )
+        self._check_batch_dst(frames, dst, region)
+        for frame, out in zip(frames, dst):
+            self.process_into(
+                _ArrayRect(frame), width, height, region, rotation_angle, out
+            )
+
+    def _cvtcolor_into(self, image: NDArray[np.uint8], dst: NDArray[np.uint8]) -> None:
         self._ensure_cvtcolor_initialized()
-        assert self._cv2 is not None
-        assert self._cv2_code is not None
-        if self._is_gray:
-            self._cv2.cvtColor(image, self._cv2_code, dst=dst[..., 0])
-        else:
-            self._cv2.cvtColor(image, self._cv2_code, dst=dst)
+        self._cvtcolor_bands(image, dst[..., 0] if self._is_gray else dst)
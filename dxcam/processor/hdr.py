@@ -0,0 +1,452 @@
+"""HDR (10-bit and half-float) desktop sources.
+
+Desktop Duplication can deliver ``R10G10B10A2_UNORM`` (HDR10: PQ transfer,
+BT.2020 primaries) or ``R16G16B16A16_FLOAT`` (linear scRGB, BT.709
+primaries, ``1.0`` = 80 nits) frames. :class:`HdrProcessor` wraps a regular
+BGRA processor and either tone-maps those frames to 8-bit sRGB BGRA before
+the usual rotate/crop/resize/convert pipeline, or (``tone_map="none"``)
+rotates and crops them at source precision into ``uint16``/``float16`` RGB(A).
+
+Tone mapping is table driven: the transfer functions and sRGB encoding are
+precomputed per ``(tone_map, white_nits)``, so the compiled kernels and the
+NumPy fallback produce the same codes.
+"""
+
+from __future__ import annotations
+
+import ctypes
+from functools import lru_cache
+from typing import Any, Sequence
+
+import numpy as np
+from numpy.typing import NDArray
+
+from dxcam.types import ColorMode, Region, Size, SourceFormat, ToneMap
+from .cv2_processor import _NUMPY_KERNELS_AVAILABLE, Cv2Processor, _numpy_kernels
+from .plan import ProcessingPlan
+from .pure_numpy_processor import PureNumpyProcessor
+from .stats import ProcessorInstrumentation, ProcessorStats
+
+#: Reference luminance of scRGB ``1.0``.
+SCRGB_WHITE_NITS = 80.0
+#: Peak luminance of the PQ (SMPTE ST 2084) curve.
+PQ_PEAK_NITS = 10000.0
+#: Entries of the linear-to-sRGB encode table over ``[0, 1]``.
+SRGB_ENCODE_LUT_SIZE = 4096
+
+# Linear BT.2020 RGB to linear BT.709 RGB.
+BT2020_TO_BT709: NDArray[np.float64] = np.array(
+    [
+        [1.660491, -0.587641, -0.072850],
+        [-0.124550, 1.132900, -0.008349],
+        [-0.018151, -0.100579, 1.118730],
+    ],
+    dtype=np.float64,
+)
+
+_PQ_M1 = 2610.0 / 16384.0
+_PQ_M2 = 2523.0 / 4096.0 * 128.0
+_PQ_C1 = 3424.0 / 4096.0
+_PQ_C2 = 2413.0 / 4096.0 * 32.0
+_PQ_C3 = 2392.0 / 4096.0 * 32.0
+
+_SOURCE_BYTES_PER_PIXEL: dict[str, int] = {"BGRA8": 4, "RGB10A2": 4, "RGBA16F": 8}
+
+
+def source_bytes_per_pixel(source_format: SourceFormat) -> int:
+    """Return the mapped bytes per pixel of ``source_format``."""
+    return _SOURCE_BYTES_PER_PIXEL[source_format]
+
+
+def native_output_dtype(source_format: SourceFormat) -> np.dtype[Any]:
+    """Return the frame dtype of ``tone_map="none"`` output for a source."""
+    return np.dtype(np.float16 if source_format == "RGBA16F" else np.uint16)
+
+
+def tone_map_values(x: NDArray[np.float64], tone_map: ToneMap) -> NDArray[np.float64]:
+    """Apply ``tone_map`` to linear values relative to SDR white.
+
+    Returns display-linear values in ``[0, 1]``; non-positive input maps to 0.
+    """
+    x = np.maximum(x, 0.0)
+    if tone_map == "reinhard":
+        x = x / (1.0 + x)
+    elif tone_map == "aces":
+        x = (x * (2.51 * x + 0.03)) / (x * (2.43 * x + 0.59) + 0.14)
+    return np.minimum(x, 1.0)
+
+
+@lru_cache(maxsize=None)
+def srgb_encode_lut(size: int = SRGB_ENCODE_LUT_SIZE) -> NDArray[np.uint8]:
+    """Return 8-bit sRGB codes for ``size`` linear values evenly over ``[0, 1]``."""
+    t = np.linspace(0.0, 1.0, size)
+    encoded = np.where(
+        t <= 0.0031308, 12.92 * t, 1.055 * np.power(t, 1.0 / 2.4) - 0.055
+    )
+    lut = np.rint(encoded * 255.0).astype(np.uint8)
+    lut.flags.writeable = False
+    return lut
+
+
+def encode_srgb(t: NDArray[np.float64]) -> NDArray[np.uint8]:
+    """Encode display-linear ``[0, 1]`` values through :func:`srgb_encode_lut`."""
+    lut = srgb_encode_lut()
+    return lut[(t * (lut.shape[0] - 1) + 0.5).astype(np.intp)]
+
+
+@lru_cache(maxsize=None)
+def pq_decode_lut(white_nits: float) -> NDArray[np.float64]:
+    """Return linear light relative to ``white_nits`` for each 10-bit PQ code."""
+    e = np.arange(1024, dtype=np.float64) / 1023.0
+    p = np.power(e, 1.0 / _PQ_M2)
+    y = np.power(np.maximum(p - _PQ_C1, 0.0) / (_PQ_C2 - _PQ_C3 * p), 1.0 / _PQ_M1)
+    lut = y * (PQ_PEAK_NITS / white_nits)
+    lut.flags.writeable = False
+    return lut
+
+
+@lru_cache(maxsize=None)
+def scrgb_tone_lut(tone_map: ToneMap, white_nits: float) -> NDArray[np.uint8]:
+    """Return the 8-bit sRGB code of every half-float bit pattern.
+
+    NaNs and negative values map to 0 and ``+inf`` to the brightest code.
+    """
+    values = np.arange(65536, dtype=np.uint32).astype(np.uint16).view(np.float16)
+    linear = np.nan_to_num(values.astype(np.float64), nan=0.0, posinf=65504.0)
+    lut = encode_srgb(
+        tone_map_values(linear * (SCRGB_WHITE_NITS / white_nits), tone_map)
+    )
+    lut.flags.writeable = False
+    return lut
+
+
+def rgba16f_to_bgra_numpy(
+    src: NDArray[Any], dst: NDArray[np.uint8], lut: NDArray[np.uint8]
+) -> None:
+    """NumPy equivalent of the ``rgba16f_to_bgra_into`` kernel."""
+    bits = src.view(np.uint16)
+    for channel in range(3):
+        np.take(lut, bits[..., 2 - channel], out=dst[..., channel])
+    dst[..., 3] = 255
+
+
+def rgb10a2_to_bgra_numpy(
+    src: NDArray[np.uint32],
+    dst: NDArray[np.uint8],
+    tone_map: ToneMap,
+    white_nits: float,
+) -> None:
+    """NumPy equivalent of the ``rgb10a2_to_bgra_into`` kernel."""
+    decode = pq_decode_lut(white_nits)
+    r = decode[src & 0x3FF]
+    g = decode[(src >> 10) & 0x3FF]
+    b = decode[(src >> 20) & 0x3FF]
+    m = BT2020_TO_BT709
+    for channel, row in ((0, 2), (1, 1), (2, 0)):
+        mixed = m[row, 0] * r + m[row, 1] * g + m[row, 2] * b
+        dst[..., channel] = encode_srgb(tone_map_values(mixed, tone_map))
+    dst[..., 3] = 255
+
+
+class _BufferRect:
+    """DXGI_MAPPED_RECT-like view of a packed BGRA8 decode buffer."""
+
+    def __init__(self, image: NDArray[np.uint8]) -> None:
+        self.keepalive = image
+        self.Pitch = image.strides[0]
+        self.pBits = image.ctypes.data
+
+
+class HdrProcessor:
+    """Processor for ``RGB10A2``/``RGBA16F`` mapped frames.
+
+    With a tone map, every frame is decoded to a reused BGRA8 buffer (the
+    ``"decode"`` stage) that ``inner`` then processes exactly like a captured
+    BGRA frame, so every output option keeps working. With
+    ``tone_map="none"`` the frame is rotated and cropped at source precision
+    into ``RGBA``/``RGB`` output of :func:`native_output_dtype`.
+
+    Decoding uses the compiled kernels when they are available, except under
+    a :class:`PureNumpyProcessor`, which keeps to NumPy.
+    """
+
+    _FRAME_METHODS: tuple[str, ...] = (
+        "process",
+        "process_into",
+        "process_regions_into",
+    )
+
+    def __init__(
+        self,
+        inner: Cv2Processor,
+        source_format: SourceFormat,
+        tone_map: ToneMap = "clip",
+        white_nits: float = SCRGB_WHITE_NITS,
+        color_mode: ColorMode = "RGBA",
+    ) -> None:
+        if source_format == "BGRA8":
+            raise ValueError("HdrProcessor requires an RGB10A2 or RGBA16F source.")
+        self.inner = inner
+        self.source_format: SourceFormat = source_format
+        self.tone_map: ToneMap = tone_map
+        self.white_nits = float(white_nits)
+        self.native = tone_map == "none"
+        self._channels = 4 if color_mode == "RGBA" else 3
+        self._bytes_per_pixel = source_bytes_per_pixel(source_format)
+        self._use_kernels = _NUMPY_KERNELS_AVAILABLE and not isinstance(
+            inner, PureNumpyProcessor
+        )
+        self._pbyte = ctypes.POINTER(ctypes.c_ubyte)
+        self._decoded: NDArray[np.uint8] | None = None
+        self._native_dst: NDArray[Any] | None = None
+        self._instrumentation: ProcessorInstrumentation | None = None
+        self._lut: NDArray[np.uint8] | None = None
+        if not self.native and source_format == "RGBA16F":
+            self._lut = scrgb_tone_lut(tone_map, self.white_nits)
+
+    @property
+    def _plan_epoch(self) -> int:
+        return self.inner._plan_epoch
+
+    def _plan_kernel_mode(self) -> str | None:
+        return None
+
+    def _plan_stages_bgra(self, rotation_angle: int) -> bool:
+        return False
+
+    def _plan_uses_view(self, rotation_angle: int) -> bool:
+        return False
+
+    def _map_source(
+        self, rect: Any, width: int, height: int, rotation_angle: int
+    ) -> NDArray[Any]:
+        bpp = self._bytes_per_pixel
+        pitch = int(rect.Pitch)
+        rows, cols = (height, width) if rotation_angle in (0, 180) else (width, height)
+        if pitch <= 0 or pitch % bpp != 0 or pitch < cols * bpp:
+            raise ValueError(
+                f"Invalid mapped pitch {pitch} for {cols} {self.source_format} pixels."
+            )
+        buffer = ctypes.cast(rect.pBits, self._pbyte)
+        data: NDArray[np.uint8] = np.ctypeslib.as_array(buffer, shape=(pitch * rows,))
+        if self.source_format == "RGBA16F":
+            return data.view(np.uint16).reshape(rows, pitch // bpp, 4)[:, :cols]
+        return data.view(np.uint32).reshape(rows, pitch // bpp)[:, :cols]
+
+    def _decode(self, source: NDArray[Any]) -> NDArray[np.uint8]:
+        shape = (source.shape[0], source.shape[1], 4)
+        if self._decoded is None or self._decoded.shape != shape:
+            self._decoded = np.empty(shape, dtype=np.uint8)
+        dst = self._decoded
+        if self.source_format == "RGBA16F":
+            assert self._lut is not None
+            if self._use_kernels:
+                assert _numpy_kernels is not None
+                _numpy_kernels.rgba16f_to_bgra_into(source, dst, self._lut)
+            else:
+                rgba16f_to_bgra_numpy(source, dst, self._lut)
+        elif self._use_kernels:
+            assert _numpy_kernels is not None
+            _numpy_kernels.rgb10a2_to_bgra_into(
+                source,
+                dst,
+                pq_decode_lut(self.white_nits),
+                BT2020_TO_BT709,
+                srgb_encode_lut(),
+                self.tone_map,
+            )
+        else:
+            rgb10a2_to_bgra_numpy(source, dst, self.tone_map, self.white_nits)
+        return dst
+
+    def _decoded_rect(
+        self, rect: Any, width: int, height: int, rotation_angle: int
+    ) -> _BufferRect:
+        source = self._map_source(rect, width, height, rotation_angle)
+        return _BufferRect(self._decode(source))
+
+    def _native_into(
+        self,
+        source: NDArray[Any],
+        region: Region,
+        rotation_angle: int,
+        dst: NDArray[Any],
+    ) -> None:
+        if rotation_angle == 90:
+            source = np.rot90(source, axes=(1, 0))
+        elif rotation_angle == 180:
+            source = np.rot90(source, k=2, axes=(0, 1))
+        elif rotation_angle == 270:
+            source = np.rot90(source, axes=(0, 1))
+        source = source[region[1] : region[3], region[0] : region[2]]
+        if self.source_format == "RGBA16F":
+            np.copyto(dst, source[..., : self._channels].view(np.float16))
+            return
+        for channel in range(3):
+            np.bitwise_and(
+                source >> (10 * channel), 0x3FF, out=dst[..., channel], casting="unsafe"
+            )
+        if self._channels == 4:
+            # Spread the 2-bit alpha over the 10-bit range.
+            np.multiply(source >> 30, 341, out=dst[..., 3], casting="unsafe")
+
+    def set_output_size(self, output_size: Size | None) -> None:
+        self.inner.set_output_size(output_size)
+
+    def close(self) -> None:
+        self.inner.close()
+
+    def processing_plan(
+        self,
+        pitch: int,
+        width: int,
+        height: int,
+        region: Region,
+        rotation_angle: int,
+        dst: NDArray[Any],
+    ) -> ProcessingPlan:
+        # Plans for HDR sources always take the generic process_into path.
+        return ProcessingPlan(self, pitch, width, height, region, rotation_angle, dst)
+
+    def process(
+        self,
+        rect: Any,
+        width: int,
+        height: int,
+        region: Region,
+        rotation_angle: int,
+    ) -> NDArray[Any]:
+        if not self.native:
+            decoded = self._decoded_rect(rect, width, height, rotation_angle)
+            return self.inner.process(decoded, width, height, region, rotation_angle)
+        shape = (region[3] - region[1], region[2] - region[0], self._channels)
+        if self._native_dst is None or self._native_dst.shape != shape:
+            self._native_dst = np.empty(
+                shape, dtype=native_output_dtype(self.source_format)
+            )
+        self.process_into(rect, width, height, region, rotation_angle, self._native_dst)
+        return self._native_dst
+
+    def process_into(
+        self,
+        rect: Any,
+        width: int,
+        height: int,
+        region: Region,
+        rotation_angle: int,
+        dst: NDArray[Any],
+        tile_hashes: NDArray[np.uint64] | None = None,
+        tile_size: int = 32,
+    ) -> None:
+        if not self.native:
+            decoded = self._decoded_rect(rect, width, height, rotation_angle)
+            self.inner.process_into(
+                decoded,
+                width,
+                height,
+                region,
+                rotation_angle,
+                dst,
+                tile_hashes,
+                tile_size,
+            )
+            return
+        source = self._map_source(rect, width, height, rotation_angle)
+        self._native_into(source, region, rotation_angle, dst)
+        if tile_hashes is not None:
+            self.inner.hash_tiles_into(dst, tile_hashes, tile_size)
+
+    def process_regions_into(
+        self,
+        rect: Any,
+        width: int,
+        height: int,
+        regions: Sequence[Region],
+        rotation_angle: int,
+        dsts: Sequence[NDArray[Any]],
+    ) -> None:
+        if len(regions) != len(dsts):
+            raise ValueError(
+                f"Expected {len(regions)} destination arrays, got {len(dsts)}."
+            )
+        if not self.native:
+            # Decode once; every region reads the same BGRA8 frame.
+            decoded = self._decoded_rect(rect, width, height, rotation_angle)
+            self.inner.process_regions_into(
+                decoded, width, height, regions, rotation_angle, dsts
+            )
+            return
+        source = self._map_source(rect, width, height, rotation_angle)
+        for region, dst in zip(regions, dsts):
+            self._native_into(source, region, rotation_angle, dst)
+
+    def process_batch_into(
+        self,
+        frames: NDArray[np.uint8],
+        dst: NDArray[Any],
+        rotation_angle: int = 0,
+        region: Region | None = None,
+    ) -> None:
+        if self.native:
+            raise ValueError(
+                "Batch processing takes BGRA8 frames and needs a tone-mapped "
+                "(8-bit) output."
+            )
+        self.inner.process_batch_into(frames, dst, rotation_angle, region)
+
+    def hash_tiles_into(
+        self,
+        frame: NDArray[Any],
+        tile_hashes: NDArray[np.uint64],
+        tile_size: int,
+    ) -> None:
+        self.inner.hash_tiles_into(frame, tile_hashes, tile_size)
+
+    def fingerprint(self, frame: NDArray[Any], sample_step: int = 1) -> int:
+        return self.inner.fingerprint(frame, sample_step)
+
+    def enable_stats(self, enabled: bool = True) -> None:
+        if not enabled:
+            for name in (*self._FRAME_METHODS, "_decode", "_native_into"):
+                self.__dict__.pop(name, None)
+            self._instrumentation = None
+            self.inner.enable_stats(False)
+            return
+        if self._instrumentation is not None:
+            return
+        self.inner.enable_stats(True)
+        stats = self.inner._instrumentation
+        assert stats is not None
+        # Frames are timed here so the decode pass counts toward "total";
+        # the inner processor's own frame wrappers then see a nested call.
+        setattr(self, "_decode", stats.wrap_stage("decode", self._decode))
+        setattr(self, "_native_into", stats.wrap_stage("convert", self._native_into))
+        for name in ("process", "process_into"):
+            setattr(
+                self, name, stats.wrap_frame(getattr(self, name), self._account_frame)
+            )
+        setattr(
+            self,
+            "process_regions_into",
+            stats.wrap_frame(self.process_regions_into, self._account_regions),
+        )
+        self._instrumentation = stats
+
+    def _account_frame(
+        self, result: NDArray[Any] | None, *args: Any, **kwargs: Any
+    ) -> tuple[int, int, int, bool]:
+        frames, read, written, parallel = self.inner._account_frame(
+            result, *args, **kwargs
+        )
+        return frames, read // 4 * self._bytes_per_pixel, written, parallel
+
+    def _account_regions(
+        self, result: None, *args: Any, **kwargs: Any
+    ) -> tuple[int, int, int, bool]:
+        frames, read, written, parallel = self.inner._account_regions(
+            result, *args, **kwargs
+        )
+        return frames, read // 4 * self._bytes_per_pixel, written, parallel
+
+    def stats(self, reset: bool = False) -> ProcessorStats | None:
+        return self.inner.stats(reset=reset)
@@ -1,12 +1,13 @@
 from __future__ import annotations
 
 import logging
-from typing import Any
+from typing import Any, Sequence
 
 import numpy as np
 from numpy.typing import NDArray
 
-from dxcam.types import ColorMode, Region
+from dxcam.types import ColorMode, Interpolation, Region, Size, YuvMatrix, YuvRange
+from .base import TensorFormat, batch_frame_geometry
 from .cv2_processor import (
     Cv2Processor,
     _NUMPY_IMPORT_ERROR,
@@ -26,9 +27,45 @@ class NumpyProcessor(Cv2Processor):
     """
 
     _missing_extension_warned = False
+    # Fused kernel passes are charged to their last stage.
+    _STAGE_METHODS: dict[str, tuple[str, ...]] = {
+        **Cv2Processor._STAGE_METHODS,
+        "resize": (
+            *Cv2Processor._STAGE_METHODS["resize"],
+            "_resize_prepare_into",
+        ),
+        "convert": (
+            *Cv2Processor._STAGE_METHODS["convert"],
+            "_convert_prepare_into",
+            "_convert_into",
+        ),
+    }
 
-    def __init__(self, color_mode: ColorMode) -> None:
-        super().__init__(color_mode=color_mode)
+    def __init__(
+        self,
+        color_mode: ColorMode,
+        output_size: Size | None = None,
+        interpolation: Interpolation = "area",
+        letterbox: bool = False,
+        letterbox_color: int = 114,
+        tensor_format: TensorFormat | None = None,
+        yuv_matrix: YuvMatrix = "bt601",
+        yuv_range: YuvRange = "limited",
+        band_workers: int = 0,
+        band_min_rows: int = 64,
+    ) -> None:
+        super().__init__(
+            color_mode=color_mode,
+            output_size=output_size,
+            interpolation=interpolation,
+            letterbox=letterbox,
+            letterbox_color=letterbox_color,
+            tensor_format=tensor_format,
+            yuv_matrix=yuv_matrix,
+            yuv_range=yuv_range,
+            band_workers=band_workers,
+            band_min_rows=band_min_rows,
+        )
         self._numpy_dst: NDArray[np.uint8] | None = None
         self._numpy_dst_shape: tuple[int, ...] | None = None
         self._numpy_contiguous_dst: NDArray[np.uint8] | None = None
@@ -43,16 +80,11 @@ class NumpyProcessor(Cv2Processor):
             "NumPy processor backend requested but compiled extension "
             "'dxcam.processor._numpy_kernels' is unavailable; falling back to "
             "cv2 processor. Build with DXCAM_BUILD_CYTHON=1 and install "
-            "the 'cython' extra to enable the accelerated backend.",
+            "the 'cython' extra to enable the accelerated backend, or use "
+            "processor_backend='pure_numpy' to avoid OpenCV.",
             exc_info=_NUMPY_IMPORT_ERROR is not None,
         )
 
-    @staticmethod
-    def _ensure_contiguous_uint8(image: NDArray[np.uint8]) -> NDArray[np.uint8]:
-        if image.dtype != np.uint8 or not image.flags.c_contiguous:
-            return np.ascontiguousarray(image, dtype=np.uint8)
-        return image
-
     def _ensure_numpy_dst(self, height: int, width: int) -> NDArray[np.uint8]:
         if self._is_gray:
             dst_shape: tuple[int, ...] = (height, width, 1)
@@ -75,6 +107,143 @@ class NumpyProcessor(Cv2Processor):
             self._numpy_contiguous_dst_shape = dst_shape
         return self._numpy_contiguous_dst
 
+    def _convert_prepare_into(
+        self,
+        rect: Any,
+        width: int,
+        height: int,
+        region: Region,
+        rotation_angle: int,
+        dst: NDArray[np.uint8],
+        tile_hashes: NDArray[np.uint64] | None = None,
+        tile_size: int = 32,
+    ) -> None:
+        # Rotated outputs: crop + rotate + convert in a single pass over the
+        # mapped frame instead of staging an intermediate BGRA copy.
+        assert _numpy_kernels is not None
+        assert self.color_mode is not None
+        image = self._map_rect_as_image(rect, width, height, rotation_angle)
+        target = dst
+        if not dst.flags.c_contiguous:
+            target = self._ensure_numpy_contiguous_dst(dst_shape=dst.shape)
+        _numpy_kernels.convert_bgra_prepare_into(
+            image,
+            target,
+            width,
+            height,
+            region,
+            rotation_angle,
+            self.color_mode,
+            tile_hashes,
+            tile_size,
+        )
+        if target is not dst:
+            self._copy_into(dst, target)
+
+    def _resize_prepare_into(
+        self,
+        rect: Any,
+        width: int,
+        height: int,
+        region: Region,
+        rotation_angle: int,
+        dst: NDArray[np.uint8],
+    ) -> None:
+        # Resized outputs: crop + rotate + resample + convert in one pass, so
+        # the full-resolution region is never staged or converted. Letterboxed
+        # outputs resample into the inner rectangle of the padded canvas.
+        assert _numpy_kernels is not None
+        image = self._map_rect_as_image(rect, width, height, rotation_angle)
+        target = dst
+        if not dst.flags.c_contiguous:
+            target = self._ensure_numpy_contiguous_dst(dst_shape=dst.shape)
+        dst_rect = None
+        if self.letterbox:
+            _, inner = self._letterbox_inner(region)
+            dst_rect = (inner[0], inner[1], inner[2] - inner[0], inner[3] - inner[1])
+        _numpy_kernels.resize_bgra_prepare_into(
+            image,
+            target,
+            width,
+            height,
+            region,
+            rotation_angle,
+            self.color_mode or "BGRA",
+            self.interpolation,
+            dst_rect,
+        )
+        if self.letterbox:
+            self._fill_letterbox_border(target, inner)
+        if target is not dst:
+            self._copy_into(dst, target)
+
+    def _convert_into(
+        self,
+        image: NDArray[np.uint8],
+        dst: NDArray[np.uint8],
+        tile_hashes: NDArray[np.uint64] | None = None,
+        tile_size: int = 32,
+    ) -> None:
+        assert _numpy_kernels is not None
+        assert self.color_mode is not None
+        _numpy_kernels.convert_bgra_into(
+            image, dst, self.color_mode, tile_hashes, tile_size
+        )
+
+    def _runs_parallel(self, height: int, width: int) -> bool:
+        if not _NUMPY_KERNELS_AVAILABLE:
+            return super()._runs_parallel(height, width)
+        assert _numpy_kernels is not None
+        return (
+            _numpy_kernels.get_num_threads() > 1
+            and height * width >= _numpy_kernels.get_parallel_pixels_threshold()
+        )
+
+    def _runs_batch_parallel(self, frames: int, height: int, width: int) -> bool:
+        if not _NUMPY_KERNELS_AVAILABLE or not self._batch_uses_kernel():
+            return super()._runs_batch_parallel(frames, height, width)
+        assert _numpy_kernels is not None
+        return (
+            _numpy_kernels.get_num_threads() > 1
+            and frames * height * width
+            >= _numpy_kernels.get_parallel_pixels_threshold()
+        )
+
+    def _plan_kernel_mode(self) -> str | None:
+        if _NUMPY_KERNELS_AVAILABLE and self._plans_direct():
+            return self.color_mode or "BGRA"
+        return None
+
+    def _tensor_into(self, image: NDArray[np.uint8], dst: NDArray[Any]) -> None:
+        if not _NUMPY_KERNELS_AVAILABLE or not dst.flags.c_contiguous:
+            super()._tensor_into(image, dst)
+            return
+        assert _numpy_kernels is not None
+        assert self.tensor_format is not None
+        scale = self.tensor_format.scale or None
+        bias = self.tensor_format.bias or None
+        _numpy_kernels.convert_bgra_tensor_into(
+            image,
+            dst,
+            self.color_mode or "BGRA",
+            self.tensor_format.layout,
+            scale,
+            bias,
+        )
+
+    def _yuv_into(self, image: NDArray[np.uint8], dst: NDArray[np.uint8]) -> None:
+        if not _NUMPY_KERNELS_AVAILABLE or not dst.flags.c_contiguous:
+            super()._yuv_into(image, dst)
+            return
+        assert _numpy_kernels is not None
+        _numpy_kernels.convert_bgra_yuv420_into(
+            image,
+            dst,
+            self.color_mode,
+            self.yuv_matrix,
+            self.yuv_range == "full",
+        )
+
     def process(
         self,
         rect: Any,
@@ -87,14 +256,37 @@ class NumpyProcessor(Cv2Processor):
             self._warn_missing_extension_once()
             return super().process(rect, width, height, region, rotation_angle)
 
+        if self._bgra_stage is not None:
+            return super().process(rect, width, height, region, rotation_angle)
+
+        if self.output_size is not None or self.letterbox:
+            out_width, out_height = self.output_frame_size(
+                region[2] - region[0], region[3] - region[1]
+            )
+            if self.color_mode is None:
+                dst = self._ensure_prepared_bgra_dst(height=out_height, width=out_width)
+            else:
+                dst = self._ensure_numpy_dst(height=out_height, width=out_width)
+            self._resize_prepare_into(rect, width, height, region, rotation_angle, dst)
+            return dst
+
         if self.color_mode is None:
             return super().process(rect, width, height, region, rotation_angle)
 
-        image = self._prepare_image(rect, width, height, region, rotation_angle)
         assert _numpy_kernels is not None
-        src = self._ensure_contiguous_uint8(image)
-        dst = self._ensure_numpy_dst(height=src.shape[0], width=src.shape[1])
-        _numpy_kernels.convert_bgra_into(src, dst, self.color_mode)
+        if rotation_angle != 0:
+            dst = self._ensure_numpy_dst(
+                height=region[3] - region[1],
+                width=region[2] - region[0],
+            )
+            self._convert_prepare_into(rect, width, height, region, rotation_angle, dst)
+            return dst
+
+        # Unrotated crops stay views of the mapped frame; the kernel walks the
+        # mapped row pitch directly instead of copying the crop first.
+        image = self._prepare_image(rect, width, height, region, rotation_angle)
+        dst = self._ensure_numpy_dst(height=image.shape[0], width=image.shape[1])
+        self._convert_into(image, dst)
         return dst
 
     def process_into(
@@ -105,24 +297,122 @@ class NumpyProcessor(Cv2Processor):
         region: Region,
         rotation_angle: int,
         dst: NDArray[np.uint8],
+        tile_hashes: NDArray[np.uint64] | None = None,
+        tile_size: int = 32,
+    ) -> None:
+        if (
+            tile_hashes is None
+            or not _NUMPY_KERNELS_AVAILABLE
+            or self._bgra_stage is not None
+            or self.output_size is not None
+            or self.letterbox
+            or self.color_mode is None
+        ):
+            super().process_into(
+                rect, width, height, region, rotation_angle, dst, tile_hashes, tile_size
+            )
+            return
+
+        # Plain color conversion: hash each band of tiles right after it is
+        # converted, while it is still in cache.
+        assert _numpy_kernels is not None
+        if rotation_angle != 0:
+            self._convert_prepare_into(
+                rect, width, height, region, rotation_angle, dst, tile_hashes, tile_size
+            )
+            return
+        image = self._prepare_image(rect, width, height, region, rotation_angle)
+        self._convert_into(image, dst, tile_hashes, tile_size)
+
+    def _process_into(
+        self,
+        rect: Any,
+        width: int,
+        height: int,
+        region: Region,
+        rotation_angle: int,
+        dst: NDArray[np.uint8],
     ) -> None:
         if not _NUMPY_KERNELS_AVAILABLE:
             self._warn_missing_extension_once()
-            super().process_into(rect, width, height, region, rotation_angle, dst)
+            super()._process_into(rect, width, height, region, rotation_angle, dst)
+            return
+
+        if self._bgra_stage is not None:
+            super()._process_into(rect, width, height, region, rotation_angle, dst)
+            return
+
+        if self.output_size is not None or self.letterbox:
+            self._resize_prepare_into(rect, width, height, region, rotation_angle, dst)
             return
 
         if self.color_mode is None:
-            super().process_into(rect, width, height, region, rotation_angle, dst)
+            super()._process_into(rect, width, height, region, rotation_angle, dst)
+            return
+
+        assert _numpy_kernels is not None
+        if rotation_angle != 0:
+            self._convert_prepare_into(rect, width, height, region, rotation_angle, dst)
             return
 
         image = self._prepare_image(rect, width, height, region, rotation_angle)
+        self._convert_into(image, dst)
+
+    def process_regions_into(
+        self,
+        rect: Any,
+        width: int,
+        height: int,
+        regions: Sequence[Region],
+        rotation_angle: int,
+        dsts: Sequence[NDArray[Any]],
+    ) -> None:
+        if (
+            not _NUMPY_KERNELS_AVAILABLE
+            or self._bgra_stage is not None
+            or self.output_size is not None
+            or self.letterbox
+            or not all(dst.flags.c_contiguous for dst in dsts)
+        ):
+            super().process_regions_into(
+                rect, width, height, regions, rotation_angle, dsts
+            )
+            return
+
+        # All regions come from one mapping: a single kernel call schedules
+        # every region's rows together instead of one pass per region.
         assert _numpy_kernels is not None
-        src = self._ensure_contiguous_uint8(image)
-        if not dst.flags.c_contiguous:
-            # Preserve behavior for non-contiguous destinations by converting
-            # into a reusable contiguous temp and copying back.
-            contiguous_dst = self._ensure_numpy_contiguous_dst(dst_shape=dst.shape)
-            _numpy_kernels.convert_bgra_into(src, contiguous_dst, self.color_mode)
-            np.copyto(dst, contiguous_dst, casting="no")
+        image = self._map_rect_as_image(rect, width, height, rotation_angle)
+        _numpy_kernels.convert_bgra_regions_into(
+            image,
+            dsts,
+            width,
+            height,
+            regions,
+            rotation_angle,
+            self.color_mode or "BGRA",
+        )
+
+    def _batch_uses_kernel(self) -> bool:
+        return (
+            self._bgra_stage is None and self.output_size is None and not self.letterbox
+        )
+
+    def process_batch_into(
+        self,
+        frames: NDArray[np.uint8],
+        dst: NDArray[Any],
+        rotation_angle: int = 0,
+        region: Region | None = None,
+    ) -> None:
+        if not _NUMPY_KERNELS_AVAILABLE or not self._batch_uses_kernel():
+            super().process_batch_into(frames, dst, rotation_angle, region)
             return
-        _numpy_kernels.convert_bgra_into(src, dst, self.color_mode)
+
+        # One parallel loop covers the row bands of every frame in the stack.
+        assert _numpy_kernels is not None
+        _, _, region = batch_frame_geometry(frames.shape, rotation_angle, region)
+        self._check_batch_dst(frames, dst, region)
+        _numpy_kernels.convert_bgra_batch_into(
+            frames, dst, self.color_mode or "BGRA", rotation_angle, region
+        )
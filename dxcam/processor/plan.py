@@ -0,0 +1,223 @@
+from __future__ import annotations
+
+import ctypes
+from typing import TYPE_CHECKING, Any, Protocol
+
+import numpy as np
+from numpy.typing import NDArray
+
+from dxcam.types import Region
+
+if TYPE_CHECKING:
+    from .cv2_processor import Cv2Processor
+
+
+class PlanProcessor(Protocol):
+    """Processor hooks a :class:`ProcessingPlan` is built from.
+
+    Implemented by :class:`Cv2Processor` and its subclasses and by
+    :class:`dxcam.processor.hdr.HdrProcessor`. Only :class:`Cv2Processor`
+    may select ``"staged"`` or ``"view"`` plans, which use its color
+    conversion.
+    """
+
+    @property
+    def _plan_epoch(self) -> int: ...
+
+    def _plan_kernel_mode(self) -> str | None: ...
+
+    def _plan_stages_bgra(self, rotation_angle: int) -> bool: ...
+
+    def _plan_uses_view(self, rotation_angle: int) -> bool: ...
+
+    def process_into(
+        self,
+        rect: Any,
+        width: int,
+        height: int,
+        region: Region,
+        rotation_angle: int,
+        dst: NDArray[Any],
+        tile_hashes: NDArray[np.uint64] | None = None,
+        tile_size: int = 32,
+    ) -> None: ...
+
+    def hash_tiles_into(
+        self,
+        frame: NDArray[Any],
+        tile_hashes: NDArray[np.uint64],
+        tile_size: int,
+    ) -> None: ...
+
+
+def mapped_address(rect: Any) -> int:
+    """Return the base address of a mapped rect's ``pBits`` as an ``int``."""
+    return ctypes.cast(rect.pBits, ctypes.c_void_p).value or 0
+
+
+class ProcessingPlan:
+    """Processing of one mapped-frame geometry with setup done once.
+
+    A plan is built for a ``(pitch, width, height, region, rotation_angle)``
+    geometry, the processor's output settings and the shape/strides of the
+    destination. Validation, crop and pitch-trim views and the choice of
+    conversion routine are resolved up front, so :meth:`run` only looks at
+    the mapped pointer:
+
+    - ``"kernel"``: a pre-validated compiled kernel call on the mapped
+      address (plain color or BGRA output with the compiled kernels).
+    - ``"staged"``: rotated color conversion in two passes, a pre-validated
+      kernel rotate/crop into a reused BGRA buffer followed by the
+      processor's color conversion.
+    - ``"view"``: unrotated color conversion from a cropped view that is
+      rebuilt only when the mapped pointer moves.
+    - ``"generic"``: everything else, forwarded to ``process_into``.
+
+    Use :meth:`matches` to tell whether a plan still applies; a plan goes
+    stale when the processor's output settings or instrumentation change.
+    """
+
+    def __init__(
+        self,
+        processor: PlanProcessor,
+        pitch: int,
+        width: int,
+        height: int,
+        region: Region,
+        rotation_angle: int,
+        dst: NDArray[Any],
+    ) -> None:
+        self._processor = processor
+        self._epoch = processor._plan_epoch
+        self.pitch = int(pitch)
+        self.width = int(width)
+        self.height = int(height)
+        self.region: Region = (
+            int(region[0]),
+            int(region[1]),
+            int(region[2]),
+            int(region[3]),
+        )
+        self.rotation_angle = int(rotation_angle)
+        self._dst_layout = (dst.shape, dst.strides, dst.dtype)
+        self._kernel_plan: Any | None = None
+        self._address = -1
+        self._view: NDArray[np.uint8] | None = None
+        self._converter: Cv2Processor | None = None
+
+        mode = processor._plan_kernel_mode()
+        if mode is not None:
+            self._kernel_plan = self._build_kernel_plan(mode, dst)
+            self.kind = "kernel"
+        elif processor._plan_stages_bgra(self.rotation_angle):
+            self._converter = _color_converter(processor)
+            left, top, right, bottom = self.region
+            self._view = np.empty((bottom - top, right - left, 4), dtype=np.uint8)
+            self._kernel_plan = self._build_kernel_plan("BGRA", self._view)
+            self.kind = "staged"
+        elif processor._plan_uses_view(self.rotation_angle):
+            if self.pitch <= 0 or self.pitch % 4 != 0 or self.pitch < self.width * 4:
+                raise ValueError(f"Invalid mapped pitch: {self.pitch}")
+            self._converter = _color_converter(processor)
+            self.kind = "view"
+        else:
+            self.kind = "generic"
+
+    def matches(
+        self,
+        pitch: int,
+        width: int,
+        height: int,
+        region: Region,
+        rotation_angle: int,
+        dst: NDArray[Any],
+    ) -> bool:
+        """Return whether this plan applies to the given frame and ``dst``."""
+        return (
+            self._epoch == self._processor._plan_epoch
+            and pitch == self.pitch
+            and rotation_angle == self.rotation_angle
+            and width == self.width
+            and height == self.height
+            and tuple(region) == self.region
+            and (dst.shape, dst.strides, dst.dtype) == self._dst_layout
+        )
+
+    def run(
+        self,
+        rect: Any,
+        dst: NDArray[Any],
+        tile_hashes: NDArray[np.uint64] | None = None,
+        tile_size: int = 32,
+    ) -> None:
+        """Process ``rect`` into ``dst``, which must match the plan's layout.
+
+        Args:
+            rect: Mapped frame with ``Pitch`` equal to the plan's pitch.
+            dst: Destination with the shape, strides and dtype of the array
+                the plan was built for.
+            tile_hashes: Optional tile hashes of ``dst``, as in
+                ``process_into``.
+            tile_size: Tile edge in pixels for ``tile_hashes``.
+        """
+        processor = self._processor
+        if self.kind == "generic":
+            processor.process_into(
+                rect,
+                self.width,
+                self.height,
+                self.region,
+                self.rotation_angle,
+                dst,
+                tile_hashes,
+                tile_size,
+            )
+            return
+
+        address = mapped_address(rect)
+        if self.kind == "kernel":
+            assert self._kernel_plan is not None
+            self._kernel_plan.run(address, dst)
+        elif self.kind == "staged":
+            assert self._kernel_plan is not None
+            assert self._view is not None and self._converter is not None
+            self._kernel_plan.run(address, self._view)
+            self._converter._cvtcolor_into(self._view, dst)
+        else:
+            assert self._converter is not None
+            if address != self._address:
+                self._view = self._crop_view(self._converter, rect)
+                self._address = address
+            assert self._view is not None
+            self._converter._cvtcolor_into(self._view, dst)
+        if tile_hashes is not None:
+            processor.hash_tiles_into(dst, tile_hashes, tile_size)
+
+    def _build_kernel_plan(self, mode: str, dst: NDArray[np.uint8]) -> Any:
+        from .cv2_processor import _numpy_kernels
+
+        assert _numpy_kernels is not None
+        return _numpy_kernels.ConversionPlan(
+            self.pitch,
+            self.width,
+            self.height,
+            self.region,
+            self.rotation_angle,
+            mode,
+            dst,
+        )
+
+    def _crop_view(self, converter: Cv2Processor, rect: Any) -> NDArray[np.uint8]:
+        left, top, right, bottom = self.region
+        image = converter._map_rect_as_image(
+            rect, self.width, self.height, self.rotation_angle
+        )
+        return image[top:bottom, left:right]
+
+
+def _color_converter(processor: PlanProcessor) -> Cv2Processor:
+    from .cv2_processor import Cv2Processor
+
+    if not isinstance(processor, Cv2Processor):
+        raise TypeError("Staged and view plans need a Cv2Processor.")
+    return processor
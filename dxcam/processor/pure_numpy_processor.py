@@ -0,0 +1,274 @@
+from __future__ import annotations
+
+from typing import Any
+
+import numpy as np
+from numpy.typing import NDArray
+
+from dxcam.types import Region, Size
+from .cv2_processor import Cv2Processor
+
+# Channel gathers from BGRA for 3-channel outputs.
+_BGRA_GATHER: dict[str, NDArray[np.intp]] = {
+    "RGB": np.array([2, 1, 0], dtype=np.intp),
+    "BGR": np.array([0, 1, 2], dtype=np.intp),
+}
+# BT.601 gray weights in Q15 for (B, G, R); matches OpenCV's BGRA2GRAY.
+_GRAY_WEIGHTS_Q15: tuple[int, int, int] = (3735, 19235, 9798)
+
+
+class PureNumpyProcessor(Cv2Processor):
+    """Dependency-free processor built only on vectorized NumPy.
+
+    Rotation and crop are ``np.rot90``/slice views of the mapped frame, so
+    the only pass over the pixels is the final gather into the destination:
+    ``np.take`` channel gathers for ``RGB``/``BGR``, 32-bit byte swizzles for
+    ``RGBA`` and Q15 integer arithmetic for ``GRAY`` (bit-exact with OpenCV).
+    Resizing is separable: index gathers for ``nearest``, weighted taps for
+    ``bilinear`` and ``area``, and strided block sums for integer ``area``
+    downscales. Intermediate buffers are reused across frames. Neither
+    OpenCV nor the compiled kernels are used.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._work: dict[str, NDArray[Any]] = {}
+
+    def _work_buffer(
+        self, key: str, shape: tuple[int, ...], dtype: Any
+    ) -> NDArray[Any]:
+        buffer = self._work.get(key)
+        if buffer is None or buffer.shape != shape or buffer.dtype != dtype:
+            buffer = np.empty(shape, dtype=dtype)
+            self._work[key] = buffer
+        return buffer
+
+    # ---- geometry -------------------------------------------------------
+
+    def _get_cv2_rotate_module(self) -> Any | None:
+        return None
+
+    def _rotated_view(
+        self,
+        rect: Any,
+        width: int,
+        height: int,
+        region: Region,
+        rotation_angle: int,
+    ) -> NDArray[np.uint8]:
+        image = self._map_rect_as_image(rect, width, height, rotation_angle)
+        return self._prepare_image_python(
+            image=image,
+            width=width,
+            height=height,
+            region=region,
+            rotation_angle=rotation_angle,
+        )
+
+    def _prepare_image(
+        self,
+        rect: Any,
+        width: int,
+        height: int,
+        region: Region,
+        rotation_angle: int,
+    ) -> NDArray[np.uint8]:
+        # A view: the color gather reads the rotated/cropped pixels directly.
+        return self._rotated_view(rect, width, height, region, rotation_angle)
+
+    def _prepare_bgra_into(
+        self,
+        rect: Any,
+        width: int,
+        height: int,
+        region: Region,
+        rotation_angle: int,
+        dst: NDArray[np.uint8],
+    ) -> None:
+        view = self._rotated_view(rect, width, height, region, rotation_angle)
+        np.copyto(dst, view, casting="no")
+
+    # ---- color ----------------------------------------------------------
+
+    def _ensure_cvtcolor_initialized(self) -> None:
+        self._cvtcolor_impl = self._process_numpy_color
+
+    def _process_numpy_color(self, image: NDArray[np.uint8]) -> NDArray[np.uint8]:
+        height, width = image.shape[:2]
+        dst = self._ensure_cvtcolor_dst(height=height, width=width)
+        if self._is_gray:
+            self._gray_into(image, dst)
+            return dst[..., np.newaxis]
+        self._color_into(image, dst)
+        return dst
+
+    def _cvtcolor_into(self, image: NDArray[np.uint8], dst: NDArray[np.uint8]) -> None:
+        if self._is_gray:
+            self._gray_into(image, dst[..., 0])
+        else:
+            self._color_into(image, dst)
+
+    def _color_into(self, image: NDArray[np.uint8], dst: NDArray[np.uint8]) -> None:
+        assert self.color_mode is not None
+        if self.color_mode == "RGBA":
+            self._rgba_into(image, dst)
+            return
+        gather = _BGRA_GATHER[self.color_mode]
+        if dst.flags.c_contiguous:
+            np.take(image, gather, axis=2, out=dst)
+        else:
+            np.copyto(dst, np.take(image, gather, axis=2))
+
+    def _rgba_into(self, image: NDArray[np.uint8], dst: NDArray[np.uint8]) -> None:
+        # Swap B and R inside each little-endian 32-bit pixel.
+        height, width = image.shape[:2]
+        src = image.view(np.uint32)[..., 0]
+        out = self._work_buffer("rgba", (height, width), np.uint32)
+        tmp = self._work_buffer("rgba_tmp", (height, width), np.uint32)
+        np.bitwise_and(src, 0xFF00FF00, out=out)
+        np.right_shift(src, 16, out=tmp)
+        np.bitwise_and(tmp, 0x000000FF, out=tmp)
+        np.bitwise_or(out, tmp, out=out)
+        np.left_shift(src, 16, out=tmp)
+        np.bitwise_and(tmp, 0x00FF0000, out=tmp)
+        np.bitwise_or(out, tmp, out=out)
+        np.copyto(dst, out.view(np.uint8).reshape(height, width, 4), casting="no")
+
+    def _gray_into(self, image: NDArray[np.uint8], dst: NDArray[np.uint8]) -> None:
+        height, width = image.shape[:2]
+        acc = self._work_buffer("gray", (height, width), np.uint32)
+        tmp = self._work_buffer("gray_tmp", (height, width), np.uint32)
+        b_weight, g_weight, r_weight = _GRAY_WEIGHTS_Q15
+        np.multiply(image[..., 0], b_weight, out=acc, dtype=np.uint32)
+        np.multiply(image[..., 1], g_weight, out=tmp, dtype=np.uint32)
+        np.add(acc, tmp, out=acc)
+        np.multiply(image[..., 2], r_weight, out=tmp, dtype=np.uint32)
+        np.add(acc, tmp, out=acc)
+        np.add(acc, 1 << 14, out=acc)
+        np.right_shift(acc, 15, out=acc)
+        np.copyto(dst, acc, casting="unsafe")
+
+    # ---- resize ---------------------------------------------------------
+
+    def _resize_prepared_bgra(
+        self,
+        image: NDArray[np.uint8],
+        size: Size,
+    ) -> NDArray[np.uint8]:
+        out_w, out_h = size
+        dst = self._ensure_resized_bgra_dst(height=out_h, width=out_w)
+        in_h, in_w = image.shape[:2]
+        if self.interpolation == "nearest":
+            rows = self._work_buffer("nearest", (out_h, in_w, 4), np.uint8)
+            np.take(image, _nearest_indices(in_h, out_h), axis=0, out=rows)
+            np.take(rows, _nearest_indices(in_w, out_w), axis=1, out=dst)
+            return dst
+        if self.interpolation == "area" and in_h >= out_h and in_w >= out_w:
+            if in_h % out_h == 0 and in_w % out_w == 0:
+                self._box_downscale_into(image, dst)
+                return dst
+            taps = _area_taps
+        elif self.interpolation == "area":
+            taps = _area_upscale_taps
+        else:
+            taps = _linear_taps
+        rows_f = _resample_axis(image, *taps(in_h, out_h), axis=0)
+        resized = _resample_axis(rows_f, *taps(in_w, out_w), axis=1)
+        np.rint(resized, out=resized)
+        np.copyto(dst, resized, casting="unsafe")
+        return dst
+
+    def _box_downscale_into(
+        self, image: NDArray[np.uint8], dst: NDArray[np.uint8]
+    ) -> None:
+        # Integer factors: add the fy x fx pixels of each block with strided
+        # slices, then round-divide once.
+        in_h, in_w = image.shape[:2]
+        out_h, out_w = dst.shape[:2]
+        fy, fx = in_h // out_h, in_w // out_w
+        count = fy * fx
+        dtype = np.uint16 if count * 255 + count // 2 <= 0xFFFF else np.uint32
+        rows = self._work_buffer("box_rows", (out_h, in_w, 4), dtype)
+        np.copyto(rows, image[0::fy], casting="safe")
+        for k in range(1, fy):
+            np.add(rows, image[k::fy], out=rows)
+        sums = self._work_buffer("box", (out_h, out_w, 4), dtype)
+        np.copyto(sums, rows[:, 0::fx])
+        for k in range(1, fx):
+            np.add(sums, rows[:, k::fx], out=sums)
+        np.add(sums, count // 2, out=sums)
+        np.floor_divide(sums, count, out=sums)
+        np.copyto(dst, sums, casting="unsafe")
+
+
+Taps = tuple[NDArray[np.intp], NDArray[np.float32]]
+
+
+def _nearest_indices(in_size: int, out_size: int) -> NDArray[np.intp]:
+    # Pixel-center sampling in OpenCV INTER_NEAREST_EXACT's 16-bit fixed
+    # point, so ties on fractional scales pick the same source pixel.
+    scale = ((in_size << 16) + out_size // 2) // out_size
+    offset = scale // 2 - in_size % 2
+    idx = (np.arange(out_size, dtype=np.int64) * scale + offset) >> 16
+    return np.minimum(idx, in_size - 1).astype(np.intp)
+
+
+def _two_taps(lo: NDArray[np.intp], frac: NDArray[np.float64], in_size: int) -> Taps:
+    index = np.stack((lo, np.minimum(lo + 1, in_size - 1)))
+    weight = np.stack((1.0 - frac, frac)).astype(np.float32)
+    return index, weight
+
+
+def _linear_taps(in_size: int, out_size: int) -> Taps:
+    # Half-pixel-aligned taps, as OpenCV's INTER_LINEAR.
+    coords = (np.arange(out_size, dtype=np.float64) + 0.5) * (in_size / out_size)
+    coords = np.clip(coords - 0.5, 0.0, in_size - 1)
+    lo = np.floor(coords).astype(np.intp)
+    return _two_taps(lo, coords - lo, in_size)
+
+
+def _area_upscale_taps(in_size: int, out_size: int) -> Taps:
+    # OpenCV's INTER_AREA outside pure downscaling: each output pixel blends
+    # the source pixel it starts in with the next one by their overlap.
+    dx = np.arange(out_size, dtype=np.float64)
+    lo = np.floor(dx * (in_size / out_size)).astype(np.intp)
+    frac = (dx + 1) - (lo + 1) * (out_size / in_size)
+    frac = np.where(frac <= 0, 0.0, frac - np.floor(frac))
+    last = lo >= in_size - 1
+    frac[last] = 0.0
+    lo[last] = in_size - 1
+    return _two_taps(lo, frac, in_size)
+
+
+def _area_taps(in_size: int, out_size: int) -> Taps:
+    # Box filter over fractional source intervals: tap k of output pixel i is
+    # source pixel floor(i * scale) + k, weighted by its overlap with
+    # [i * scale, (i + 1) * scale).
+    scale = in_size / out_size
+    begin = np.arange(out_size, dtype=np.float64) * scale
+    end = begin + scale
+    first = np.floor(begin).astype(np.intp)
+    n_taps = int(np.ceil(scale)) + 1
+    index = first + np.arange(n_taps)[:, np.newaxis]
+    overlap = np.minimum(end, index + 1) - np.maximum(begin, index)
+    weight = np.clip(overlap, 0.0, None) / scale
+    weight[index >= in_size] = 0.0
+    return np.minimum(index, in_size - 1), weight.astype(np.float32)
+
+
+def _resample_axis(
+    image: NDArray[Any],
+    index: NDArray[np.intp],
+    weight: NDArray[np.float32],
+    axis: int,
+) -> NDArray[np.float32]:
+    # ``out = sum_k weight[k] * take(image, index[k])`` along ``axis``.
+    shape = [1] * image.ndim
+    shape[axis] = index.shape[1]
+    out = np.take(image, index[0], axis=axis).astype(np.float32)
+    out *= weight[0].reshape(shape)
+    for k in range(1, index.shape[0]):
+        tap = np.take(image, index[k], axis=axis).astype(np.float32)
+        tap *= weight[k].reshape(shape)
+        out += tap
+    return out
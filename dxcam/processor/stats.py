@@ -0,0 +1,189 @@
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Mapping
+
+#: Histogram buckets: bucket ``0`` counts calls under 1 us, bucket ``i``
+#: calls in ``[2**(i - 1), 2**i)`` us; the last bucket is open-ended.
+HISTOGRAM_BUCKETS = 21
+
+
+@dataclass(frozen=True)
+class ProcessorStageStats:
+    """Exclusive timing of one processor stage.
+
+    Attributes:
+        calls: Number of times the stage ran.
+        total_seconds: Summed time, excluding nested stages.
+        last_seconds: Time of the most recent call.
+        max_seconds: Slowest call so far.
+        histogram: Call counts per log2 microsecond bucket (see
+            :data:`HISTOGRAM_BUCKETS`).
+    """
+
+    calls: int
+    total_seconds: float
+    last_seconds: float
+    max_seconds: float
+    histogram: tuple[int, ...]
+
+    @property
+    def mean_seconds(self) -> float:
+        return self.total_seconds / self.calls if self.calls else 0.0
+
+
+@dataclass(frozen=True)
+class ProcessorStats:
+    """Snapshot of processor instrumentation.
+
+    Attributes:
+        frames: Frames processed since the last reset.
+        parallel_frames: Frames that ran a multi-threaded path (OpenMP
+            kernels or band-parallel workers).
+        bytes_read: Mapped BGRA bytes covered by the processed regions.
+        bytes_written: Bytes written to output frames.
+        stages: Per-stage timing, keyed by ``"map"``, ``"prepare"``,
+            ``"resize"``, ``"convert"``, ``"copy"`` and (for HDR sources)
+            ``"decode"``, plus ``"total"`` for whole entry-point calls (one
+            per frame, or one per batch).
+    """
+
+    frames: int
+    parallel_frames: int
+    bytes_read: int
+    bytes_written: int
+    stages: Mapping[str, ProcessorStageStats]
+
+
+@dataclass
+class _StageCounter:
+    calls: int = 0
+    total_ns: int = 0
+    last_ns: int = 0
+    max_ns: int = 0
+    histogram: list[int] = field(default_factory=lambda: [0] * HISTOGRAM_BUCKETS)
+
+    def record(self, elapsed_ns: int) -> None:
+        self.calls += 1
+        self.total_ns += elapsed_ns
+        self.last_ns = elapsed_ns
+        if elapsed_ns > self.max_ns:
+            self.max_ns = elapsed_ns
+        bucket = (elapsed_ns // 1000).bit_length()
+        self.histogram[min(bucket, HISTOGRAM_BUCKETS - 1)] += 1
+
+    def snapshot(self) -> ProcessorStageStats:
+        return ProcessorStageStats(
+            calls=self.calls,
+            total_seconds=self.total_ns / 1e9,
+            last_seconds=self.last_ns / 1e9,
+            max_seconds=self.max_ns / 1e9,
+            histogram=tuple(self.histogram),
+        )
+
+
+class ProcessorInstrumentation:
+    """Per-stage nanosecond counters fed by wrapped processor methods.
+
+    A processor enables instrumentation by shadowing its stage methods with
+    :meth:`wrap_stage`/:meth:`wrap_frame` wrappers on the instance, and
+    disables it by deleting them again, so a disabled processor runs the
+    unwrapped methods with no bookkeeping at all. Stage times are exclusive:
+    a stage called from another stage is subtracted from its caller.
+    """
+
+    def __init__(self) -> None:
+        self._counters: dict[str, _StageCounter] = {}
+        self._local = threading.local()
+        self.frames = 0
+        self.parallel_frames = 0
+        self.bytes_read = 0
+        self.bytes_written = 0
+
+    def _child_stack(self) -> list[int]:
+        # Nested-call time accumulated for each active wrapper, per thread.
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def _counter(self, stage: str) -> _StageCounter:
+        counter = self._counters.get(stage)
+        if counter is None:
+            counter = self._counters[stage] = _StageCounter()
+        return counter
+
+    def wrap_stage(self, stage: str, fn: Callable[..., Any]) -> Callable[..., Any]:
+        """Return ``fn`` timed as ``stage``."""
+
+        def _timed(*args: Any, **kwargs: Any) -> Any:
+            stack = self._child_stack()
+            stack.append(0)
+            start = time.perf_counter_ns()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter_ns() - start
+                child = stack.pop()
+                if stack:
+                    stack[-1] += elapsed
+                self._counter(stage).record(elapsed - child)
+
+        return _timed
+
+    def wrap_frame(
+        self,
+        fn: Callable[..., Any],
+        account: Callable[..., tuple[int, int, int, bool]],
+    ) -> Callable[..., Any]:
+        """Return a processing entry point timed as one ``"total"`` call.
+
+        ``account(result, *args, **kwargs)`` returns ``(frames, bytes_read,
+        bytes_written, parallel)`` for the call. Entry points reached from
+        inside another frame (e.g. ``process`` delegating to
+        ``process_into``) are not counted again.
+        """
+
+        def _timed(*args: Any, **kwargs: Any) -> Any:
+            stack = self._child_stack()
+            if stack:
+                return fn(*args, **kwargs)
+            stack.append(0)
+            start = time.perf_counter_ns()
+            try:
+                result = fn(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter_ns() - start
+                stack.pop()
+            self._counter("total").record(elapsed)
+            frames, bytes_read, bytes_written, parallel = account(
+                result, *args, **kwargs
+            )
+            self.frames += frames
+            self.parallel_frames += frames if parallel else 0
+            self.bytes_read += bytes_read
+            self.bytes_written += bytes_written
+            return result
+
+        return _timed
+
+    def snapshot(self) -> ProcessorStats:
+        return ProcessorStats(
+            frames=self.frames,
+            parallel_frames=self.parallel_frames,
+            bytes_read=self.bytes_read,
+            bytes_written=self.bytes_written,
+            stages={
+                name: counter.snapshot() for name, counter in self._counters.items()
+            },
+        )
+
+    def reset(self) -> None:
+        # Swap in fresh counters so a concurrent record lands in the old ones.
+        self._counters = {}
+        self.frames = 0
+        self.parallel_frames = 0
+        self.bytes_read = 0
+        self.bytes_written = 0
@@ -8,16 +8,18 @@ Example:
 
 from __future__ import annotations
 
-from typing import Literal, TypeAlias
+from typing import Any, Literal, TypeAlias
 
-import numpy as np
 from numpy.typing import NDArray
 
 #: Output pixel format accepted by :func:`dxcam.create`.
 #:
+#: ``"NV12"`` and ``"I420"`` produce planar YUV 4:2:0 frames of shape
+#: ``(height * 3 // 2, width)`` with dimensions padded up to even values.
+#:
 #: Example:
 #:     >>> mode: ColorMode = "BGRA"
-ColorMode: TypeAlias = Literal["RGB", "RGBA", "BGR", "BGRA", "GRAY"]
+ColorMode: TypeAlias = Literal["RGB", "RGBA", "BGR", "BGRA", "GRAY", "NV12", "I420"]
 
 #: Capture backend accepted by :func:`dxcam.create`.
 #:
@@ -29,7 +31,7 @@ CaptureBackend: TypeAlias = Literal["dxgi", "winrt"]
 #:
 #: Example:
 #:     >>> p_backend: ProcessorBackend = "cv2"
-ProcessorBackend: TypeAlias = Literal["cv2", "numpy"]
+ProcessorBackend: TypeAlias = Literal["cv2", "numpy", "pure_numpy"]
 
 #: Rectangle tuple ``(left, top, right, bottom)`` in output coordinates.
 #:
@@ -37,11 +39,92 @@ ProcessorBackend: TypeAlias = Literal["cv2", "numpy"]
 #:     >>> region: Region = (0, 0, 1920, 1080)
 Region: TypeAlias = tuple[int, int, int, int]
 
-#: Captured frame as ``numpy.ndarray`` with ``dtype=uint8``.
+#: Frame size tuple ``(width, height)`` in pixels.
+#:
+#: Example:
+#:     >>> size: Size = (640, 640)
+Size: TypeAlias = tuple[int, int]
+
+#: Resize interpolation accepted by :func:`dxcam.create`.
+#:
+#: Example:
+#:     >>> interpolation: Interpolation = "area"
+Interpolation: TypeAlias = Literal["nearest", "bilinear", "area"]
+
+#: Memory layout of output frames: interleaved ``HWC`` or planar ``CHW``.
+#:
+#: Example:
+#:     >>> layout: OutputLayout = "CHW"
+OutputLayout: TypeAlias = Literal["HWC", "CHW"]
+
+#: Element type of output frames. Float types are scaled by ``1/255`` and
+#: optionally mean/std normalized.
+#:
+#: Example:
+#:     >>> dtype: OutputDType = "float16"
+OutputDType: TypeAlias = Literal["uint8", "float32", "float16"]
+
+#: YUV color matrix used by the ``NV12``/``I420`` output modes.
+#:
+#: Example:
+#:     >>> matrix: YuvMatrix = "bt709"
+YuvMatrix: TypeAlias = Literal["bt601", "bt709"]
+
+#: YUV quantization range: ``"limited"`` (16-235 luma, 16-240 chroma) or
+#: ``"full"`` (0-255).
+#:
+#: Example:
+#:     >>> yuv_range: YuvRange = "limited"
+YuvRange: TypeAlias = Literal["limited", "full"]
+
+#: Desktop format requested from Desktop Duplication.
+#:
+#: ``"BGRA8"`` is the 8-bit SDR format. ``"RGB10A2"`` is 10-bit HDR10
+#: (PQ transfer, BT.2020 primaries) and ``"RGBA16F"`` is linear scRGB
+#: half floats (BT.709 primaries, ``1.0`` = 80 nits).
+#:
+#: Example:
+#:     >>> source: SourceFormat = "RGBA16F"
+SourceFormat: TypeAlias = Literal["BGRA8", "RGB10A2", "RGBA16F"]
+
+#: Tone curve used to bring HDR sources down to 8-bit sRGB. ``"none"`` keeps
+#: the source precision: ``uint16`` (10-bit values) for ``RGB10A2`` and
+#: ``float16`` (linear scRGB) for ``RGBA16F``.
+#:
+#: Example:
+#:     >>> tone_map: ToneMap = "aces"
+ToneMap: TypeAlias = Literal["none", "clip", "reinhard", "aces"]
+
+#: Letterbox mapping ``(scale, pad_left, pad_top)`` of one output frame.
+#:
+#: A point ``(x, y)`` in the padded frame maps back to capture-region
+#: coordinates as ``((x - pad_left) / scale, (y - pad_top) / scale)``.
+#:
+#: Example:
+#:     >>> transform: LetterboxTransform = (0.333, 0, 140)
+LetterboxTransform: TypeAlias = tuple[float, int, int]
+
+#: Captured frame as ``numpy.ndarray``. ``dtype=uint8`` with ``HWC`` layout
+#: unless a tensor ``output_dtype``/``output_layout`` is requested.
 #:
 #: Example:
 #:     >>> import numpy as np
 #:     >>> frame: Frame = np.zeros((1080, 1920, 3), dtype=np.uint8)
-Frame: TypeAlias = NDArray[np.uint8]
+Frame: TypeAlias = NDArray[Any]
 
-__all__ = ["ColorMode", "CaptureBackend", "ProcessorBackend", "Region", "Frame"]
+__all__ = [
+    "ColorMode",
+    "CaptureBackend",
+    "ProcessorBackend",
+    "Region",
+    "Size",
+    "Interpolation",
+    "OutputLayout",
+    "OutputDType",
+    "YuvMatrix",
+    "YuvRange",
+    "SourceFormat",
+    "ToneMap",
+    "LetterboxTransform",
+    "Frame",
+]
@@ -37,7 +37,7 @@ stream = container.add_stream("mpeg4", rate=TARGET_FPS)
 stream.pix_fmt, stream.height, stream.width = "yuv420p", HEIGHT, WIDTH
 stream.bit_rate = BIT_RATE
 
-camera = dxcam.create(output_color="RGB")
+camera = dxcam.create(output_color="I420")
 camera.start(target_fps=TARGET_FPS, video_mode=True)
 logger.info(
     "Instant replay started. target_fps=%d window=%ds resolution=%dx%d",
@@ -89,7 +89,7 @@ def main() -> None:
             frame = camera.get_latest_frame()
             if frame is None:
                 continue
-            video_frame = av.VideoFrame.from_ndarray(frame, format="rgb24")
+            video_frame = av.VideoFrame.from_ndarray(frame, format="yuv420p")
             with buffer_lock:
                 for packet in stream.encode(video_frame):
                     buffer.append(packet)
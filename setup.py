@@ -35,6 +35,7 @@ def _build_optional_cython_extensions() -> list[Extension]:
         Extension(
             "dxcam.processor._numpy_kernels",
             sources=["dxcam/processor/_numpy_kernels.pyx"],
+            depends=["dxcam/processor/_simd_kernels.h"],
             include_dirs=[np.get_include()],
             extra_compile_args=_cython_compile_args(),
             extra_link_args=_cython_link_args(),
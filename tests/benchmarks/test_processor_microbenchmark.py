@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import ctypes
 from dataclasses import dataclass
 from typing import Any
 
@@ -10,49 +9,24 @@ import pytest
 pytest.importorskip("pytest_benchmark")
 pytest.importorskip("cv2")
 
+from mapped_rect import FakeMappedRect, random_mapped_rect
+
 from dxcam.processor import Processor
 from dxcam.processor.cv2_processor import _NUMPY_KERNELS_AVAILABLE
 
 
-class FakeMappedRect:
-    """Minimal DXGI_MAPPED_RECT-like object for processor microbenchmarks."""
-
-    def __init__(self, pitch: int, pbits: Any) -> None:
-        self.Pitch = pitch
-        self.pBits = pbits
-
-
 @dataclass
 class _Case:
     rect: FakeMappedRect
-    keepalive: Any
     width: int
     height: int
     region: tuple[int, int, int, int]
     rotation: int
 
 
-def _aligned_pitch(width_pixels: int, align_bytes: int = 256) -> int:
-    row_bytes = width_pixels * 4
-    return ((row_bytes + align_bytes - 1) // align_bytes) * align_bytes
-
-
 def _make_case(*, width: int, height: int, rotation: int, seed: int) -> _Case:
-    rows = height if rotation in (0, 180) else width
-    active_cols = width if rotation in (0, 180) else height
-    pitch = _aligned_pitch(active_cols)
-    size = pitch * rows
-    raw = (ctypes.c_ubyte * size)()
-    buffer = np.frombuffer(memoryview(raw), dtype=np.uint8)
-    rng = np.random.default_rng(seed)
-    buffer[:] = rng.integers(0, 256, size=size, dtype=np.uint8)
-    rect = FakeMappedRect(
-        pitch=pitch,
-        pbits=ctypes.cast(raw, ctypes.POINTER(ctypes.c_ubyte)),
-    )
     return _Case(
-        rect=rect,
-        keepalive=raw,
+        rect=random_mapped_rect(width, height, rotation, seed, pitch_align=256),
         width=width,
         height=height,
         region=(0, 0, width, height),
@@ -126,3 +100,128 @@ def test_process_into_microbenchmark_matrix(
         return int(dst[0, 0, 0])
 
     benchmark(_run)
+
+
+_CROP_REGION: tuple[int, int, int, int] = (320, 180, 1600, 900)
+_DST_LAYOUTS: tuple[str, ...] = ("contiguous", "row_padded")
+
+
+def _crop_dst(layout: str, height: int, width: int, channels: int) -> np.ndarray:
+    if layout == "contiguous":
+        return np.empty((height, width, channels), dtype=np.uint8)
+    # Row slice of a wider buffer: packed pixels, padded row pitch.
+    return np.empty((height, width + 64, channels), dtype=np.uint8)[:, :width]
+
+
+@pytest.mark.parametrize("output_color", ("RGB", "BGR", "RGBA", "GRAY"))
+@pytest.mark.parametrize("dst_layout", _DST_LAYOUTS)
+def test_cropped_process_into_is_allocation_free(
+    benchmark: Any,
+    output_color: str,
+    dst_layout: str,
+    cases_by_rotation: dict[int, _Case],
+) -> None:
+    if not _NUMPY_KERNELS_AVAILABLE:
+        pytest.skip("NumPy/Cython kernels are unavailable in this environment.")
+
+    import tracemalloc
+
+    case = cases_by_rotation[0]
+    left, top, right, bottom = _CROP_REGION
+    processor = Processor(output_color=output_color, backend="numpy")
+    dst = _crop_dst(
+        dst_layout, bottom - top, right - left, _MODE_CHANNELS[output_color]
+    )
+
+    def _run() -> int:
+        processor.process_into(
+            case.rect,
+            case.width,
+            case.height,
+            _CROP_REGION,
+            case.rotation,
+            dst,
+        )
+        return int(dst[0, 0, 0])
+
+    _run()
+    # The crop view of the pitch-padded mapping is converted in one pass:
+    # no staging copy of the region and no temporary destination.
+    tracemalloc.start()
+    try:
+        _run()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert peak < 64 * 1024
+
+    benchmark.group = "process_into_crop"
+    benchmark.extra_info["output_color"] = output_color
+    benchmark.extra_info["dst_layout"] = dst_layout
+    benchmark.extra_info["region"] = f"{right - left}x{bottom - top}"
+    benchmark(_run)
+
+
+def _numpy_tile_changes(frame: np.ndarray, previous: np.ndarray, tile: int) -> Any:
+    # Reference change map: full-frame diff reduced per tile.
+    height, width = frame.shape[:2]
+    pad_h, pad_w = -height % tile, -width % tile
+    diff = np.pad((frame != previous).any(axis=2), ((0, pad_h), (0, pad_w)))
+    tiles = diff.reshape((height + pad_h) // tile, tile, (width + pad_w) // tile, tile)
+    return tiles.any(axis=(1, 3))
+
+
+@pytest.mark.parametrize("change_map", ("tile_hashes", "numpy_diff"))
+@pytest.mark.parametrize("rotation", (0, 90))
+def test_change_map_microbenchmark(
+    benchmark: Any,
+    change_map: str,
+    rotation: int,
+    cases_by_rotation: dict[int, _Case],
+) -> None:
+    if not _NUMPY_KERNELS_AVAILABLE:
+        pytest.skip("NumPy/Cython kernels are unavailable in this environment.")
+
+    from dxcam.processor import tile_grid_shape
+
+    tile = 32
+    case = cases_by_rotation[rotation]
+    processor = Processor(output_color="RGB", backend="numpy")
+    dst = np.empty((case.height, case.width, 3), dtype=np.uint8)
+    previous = np.zeros_like(dst)
+    hashes = np.zeros(tile_grid_shape(case.height, case.width, tile), np.uint64)
+    previous_hashes = np.zeros_like(hashes)
+
+    if change_map == "tile_hashes":
+
+        def _run() -> int:
+            processor.process_into(
+                case.rect,
+                case.width,
+                case.height,
+                case.region,
+                case.rotation,
+                dst,
+                tile_hashes=hashes,
+                tile_size=tile,
+            )
+            return int((hashes != previous_hashes).sum())
+
+    else:
+
+        def _run() -> int:
+            processor.process_into(
+                case.rect,
+                case.width,
+                case.height,
+                case.region,
+                case.rotation,
+                dst,
+            )
+            return int(_numpy_tile_changes(dst, previous, tile).sum())
+
+    _run()
+    benchmark.group = f"change_map_rotate{rotation}"
+    benchmark.extra_info["change_map"] = change_map
+    benchmark.extra_info["tile_size"] = tile
+    benchmark(_run)
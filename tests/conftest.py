@@ -0,0 +1,5 @@
+"""Test-suite root.
+
+Pytest puts this directory on ``sys.path`` when it loads this conftest, so
+``tests/benchmarks`` can import the shared ``mapped_rect`` helpers too.
+"""
@@ -0,0 +1,53 @@
+"""Fake DXGI mapped frames and backend helpers for the processor tests."""
+
+from __future__ import annotations
+
+import ctypes
+
+import numpy as np
+import pytest
+
+from dxcam.processor.cv2_processor import _NUMPY_KERNELS_AVAILABLE
+
+#: Processor backends built on OpenCV.
+CV2_BACKENDS: tuple[str, ...] = ("cv2", "numpy")
+#: Every processor backend.
+BACKENDS: tuple[str, ...] = (*CV2_BACKENDS, "pure_numpy")
+
+
+class FakeMappedRect:
+    """Minimal DXGI_MAPPED_RECT-like object backed by a NumPy array."""
+
+    def __init__(self, image: np.ndarray) -> None:
+        self.keepalive = image
+        self.Pitch = image.shape[1] * 4
+        self.pBits = image.ctypes.data_as(ctypes.POINTER(ctypes.c_ubyte))
+
+
+def random_mapped_rect(
+    width: int,
+    height: int,
+    rotation: int = 0,
+    seed: int = 0,
+    pitch_align: int | None = None,
+) -> FakeMappedRect:
+    """Random BGRA desktop of ``width`` x ``height`` as DXGI maps it.
+
+    Outputs rotated by 90/270 degrees are mapped in panel orientation, so
+    rows and columns swap. Rows carry pitch padding like DXGI row alignment:
+    seven pixels by default, or up to a ``pitch_align``-byte multiple.
+    """
+    rows, cols = (height, width) if rotation in (0, 180) else (width, height)
+    if pitch_align is None:
+        padded = cols + 7
+    else:
+        padded = -(-cols * 4 // pitch_align) * pitch_align // 4
+    rng = np.random.default_rng(seed)
+    image = rng.integers(0, 256, size=(rows, padded, 4), dtype=np.uint8)
+    return FakeMappedRect(image)
+
+
+def skip_unavailable(backend: str) -> None:
+    """Skip the calling test if ``backend`` cannot run in this environment."""
+    if backend == "numpy" and not _NUMPY_KERNELS_AVAILABLE:
+        pytest.skip("NumPy/Cython kernels are unavailable in this environment.")
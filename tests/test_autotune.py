@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("dxcam.processor._numpy_kernels")
+
+from dxcam.processor import _numpy_kernels, autotune
+from dxcam.processor.autotune import KernelTuning
+
+
+@pytest.fixture(autouse=True)
+def _restore_tuning(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("DXCAM_TUNING_CACHE", str(tmp_path / "tuning.json"))
+    previous = autotune.current_tuning(_numpy_kernels)
+    yield
+    autotune.apply_tuning(previous, _numpy_kernels)
+
+
+def test_num_threads_setting_is_validated() -> None:
+    assert _numpy_kernels.get_num_threads() >= 1
+    _numpy_kernels.set_num_threads(1)
+    assert _numpy_kernels.get_num_threads() == 1
+    with pytest.raises(ValueError):
+        _numpy_kernels.set_num_threads(0)
+    _numpy_kernels.reset_num_threads()
+    assert _numpy_kernels.get_num_threads() == _numpy_kernels.get_max_threads()
+
+
+def test_tuning_cache_round_trip(tmp_path: Path) -> None:
+    path = autotune.tuning_cache_path()
+    assert path == tmp_path / "tuning.json"
+    assert autotune.load_cached_tuning(_numpy_kernels) is None
+
+    # Entries for other machines survive a save.
+    path.write_text(
+        json.dumps({"format": 1, "machines": {"other": {"rotate_tile": 8}}}),
+        encoding="utf-8",
+    )
+    tuning = KernelTuning(parallel_pixels_threshold=4096, rotate_tile=16, num_threads=1)
+    assert autotune.save_tuning(tuning, _numpy_kernels) == path
+    machines = json.loads(path.read_text(encoding="utf-8"))["machines"]
+    assert set(machines) == {"other", autotune.machine_key(_numpy_kernels)}
+
+    assert autotune.apply_cached_tuning(_numpy_kernels) == tuning
+    assert _numpy_kernels.get_parallel_pixels_threshold() == 4096
+    assert _numpy_kernels.get_rotate_tile() == 16
+    assert _numpy_kernels.get_num_threads() == 1
+
+
+def test_unreadable_or_disabled_cache_is_ignored(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    (tmp_path / "tuning.json").write_text("not json", encoding="utf-8")
+    assert autotune.apply_cached_tuning(_numpy_kernels) is None
+
+    monkeypatch.setenv("DXCAM_TUNING_CACHE", "")
+    assert autotune.tuning_cache_path() is None
+    tuning = KernelTuning(parallel_pixels_threshold=0, rotate_tile=32, num_threads=1)
+    assert autotune.save_tuning(tuning, _numpy_kernels) is None
+
+
+def test_autotune_applies_and_persists_winners() -> None:
+    tuning = autotune.autotune(
+        resolutions=((96, 64), (32, 24)),
+        rotations=(0, 90),
+        thresholds=(0, 1 << 30),
+        tiles=(8, 16),
+        thread_counts=(1,),
+        repeat=1,
+    )
+    assert tuning.num_threads == 1
+    assert tuning.rotate_tile in (8, 16)
+    assert tuning.parallel_pixels_threshold in (0, 1 << 30)
+    assert autotune.current_tuning(_numpy_kernels) == tuning
+    assert autotune.load_cached_tuning(_numpy_kernels) == tuning
+
+    with pytest.raises(ValueError):
+        autotune.autotune(rotations=(45,), persist=False)
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import threading
+
+import numpy as np
+import pytest
+
+pytest.importorskip("cv2")
+
+from mapped_rect import random_mapped_rect
+
+from dxcam.processor import Processor
+from dxcam.processor import cv2_processor
+from dxcam.processor.bands import BandExecutor
+
+_WIDTH, _HEIGHT = 131, 97
+
+
+def test_band_executor_splits_rows_and_joins() -> None:
+    executor = BandExecutor(workers=4, min_rows=16)
+    assert executor.bands(10) == [(0, 10)]
+    assert executor.bands(50) == [(0, 17), (17, 34), (34, 50)]
+    assert executor.bands(1000) == [(0, 250), (250, 500), (500, 750), (750, 1000)]
+
+    seen: list[tuple[int, int]] = []
+    threads: set[str] = set()
+    lock = threading.Lock()
+
+    def _record(start: int, stop: int) -> None:
+        with lock:
+            seen.append((start, stop))
+            threads.add(threading.current_thread().name)
+
+    executor.run(_record, 1000)
+    assert sorted(seen) == executor.bands(1000)
+    assert threading.current_thread().name in threads
+
+    def _fail(start: int, stop: int) -> None:
+        if start == 0:
+            raise RuntimeError("band failed")
+
+    with pytest.raises(RuntimeError, match="band failed"):
+        executor.run(_fail, 1000)
+    executor.close()
+    assert executor._pool is None
+
+
+def test_band_options_are_validated() -> None:
+    with pytest.raises(ValueError):
+        Processor(backend="cv2", band_workers=-1)
+    with pytest.raises(ValueError):
+        Processor(backend="cv2", band_workers=4, band_min_rows=0)
+
+
+@pytest.mark.parametrize("kernels", (True, False))
+@pytest.mark.parametrize("rotation", (0, 90, 180, 270))
+@pytest.mark.parametrize("output_color", ("BGRA", "RGB", "RGBA", "GRAY"))
+def test_band_parallel_matches_serial(
+    kernels: bool,
+    rotation: int,
+    output_color: str,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    if not kernels:
+        monkeypatch.setattr(cv2_processor, "_NUMPY_KERNELS_AVAILABLE", False)
+    elif not cv2_processor._NUMPY_KERNELS_AVAILABLE:
+        pytest.skip("NumPy/Cython kernels are unavailable in this environment.")
+    rect = random_mapped_rect(_WIDTH, _HEIGHT, rotation, seed=rotation)
+    serial = Processor(backend="cv2", output_color=output_color)
+    banded = Processor(
+        backend="cv2", output_color=output_color, band_workers=3, band_min_rows=8
+    )
+    try:
+        for region in ((0, 0, _WIDTH, _HEIGHT), (5, 3, 120, 90)):
+            expected = serial.process(rect, _WIDTH, _HEIGHT, region, rotation).copy()
+            actual = banded.process(rect, _WIDTH, _HEIGHT, region, rotation)
+            np.testing.assert_array_equal(actual, expected)
+
+            dst = np.zeros_like(expected)
+            banded.process_into(rect, _WIDTH, _HEIGHT, region, rotation, dst)
+            np.testing.assert_array_equal(dst, expected)
+    finally:
+        banded.close()
@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+pytest.importorskip("cv2")
+
+from mapped_rect import BACKENDS, FakeMappedRect, skip_unavailable
+
+from dxcam.processor import Processor, batch_frame_geometry
+
+_ROWS, _COLS = 53, 79
+
+
+def _frames(count: int, seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    return rng.integers(0, 256, size=(count, _ROWS, _COLS, 4), dtype=np.uint8)
+
+
+def _expected(
+    processor: Processor,
+    frames: np.ndarray,
+    rotation: int,
+    region: tuple[int, int, int, int] | None,
+) -> np.ndarray:
+    width, height, region = batch_frame_geometry(frames.shape, rotation, region)
+    out = []
+    for frame in frames:
+        rect = FakeMappedRect(np.ascontiguousarray(frame))
+        out.append(processor.process(rect, width, height, region, rotation).copy())
+    return np.stack(out)
+
+
+def test_batch_geometry_is_validated() -> None:
+    assert batch_frame_geometry((2, 10, 20, 4), 0) == (20, 10, (0, 0, 20, 10))
+    assert batch_frame_geometry((2, 10, 20, 4), 90, (1, 2, 5, 6)) == (
+        10,
+        20,
+        (1, 2, 5, 6),
+    )
+    with pytest.raises(ValueError):
+        batch_frame_geometry((2, 10, 20, 3), 0)
+    with pytest.raises(ValueError):
+        batch_frame_geometry((2, 10, 20, 4), 45)
+    with pytest.raises(ValueError):
+        batch_frame_geometry((2, 10, 20, 4), 90, (0, 0, 20, 10))
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+@pytest.mark.parametrize("rotation", (0, 90, 180, 270))
+@pytest.mark.parametrize("output_color", ("BGRA", "RGB", "BGR", "RGBA", "GRAY"))
+def test_batch_matches_per_frame_processing(
+    backend: str, rotation: int, output_color: str
+) -> None:
+    skip_unavailable(backend)
+    processor = Processor(backend=backend, output_color=output_color)
+    frames = _frames(3, seed=rotation)
+    for region in (None, (3, 5, 40, 50)):
+        expected = _expected(processor, frames, rotation, region)
+        np.testing.assert_array_equal(
+            processor.process_batch(frames, rotation, region), expected
+        )
+
+
+@pytest.mark.parametrize("backend", ("cv2", "numpy"))
+def test_batch_accepts_strided_frames_and_destinations(backend: str) -> None:
+    skip_unavailable(backend)
+    processor = Processor(backend=backend, output_color="RGB")
+    padded = _frames(4, seed=7)
+    frames = padded[::2, :, :61]
+    expected = _expected(processor, frames, 90, (2, 4, 30, 50))
+
+    canvas = np.zeros((2, 46, 40, 3), dtype=np.uint8)
+    dst = canvas[:, :, 5:33]
+    processor.process_batch_into(frames, dst, 90, (2, 4, 30, 50))
+    np.testing.assert_array_equal(dst, expected)
+    assert not canvas[:, :, :5].any() and not canvas[:, :, 33:].any()
+
+
+@pytest.mark.parametrize("backend", ("cv2", "numpy"))
+def test_batch_staged_outputs_fall_back_per_frame(backend: str) -> None:
+    skip_unavailable(backend)
+    processor = Processor(
+        backend=backend,
+        output_color="RGB",
+        output_size=(32, 24),
+        output_layout="CHW",
+        output_dtype="float32",
+    )
+    frames = _frames(2, seed=3)
+    batch = processor.process_batch(frames, 180)
+    assert batch.shape == (2, 3, 24, 32) and batch.dtype == np.float32
+    np.testing.assert_array_equal(batch, _expected(processor, frames, 180, None))
+
+
+def test_batch_rejects_mismatched_destination() -> None:
+    processor = Processor(backend="numpy", output_color="RGB")
+    frames = _frames(2)
+    with pytest.raises(ValueError):
+        processor.process_batch_into(
+            frames, np.empty((2, _ROWS, _COLS, 4), dtype=np.uint8)
+        )
+
+
+@pytest.mark.parametrize("backend", ("cv2", "numpy"))
+def test_batch_stats_count_every_frame(backend: str) -> None:
+    skip_unavailable(backend)
+    processor = Processor(backend=backend, output_color="BGR")
+    processor.enable_stats()
+    dst = processor.process_batch(_frames(3))
+
+    stats = processor.stats()
+    assert stats is not None
+    assert stats.frames == 3
+    assert stats.stages["total"].calls == 1
+    assert stats.bytes_read == 3 * _ROWS * _COLS * 4
+    assert stats.bytes_written == dst.nbytes
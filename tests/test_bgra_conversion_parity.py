@@ -3,6 +3,9 @@ from __future__ import annotations
 import numpy as np
 import pytest
 
+from dxcam.processor import Processor
+from mapped_rect import random_mapped_rect
+
 cv2 = pytest.importorskip("cv2")
 _numpy_kernels = pytest.importorskip("dxcam.processor._numpy_kernels")
 
@@ -24,6 +27,9 @@ _THRESHOLDS: tuple[int, ...] = (
     10**9,  # force serial path
 )
 
+# Every vector tier this CPU can run, always including the scalar fallback.
+_SIMD_TIERS: tuple[str, ...] = _numpy_kernels.get_supported_simd_tiers()
+
 
 def _random_bgra(height: int, width: int, seed: int) -> np.ndarray:
     rng = np.random.default_rng(seed)
@@ -40,15 +46,19 @@ def _cv2_expected(src: np.ndarray, cv2_code: int) -> np.ndarray:
 @pytest.fixture(autouse=True)
 def _restore_parallel_threshold() -> None:
     original = _numpy_kernels.get_parallel_pixels_threshold()
+    original_tier = _numpy_kernels.get_simd_tier()
     try:
         yield
     finally:
         _numpy_kernels.set_parallel_pixels_threshold(original)
+        _numpy_kernels.set_simd_tier(original_tier)
+        _numpy_kernels.reset_num_threads()
 
 
 @pytest.mark.parametrize("height,width", _SIZES)
 @pytest.mark.parametrize("mode,cv2_code,channels", _COLOR_CASES)
 @pytest.mark.parametrize("threshold", _THRESHOLDS)
+@pytest.mark.parametrize("simd_tier", _SIMD_TIERS)
 def test_convert_bgra_matches_cv2(
     height: int,
     width: int,
@@ -56,9 +66,11 @@ def test_convert_bgra_matches_cv2(
     cv2_code: int,
     channels: int,
     threshold: int,
+    simd_tier: str,
 ) -> None:
     src = _random_bgra(height=height, width=width, seed=height * 1000 + width)
     _numpy_kernels.set_parallel_pixels_threshold(threshold)
+    _numpy_kernels.set_simd_tier(simd_tier)
 
     out = _numpy_kernels.convert_bgra(src, mode)
     expected = _cv2_expected(src, cv2_code)
@@ -70,6 +82,7 @@ def test_convert_bgra_matches_cv2(
 @pytest.mark.parametrize("height,width", _SIZES)
 @pytest.mark.parametrize("mode,cv2_code,channels", _COLOR_CASES)
 @pytest.mark.parametrize("threshold", _THRESHOLDS)
+@pytest.mark.parametrize("simd_tier", _SIMD_TIERS)
 def test_convert_bgra_into_matches_cv2(
     height: int,
     width: int,
@@ -77,12 +90,464 @@ def test_convert_bgra_into_matches_cv2(
     cv2_code: int,
     channels: int,
     threshold: int,
+    simd_tier: str,
 ) -> None:
-    src = _random_bgra(height=height, width=width, seed=(height * 1000 + width) ^ 0xA5A5)
+    src = _random_bgra(
+        height=height, width=width, seed=(height * 1000 + width) ^ 0xA5A5
+    )
     dst = np.empty((height, width, channels), dtype=np.uint8)
     _numpy_kernels.set_parallel_pixels_threshold(threshold)
+    _numpy_kernels.set_simd_tier(simd_tier)
 
     _numpy_kernels.convert_bgra_into(src, dst, mode)
     expected = _cv2_expected(src, cv2_code)
 
     np.testing.assert_array_equal(dst, expected)
+
+
+# Pixel counts one row below and one row above the parallel threshold; the
+# parallel side runs several threads even on a single-core machine.
+_PARALLEL_PIXELS = 16384
+_PARALLEL_THREADS = 4
+_THRESHOLD_SIZES: tuple[tuple[int, int], ...] = ((127, 129), (128, 129))
+
+
+def _row_padded(height: int, width: int, channels: int) -> np.ndarray:
+    # Packed pixels with a padded row pitch, filled to catch stray writes.
+    return np.full((height, width + 5, channels), 7, dtype=np.uint8)[:, :width]
+
+
+@pytest.mark.parametrize("height,width", _THRESHOLD_SIZES)
+@pytest.mark.parametrize("mode,cv2_code,channels", _COLOR_CASES)
+@pytest.mark.parametrize("simd_tier", _SIMD_TIERS)
+def test_convert_bgra_strided_views_match_cv2(
+    height: int,
+    width: int,
+    mode: str,
+    cv2_code: int,
+    channels: int,
+    simd_tier: str,
+) -> None:
+    # Crop view of a pitch-padded mapping, converted without staging copies.
+    mapped = _random_bgra(height=height + 6, width=width + 11, seed=height + width)
+    src = mapped[2 : 2 + height, 5 : 5 + width]
+    dst = _row_padded(height, width, channels)
+    _numpy_kernels.set_parallel_pixels_threshold(_PARALLEL_PIXELS)
+    _numpy_kernels.set_num_threads(_PARALLEL_THREADS)
+    _numpy_kernels.set_simd_tier(simd_tier)
+
+    out = _numpy_kernels.convert_bgra(src, mode)
+    _numpy_kernels.convert_bgra_into(src, dst, mode)
+
+    expected = _cv2_expected(np.ascontiguousarray(src), cv2_code)
+    np.testing.assert_array_equal(out, expected)
+    np.testing.assert_array_equal(dst, expected)
+    assert np.all(dst.base[:, width:] == 7)
+
+
+@pytest.mark.parametrize("height,width", _THRESHOLD_SIZES)
+@pytest.mark.parametrize("mode,cv2_code,channels", _COLOR_CASES)
+@pytest.mark.parametrize("row_padded", (False, True))
+def test_numpy_processor_cropped_process_into_matches_cv2(
+    height: int,
+    width: int,
+    mode: str,
+    cv2_code: int,
+    channels: int,
+    row_padded: bool,
+) -> None:
+    map_width, map_height = width + 9, height + 8
+    rect = random_mapped_rect(map_width, map_height, seed=height)
+    region = (4, 3, 4 + width, 3 + height)
+    if row_padded:
+        dst = _row_padded(height, width, channels)
+    else:
+        dst = np.empty((height, width, channels), dtype=np.uint8)
+    processor = Processor(output_color=mode, backend="numpy")
+    _numpy_kernels.set_parallel_pixels_threshold(_PARALLEL_PIXELS)
+    _numpy_kernels.set_num_threads(_PARALLEL_THREADS)
+
+    processor.process_into(rect, map_width, map_height, region, 0, dst)
+
+    crop = rect.keepalive[3 : 3 + height, 4 : 4 + width]
+    np.testing.assert_array_equal(
+        dst, _cv2_expected(np.ascontiguousarray(crop), cv2_code)
+    )
+    if row_padded:
+        assert np.all(dst.base[:, width:] == 7)
+
+
+@pytest.mark.parametrize("mode,cv2_code,channels", _COLOR_CASES)
+@pytest.mark.parametrize("simd_tier", _SIMD_TIERS)
+def test_convert_bgra_simd_tail_widths_match_cv2(
+    mode: str,
+    cv2_code: int,
+    channels: int,
+    simd_tier: str,
+) -> None:
+    # Widths around the 4/8/16/32-pixel vector blocks exercise scalar tails.
+    _numpy_kernels.set_simd_tier(simd_tier)
+    for width in range(1, 70):
+        src = _random_bgra(height=3, width=width, seed=width)
+        for threshold in _THRESHOLDS:
+            _numpy_kernels.set_parallel_pixels_threshold(threshold)
+            out = _numpy_kernels.convert_bgra(src, mode)
+            np.testing.assert_array_equal(out, _cv2_expected(src, cv2_code))
+
+
+def test_simd_tier_selection() -> None:
+    detected = _SIMD_TIERS[-1]
+    assert _SIMD_TIERS[0] == "scalar"
+    assert _numpy_kernels.get_simd_tier() in _SIMD_TIERS
+
+    _numpy_kernels.set_simd_tier("scalar")
+    assert _numpy_kernels.get_simd_tier() == "scalar"
+    _numpy_kernels.reset_simd_tier()
+    assert _numpy_kernels.get_simd_tier() == detected
+    with pytest.raises(ValueError):
+        _numpy_kernels.set_simd_tier("avx512")
+    if detected != "avx2":
+        with pytest.raises(ValueError):
+            _numpy_kernels.set_simd_tier("avx2")
+
+
+_ROTATIONS: tuple[int, ...] = (0, 90, 180, 270)
+
+
+def _random_mapped_bgra(
+    width: int,
+    height: int,
+    rotation_angle: int,
+    seed: int,
+    pitch_padding: int = 7,
+) -> np.ndarray:
+    rows = height if rotation_angle in (0, 180) else width
+    active_cols = width if rotation_angle in (0, 180) else height
+    return _random_bgra(height=rows, width=active_cols + pitch_padding, seed=seed)
+
+
+@pytest.mark.parametrize("height,width", _SIZES)
+@pytest.mark.parametrize("rotation", _ROTATIONS)
+@pytest.mark.parametrize("mode,cv2_code,channels", _COLOR_CASES)
+@pytest.mark.parametrize("threshold", _THRESHOLDS)
+@pytest.mark.parametrize("cropped", (False, True))
+def test_convert_bgra_prepare_into_matches_two_pass(
+    height: int,
+    width: int,
+    rotation: int,
+    mode: str,
+    cv2_code: int,
+    channels: int,
+    threshold: int,
+    cropped: bool,
+) -> None:
+    src = _random_mapped_bgra(
+        width=width,
+        height=height,
+        rotation_angle=rotation,
+        seed=width * 31 + height + rotation,
+    )
+    if cropped:
+        region = (3, 5, width - 4, height - 2)
+    else:
+        region = (0, 0, width, height)
+    out_h = region[3] - region[1]
+    out_w = region[2] - region[0]
+    dst = np.empty((out_h, out_w, channels), dtype=np.uint8)
+    _numpy_kernels.set_parallel_pixels_threshold(threshold)
+
+    _numpy_kernels.convert_bgra_prepare_into(
+        src, dst, width, height, region, rotation, mode
+    )
+    prepared = _numpy_kernels.prepare_bgra(src, width, height, region, rotation)
+    expected = _numpy_kernels.convert_bgra(prepared, mode)
+
+    np.testing.assert_array_equal(dst, expected)
+    np.testing.assert_array_equal(dst, _cv2_expected(prepared, cv2_code))
+
+
+_RESIZE_CASES: tuple[tuple[str, int], ...] = (
+    ("bilinear", cv2.INTER_LINEAR),
+    ("area", cv2.INTER_AREA),
+)
+
+_RESIZE_OUTPUT_SIZES: tuple[tuple[int, int], ...] = (
+    (160, 120),  # exact 2x area binning
+    (80, 60),  # exact 4x area binning
+    (111, 73),  # fractional coverage
+    (400, 300),  # upscale
+)
+
+
+@pytest.mark.parametrize("rotation", _ROTATIONS)
+@pytest.mark.parametrize("interpolation,cv2_interpolation", _RESIZE_CASES)
+@pytest.mark.parametrize("output_size", _RESIZE_OUTPUT_SIZES)
+@pytest.mark.parametrize("threshold", _THRESHOLDS)
+def test_resize_bgra_prepare_into_matches_cv2(
+    rotation: int,
+    interpolation: str,
+    cv2_interpolation: int,
+    output_size: tuple[int, int],
+    threshold: int,
+) -> None:
+    width, height = 320, 240
+    src = _random_mapped_bgra(
+        width=width, height=height, rotation_angle=rotation, seed=rotation + 11
+    )
+    region = (0, 0, width, height)
+    out_w, out_h = output_size
+    dst = np.empty((out_h, out_w, 4), dtype=np.uint8)
+    _numpy_kernels.set_parallel_pixels_threshold(threshold)
+
+    _numpy_kernels.resize_bgra_prepare_into(
+        src, dst, width, height, region, rotation, "BGRA", interpolation
+    )
+    prepared = _numpy_kernels.prepare_bgra(src, width, height, region, rotation)
+    if interpolation == "area" and (out_w > width or out_h > height):
+        cv2_interpolation = cv2.INTER_LINEAR
+    expected = cv2.resize(prepared, output_size, interpolation=cv2_interpolation)
+
+    diff = np.abs(dst.astype(np.int16) - expected.astype(np.int16))
+    assert int(diff.max()) <= 1
+
+
+@pytest.mark.parametrize("factor", (2, 4))
+def test_resize_bgra_area_integer_factor_is_exact_box_mean(factor: int) -> None:
+    width, height = 96, 64
+    src = _random_mapped_bgra(width=width, height=height, rotation_angle=0, seed=5)
+    dst = np.empty((height // factor, width // factor, 4), dtype=np.uint8)
+
+    _numpy_kernels.resize_bgra_prepare_into(
+        src, dst, width, height, (0, 0, width, height), 0, "BGRA", "area"
+    )
+    blocks = src[:height, :width].reshape(
+        height // factor, factor, width // factor, factor, 4
+    )
+    total = blocks.astype(np.uint32).sum(axis=(1, 3))
+    area = factor * factor
+    expected = ((total + area // 2) // area).astype(np.uint8)
+    np.testing.assert_array_equal(dst, expected)
+
+
+@pytest.mark.parametrize("rotation", _ROTATIONS)
+@pytest.mark.parametrize("mode,cv2_code,channels", _COLOR_CASES)
+@pytest.mark.parametrize("interpolation", ("nearest", "bilinear", "area"))
+def test_resize_bgra_prepare_color_matches_resize_then_convert(
+    rotation: int,
+    mode: str,
+    cv2_code: int,
+    channels: int,
+    interpolation: str,
+) -> None:
+    width, height = 53, 37
+    src = _random_mapped_bgra(
+        width=width, height=height, rotation_angle=rotation, seed=rotation + 3
+    )
+    region = (3, 5, width - 4, height - 2)
+    output_size = (19, 13)
+
+    resized_bgra = _numpy_kernels.resize_bgra_prepare(
+        src, width, height, region, rotation, output_size, "BGRA", interpolation
+    )
+    resized = _numpy_kernels.resize_bgra_prepare(
+        src, width, height, region, rotation, output_size, mode, interpolation
+    )
+
+    assert resized.shape == (output_size[1], output_size[0], channels)
+    np.testing.assert_array_equal(resized, _cv2_expected(resized_bgra, cv2_code))
+
+
+@pytest.mark.parametrize("rotation", _ROTATIONS)
+@pytest.mark.parametrize("mode,cv2_code,channels", _COLOR_CASES)
+def test_resize_bgra_prepare_into_dst_rect_writes_only_inner_rect(
+    rotation: int,
+    mode: str,
+    cv2_code: int,
+    channels: int,
+) -> None:
+    width, height = 53, 37
+    src = _random_mapped_bgra(
+        width=width, height=height, rotation_angle=rotation, seed=rotation + 17
+    )
+    region = (0, 0, width, height)
+    dst = np.full((40, 40, channels), 7, dtype=np.uint8)
+    dst_rect = (0, 6, 40, 28)
+
+    _numpy_kernels.resize_bgra_prepare_into(
+        src, dst, width, height, region, rotation, mode, "bilinear", dst_rect
+    )
+    expected = _numpy_kernels.resize_bgra_prepare(
+        src, width, height, region, rotation, (40, 28), mode, "bilinear"
+    )
+
+    np.testing.assert_array_equal(dst[6:34], expected)
+    assert np.all(dst[:6] == 7)
+    assert np.all(dst[34:] == 7)
+
+
+_TENSOR_CASES: tuple[tuple[str, tuple[int, ...]], ...] = (
+    ("RGB", (2, 1, 0)),
+    ("BGR", (0, 1, 2)),
+    ("RGBA", (2, 1, 0, 3)),
+    ("BGRA", (0, 1, 2, 3)),
+)
+
+
+@pytest.mark.parametrize("mode,order", _TENSOR_CASES)
+@pytest.mark.parametrize("layout", ("CHW", "HWC"))
+@pytest.mark.parametrize("dtype", (np.float32, np.float16))
+@pytest.mark.parametrize("threshold", _THRESHOLDS)
+def test_convert_bgra_tensor_into_matches_numpy(
+    mode: str,
+    order: tuple[int, ...],
+    layout: str,
+    dtype: type,
+    threshold: int,
+) -> None:
+    # Strided crop view: rows keep the mapped pitch.
+    src = _random_bgra(height=67, width=91, seed=len(mode) + 13)[4:60, 5:83]
+    channels = len(order)
+    mean = np.linspace(0.4, 0.5, channels, dtype=np.float32)
+    std = np.linspace(0.2, 0.3, channels, dtype=np.float32)
+    scale = (1.0 / 255.0) / std
+    bias = -mean / std
+    expected = src[..., list(order)].astype(np.float32) * scale + bias
+    if layout == "CHW":
+        expected = expected.transpose(2, 0, 1)
+    dst = np.empty(expected.shape, dtype=dtype)
+    _numpy_kernels.set_parallel_pixels_threshold(threshold)
+
+    _numpy_kernels.convert_bgra_tensor_into(
+        src, dst, mode, layout, scale.tolist(), bias.tolist()
+    )
+
+    if dtype is np.float32:
+        np.testing.assert_allclose(dst, expected, rtol=1e-6, atol=1e-6)
+    else:
+        np.testing.assert_allclose(
+            dst.astype(np.float32), expected.astype(np.float16), rtol=1e-3, atol=1e-3
+        )
+
+
+def test_convert_bgra_tensor_into_planar_uint8_and_gray() -> None:
+    src = _random_bgra(height=31, width=45, seed=21)
+    planar = np.empty((3, 31, 45), dtype=np.uint8)
+    gray = np.empty((1, 31, 45), dtype=np.float32)
+
+    _numpy_kernels.convert_bgra_tensor_into(src, planar, "RGB", "CHW")
+    _numpy_kernels.convert_bgra_tensor_into(
+        src, gray, "GRAY", "CHW", [1.0 / 255.0], [0.0]
+    )
+
+    np.testing.assert_array_equal(planar, src[..., [2, 1, 0]].transpose(2, 0, 1))
+    expected_gray = _cv2_expected(src, cv2.COLOR_BGRA2GRAY).transpose(2, 0, 1) / 255.0
+    np.testing.assert_allclose(gray, expected_gray, rtol=1e-6)
+
+
+def test_convert_bgra_tensor_into_float16_rounds_to_nearest_even() -> None:
+    values = np.array(
+        [0.0, 1.0 / 3.0, 2049.0, 2051.0, 65504.0, 65520.0, 1e-7, 3e-8, -5.5e-5],
+        dtype=np.float32,
+    )
+    src = np.zeros((1, 1, 4), dtype=np.uint8)
+    for value in values:
+        dst = np.empty((1, 1, 1), dtype=np.float16)
+        _numpy_kernels.convert_bgra_tensor_into(
+            src, dst, "GRAY", "HWC", [1.0], [float(value)]
+        )
+        with np.errstate(over="ignore"):
+            expected = np.float16(value)
+        assert dst[0, 0, 0].view(np.uint16) == expected.view(np.uint16)
+
+
+def _yuv420_reference(
+    src: np.ndarray, fourcc: str, matrix: str, full_range: bool
+) -> np.ndarray:
+    kr, kb = {"bt601": (0.299, 0.114), "bt709": (0.2126, 0.0722)}[matrix]
+    kg = 1.0 - kr - kb
+    height, width = src.shape[:2]
+    padded = np.pad(src, ((0, height & 1), (0, width & 1), (0, 0)), mode="edge")
+    blue, green, red = (padded[..., c].astype(np.float64) for c in range(3))
+    y_scale = 1.0 if full_range else 219.0 / 255.0
+    c_scale = 1.0 if full_range else 224.0 / 255.0
+    luma = (kr * red + kg * green + kb * blue) * y_scale + (0 if full_range else 16)
+    rows, cols = blue.shape
+
+    def _block_mean(plane: np.ndarray) -> np.ndarray:
+        return plane.reshape(rows // 2, 2, cols // 2, 2).mean(axis=(1, 3))
+
+    r, g, b = _block_mean(red), _block_mean(green), _block_mean(blue)
+    u = (-kr * r - kg * g + (1.0 - kb) * b) / (2.0 * (1.0 - kb)) * c_scale + 128
+    v = ((1.0 - kr) * r - kg * g - kb * b) / (2.0 * (1.0 - kr)) * c_scale + 128
+    luma, u, v = (
+        np.clip(np.floor(p + 0.5), 0, 255).astype(np.uint8) for p in (luma, u, v)
+    )
+    if fourcc == "NV12":
+        chroma = np.stack([u, v], axis=-1).reshape(rows // 2, cols)
+    else:
+        chroma = np.concatenate([u.reshape(-1), v.reshape(-1)]).reshape(rows // 2, cols)
+    return np.concatenate([luma, chroma])
+
+
+@pytest.mark.parametrize("height,width", ((36, 50), (37, 51), (1, 1), (2, 3)))
+@pytest.mark.parametrize("fourcc", ("NV12", "I420"))
+@pytest.mark.parametrize("matrix", ("bt601", "bt709"))
+@pytest.mark.parametrize("full_range", (False, True))
+@pytest.mark.parametrize("threshold", _THRESHOLDS)
+def test_convert_bgra_yuv420_into_matches_reference(
+    height: int,
+    width: int,
+    fourcc: str,
+    matrix: str,
+    full_range: bool,
+    threshold: int,
+) -> None:
+    # Strided crop view: rows keep the mapped pitch.
+    mapped = _random_bgra(height=height + 4, width=width + 9, seed=height * width)
+    src = mapped[2 : 2 + height, 3 : 3 + width]
+    dst = np.empty(_numpy_kernels.yuv420_frame_shape(width, height), dtype=np.uint8)
+    _numpy_kernels.set_parallel_pixels_threshold(threshold)
+
+    _numpy_kernels.convert_bgra_yuv420_into(src, dst, fourcc, matrix, full_range)
+
+    expected = _yuv420_reference(src, fourcc, matrix, full_range)
+    assert dst.shape == expected.shape
+    np.testing.assert_allclose(dst, expected, rtol=0, atol=1)
+
+
+def test_convert_bgra_yuv420_into_matches_cv2_i420() -> None:
+    # OpenCV samples chroma from one pixel per 2x2 block, so compare on
+    # block-constant input where sampling and averaging agree.
+    blocks = _random_bgra(height=24, width=40, seed=31)
+    src = np.repeat(np.repeat(blocks, 2, axis=0), 2, axis=1)
+    dst = np.empty(_numpy_kernels.yuv420_frame_shape(80, 48), dtype=np.uint8)
+
+    _numpy_kernels.convert_bgra_yuv420_into(src, dst, "I420", "bt601", False)
+
+    expected = cv2.cvtColor(src, cv2.COLOR_BGRA2YUV_I420)
+    np.testing.assert_allclose(dst, expected, rtol=0, atol=1)
+
+
+def test_convert_bgra_yuv420_into_nv12_interleaves_i420_planes() -> None:
+    src = _random_bgra(height=30, width=42, seed=41)
+    shape = _numpy_kernels.yuv420_frame_shape(42, 30)
+    nv12 = np.empty(shape, dtype=np.uint8)
+    i420 = np.empty(shape, dtype=np.uint8)
+
+    _numpy_kernels.convert_bgra_yuv420_into(src, nv12, "NV12")
+    _numpy_kernels.convert_bgra_yuv420_into(src, i420, "I420")
+
+    np.testing.assert_array_equal(nv12[:30], i420[:30])
+    chroma = i420[30:].reshape(-1)
+    np.testing.assert_array_equal(
+        nv12[30:, 0::2].reshape(-1), chroma[: chroma.size // 2]
+    )
+    np.testing.assert_array_equal(
+        nv12[30:, 1::2].reshape(-1), chroma[chroma.size // 2 :]
+    )
+    with pytest.raises(ValueError):
+        _numpy_kernels.convert_bgra_yuv420_into(
+            src, np.empty((44, 42), np.uint8), "NV12"
+        )
+    with pytest.raises(ValueError):
+        _numpy_kernels.convert_bgra_yuv420_into(src, nv12, "YUY2")
@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import threading
+
+import numpy as np
+import pytest
+
+from dxcam.core.capture_loop import CaptureLoopRunner
+from dxcam.core.capture_runtime import CaptureRuntime
+from dxcam.core.capture_stages import StageChain
+
+
+def _crop(src: np.ndarray, out: np.ndarray) -> None:
+    out[...] = src[:2, :3]
+
+
+def _channel_sum(src: np.ndarray, out: np.ndarray) -> None:
+    out[...] = src.sum(axis=(0, 1))
+
+
+def test_stage_chain_validates_stages() -> None:
+    chain = StageChain()
+    assert not chain
+    with pytest.raises(TypeError):
+        chain.add("not callable", (1,))  # type: ignore[arg-type]
+    with pytest.raises(ValueError):
+        chain.add(_crop, (0, 3))
+    with pytest.raises(ValueError):
+        chain.add(_crop, (2, 3, 3), source="missing")
+
+    assert chain.add(_crop, (2, 3, 3)).name == "_crop"
+    assert chain.add(_crop, (2, 3, 3)).name == "_crop_1"
+    with pytest.raises(ValueError):
+        chain.add(_crop, (2, 3, 3), name="_crop")
+    chain.add(_channel_sum, (3,), np.int64, name="sum", source="_crop")
+    assert chain.names() == ["_crop", "_crop_1", "sum"]
+
+    with pytest.raises(ValueError):
+        chain.remove("_crop")
+    with pytest.raises(KeyError):
+        chain.remove("missing")
+    chain.remove("_crop_1")
+    assert chain.names() == ["_crop", "sum"]
+
+
+def _runner(runtime: CaptureRuntime, frames: list[np.ndarray]) -> CaptureLoopRunner:
+    ticks = iter(range(1, 100))
+
+    def _grab_into(region, dst, tile_hashes):
+        if not frames:
+            return False, 0, 0, 0
+        np.copyto(dst, frames.pop(0))
+        return True, next(ticks), dst.shape[1], dst.shape[0]
+
+    return CaptureLoopRunner(
+        lock=threading.Lock(),
+        frame_available_event=threading.Event(),
+        runtime=runtime,
+        grab_into=_grab_into,
+        process_staging_frame=lambda width, height: None,
+        handle_frame_size_change=lambda height, width: None,
+    )
+
+
+def test_capture_loop_runs_stages_into_ring_slots() -> None:
+    chain = StageChain()
+    chain.add(_crop, (2, 3, 3), name="crop")
+    chain.add(_channel_sum, (3,), np.int64, name="sum", source="crop")
+    runtime = CaptureRuntime(max_buffer_len=3, channel_size=3)
+    runtime.stages = chain
+    runtime.allocate_for_shape(4, 5)
+
+    rng = np.random.default_rng(0)
+    frames = [rng.integers(0, 256, (4, 5, 3), dtype=np.uint8) for _ in range(2)]
+    runner = _runner(runtime, [frame.copy() for frame in frames])
+
+    runner.run_once(region=(0, 0, 5, 4), video_mode=False)
+    first = runtime.peek_latest_stage_outputs(copy=True)
+    runner.run_once(region=(0, 0, 5, 4), video_mode=False)
+    second = runtime.peek_latest_stage_outputs(copy=False)
+
+    for outputs, frame in ((first, frames[0]), (second, frames[1])):
+        np.testing.assert_array_equal(outputs["crop"], frame[:2, :3])
+        np.testing.assert_array_equal(
+            outputs["sum"], frame[:2, :3].sum(axis=(0, 1), dtype=np.int64)
+        )
+    assert second["crop"].base is chain.stages[0].buffers
+
+    # Video-mode repeats reuse the previous slot's stage outputs.
+    runner.run_once(region=(0, 0, 5, 4), video_mode=True)
+    assert runtime.frame_count == 3
+    repeated = runtime.peek_latest_stage_outputs()
+    np.testing.assert_array_equal(repeated["sum"], second["sum"])
+
+    stats = chain.stats()
+    assert stats["crop"].calls == 2 and stats["sum"].calls == 2
+    assert stats["crop"].max_seconds >= stats["crop"].last_seconds > 0
+    assert stats["sum"].mean_seconds > 0
+
+    runtime.clear()
+    assert runtime.stages is None
+    assert chain.stages[0].buffers is None
+    assert chain.names() == ["crop", "sum"]
+
+
+def test_stage_stats_reset_does_not_lose_concurrent_calls() -> None:
+    chain = StageChain()
+    chain.add(_crop, (2, 3, 3), name="crop")
+    chain.allocate(1)
+    frame = np.zeros((4, 5, 3), dtype=np.uint8)
+    runs = 2000
+
+    def _capture() -> None:
+        for _ in range(runs):
+            chain.run(0, frame)
+
+    thread = threading.Thread(target=_capture)
+    thread.start()
+    counted = 0
+    while thread.is_alive():
+        counted += chain.stats(reset=True)["crop"].calls
+    thread.join()
+    counted += chain.stats(reset=True)["crop"].calls
+
+    assert counted == runs
+    assert chain.stats()["crop"].calls == 0
@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+import threading
+
+import numpy as np
+
+from dxcam.core.capture_loop import CaptureLoopRunner
+from dxcam.core.capture_runtime import CaptureRuntime
+from dxcam.core.capture_subscription import CaptureSubscription
+
+
+class _Capture:
+    """Runtime, condition and loop runner wired like ``DXCamera`` wires them."""
+
+    def __init__(self, max_buffer_len: int = 4) -> None:
+        self.lock = threading.Lock()
+        self.committed = threading.Condition(self.lock)
+        self.runtime = CaptureRuntime(max_buffer_len=max_buffer_len, channel_size=1)
+        self.runtime.allocate_for_shape(2, 2)
+        self.frames: list[int] = []
+        self.runner = CaptureLoopRunner(
+            lock=self.lock,
+            frame_available_event=threading.Event(),
+            runtime=self.runtime,
+            grab_into=self._grab_into,
+            process_staging_frame=lambda width, height: None,
+            handle_frame_size_change=lambda height, width: None,
+            frame_committed=self.committed,
+        )
+
+    def _grab_into(self, region, dst, tile_hashes):
+        if not self.frames:
+            return False, 0, 0, 0
+        value = self.frames.pop(0)
+        dst[...] = value
+        return True, value * 10, 2, 2
+
+    def produce(self, *values: int) -> None:
+        for value in values:
+            self.frames.append(value)
+            self.runner.run_once(region=(0, 0, 2, 2), video_mode=False)
+
+    def subscribe(self) -> CaptureSubscription:
+        return CaptureSubscription(
+            frame_committed=self.committed,
+            runtime=self.runtime,
+            copy_frame=lambda frame, out: frame.copy() if out is None else out,
+            ticks_to_seconds=lambda ticks: ticks / 10,
+        )
+
+
+def test_commits_number_frames_across_reallocation() -> None:
+    runtime = CaptureRuntime(max_buffer_len=2, channel_size=1)
+    runtime.allocate_for_shape(2, 2)
+    assert runtime.peek_latest_sequence() is None
+    for ticks in range(3):
+        runtime.commit_write(runtime.head, ticks)
+    assert runtime.sequence == 3 and runtime.peek_latest_sequence() == 3
+    assert sorted(runtime.frame_sequences.tolist()) == [2, 3]
+
+    runtime.dedupe = runtime.fingerprint_frames = True
+    runtime.allocate_for_shape(2, 2)
+    assert runtime.commit_write(runtime.head, 0, fingerprint=7)
+    assert not runtime.commit_write(runtime.head, 1, fingerprint=7)
+    runtime.clear()
+    runtime.allocate_for_shape(2, 2)
+    runtime.commit_write(runtime.head, 0)
+    assert runtime.peek_latest_sequence() == 5
+
+
+def test_subscribers_read_independently_and_count_overruns() -> None:
+    capture = _Capture()
+    capture.produce(1)
+    recorder, detector = capture.subscribe(), capture.subscribe()
+    # Subscriptions start after the latest frame.
+    assert recorder.cursor == 1 and recorder.pending == 0
+    assert recorder.read(timeout=0) is None
+
+    capture.produce(2)
+    frame, timestamp = recorder.read(timeout=0, with_timestamp=True)
+    assert int(frame[0, 0, 0]) == 2 and timestamp == 2.0
+    assert recorder.read(timeout=0) is None
+
+    capture.produce(3, 4, 5)
+    assert recorder.pending == 3 and detector.pending == 4
+    assert int(recorder.read(timeout=0)[0, 0, 0]) == 5
+    assert int(detector.read(timeout=0)[0, 0, 0]) == 5
+    assert (recorder.overruns, detector.overruns) == (2, 3)
+    assert recorder.cursor == detector.cursor == 5
+
+
+def test_waiting_subscribers_all_wake_for_one_frame() -> None:
+    capture = _Capture()
+    subscriptions = [capture.subscribe() for _ in range(3)]
+    results: list[int | None] = [None] * len(subscriptions)
+    ready = threading.Barrier(len(subscriptions) + 1)
+
+    def consume(index: int) -> None:
+        ready.wait()
+        frame = subscriptions[index].read(timeout=5.0)
+        results[index] = None if frame is None else int(frame[0, 0, 0])
+
+    threads = [threading.Thread(target=consume, args=(i,)) for i in range(3)]
+    for thread in threads:
+        thread.start()
+    ready.wait()
+    capture.produce(9)
+    for thread in threads:
+        thread.join(timeout=5.0)
+    assert results == [9, 9, 9]
+
+
+def test_stopping_capture_releases_waiting_subscribers() -> None:
+    capture = _Capture()
+    subscription = capture.subscribe()
+    result: list[object] = []
+    thread = threading.Thread(target=lambda: result.append(subscription.read()))
+    thread.start()
+    with capture.committed:
+        capture.runtime.clear()
+        capture.committed.notify_all()
+    thread.join(timeout=5.0)
+    assert not thread.is_alive() and result == [None]
+
+
+def test_region_subscriptions_return_region_frames() -> None:
+    capture = _Capture()
+    capture.runtime.allocate_for_regions([(1, 2, 1), (1, 1, 1)])
+    subscription = capture.subscribe()
+    with capture.committed:
+        write_idx, dst = capture.runtime.reserve_write_slot()
+        dst[...] = np.arange(3)
+        capture.runtime.commit_write(write_idx, 0)
+        capture.committed.notify_all()
+    first, second = subscription.read(timeout=0)
+    assert first.ravel().tolist() == [0, 1] and second.ravel().tolist() == [2]
+
+
+def test_frames_since_returns_unread_frames_across_the_wrap() -> None:
+    capture = _Capture(max_buffer_len=4)
+    capture.produce(1, 2, 3)
+    runtime = capture.runtime
+    chunks, sequences, ticks, dropped = runtime.frames_since(1, copy=False)
+    assert len(chunks) == 1 and np.shares_memory(chunks[0], runtime.frame_buffer)
+    assert sequences.tolist() == [2, 3] and ticks.tolist() == [20, 30]
+    assert dropped == 0
+
+    # Six commits into four slots: the write slot and frames 1-2 are gone.
+    capture.produce(4, 5, 6)
+    chunks, sequences, _, dropped = runtime.frames_since(0, copy=False)
+    assert [len(chunk) for chunk in chunks] == [1, 2]
+    assert [int(f[0, 0, 0]) for c in chunks for f in c] == [4, 5, 6]
+    assert sequences.tolist() == [4, 5, 6] and dropped == 3
+
+    (block,), _, _, _ = runtime.frames_since(3, copy=True)
+    assert block.shape == (3, 2, 2, 1)
+    assert not np.shares_memory(block, runtime.frame_buffer)
+    assert runtime.frames_since(6)[1].size == 0
+    assert runtime.frames_since(9)[3] == 0
+
+
+def test_batches_and_iteration_return_every_frame_in_order() -> None:
+    capture = _Capture(max_buffer_len=4)
+    subscription = capture.subscribe()
+    capture.produce(1, 2)
+    batch = subscription.read_batch(copy=False, timeout=0)
+    assert batch is not None and len(batch) == 2 and batch.dropped == 0
+    assert batch.timestamps.tolist() == [1.0, 2.0]
+    assert [int(frame[0, 0, 0]) for frame in batch] == [1, 2]
+    assert batch.stacked().shape == (2, 2, 2, 1)
+
+    empty = subscription.read_batch(timeout=0)
+    assert empty is not None and len(empty) == 0
+
+    capture.produce(*range(3, 10))
+    received = list(subscription.iter_frames(timeout=0))
+    assert [ts for _, ts in received] == [7.0, 8.0, 9.0]
+    assert [int(frame[0, 0, 0]) for frame, _ in received] == [7, 8, 9]
+    assert subscription.overruns == 4 and subscription.cursor == 9
+
+    late = capture.subscribe()
+    late.cursor = 7
+    assert [ts for _, ts in late.iter_frames(timeout=0)] == [8.0, 9.0]
+    capture.runtime.clear()
+    assert late.read_batch(timeout=0) is None
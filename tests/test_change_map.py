@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+pytest.importorskip("cv2")
+
+from mapped_rect import CV2_BACKENDS, random_mapped_rect, skip_unavailable
+
+from dxcam.core.capture_runtime import CaptureRuntime
+from dxcam.processor import Processor, normalize_change_tile_size, tile_grid_shape
+from dxcam.processor.cv2_processor import _NUMPY_KERNELS_AVAILABLE, _numpy_kernels
+
+_ROTATIONS: tuple[int, ...] = (0, 90, 180, 270)
+_WIDTH, _HEIGHT = 133, 75
+
+
+@pytest.fixture
+def _parallel_threshold():
+    if not _NUMPY_KERNELS_AVAILABLE:
+        yield
+        return
+    previous = _numpy_kernels.get_parallel_pixels_threshold()
+    yield
+    _numpy_kernels.set_parallel_pixels_threshold(previous)
+
+
+def test_tile_grid_shape_rounds_up() -> None:
+    assert tile_grid_shape(64, 64, 32) == (2, 2)
+    assert tile_grid_shape(65, 33, 32) == (3, 2)
+    if _NUMPY_KERNELS_AVAILABLE:
+        assert _numpy_kernels.tile_grid_shape(65, 33, 32) == (3, 2)
+
+
+@pytest.mark.parametrize("tile_size", (0, 7, 257))
+def test_normalize_change_tile_size_rejects_out_of_range(tile_size: int) -> None:
+    with pytest.raises(ValueError):
+        normalize_change_tile_size(tile_size)
+
+
+@pytest.mark.parametrize("backend", CV2_BACKENDS)
+@pytest.mark.parametrize("rotation", _ROTATIONS)
+@pytest.mark.parametrize("output_color", ("RGB", "BGRA", "GRAY"))
+@pytest.mark.parametrize("threshold", (1, 1 << 30))
+def test_fused_tile_hashes_match_post_hoc_hashes(
+    backend: str,
+    rotation: int,
+    output_color: str,
+    threshold: int,
+    _parallel_threshold,
+) -> None:
+    skip_unavailable(backend)
+    if _NUMPY_KERNELS_AVAILABLE:
+        _numpy_kernels.set_parallel_pixels_threshold(threshold)
+    rect = random_mapped_rect(_WIDTH, _HEIGHT, rotation, seed=rotation + 3)
+    processor = Processor(backend=backend, output_color=output_color)
+    region = (5, 3, _WIDTH - 2, _HEIGHT - 1)
+    shape = processor.output_frame_shape(region[2] - region[0], region[3] - region[1])
+    dst = np.empty(shape, dtype=processor.output_dtype)
+    hashes = np.zeros(tile_grid_shape(shape[0], shape[1], 16), dtype=np.uint64)
+
+    processor.process_into(
+        rect, _WIDTH, _HEIGHT, region, rotation, dst, tile_hashes=hashes, tile_size=16
+    )
+
+    expected_frame = np.empty_like(dst)
+    processor.process_into(rect, _WIDTH, _HEIGHT, region, rotation, expected_frame)
+    np.testing.assert_array_equal(dst, expected_frame)
+    expected = np.zeros_like(hashes)
+    processor.hash_tiles_into(dst, expected, 16)
+    np.testing.assert_array_equal(hashes, expected)
+
+
+@pytest.mark.parametrize("backend", CV2_BACKENDS)
+def test_single_pixel_change_flags_one_tile(backend: str) -> None:
+    skip_unavailable(backend)
+    processor = Processor(backend=backend, output_color="RGB")
+    frame = np.random.default_rng(1).integers(0, 256, (70, 90, 3), dtype=np.uint8)
+    before = np.zeros(tile_grid_shape(70, 90, 32), dtype=np.uint64)
+    after = np.zeros_like(before)
+    processor.hash_tiles_into(frame, before, 32)
+    frame[40, 70, 2] ^= 1
+    processor.hash_tiles_into(frame, after, 32)
+
+    changed = np.argwhere(before != after)
+    np.testing.assert_array_equal(changed, [[1, 2]])
+
+
+def test_hash_tiles_into_rejects_bad_hash_arrays() -> None:
+    skip_unavailable("numpy")
+    frame = np.zeros((64, 64, 3), dtype=np.uint8)
+    with pytest.raises(ValueError):
+        _numpy_kernels.hash_tiles_into(frame, np.zeros((2, 3), np.uint64), 32)
+    with pytest.raises(ValueError):
+        _numpy_kernels.hash_tiles_into(frame, np.zeros((2, 2), np.int64), 32)
+
+
+def test_capture_runtime_reports_changed_tiles() -> None:
+    runtime = CaptureRuntime(max_buffer_len=3, channel_size=3)
+    runtime.change_tile_size = 16
+    runtime.allocate_for_shape(40, 50)
+    assert runtime.frame_tile_hashes is not None
+    assert runtime.frame_tile_hashes.shape == (3, 3, 4)
+    assert runtime.peek_latest_changes() is None
+
+    write_idx, _ = runtime.reserve_write_slot()
+    hashes = runtime.tile_hashes_slot(write_idx)
+    hashes[...] = 7
+    runtime.commit_write(write_idx, frame_ticks=1)
+    assert runtime.peek_latest_changes().all()
+
+    write_idx, _, _, ticks = runtime.reserve_duplicate_copy()
+    runtime.commit_write(write_idx, frame_ticks=ticks)
+    assert not runtime.peek_latest_changes().any()
+
+    write_idx, _ = runtime.reserve_write_slot()
+    hashes = runtime.tile_hashes_slot(write_idx)
+    hashes[...] = 7
+    hashes[2, 1] = 8
+    runtime.commit_write(write_idx, frame_ticks=2)
+    np.testing.assert_array_equal(np.argwhere(runtime.peek_latest_changes()), [[2, 1]])
+
+    runtime.allocate_for_regions([(4, 5, 3)])
+    assert runtime.peek_latest_changes() is None
@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+pytest.importorskip("cv2")
+
+from dxcam.core.pointer import (
+    POINTER_SHAPE_COLOR,
+    POINTER_SHAPE_MASKED_COLOR,
+    POINTER_SHAPE_MONOCHROME,
+    CursorShape,
+    decode_pointer_shape,
+)
+from dxcam.processor import Processor
+from dxcam.processor.cursor import CursorCompositor
+from dxcam.processor.cv2_processor import _NUMPY_KERNELS_AVAILABLE
+
+_KERNEL_MODES: tuple[bool, ...] = (True, False)
+
+
+def _compositor(color_mode: str, use_kernels: bool) -> CursorCompositor:
+    if use_kernels and not _NUMPY_KERNELS_AVAILABLE:
+        pytest.skip("NumPy/Cython kernels are unavailable in this environment.")
+    return CursorCompositor(color_mode, use_kernels=use_kernels)
+
+
+def _frame(height: int = 24, width: int = 32, channels: int = 3) -> np.ndarray:
+    rng = np.random.default_rng(height * width)
+    return rng.integers(0, 256, size=(height, width, channels), dtype=np.uint8)
+
+
+def _color_buffer(pixels: np.ndarray, pitch: int) -> bytes:
+    height, width = pixels.shape[:2]
+    rows = np.zeros((height, pitch), dtype=np.uint8)
+    rows[:, : width * 4] = pixels.reshape(height, -1)
+    return rows.tobytes()
+
+
+def _mono_buffer(and_bits: np.ndarray, xor_bits: np.ndarray, pitch: int) -> bytes:
+    packed = np.packbits(np.concatenate([and_bits, xor_bits]), axis=1)
+    rows = np.zeros((packed.shape[0], pitch), dtype=np.uint8)
+    rows[:, : packed.shape[1]] = packed
+    return rows.tobytes()
+
+
+def test_monochrome_shape_decodes_and_and_xor_masks() -> None:
+    # Columns: transparent, black, white, inverted; 10 px wide, 3 rows tall.
+    and_bits = np.tile(np.array([1, 0, 0, 1, 1, 1, 1, 1, 1, 1], np.uint8), (3, 1))
+    xor_bits = np.tile(np.array([0, 0, 1, 1, 0, 0, 0, 0, 0, 0], np.uint8), (3, 1))
+    shape = decode_pointer_shape(
+        POINTER_SHAPE_MONOCHROME, 10, 6, 4, _mono_buffer(and_bits, xor_bits, 4), (1, 2)
+    )
+    assert (shape.width, shape.height, shape.hot_spot) == (10, 3, (1, 2))
+    assert shape.and_mask is not None
+    np.testing.assert_array_equal(shape.and_mask, and_bits * 255)
+    np.testing.assert_array_equal(shape.color[..., 0], xor_bits * 255)
+
+
+@pytest.mark.parametrize("use_kernels", _KERNEL_MODES)
+def test_monochrome_cursor_masks_and_inverts(use_kernels: bool) -> None:
+    and_bits = np.array([[1, 0, 0, 1]], dtype=np.uint8)
+    xor_bits = np.array([[0, 0, 1, 1]], dtype=np.uint8)
+    shape = decode_pointer_shape(
+        POINTER_SHAPE_MONOCHROME, 4, 2, 1, _mono_buffer(and_bits, xor_bits, 1)
+    )
+    frame = np.full((3, 6, 3), 100, dtype=np.uint8)
+    _compositor("BGR", use_kernels).composite(frame, shape, 1, 1)
+
+    np.testing.assert_array_equal(frame[1, 1:5, 0], [100, 0, 255, 155])
+    assert (frame[0] == 100).all() and (frame[2] == 100).all()
+    assert (frame[1, [0, 5]] == 100).all()
+
+
+@pytest.mark.parametrize("use_kernels", _KERNEL_MODES)
+@pytest.mark.parametrize("color_mode", ("RGB", "BGR", "RGBA", "BGRA"))
+def test_color_cursor_alpha_blends_into_channel_order(
+    use_kernels: bool, color_mode: str
+) -> None:
+    rng = np.random.default_rng(1)
+    pixels = rng.integers(0, 256, size=(9, 7, 4), dtype=np.uint8)
+    pixels[0, :3, 3] = (0, 255, 128)
+    shape = decode_pointer_shape(
+        POINTER_SHAPE_COLOR, 7, 9, 32, _color_buffer(pixels, 32)
+    )
+    assert shape.and_mask is None
+
+    frame = _frame(channels=len(color_mode))
+    before = frame.copy()
+    _compositor(color_mode, use_kernels).composite(frame, shape, 5, 3)
+
+    order = [color_mode.index(c) for c in "BGR"]
+    box = before[3:12, 5:12][..., order].astype(np.float64)
+    alpha = pixels[..., 3:].astype(np.float64)
+    blended = pixels[..., :3] * alpha + box * (255 - alpha)
+    expected = np.floor(blended / 255 + 0.5).astype(np.uint8)
+    np.testing.assert_array_equal(frame[3:12, 5:12][..., order], expected)
+    # Alpha channels and pixels outside the cursor box are untouched.
+    untouched = np.ones(frame.shape, dtype=bool)
+    untouched[3:12, 5:12, order] = False
+    np.testing.assert_array_equal(frame[untouched], before[untouched])
+
+
+@pytest.mark.parametrize("use_kernels", _KERNEL_MODES)
+def test_masked_color_cursor_replaces_or_xors(use_kernels: bool) -> None:
+    pixels = np.zeros((2, 2, 4), dtype=np.uint8)
+    pixels[..., :3] = (10, 20, 30)
+    pixels[0, :, 3] = 0xFF
+    shape = decode_pointer_shape(
+        POINTER_SHAPE_MASKED_COLOR, 2, 2, 8, _color_buffer(pixels, 8)
+    )
+    frame = np.full((2, 2, 3), 0x0F, dtype=np.uint8)
+    _compositor("RGB", use_kernels).composite(frame, shape, 0, 0)
+
+    np.testing.assert_array_equal(frame[0], [[30 ^ 15, 20 ^ 15, 10 ^ 15]] * 2)
+    np.testing.assert_array_equal(frame[1], [[30, 20, 10]] * 2)
+
+
+@pytest.mark.parametrize("use_kernels", _KERNEL_MODES)
+def test_cursor_is_clipped_to_the_frame(use_kernels: bool) -> None:
+    color = np.full((8, 8, 4), 255, dtype=np.uint8)
+    shape = CursorShape(color)
+    compositor = _compositor("RGB", use_kernels)
+    for left, top in ((-5, -6), (28, 20), (-20, 0), (32, 3)):
+        frame = np.zeros((24, 32, 3), dtype=np.uint8)
+        compositor.composite(frame, shape, left, top)
+        expected = np.zeros_like(frame)
+        expected[max(top, 0) : max(top + 8, 0), max(left, 0) : max(left + 8, 0)] = 255
+        np.testing.assert_array_equal(frame, expected)
+
+
+def test_kernel_and_numpy_blends_match() -> None:
+    if not _NUMPY_KERNELS_AVAILABLE:
+        pytest.skip("NumPy/Cython kernels are unavailable in this environment.")
+    rng = np.random.default_rng(7)
+    color = rng.integers(0, 256, size=(32, 32, 4), dtype=np.uint8)
+    mask = rng.choice(np.array([0, 255], np.uint8), size=(32, 32))
+    for shape in (CursorShape(color), CursorShape(color, mask)):
+        frames = [_frame(48, 64, 4) for _ in range(2)]
+        for frame, use_kernels in zip(frames, _KERNEL_MODES):
+            CursorCompositor("BGRA", use_kernels=use_kernels).composite(
+                frame, shape, 40, 30
+            )
+        np.testing.assert_array_equal(frames[0], frames[1])
+
+
+def test_invalid_shapes_and_outputs_are_rejected() -> None:
+    with pytest.raises(ValueError):
+        decode_pointer_shape(POINTER_SHAPE_COLOR, 4, 4, 16, bytes(32))
+    with pytest.raises(ValueError):
+        decode_pointer_shape(POINTER_SHAPE_MONOCHROME, 8, 3, 1, bytes(3))
+    with pytest.raises(ValueError):
+        decode_pointer_shape(3, 4, 4, 16, bytes(64))
+    with pytest.raises(ValueError):
+        CursorCompositor("GRAY")
+
+    compositor = Processor(output_color="BGRA").cursor_compositor()
+    assert compositor.channel_offsets == (0, 1, 2)
+    invalid = (
+        {"output_color": "NV12"},
+        {"output_size": (32, 32)},
+        {"letterbox": True},
+        {"output_dtype": "float32"},
+        {"source_format": "RGB10A2", "tone_map": "none"},
+    )
+    for kwargs in invalid:
+        options = {"output_color": "RGB", **kwargs}
+        with pytest.raises(ValueError):
+            Processor(**options).cursor_compositor()
@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import os
+
+import numpy as np
+import pytest
+
+from dxcam.core.capture_runtime import CaptureRuntime
+from dxcam.core.disk_ring import DiskRing
+
+
+def _ring_files(directory) -> list[str]:
+    return sorted(name for name in os.listdir(directory) if name.endswith(".bin"))
+
+
+def _commit(runtime: CaptureRuntime, value: int) -> None:
+    write_idx, dst = runtime.reserve_write_slot()
+    dst[...] = value
+    runtime.commit_write(write_idx, value * 100)
+
+
+def test_frames_live_in_a_ring_file_that_is_replaced_and_removed(tmp_path) -> None:
+    runtime = CaptureRuntime(
+        max_buffer_len=3, channel_size=3, storage=DiskRing(str(tmp_path))
+    )
+    runtime.allocate_for_shape(4, 5)
+    (first_file,) = _ring_files(tmp_path)
+    assert isinstance(runtime.frame_buffer, np.memmap)
+    assert os.path.getsize(tmp_path / first_file) == 3 * 4 * 5 * 3
+
+    _commit(runtime, 7)
+    frame, frame_ticks = runtime.peek_latest_with_ticks(copy=True)
+    assert (frame == 7).all() and frame_ticks == 700
+
+    runtime.allocate_for_shape(2, 2)
+    (second_file,) = _ring_files(tmp_path)
+    assert second_file != first_file
+    runtime.clear()
+    assert _ring_files(tmp_path) == []
+
+
+def test_ring_file_is_removed_once_the_last_view_is_gone(
+    tmp_path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    storage = DiskRing(str(tmp_path))
+    frames, _ = storage.allocate(2, (3, 3), np.uint8, 0)
+    view = frames[1]
+    del frames
+
+    def refuse(path: str) -> None:
+        # Windows refuses to delete a file that is still mapped.
+        raise PermissionError(path)
+
+    monkeypatch.setattr(os, "remove", refuse)
+    storage.close()
+    monkeypatch.undo()
+    assert len(_ring_files(tmp_path)) == 1
+    del view
+    assert _ring_files(tmp_path) == []
+
+
+def test_preallocate_and_directory_validation(tmp_path) -> None:
+    storage = DiskRing(str(tmp_path), preallocate=True)
+    frames, frame_ticks = storage.allocate(2, (3, 3), np.uint8, 0)
+    assert frames.shape == (2, 3, 3) and not frames.any()
+    assert storage.path is not None and os.path.getsize(storage.path) == 18
+    assert frame_ticks.tolist() == [0, 0]
+    del frames
+    storage.close()
+    assert _ring_files(tmp_path) == []
+    with pytest.raises(FileNotFoundError):
+        DiskRing(str(tmp_path / "missing"))
+
+
+def test_frames_between_selects_inclusive_windows() -> None:
+    runtime = CaptureRuntime(max_buffer_len=4, channel_size=1)
+    runtime.allocate_for_shape(1, 1)
+    assert runtime.readable_sequences() is None
+    for value in range(1, 7):
+        _commit(runtime, value)
+    # Four slots, one reserved for the producer: frames 4-6 are buffered.
+    assert runtime.readable_sequences() == (4, 6)
+
+    chunks, sequences, frame_ticks, dropped = runtime.frames_between(2, 5)
+    assert sequences.tolist() == [4, 5] and frame_ticks.tolist() == [400, 500]
+    assert [int(f.item()) for f in chunks[0]] == [4, 5] and dropped == 2
+    assert runtime.frames_between(5, 9)[1].tolist() == [5, 6]
+    assert runtime.frames_between(1, 3)[1].size == 0
+    assert runtime.frames_between(1, 3)[3] == 3
+
+    frame_buffer = runtime.frame_buffer
+    _commit(runtime, 7)
+    assert runtime.count_overwritten(sequences, frame_buffer) == 1
+    runtime.allocate_for_shape(1, 1)
+    assert runtime.count_overwritten(sequences, frame_buffer) == 2
+
+
+def test_export_frames_copies_outside_the_lock(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    pytest.importorskip("comtypes")
+    from threading import Lock
+    from types import SimpleNamespace
+
+    from dxcam.dxcam import DXCamera
+
+    camera = DXCamera.__new__(DXCamera)
+    lock = camera._DXCamera__lock = Lock()
+    runtime = camera._DXCamera__capture_runtime = CaptureRuntime(
+        max_buffer_len=4, channel_size=1
+    )
+    camera._duplicator = SimpleNamespace(ticks_to_seconds=lambda ticks: ticks / 100)
+    camera._ring_storage = None
+    runtime.allocate_for_shape(1, 1)
+    for value in range(1, 7):
+        _commit(runtime, value)
+    concatenate = np.concatenate
+
+    def commit_while_copying(chunks):
+        if chunks[0].ndim > 1:
+            # The producer keeps committing while the frames are copied.
+            assert not lock.locked()
+            for value in (7, 8):
+                _commit(runtime, value)
+        return concatenate(chunks)
+
+    monkeypatch.setattr(np, "concatenate", commit_while_copying)
+    batch = camera.export_frames()
+
+    # Frames 4 and 5 were overwritten during the copy.
+    assert batch.sequences.tolist() == [6] and batch.dropped == 2
+    assert [int(f.item()) for f in batch] == [6]
+    assert batch.timestamps.tolist() == [6.0]
+
+
+def test_export_frames_views_disk_rings_by_default(tmp_path) -> None:
+    pytest.importorskip("comtypes")
+    from threading import Lock
+    from types import SimpleNamespace
+
+    from dxcam.dxcam import DXCamera
+
+    camera = DXCamera.__new__(DXCamera)
+    camera._DXCamera__lock = Lock()
+    storage = camera._ring_storage = DiskRing(str(tmp_path))
+    runtime = camera._DXCamera__capture_runtime = CaptureRuntime(
+        max_buffer_len=4, channel_size=1, storage=storage
+    )
+    camera._duplicator = SimpleNamespace(ticks_to_seconds=lambda ticks: ticks / 100)
+    runtime.allocate_for_shape(1, 1)
+    for value in range(1, 4):
+        _commit(runtime, value)
+
+    # The window is not copied into RAM unless asked for.
+    clip = camera.export_frames()
+    assert clip.sequences.tolist() == [1, 2, 3]
+    assert all(np.shares_memory(chunk, runtime.frame_buffer) for chunk in clip.chunks)
+    copied = camera.export_frames(copy=True)
+    assert not np.shares_memory(copied.stacked(), runtime.frame_buffer)
+    del clip, copied
+    runtime.clear()
@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import threading
+
+import numpy as np
+import pytest
+
+pytest.importorskip("cv2")
+
+from dxcam.core.capture_loop import CaptureLoopRunner
+from dxcam.core.capture_runtime import CaptureRuntime
+from dxcam.processor import Processor, cv2_processor
+from dxcam.processor.cv2_processor import _NUMPY_KERNELS_AVAILABLE, _numpy_kernels
+
+
+@pytest.fixture
+def _parallel_threshold():
+    if not _NUMPY_KERNELS_AVAILABLE:
+        yield
+        return
+    previous = _numpy_kernels.get_parallel_pixels_threshold()
+    yield
+    _numpy_kernels.set_parallel_pixels_threshold(previous)
+
+
+def _frame(seed: int = 0, shape: tuple[int, ...] = (67, 131, 3)) -> np.ndarray:
+    return np.random.default_rng(seed).integers(0, 256, shape, dtype=np.uint8)
+
+
+@pytest.mark.parametrize("threshold", (1, 1 << 30))
+def test_fingerprint_is_deterministic_and_content_sensitive(
+    threshold: int, _parallel_threshold
+) -> None:
+    if _NUMPY_KERNELS_AVAILABLE:
+        _numpy_kernels.set_parallel_pixels_threshold(threshold)
+    processor = Processor(backend="numpy", output_color="RGB")
+    frame = _frame()
+    fingerprint = processor.fingerprint(frame)
+    assert 0 <= fingerprint < 1 << 64
+    assert processor.fingerprint(frame.copy()) == fingerprint
+
+    changed = frame.copy()
+    changed[40, 100, 1] ^= 0x80
+    assert processor.fingerprint(changed) != fingerprint
+
+    swapped = frame.copy()
+    swapped[[0, 2]] = swapped[[2, 0]]
+    assert processor.fingerprint(swapped) != fingerprint
+    assert processor.fingerprint(frame[:, :-1]) != fingerprint
+
+
+def test_sampled_fingerprint_skips_blocks() -> None:
+    processor = Processor(backend="numpy", output_color="RGB")
+    frame = _frame(shape=(64, 1024, 4))
+    sampled = processor.fingerprint(frame, sample_step=2)
+    # The second 4 KiB block is not sampled with a step of 2.
+    frame.reshape(-1)[4096 + 17] ^= 1
+    assert processor.fingerprint(frame, sample_step=2) == sampled
+    with pytest.raises(ValueError):
+        processor.fingerprint(frame, sample_step=0)
+
+
+def test_hashlib_fallback_accepts_strided_frames(monkeypatch) -> None:
+    monkeypatch.setattr(cv2_processor, "_NUMPY_KERNELS_AVAILABLE", False)
+    processor = Processor(backend="cv2", output_color="RGB")
+    frame = _frame(shape=(64, 1024, 4))
+    strided = frame[::2, ::3]
+    assert not strided.flags.c_contiguous
+    for step in (1, 2):
+        expected = processor.fingerprint(strided.copy(), sample_step=step)
+        assert processor.fingerprint(strided, sample_step=step) == expected
+    assert processor.fingerprint(frame[:0]) == processor.fingerprint(frame[:0].copy())
+
+
+def test_runtime_dedupe_drops_identical_commits() -> None:
+    runtime = CaptureRuntime(max_buffer_len=4, channel_size=3)
+    runtime.fingerprint_frames = True
+    runtime.dedupe = True
+    runtime.allocate_for_shape(2, 2)
+    assert runtime.peek_latest_fingerprint() is None
+
+    write_idx, _ = runtime.reserve_write_slot()
+    assert runtime.commit_write(write_idx, frame_ticks=1, fingerprint=11)
+    assert runtime.peek_latest_fingerprint() == 11
+
+    write_idx, _ = runtime.reserve_write_slot()
+    assert not runtime.commit_write(write_idx, frame_ticks=2, fingerprint=11)
+    assert runtime.deduped_frames == 1
+    assert runtime.frame_count == 1
+    assert runtime.reserve_duplicate_copy() is None
+
+    assert runtime.commit_write(write_idx, frame_ticks=3, fingerprint=12)
+    assert runtime.peek_latest_fingerprint() == 12
+    assert runtime.latest_frame_ticks == 3
+
+
+def _runner(runtime: CaptureRuntime, frames: list[np.ndarray]) -> CaptureLoopRunner:
+    processor = Processor(backend="numpy", output_color="RGB")
+    ticks = iter(range(1, 100))
+
+    def _grab_into(region, dst, tile_hashes):
+        if not frames:
+            return False, 0, 0, 0
+        np.copyto(dst, frames.pop(0))
+        return True, next(ticks), dst.shape[1], dst.shape[0]
+
+    return CaptureLoopRunner(
+        lock=threading.Lock(),
+        frame_available_event=threading.Event(),
+        runtime=runtime,
+        grab_into=_grab_into,
+        process_staging_frame=lambda width, height: None,
+        handle_frame_size_change=lambda height, width: None,
+        fingerprint=processor.fingerprint,
+    )
+
+
+@pytest.mark.parametrize("dedupe", (False, True))
+def test_capture_loop_dedupes_repeated_frames(dedupe: bool) -> None:
+    runtime = CaptureRuntime(max_buffer_len=8, channel_size=3)
+    runtime.fingerprint_frames = True
+    runtime.dedupe = dedupe
+    runtime.allocate_for_shape(9, 7)
+    first, second = _frame(1, (9, 7, 3)), _frame(2, (9, 7, 3))
+    runner = _runner(runtime, [first, first.copy(), second, second.copy()])
+
+    for _ in range(6):
+        runner.run_once(region=(0, 0, 7, 9), video_mode=True)
+
+    if dedupe:
+        assert runtime.frame_count == 2
+        assert runtime.deduped_frames == 2
+        assert runtime.latest_frame_ticks == 3
+    else:
+        # Four captured frames plus two video-mode repeats.
+        assert runtime.frame_count == 6
+    latest = runtime.peek_latest(copy=False)
+    np.testing.assert_array_equal(latest, second)
+    processor = Processor(backend="numpy", output_color="RGB")
+    assert runtime.peek_latest_fingerprint() == processor.fingerprint(second)
@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+import ctypes
+
+import numpy as np
+import pytest
+
+from dxcam.core.capture_runtime import CaptureRuntime
+from dxcam.core.frame_pool import (
+    FrameAllocator,
+    FrameArena,
+    FramePool,
+    aligned_allocator,
+    allocate_frame,
+)
+
+
+def test_pool_reuses_recycled_frames_per_shape_and_dtype() -> None:
+    pool = FramePool(max_free=1)
+    frame = pool.acquire((4, 6, 3), np.uint8)
+    assert frame.shape == (4, 6, 3) and frame.dtype == np.uint8
+    assert pool.recycle(frame)
+    # Recycling twice, views and foreign arrays are ignored.
+    assert not pool.recycle(frame)
+    assert not pool.recycle(np.empty((4, 6, 3), np.uint8))
+
+    assert pool.acquire((4, 6, 3), np.float32) is not frame
+    reused = pool.acquire((4, 6, 3), np.uint8)
+    assert reused is frame
+    assert not pool.recycle(reused[1:])
+    assert (pool.allocated, pool.reused) == (2, 1)
+
+    # Only max_free idle frames are kept.
+    frames = [pool.acquire((2, 2), np.uint8) for _ in range(3)]
+    assert all(pool.recycle(f) for f in frames)
+    assert pool.acquire((2, 2), np.uint8) is frames[0]
+    assert pool.acquire((2, 2), np.uint8) is not frames[1]
+
+
+def test_pool_validates_options_and_allocator_results() -> None:
+    with pytest.raises(ValueError):
+        FramePool(max_free=-1)
+    pool = FramePool(lambda shape, dtype: np.empty((1,), dtype))
+    with pytest.raises(ValueError):
+        pool.acquire((2, 2), np.uint8)
+
+
+@pytest.mark.parametrize("alignment", (16, 64, 4096))
+def test_aligned_allocator(alignment: int) -> None:
+    allocate = aligned_allocator(alignment)
+    for shape, dtype in (((3, 5, 3), np.uint8), ((2, 7), np.float32)):
+        frame = allocate(shape, np.dtype(dtype))
+        assert frame.shape == shape and frame.dtype == dtype
+        assert frame.flags.c_contiguous and frame.flags.writeable
+        assert frame.ctypes.data % alignment == 0
+    with pytest.raises(ValueError):
+        aligned_allocator(48)
+
+
+def test_runtime_allocates_ring_with_allocator() -> None:
+    calls: list[tuple[tuple[int, ...], np.dtype]] = []
+
+    def allocator(shape: tuple[int, ...], dtype: np.dtype) -> np.ndarray:
+        calls.append((shape, dtype))
+        return aligned_allocator(128)(shape, dtype)
+
+    runtime = CaptureRuntime(max_buffer_len=3, channel_size=4, allocator=allocator)
+    runtime.allocate_for_shape(5, 7)
+    runtime.allocate_for_regions([(2, 2, 3), (1, 4, 3)])
+    assert calls == [((3, 5, 7, 4), np.uint8), ((3, 24), np.uint8)]
+    assert runtime.frame_buffer is not None
+    assert runtime.frame_buffer.ctypes.data % 128 == 0
+    assert CaptureRuntime(max_buffer_len=2, channel_size=3).allocator is allocate_frame
+
+
+def test_runtime_reuses_arena_across_clear_and_resize() -> None:
+    arena = FrameArena(aligned_allocator(64))
+    runtime = CaptureRuntime(max_buffer_len=2, channel_size=3, arena=arena)
+    runtime.allocate_for_shape(4, 4)
+    address = runtime.frame_buffer.ctypes.data
+    assert arena.capacity == 2 * 4 * 4 * 3
+    runtime.clear()
+
+    # Restart and a smaller frame reshape the same memory in place.
+    runtime.allocate_for_shape(4, 4)
+    assert runtime.frame_buffer.ctypes.data == address
+    runtime.allocate_for_shape(2, 3)
+    assert runtime.frame_buffer.shape == (2, 2, 3, 3)
+    assert runtime.frame_buffer.ctypes.data == address
+    runtime.allocate_for_regions([(2, 2, 3)])
+    assert runtime.frame_buffer.ctypes.data == address
+    assert (arena.allocated, arena.reused) == (1, 3)
+
+    # Larger frames grow the arena.
+    runtime.allocate_for_shape(8, 8)
+    assert arena.capacity == 2 * 8 * 8 * 3 and arena.allocated == 2
+    assert runtime.frame_buffer.ctypes.data % 64 == 0
+
+    runtime.clear()
+    assert arena.trim() == 2 * 8 * 8 * 3 and arena.capacity == 0
+    assert arena.trim() == 0
+
+
+@pytest.mark.parametrize("allocator", (allocate_frame, aligned_allocator(64)))
+def test_arena_keeps_memory_of_held_views(allocator: FrameAllocator) -> None:
+    arena = FrameArena(allocator)
+    runtime = CaptureRuntime(max_buffer_len=2, channel_size=3, arena=arena)
+    runtime.allocate_for_shape(4, 4)
+    write_idx, dst = runtime.reserve_write_slot()
+    dst[...] = 7
+    runtime.commit_write(write_idx, 100)
+    del dst
+    held = runtime.peek_latest(copy=False)
+    runtime.clear()
+
+    # Restarting with a zero-copy frame still held allocates a new ring.
+    runtime.allocate_for_shape(4, 4)
+    runtime.frame_buffer[...] = 0
+    assert not np.shares_memory(runtime.frame_buffer, held)
+    assert (held == 7).all() and (arena.allocated, arena.reused) == (2, 0)
+
+    # Once the view is dropped the memory is reused again.
+    del held
+    runtime.clear()
+    runtime.allocate_for_shape(4, 4)
+    assert (arena.allocated, arena.reused) == (2, 1)
+
+
+def test_grab_writes_frame_into_out(monkeypatch: pytest.MonkeyPatch) -> None:
+    pytest.importorskip("comtypes")
+    from types import SimpleNamespace
+
+    from dxcam.dxcam import DXCamera
+    from dxcam.processor import Processor
+
+    width, height = 64, 48
+    # DXGI-style mapping with padded rows.
+    image = np.random.default_rng(0).integers(
+        0, 256, size=(height, width + 7, 4), dtype=np.uint8
+    )
+    rect = SimpleNamespace(
+        Pitch=image.shape[1] * 4,
+        pBits=image.ctypes.data_as(ctypes.POINTER(ctypes.c_ubyte)),
+    )
+    processor = Processor(backend="pure_numpy", output_color="RGB")
+    camera = DXCamera.__new__(DXCamera)
+    camera._is_released = False
+    camera.is_capturing = False
+    camera.region = (0, 0, width, height)
+    camera.rotation_angle = 0
+    camera._processor = processor
+    camera._processing_plan = None
+    camera._cursor = None
+    camera._change_tile_size = None
+    camera._duplicator = SimpleNamespace(release_frame=lambda: None)
+    camera._stagesurf = SimpleNamespace(map=lambda: rect, unmap=lambda: None)
+    monkeypatch.setattr(camera, "_acquire_new_frame", lambda **_: True)
+    monkeypatch.setattr(camera, "_copy_region_to_stage", lambda _: (width, height))
+
+    out = np.zeros(processor.output_frame_shape(width, height), np.uint8)
+    frame = camera.grab(out=out)
+
+    assert frame is out
+    np.testing.assert_array_equal(
+        out, processor.process(rect, width, height, (0, 0, width, height), 0)
+    )
@@ -0,0 +1,239 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+pytest.importorskip("cv2")
+
+from mapped_rect import FakeMappedRect
+
+from dxcam.processor import (
+    Processor,
+    normalize_hdr_white_nits,
+    normalize_source_format,
+    normalize_tone_map_name,
+)
+from dxcam.processor.cv2_processor import _NUMPY_KERNELS_AVAILABLE
+from dxcam.processor.hdr import PQ_PEAK_NITS, pq_decode_lut, scrgb_tone_lut
+
+_WIDTH, _HEIGHT = 83, 57
+_REGION = (3, 5, 70, 49)
+_TONE_MAPS: tuple[str, ...] = ("clip", "reinhard", "aces")
+
+
+def _skip_without_kernels() -> None:
+    if not _NUMPY_KERNELS_AVAILABLE:
+        pytest.skip("NumPy/Cython kernels are unavailable in this environment.")
+
+
+def _source_shape(rotation_angle: int, pad: int = 0) -> tuple[int, int]:
+    if rotation_angle in (90, 270):
+        return _WIDTH, _HEIGHT + pad
+    return _HEIGHT, _WIDTH + pad
+
+
+def _rgb10a2_pixels(rotation_angle: int = 0, seed: int = 0) -> np.ndarray:
+    rows, cols = _source_shape(rotation_angle, pad=3)
+    rng = np.random.default_rng(seed)
+    return rng.integers(0, 2**32, size=(rows, cols), dtype=np.uint32)
+
+
+def _rgba16f_pixels(rotation_angle: int = 0, seed: int = 0) -> np.ndarray:
+    rows, cols = _source_shape(rotation_angle, pad=3)
+    rng = np.random.default_rng(seed)
+    pixels = (rng.standard_normal((rows, cols, 4)) * 3.0).astype(np.float16)
+    pixels[0, :4, 0] = (np.nan, np.inf, -np.inf, -0.0)
+    return pixels
+
+
+def _pack_rgb10a2(r: int, g: int, b: int, a: int = 3) -> np.ndarray:
+    return np.full((4, 8), r | (g << 10) | (b << 20) | (a << 30), dtype=np.uint32)
+
+
+def _fake_rect(pixels: np.ndarray) -> FakeMappedRect:
+    # Present the HDR buffer as packed 4-byte units, the way DXGI maps rows.
+    rows = pixels.shape[0]
+    return FakeMappedRect(pixels.view(np.uint8).reshape(rows, -1, 4))
+
+
+def _pq_code(nits: float) -> int:
+    lut = pq_decode_lut(1.0)
+    return int(np.searchsorted(lut, nits))
+
+
+@pytest.mark.parametrize("tone_map", _TONE_MAPS)
+@pytest.mark.parametrize("source_format", ("RGB10A2", "RGBA16F"))
+@pytest.mark.parametrize("rotation_angle", (0, 90, 180, 270))
+def test_kernel_decode_matches_numpy(
+    tone_map: str, source_format: str, rotation_angle: int
+) -> None:
+    _skip_without_kernels()
+    if source_format == "RGB10A2":
+        pixels = _rgb10a2_pixels(rotation_angle, seed=rotation_angle)
+    else:
+        pixels = _rgba16f_pixels(rotation_angle, seed=rotation_angle)
+    rect = _fake_rect(pixels)
+    frames = []
+    for backend in ("numpy", "pure_numpy"):
+        processor = Processor(
+            backend=backend,
+            output_color="RGB",
+            source_format=source_format,
+            tone_map=tone_map,
+            hdr_white_nits=203.0,
+        )
+        frames.append(
+            processor.process(rect, _WIDTH, _HEIGHT, _REGION, rotation_angle).copy()
+        )
+    kernel, reference = (frame.astype(np.int16) for frame in frames)
+    # Fast-math may round an RGB10A2 value across an encode-table boundary.
+    tolerance = 1 if source_format == "RGB10A2" else 0
+    assert np.abs(kernel - reference).max() <= tolerance
+
+
+def test_rgba16f_tone_lut_values() -> None:
+    values = np.array(
+        [0.0, 1.0, 0.5, -1.0, np.nan, np.inf, -np.inf, 2.0], dtype=np.float16
+    )
+    bits = values.view(np.uint16)
+    clip = scrgb_tone_lut("clip", 80.0)
+    assert clip[bits].tolist() == [0, 255, 188, 0, 0, 255, 0, 255]
+    reinhard = scrgb_tone_lut("reinhard", 80.0)
+    assert reinhard[bits[1]] == 188
+    assert reinhard[bits[7]] < 255
+    # Brighter SDR white dims scRGB 1.0 (80 nits).
+    assert scrgb_tone_lut("clip", 160.0)[bits[1]] == 188
+
+
+@pytest.mark.parametrize("backend", ("numpy", "pure_numpy"))
+def test_rgb10a2_decodes_pq_and_bt2020(backend: str) -> None:
+    if backend == "numpy":
+        _skip_without_kernels()
+    processor = Processor(backend=backend, output_color="RGB", source_format="RGB10A2")
+
+    def decode(pixels: np.ndarray) -> list[int]:
+        rect = _fake_rect(pixels)
+        return processor.process(rect, 8, 4, (0, 0, 8, 4), 0)[0, 0].tolist()
+
+    white = _pq_code(80.0)
+    assert decode(_pack_rgb10a2(white, white, white)) == [255, 255, 255]
+    assert decode(_pack_rgb10a2(1023, 1023, 1023)) == [255, 255, 255]
+    assert decode(_pack_rgb10a2(0, 0, 0)) == [0, 0, 0]
+    # BT.2020 green lies outside BT.709: red and blue clip to zero.
+    red, green, blue = decode(_pack_rgb10a2(0, white, 0))
+    assert red == 0 and blue == 0 and green == 255
+    assert pq_decode_lut(1.0)[1023] == pytest.approx(PQ_PEAK_NITS)
+
+
+@pytest.mark.parametrize("output_color", ("RGB", "RGBA"))
+@pytest.mark.parametrize("source_format", ("RGB10A2", "RGBA16F"))
+@pytest.mark.parametrize("rotation_angle", (0, 90, 180, 270))
+def test_native_output_keeps_source_precision(
+    output_color: str, source_format: str, rotation_angle: int
+) -> None:
+    rows, cols = _source_shape(rotation_angle)
+    # Route pixel indices through the BGRA pipeline for the expected layout.
+    index = np.arange(rows * cols, dtype=np.uint32).reshape(rows, cols)
+    index_rect = FakeMappedRect(index.view(np.uint8).reshape(rows, cols, 4))
+    bgra = Processor(backend="cv2", output_color="BGRA")
+    gathered = bgra.process(index_rect, _WIDTH, _HEIGHT, _REGION, rotation_angle)
+    order = np.ascontiguousarray(gathered).view(np.uint32)[..., 0]
+
+    processor = Processor(
+        backend="cv2",
+        output_color=output_color,
+        source_format=source_format,
+        tone_map="none",
+    )
+    channels = len(output_color)
+    if source_format == "RGB10A2":
+        pixels = _rgb10a2_pixels(rotation_angle)
+        source = pixels[:, :cols].reshape(-1)[order]
+        expected = np.stack(
+            [(source >> (10 * c)) & 0x3FF for c in range(3)] + [(source >> 30) * 341],
+            axis=-1,
+        ).astype(np.uint16)
+        assert processor.output_dtype == np.uint16
+    else:
+        pixels = _rgba16f_pixels(rotation_angle)
+        expected = pixels[:, :cols].reshape(-1, 4)[order]
+        assert processor.output_dtype == np.float16
+
+    frame = processor.process(
+        _fake_rect(pixels), _WIDTH, _HEIGHT, _REGION, rotation_angle
+    )
+    assert frame.dtype == processor.output_dtype
+    assert frame.shape == processor.output_frame_shape(67, 44)
+    np.testing.assert_array_equal(frame, expected[..., :channels])
+
+
+def test_hdr_options_are_validated() -> None:
+    assert normalize_source_format("rgba16f") == "RGBA16F"
+    assert normalize_tone_map_name("ACES") == "aces"
+    assert normalize_hdr_white_nits(203) == 203.0
+    with pytest.raises(ValueError):
+        normalize_source_format("RGBA32F")
+    with pytest.raises(ValueError):
+        normalize_tone_map_name("hable")
+    for nits in (0, -80.0, float("nan"), float("inf")):
+        with pytest.raises(ValueError):
+            normalize_hdr_white_nits(nits)
+
+    invalid_native = (
+        {"output_color": "BGR"},
+        {"output_color": "NV12"},
+        {"output_size": (32, 32)},
+        {"letterbox": True},
+        {"output_dtype": "float32"},
+    )
+    for kwargs in invalid_native:
+        options = {"output_color": "RGB", **kwargs}
+        with pytest.raises(ValueError):
+            Processor(source_format="RGB10A2", tone_map="none", **options)
+
+    processor = Processor(output_color="RGB", source_format="RGB10A2", tone_map="none")
+    with pytest.raises(ValueError):
+        processor.set_output_size((32, 32))
+    with pytest.raises(ValueError):
+        processor.process_batch(np.zeros((1, 8, 8, 4), dtype=np.uint8))
+
+    # An RGBA16F row needs 8 bytes per pixel.
+    rect = _fake_rect(_rgba16f_pixels())
+    rect.Pitch = _WIDTH * 4
+    processor = Processor(output_color="RGB", source_format="RGBA16F")
+    with pytest.raises(ValueError):
+        processor.process(rect, _WIDTH, _HEIGHT, _REGION, 0)
+
+
+def test_tone_mapped_sources_keep_output_options() -> None:
+    processor = Processor(
+        backend="cv2",
+        output_color="RGB",
+        output_size=(32, 24),
+        output_layout="CHW",
+        output_dtype="float32",
+        source_format="RGBA16F",
+        tone_map="reinhard",
+    )
+    frame = processor.process(
+        _fake_rect(_rgba16f_pixels()), _WIDTH, _HEIGHT, _REGION, 0
+    )
+    assert frame.shape == (3, 24, 32) and frame.dtype == np.float32
+    assert 0.0 <= frame.min() and frame.max() <= 1.0
+
+
+def test_stats_time_decode_once_per_frame() -> None:
+    processor = Processor(backend="cv2", output_color="BGR", source_format="RGBA16F")
+    processor.enable_stats()
+    rect = _fake_rect(_rgba16f_pixels())
+    regions = [(0, 0, 20, 20), (30, 10, 60, 40)]
+    dsts = [np.empty((20, 20, 3), np.uint8), np.empty((30, 30, 3), np.uint8)]
+    processor.process(rect, _WIDTH, _HEIGHT, _REGION, 0)
+    processor.process_regions_into(rect, _WIDTH, _HEIGHT, regions, 0, dsts)
+
+    stats = processor.stats()
+    assert stats is not None
+    assert stats.frames == 2
+    assert stats.stages["decode"].calls == 2
+    assert stats.stages["total"].calls == 2
+    assert stats.bytes_read == (67 * 44 + 20 * 20 + 30 * 30) * 8
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+pytest.importorskip("cv2")
+
+from mapped_rect import CV2_BACKENDS, random_mapped_rect, skip_unavailable
+
+from dxcam.processor import Processor, letterbox_geometry
+
+_MODES: tuple[tuple[str, int], ...] = (("BGRA", 4), ("RGB", 3), ("GRAY", 1))
+
+
+def test_letterbox_geometry_centers_scaled_image() -> None:
+    scale, inner = letterbox_geometry(1920, 1080, (640, 640))
+
+    assert scale == pytest.approx(1 / 3)
+    assert inner == (0, 140, 640, 500)
+
+
+def test_letterbox_geometry_pads_to_square_without_scaling() -> None:
+    scale, inner = letterbox_geometry(300, 200, (300, 300))
+
+    assert scale == 1.0
+    assert inner == (0, 50, 300, 250)
+
+
+@pytest.mark.parametrize("backend", CV2_BACKENDS)
+@pytest.mark.parametrize("mode,channels", _MODES)
+def test_letterbox_process_into_pads_border_bands(
+    backend: str, mode: str, channels: int
+) -> None:
+    skip_unavailable(backend)
+    width, height = 96, 48
+    rect = random_mapped_rect(width, height, seed=3)
+    region = (0, 0, width, height)
+    processor = Processor(
+        backend=backend,
+        output_color=mode,
+        output_size=(64, 64),
+        letterbox=True,
+        letterbox_color=114,
+    )
+    resized = Processor(backend=backend, output_color=mode, output_size=(64, 32))
+    dst = np.zeros((64, 64, channels), dtype=np.uint8)
+
+    processor.process_into(rect, width, height, region, 0, dst)
+
+    assert processor.letterbox_transform(width, height) == (pytest.approx(2 / 3), 0, 16)
+    assert np.all(dst[:16] == 114)
+    assert np.all(dst[48:] == 114)
+    np.testing.assert_array_equal(
+        dst[16:48], resized.process(rect, width, height, region, 0)
+    )
+
+
+@pytest.mark.parametrize("backend", CV2_BACKENDS)
+def test_letterbox_border_is_reused_for_unchanged_geometry(backend: str) -> None:
+    skip_unavailable(backend)
+    width, height = 64, 32
+    rect = random_mapped_rect(width, height, seed=5)
+    region = (0, 0, width, height)
+    processor = Processor(backend=backend, output_color="BGR", letterbox=True)
+    ring = np.zeros((2, 64, 64, 3), dtype=np.uint8)
+
+    for slot in ring:
+        processor.process_into(rect, width, height, region, 0, slot)
+    assert np.all(ring[:, :16] == 114)
+
+    # Border bands are written once per destination buffer, not per frame.
+    ring[:, :16] = 0
+    processor.process_into(rect, width, height, region, 0, ring[0])
+    assert np.all(ring[0, :16] == 0)
+
+    # A new buffer is padded again.
+    fresh = np.zeros((64, 64, 3), dtype=np.uint8)
+    processor.process_into(rect, width, height, region, 0, fresh)
+    assert np.all(fresh[:16] == 114)
+    assert np.all(fresh[48:] == 114)
+
+
+@pytest.mark.parametrize("backend", CV2_BACKENDS)
+def test_letterbox_process_returns_square_canvas(backend: str) -> None:
+    skip_unavailable(backend)
+    width, height = 40, 70
+    rect = random_mapped_rect(width, height, seed=9)
+    processor = Processor(
+        backend=backend, output_color="RGB", letterbox=True, letterbox_color=0
+    )
+
+    frame = processor.process(rect, width, height, (0, 0, width, height), 0)
+
+    assert frame.shape == (70, 70, 3)
+    assert processor.output_frame_size(width, height) == (70, 70)
+    assert np.all(frame[:, :15] == 0)
+    assert np.all(frame[:, 55:] == 0)
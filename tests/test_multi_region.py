@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+pytest.importorskip("cv2")
+
+from mapped_rect import CV2_BACKENDS, random_mapped_rect, skip_unavailable
+
+from dxcam.core.capture_runtime import CaptureRuntime
+from dxcam.processor import Processor
+from dxcam.processor.cv2_processor import _NUMPY_KERNELS_AVAILABLE, _numpy_kernels
+
+_ROTATIONS: tuple[int, ...] = (0, 90, 180, 270)
+_WIDTH, _HEIGHT = 97, 61
+_REGIONS = [(0, 0, _WIDTH, _HEIGHT), (3, 4, 50, 20), (10, 30, 11, 31), (60, 2, 97, 61)]
+
+
+@pytest.fixture
+def _parallel_threshold():
+    if not _NUMPY_KERNELS_AVAILABLE:
+        yield
+        return
+    previous = _numpy_kernels.get_parallel_pixels_threshold()
+    yield
+    _numpy_kernels.set_parallel_pixels_threshold(previous)
+
+
+@pytest.mark.parametrize("backend", CV2_BACKENDS)
+@pytest.mark.parametrize("rotation", _ROTATIONS)
+@pytest.mark.parametrize("output_color", ("RGB", "BGRA", "GRAY", "NV12"))
+def test_process_regions_into_matches_process_into(
+    backend: str,
+    rotation: int,
+    output_color: str,
+) -> None:
+    skip_unavailable(backend)
+    rect = random_mapped_rect(_WIDTH, _HEIGHT, rotation, seed=rotation + 1)
+    processor = Processor(backend=backend, output_color=output_color)
+    regions = [r for r in _REGIONS if output_color != "NV12" or r[2] - r[0] > 1]
+
+    frames = [
+        np.empty(
+            processor.output_frame_shape(r[2] - r[0], r[3] - r[1]),
+            dtype=processor.output_dtype,
+        )
+        for r in regions
+    ]
+    processor.process_regions_into(rect, _WIDTH, _HEIGHT, regions, rotation, frames)
+
+    for region, frame in zip(regions, frames):
+        expected = np.empty_like(frame)
+        processor.process_into(rect, _WIDTH, _HEIGHT, region, rotation, expected)
+        np.testing.assert_array_equal(frame, expected)
+
+
+@pytest.mark.parametrize("rotation", _ROTATIONS)
+@pytest.mark.parametrize("mode", ("RGB", "BGR", "RGBA", "GRAY", "BGRA"))
+@pytest.mark.parametrize("threshold", (1, 1 << 30))
+def test_convert_bgra_regions_into_matches_single_region_kernel(
+    rotation: int,
+    mode: str,
+    threshold: int,
+    _parallel_threshold,
+) -> None:
+    skip_unavailable("numpy")
+    _numpy_kernels.set_parallel_pixels_threshold(threshold)
+    image = random_mapped_rect(_WIDTH, _HEIGHT, rotation, seed=7).keepalive
+    channels = {"RGB": 3, "BGR": 3, "RGBA": 4, "GRAY": 1, "BGRA": 4}[mode]
+    frames = [
+        np.empty((r[3] - r[1], r[2] - r[0], channels), dtype=np.uint8) for r in _REGIONS
+    ]
+    _numpy_kernels.convert_bgra_regions_into(
+        image, frames, _WIDTH, _HEIGHT, _REGIONS, rotation, mode
+    )
+    for region, frame in zip(_REGIONS, frames):
+        if mode == "BGRA":
+            expected = _numpy_kernels.prepare_bgra(
+                image, _WIDTH, _HEIGHT, region, rotation
+            )
+        else:
+            expected = _numpy_kernels.convert_bgra_prepare(
+                image, _WIDTH, _HEIGHT, region, rotation, mode
+            )
+        np.testing.assert_array_equal(frame, expected)
+
+
+def test_convert_bgra_regions_into_rejects_bad_destinations() -> None:
+    skip_unavailable("numpy")
+    image = random_mapped_rect(_WIDTH, _HEIGHT, 0, seed=0).keepalive
+    region = (0, 0, 8, 4)
+    with pytest.raises(ValueError):
+        _numpy_kernels.convert_bgra_regions_into(
+            image, [], _WIDTH, _HEIGHT, [region], 0, "RGB"
+        )
+    with pytest.raises(ValueError):
+        _numpy_kernels.convert_bgra_regions_into(
+            image, [np.empty((4, 9, 3), np.uint8)], _WIDTH, _HEIGHT, [region], 0, "RGB"
+        )
+    with pytest.raises(ValueError):
+        _numpy_kernels.convert_bgra_regions_into(
+            image, [np.empty((4, 8, 4), np.uint8)], _WIDTH, _HEIGHT, [region], 0, "RGB"
+        )
+    with pytest.raises(ValueError):
+        _numpy_kernels.convert_bgra_regions_into(
+            image,
+            [np.empty((4, 8, 3), np.uint8)],
+            _WIDTH,
+            _HEIGHT,
+            [(0, 0, _WIDTH + 1, 4)],
+            0,
+            "RGB",
+        )
+
+
+def test_capture_runtime_packs_regions_into_one_slot() -> None:
+    runtime = CaptureRuntime(max_buffer_len=2, channel_size=3)
+    shapes = [(4, 5, 3), (2, 3, 3)]
+    runtime.allocate_for_regions(shapes)
+    assert runtime.frame_buffer is not None
+    assert runtime.frame_buffer.shape == (2, 4 * 5 * 3 + 2 * 3 * 3)
+
+    write_idx, write_dst = runtime.reserve_write_slot()
+    first, second = runtime.split_regions(write_dst)
+    first[...] = 1
+    second[...] = 2
+    assert np.shares_memory(first, write_dst)
+    assert runtime.commit_write(write_idx, frame_ticks=42)
+
+    latest, ticks = runtime.peek_latest_with_ticks(copy=True)
+    assert ticks == 42
+    frames = runtime.split_regions(latest)
+    assert [f.shape for f in frames] == shapes
+    assert (frames[0] == 1).all() and (frames[1] == 2).all()
+
+    runtime.allocate_for_shape(4, 5)
+    assert runtime.region_shapes is None
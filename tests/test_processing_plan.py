@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+pytest.importorskip("cv2")
+
+from mapped_rect import BACKENDS, random_mapped_rect, skip_unavailable
+
+from dxcam.processor import Processor, tile_grid_shape
+from dxcam.processor.cv2_processor import _NUMPY_KERNELS_AVAILABLE
+
+_WIDTH, _HEIGHT = 83, 59
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+@pytest.mark.parametrize("rotation", (0, 90, 180, 270))
+@pytest.mark.parametrize("output_color", ("BGRA", "RGB", "RGBA", "GRAY"))
+def test_plan_matches_process_into(
+    backend: str, rotation: int, output_color: str
+) -> None:
+    skip_unavailable(backend)
+    processor = Processor(backend=backend, output_color=output_color)
+    for region in ((0, 0, _WIDTH, _HEIGHT), (4, 3, 70, 51)):
+        shape = processor.output_frame_shape(
+            region[2] - region[0], region[3] - region[1]
+        )
+        dst = np.zeros(shape, dtype=np.uint8)
+        first = random_mapped_rect(_WIDTH, _HEIGHT, rotation, seed=1)
+        plan = processor.processing_plan(
+            first.Pitch, _WIDTH, _HEIGHT, region, rotation, dst
+        )
+        assert plan.matches(first.Pitch, _WIDTH, _HEIGHT, region, rotation, dst)
+
+        # A second mapping at another address must not reuse stale views.
+        for rect in (
+            first,
+            random_mapped_rect(_WIDTH, _HEIGHT, rotation, seed=2),
+            first,
+        ):
+            expected = np.empty_like(dst)
+            processor.process_into(rect, _WIDTH, _HEIGHT, region, rotation, expected)
+            plan.run(rect, dst)
+            np.testing.assert_array_equal(dst, expected)
+
+
+def test_plan_kinds_follow_backend_and_options() -> None:
+    rect = random_mapped_rect(_WIDTH, _HEIGHT, 0, seed=0)
+    region = (0, 0, _WIDTH, _HEIGHT)
+    rgb = np.empty((_HEIGHT, _WIDTH, 3), dtype=np.uint8)
+
+    cv2_plan = Processor(backend="cv2", output_color="RGB").processing_plan(
+        rect.Pitch, _WIDTH, _HEIGHT, region, 0, rgb
+    )
+    assert cv2_plan.kind == "view"
+    rotated = Processor(backend="cv2", output_color="RGB").processing_plan(
+        rect.Pitch,
+        _HEIGHT,
+        _WIDTH,
+        (0, 0, _HEIGHT, _WIDTH),
+        90,
+        np.empty((_WIDTH, _HEIGHT, 3), dtype=np.uint8),
+    )
+    assert rotated.kind == ("staged" if _NUMPY_KERNELS_AVAILABLE else "generic")
+
+    resized = Processor(backend="numpy", output_color="RGB", output_size=(32, 24))
+    small = np.empty((24, 32, 3), dtype=np.uint8)
+    plan = resized.processing_plan(rect.Pitch, _WIDTH, _HEIGHT, region, 0, small)
+    assert plan.kind == "generic"
+    plan.run(rect, small)
+    np.testing.assert_array_equal(
+        small, resized.process(rect, _WIDTH, _HEIGHT, region, 0)
+    )
+    if _NUMPY_KERNELS_AVAILABLE:
+        numpy_plan = Processor(backend="numpy", output_color="RGB").processing_plan(
+            rect.Pitch, _WIDTH, _HEIGHT, region, 0, rgb
+        )
+        assert numpy_plan.kind == "kernel"
+
+
+@pytest.mark.parametrize("backend", ("cv2", "numpy"))
+def test_plan_goes_stale_on_setting_changes(backend: str) -> None:
+    skip_unavailable(backend)
+    processor = Processor(backend=backend, output_color="BGR")
+    rect = random_mapped_rect(_WIDTH, _HEIGHT, 0, seed=0)
+    region = (0, 0, _WIDTH, _HEIGHT)
+    dst = np.empty((_HEIGHT, _WIDTH, 3), dtype=np.uint8)
+    plan = processor.processing_plan(rect.Pitch, _WIDTH, _HEIGHT, region, 0, dst)
+
+    assert not plan.matches(rect.Pitch + 4, _WIDTH, _HEIGHT, region, 0, dst)
+    assert not plan.matches(rect.Pitch, _WIDTH, _HEIGHT, (0, 0, 10, 10), 0, dst)
+    assert not plan.matches(rect.Pitch, _WIDTH, _HEIGHT, region, 180, dst)
+    assert not plan.matches(rect.Pitch, _WIDTH, _HEIGHT, region, 0, dst[:, :-1])
+    assert plan.matches(rect.Pitch, _WIDTH, _HEIGHT, region, 0, dst.copy())
+
+    processor.enable_stats()
+    assert not plan.matches(rect.Pitch, _WIDTH, _HEIGHT, region, 0, dst)
+    stats_plan = processor.processing_plan(rect.Pitch, _WIDTH, _HEIGHT, region, 0, dst)
+    assert stats_plan.kind == "generic"
+    stats_plan.run(rect, dst)
+    assert processor.stats().frames == 1
+
+    processor.set_output_size((40, 30))
+    assert not stats_plan.matches(rect.Pitch, _WIDTH, _HEIGHT, region, 0, dst)
+
+
+@pytest.mark.parametrize("backend", ("cv2", "numpy"))
+def test_plan_fills_tile_hashes(backend: str) -> None:
+    skip_unavailable(backend)
+    processor = Processor(backend=backend, output_color="RGB")
+    rect = random_mapped_rect(_WIDTH, _HEIGHT, 90, seed=5)
+    region = (0, 0, _WIDTH, _HEIGHT)
+    dst = np.empty((_HEIGHT, _WIDTH, 3), dtype=np.uint8)
+    expected = np.empty(tile_grid_shape(_HEIGHT, _WIDTH, 16), dtype=np.uint64)
+    processor.process_into(rect, _WIDTH, _HEIGHT, region, 90, dst, expected, 16)
+
+    hashes = np.zeros_like(expected)
+    plan = processor.processing_plan(rect.Pitch, _WIDTH, _HEIGHT, region, 90, dst)
+    plan.run(rect, dst, hashes, 16)
+    np.testing.assert_array_equal(hashes, expected)
+
+
+def test_plan_rejects_invalid_geometry() -> None:
+    if not _NUMPY_KERNELS_AVAILABLE:
+        pytest.skip("NumPy/Cython kernels are unavailable in this environment.")
+    processor = Processor(backend="numpy", output_color="RGB")
+    dst = np.empty((_HEIGHT, _WIDTH, 3), dtype=np.uint8)
+    region = (0, 0, _WIDTH, _HEIGHT)
+    with pytest.raises(ValueError):
+        processor.processing_plan(_WIDTH * 4 - 4, _WIDTH, _HEIGHT, region, 0, dst)
+    with pytest.raises(ValueError):
+        processor.processing_plan(_WIDTH * 4, _WIDTH, _HEIGHT, region, 45, dst)
+    with pytest.raises(ValueError):
+        processor.processing_plan(_WIDTH * 4, _WIDTH, _HEIGHT, region, 0, dst[:-1])
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+pytest.importorskip("cv2")
+
+from mapped_rect import BACKENDS, random_mapped_rect, skip_unavailable
+
+from dxcam.processor import Processor
+from dxcam.processor.stats import HISTOGRAM_BUCKETS
+
+_WIDTH, _HEIGHT = 97, 61
+
+
+def test_stats_are_off_by_default() -> None:
+    processor = Processor(backend="cv2", output_color="RGB")
+    assert processor.stats() is None
+    assert "process_into" not in vars(processor.backend)
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_stats_count_frames_stages_and_bytes(backend: str) -> None:
+    skip_unavailable(backend)
+    processor = Processor(backend=backend, output_color="RGB")
+    processor.enable_stats()
+    rect = random_mapped_rect(_WIDTH, _HEIGHT)
+    region = (3, 4, 50, 41)
+    dst = np.empty(processor.output_frame_shape(47, 37), dtype=np.uint8)
+
+    processor.process_into(rect, _WIDTH, _HEIGHT, region, 0, dst)
+    frame = processor.process(rect, _WIDTH, _HEIGHT, region, 0)
+    np.testing.assert_array_equal(frame, dst)
+
+    stats = processor.stats()
+    assert stats is not None
+    assert stats.frames == 2
+    assert stats.bytes_read == 2 * 47 * 37 * 4
+    assert stats.bytes_written == 2 * dst.nbytes
+    total = stats.stages["total"]
+    assert total.calls == 2
+    assert sum(total.histogram) == 2 and len(total.histogram) == HISTOGRAM_BUCKETS
+    assert stats.stages["map"].calls == 2
+    assert stats.stages["convert"].calls == 2
+    exclusive = sum(
+        stage.total_seconds for name, stage in stats.stages.items() if name != "total"
+    )
+    assert 0 < exclusive <= total.total_seconds
+
+    processor.stats(reset=True)
+    assert processor.stats().frames == 0
+
+    processor.enable_stats(False)
+    assert processor.stats() is None
+    assert "process_into" not in vars(processor.backend)
+    processor.process_into(rect, _WIDTH, _HEIGHT, region, 0, dst)
+
+
+def test_staged_outputs_count_one_frame() -> None:
+    processor = Processor(backend="cv2", output_color="NV12", output_size=(32, 24))
+    processor.enable_stats()
+    processor.process(
+        random_mapped_rect(_WIDTH, _HEIGHT), _WIDTH, _HEIGHT, (0, 0, _WIDTH, _HEIGHT), 0
+    )
+
+    stats = processor.stats()
+    assert stats is not None
+    assert stats.frames == 1
+    assert stats.stages["resize"].calls == 1
+    assert stats.stages["convert"].calls == 1
+
+
+def test_band_parallel_frames_are_flagged() -> None:
+    processor = Processor(
+        backend="cv2", output_color="BGR", band_workers=2, band_min_rows=8
+    )
+    processor.enable_stats()
+    rect = random_mapped_rect(_WIDTH, _HEIGHT)
+    processor.process(rect, _WIDTH, _HEIGHT, (0, 0, _WIDTH, _HEIGHT), 0)
+    processor.process(rect, _WIDTH, _HEIGHT, (0, 0, 10, 10), 0)
+    processor.close()
+
+    stats = processor.stats()
+    assert stats is not None
+    assert (stats.frames, stats.parallel_frames) == (2, 1)
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from dxcam.processor import Processor
+from dxcam.processor.base import normalize_processor_backend_name
+from mapped_rect import random_mapped_rect
+
+_WIDTH, _HEIGHT = 97, 61
+_RESIZE_CASES: tuple[dict[str, object], ...] = (
+    {},
+    {"output_size": (40, 30)},
+    {"output_size": (40, 30), "interpolation": "nearest"},
+    {"output_size": (40, 30), "interpolation": "bilinear"},
+    {"output_size": (200, 150), "interpolation": "area"},
+    {"output_size": (64, 64), "letterbox": True},
+)
+
+
+def test_pure_numpy_backend_name_is_accepted() -> None:
+    assert normalize_processor_backend_name("PURE_NUMPY") == "pure_numpy"
+    processor = Processor(backend="pure_numpy", output_color="RGB")
+    assert type(processor.backend).__name__ == "PureNumpyProcessor"
+
+
+@pytest.mark.parametrize("output_color", ("RGB", "BGR", "RGBA", "GRAY", "BGRA"))
+@pytest.mark.parametrize("rotation_angle", (0, 90, 180, 270))
+def test_pure_numpy_process_without_cv2(output_color: str, rotation_angle: int) -> None:
+    processor = Processor(
+        backend="pure_numpy", output_color=output_color, output_size=(40, 30)
+    )
+    rect = random_mapped_rect(_WIDTH, _HEIGHT, rotation_angle)
+    frame = processor.process(rect, _WIDTH, _HEIGHT, (3, 4, 50, 41), rotation_angle)
+
+    assert frame.shape == processor.output_frame_shape(47, 37)
+    assert processor.backend._cv2 is None
+
+
+@pytest.mark.parametrize("kwargs", _RESIZE_CASES)
+@pytest.mark.parametrize("output_color", ("RGB", "BGR", "RGBA", "GRAY", "BGRA"))
+@pytest.mark.parametrize("rotation_angle", (0, 90, 180, 270))
+def test_pure_numpy_matches_cv2(
+    kwargs: dict[str, object], output_color: str, rotation_angle: int
+) -> None:
+    pytest.importorskip("cv2")
+    rect = random_mapped_rect(_WIDTH, _HEIGHT, rotation_angle, seed=rotation_angle)
+    for region in ((0, 0, _WIDTH, _HEIGHT), (3, 4, 50, 41)):
+        reference = Processor(backend="cv2", output_color=output_color, **kwargs)
+        pure = Processor(backend="pure_numpy", output_color=output_color, **kwargs)
+        expected = reference.process(rect, _WIDTH, _HEIGHT, region, rotation_angle)
+        actual = pure.process(rect, _WIDTH, _HEIGHT, region, rotation_angle)
+        dst = np.empty_like(actual)
+        pure.process_into(rect, _WIDTH, _HEIGHT, region, rotation_angle, dst)
+
+        assert actual.shape == expected.shape
+        diff = np.abs(actual.astype(np.int16) - expected.astype(np.int16))
+        # Color conversion is bit-exact; interpolation may round differently.
+        assert diff.max() <= (1 if kwargs else 0)
+        np.testing.assert_array_equal(dst, actual)
+
+
+@pytest.mark.parametrize("backend", ("numpy", "pure_numpy"))
+def test_nearest_resize_matches_cv2_on_fractional_scale(backend: str) -> None:
+    cv2 = pytest.importorskip("cv2")
+    if int(cv2.__version__.split(".")[0]) >= 5:
+        pytest.skip("OpenCV 5 rounds INTER_NEAREST_EXACT ties differently.")
+    rect = random_mapped_rect(_WIDTH, _HEIGHT, 0, seed=7)
+    # 48 -> 20 is a 2.4x scale whose pixel centers land exactly on source
+    # pixel edges.
+    region = (0, 0, 48, 48)
+    kwargs = {
+        "output_color": "RGB",
+        "output_size": (20, 20),
+        "interpolation": "nearest",
+    }
+    expected = Processor(backend="cv2", **kwargs).process(
+        rect, _WIDTH, _HEIGHT, region, 0
+    )
+    actual = Processor(backend=backend, **kwargs).process(
+        rect, _WIDTH, _HEIGHT, region, 0
+    )
+    np.testing.assert_array_equal(actual, expected)
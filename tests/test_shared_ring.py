@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import os
+from collections.abc import Iterator
+from multiprocessing import resource_tracker
+
+import numpy as np
+import pytest
+
+from dxcam.core import shared_ring
+from dxcam.core.capture_runtime import CaptureRuntime
+from dxcam.core.shared_ring import SharedRingReader, SharedRingWriter
+
+
+@pytest.fixture
+def ring() -> Iterator[tuple[CaptureRuntime, str]]:
+    writer = SharedRingWriter()
+    runtime = CaptureRuntime(max_buffer_len=3, channel_size=3, storage=writer)
+    try:
+        yield runtime, writer.name
+    finally:
+        runtime.clear()
+        writer.close()
+
+
+def _commit(runtime: CaptureRuntime, value: int) -> None:
+    write_idx, dst = runtime.reserve_write_slot()
+    dst[...] = value
+    runtime.commit_write(write_idx, value * 100)
+
+
+def test_reader_sees_committed_frames_by_sequence(
+    ring: tuple[CaptureRuntime, str],
+) -> None:
+    runtime, name = ring
+    runtime.allocate_for_shape(4, 5)
+    with SharedRingReader(name) as reader:
+        assert reader.read() is None and reader.latest_sequence == 0
+        for value in (1, 2, 3):
+            _commit(runtime, value)
+
+        frame, ticks, sequence = reader.read()
+        assert frame.shape == (4, 5, 3) and frame.dtype == np.uint8
+        assert (frame == 3).all() and ticks == 300 and sequence == 3
+        view, _, _ = reader.read(2, copy=False)
+        assert (view == 2).all() and not view.flags.writeable
+        assert reader.oldest_sequence == 2
+
+        _commit(runtime, 4)
+        # Sequence 1 was overwritten; the view of 2 is still intact.
+        assert reader.read(1) is None and not reader.is_valid(1)
+        assert reader.is_valid(2) and (view == 2).all()
+        assert reader.read(5) is None
+
+
+def test_slot_is_invalid_while_being_written(ring: tuple[CaptureRuntime, str]) -> None:
+    runtime, name = ring
+    runtime.allocate_for_shape(2, 2)
+    with SharedRingReader(name) as reader:
+        for value in (1, 2, 3):
+            _commit(runtime, value)
+        assert reader.is_valid(1)
+        write_idx, dst = runtime.reserve_write_slot()
+        # The producer may now overwrite sequence 1's slot.
+        assert not reader.is_valid(1) and reader.read(1) is None
+        dst[...] = 4
+        runtime.commit_write(write_idx, 400)
+        assert reader.read(4)[2] == 4
+
+
+def test_reader_follows_reallocation_and_clear(
+    ring: tuple[CaptureRuntime, str],
+) -> None:
+    runtime, name = ring
+    runtime.allocate_for_shape(2, 2)
+    with SharedRingReader(name) as reader:
+        _commit(runtime, 1)
+        assert reader.read() is not None
+
+        runtime.allocate_for_shape(3, 6)
+        assert reader.read() is None and reader.latest_sequence == 1
+        _commit(runtime, 2)
+        frame, _, sequence = reader.read()
+        assert frame.shape == (3, 6, 3) and sequence == 2
+
+        runtime.allocate_for_regions([(2, 2, 3), (1, 1, 3)])
+        _commit(runtime, 3)
+        frame, _, sequence = reader.read()
+        assert frame.shape == (15,) and sequence == 3
+
+        runtime.clear()
+        assert reader.read() is None and reader.latest_sequence == 0
+
+
+def test_names_are_exclusive_and_validated() -> None:
+    writer = SharedRingWriter()
+    try:
+        with pytest.raises(FileExistsError):
+            SharedRingWriter(writer.name)
+    finally:
+        writer.close()
+    with pytest.raises(FileNotFoundError):
+        SharedRingReader(writer.name)
+
+
+@pytest.mark.skipif(os.name != "posix", reason="POSIX resource tracker only")
+def test_reader_leaves_segments_untracked(
+    ring: tuple[CaptureRuntime, str], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # A tracked segment would be unlinked when the reader process exits.
+    runtime, name = ring
+    runtime.allocate_for_shape(4, 5)
+    _commit(runtime, 1)
+    # Attach as if from another process than the writer's.
+    monkeypatch.setattr(shared_ring, "_created", set())
+    tracked: list[str] = []
+    monkeypatch.setattr(
+        resource_tracker, "register", lambda key, rtype: tracked.append(key)
+    )
+    monkeypatch.setattr(
+        resource_tracker, "unregister", lambda key, rtype: tracked.remove(key)
+    )
+    with SharedRingReader(name) as reader:
+        assert reader.read() is not None
+    assert tracked == []
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+pytest.importorskip("cv2")
+
+from mapped_rect import CV2_BACKENDS, random_mapped_rect, skip_unavailable
+
+from dxcam.processor import Processor, normalize_tensor_format
+
+_ROTATIONS: tuple[int, ...] = (0, 90, 180, 270)
+
+
+def test_normalize_tensor_format_defaults_and_validation() -> None:
+    assert normalize_tensor_format("RGB") is None
+
+    fmt = normalize_tensor_format(
+        "RGB",
+        output_layout="chw",
+        output_dtype="float32",
+        normalize_mean=(0.485, 0.456, 0.406),
+        normalize_std=(0.229, 0.224, 0.225),
+    )
+    assert fmt is not None
+    assert fmt.layout == "CHW"
+    assert fmt.scale[0] == pytest.approx(1.0 / (255.0 * 0.229))
+    assert fmt.bias[0] == pytest.approx(-0.485 / 0.229)
+
+    with pytest.raises(ValueError):
+        normalize_tensor_format("RGB", output_dtype="uint8", normalize_mean=(0.5,))
+    with pytest.raises(ValueError):
+        normalize_tensor_format("GRAY", output_dtype="float32", normalize_std=(1, 2))
+    with pytest.raises(ValueError):
+        normalize_tensor_format("RGB", output_layout="NHWC")
+
+
+@pytest.mark.parametrize("backend", CV2_BACKENDS)
+@pytest.mark.parametrize("rotation", _ROTATIONS)
+@pytest.mark.parametrize("output_color", ("RGB", "BGRA", "GRAY"))
+@pytest.mark.parametrize("output_dtype", ("uint8", "float32", "float16"))
+def test_chw_tensor_matches_normalized_hwc_frame(
+    backend: str,
+    rotation: int,
+    output_color: str,
+    output_dtype: str,
+) -> None:
+    skip_unavailable(backend)
+    width, height = 48, 30
+    rect = random_mapped_rect(width, height, rotation, seed=rotation + 1)
+    region = (2, 3, width - 5, height - 1)
+    normalize = output_dtype != "uint8"
+    processor = Processor(
+        backend=backend,
+        output_color=output_color,
+        output_layout="CHW",
+        output_dtype=output_dtype,
+        normalize_mean=(0.5,) if normalize else None,
+        normalize_std=(0.25,) if normalize else None,
+    )
+    reference = Processor(backend=backend, output_color=output_color)
+
+    frame = processor.process(rect, width, height, region, rotation)
+    hwc = reference.process(rect, width, height, region, rotation).astype(np.float32)
+
+    expected = hwc.transpose(2, 0, 1)
+    if normalize:
+        expected = (expected / 255.0 - 0.5) / 0.25
+    region_w, region_h = region[2] - region[0], region[3] - region[1]
+    assert frame.shape == processor.output_frame_shape(region_w, region_h)
+    assert frame.dtype == processor.output_dtype
+    tolerance = 1e-2 if output_dtype == "float16" else 1e-5
+    np.testing.assert_allclose(frame.astype(np.float32), expected, atol=tolerance)
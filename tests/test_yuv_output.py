@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+pytest.importorskip("cv2")
+
+from mapped_rect import CV2_BACKENDS, random_mapped_rect, skip_unavailable
+
+from dxcam.core.capture_runtime import CaptureRuntime
+from dxcam.processor import (
+    Processor,
+    normalize_tensor_format,
+    normalize_yuv_matrix_name,
+    normalize_yuv_range_name,
+)
+
+_ROTATIONS: tuple[int, ...] = (0, 90, 180, 270)
+
+
+def test_normalize_yuv_options() -> None:
+    assert normalize_yuv_matrix_name("BT.709") == "bt709"
+    assert normalize_yuv_range_name("Full") == "full"
+    with pytest.raises(ValueError):
+        normalize_yuv_matrix_name("bt2020")
+    with pytest.raises(ValueError):
+        normalize_yuv_range_name("studio")
+    with pytest.raises(ValueError):
+        normalize_tensor_format("NV12", output_layout="CHW")
+    with pytest.raises(ValueError):
+        normalize_tensor_format("I420", output_dtype="float32")
+
+
+@pytest.mark.parametrize("fourcc", ("NV12", "I420"))
+@pytest.mark.parametrize("rotation", _ROTATIONS)
+@pytest.mark.parametrize("yuv_matrix", ("bt601", "bt709"))
+@pytest.mark.parametrize("yuv_range", ("limited", "full"))
+def test_numpy_backend_matches_cv2_backend(
+    fourcc: str,
+    rotation: int,
+    yuv_matrix: str,
+    yuv_range: str,
+) -> None:
+    skip_unavailable("numpy")
+    width, height = 48, 30
+    rect = random_mapped_rect(width, height, rotation, seed=rotation + 3)
+    # Odd-sized region exercises even padding.
+    region = (2, 3, width - 5, height - 2)
+    frames = []
+    for backend in CV2_BACKENDS:
+        processor = Processor(
+            backend=backend,
+            output_color=fourcc,
+            yuv_matrix=yuv_matrix,
+            yuv_range=yuv_range,
+        )
+        frames.append(processor.process(rect, width, height, region, rotation).copy())
+
+    assert frames[0].shape == (26 * 3 // 2, 42)
+    assert frames[0].dtype == np.uint8
+    np.testing.assert_allclose(frames[0], frames[1], rtol=0, atol=1)
+
+
+@pytest.mark.parametrize("backend", CV2_BACKENDS)
+def test_yuv_output_size_letterbox_and_process_into(backend: str) -> None:
+    skip_unavailable(backend)
+    width, height = 64, 40
+    rect = random_mapped_rect(width, height, 0, seed=11)
+    region = (0, 0, width, height)
+    processor = Processor(
+        backend=backend,
+        output_color="NV12",
+        output_size=(33, 33),
+        letterbox=True,
+        letterbox_color=0,
+    )
+    shape = processor.output_frame_shape(width, height)
+    assert shape == (51, 34)
+    assert processor.output_layout == "YUV420"
+
+    dst = np.empty(shape, dtype=np.uint8)
+    processor.process_into(rect, width, height, region, 0, dst)
+
+    np.testing.assert_array_equal(
+        dst, processor.process(rect, width, height, region, 0)
+    )
+    # Limited-range black in the top letterbox band.
+    assert (dst[:4, :] == 16).all()
+    assert (dst[34:36, :] == 128).all()
+
+
+def test_capture_runtime_stores_even_padded_planes() -> None:
+    runtime = CaptureRuntime(max_buffer_len=2, channel_size=1, layout="YUV420")
+    runtime.allocate_for_shape(frame_height=37, frame_width=51)
+
+    assert runtime.frame_buffer is not None
+    assert runtime.frame_buffer.shape == (2, 57, 52)
+    assert runtime.current_frame_shape() == (38, 52)